@@ -0,0 +1,716 @@
+#!/usr/bin/env python3
+"""Synthetic-repo benchmark suite for the worker hot paths.
+
+Generates a synthetic product repository and Hugo site of configurable size,
+then times the worker entry points against it in pipeline order:
+
+    w1_fingerprint      W1 walk + fingerprint (repo_inventory.json)
+    w1_discover         W1 doc and example discovery
+    w2_extract          W2 claim extraction (heuristic, no LLM)
+    w2_map              W2 evidence mapping
+    w2_contradictions   W2 contradiction detection
+    w3_extract          W3 doc + code snippet extraction
+    w4_plan             W4 page planning
+    w5_draft            W5 drafting with the mock LLM provider
+    w5_5_review         W5.5 content review (drafts restored before each run)
+    w7_gates            W7 content gates over the synthetic site
+    event_replay        Snapshot replay of a synthetic events.ndjson
+
+Each benchmark runs --repeat times; the median wall time and the derived
+throughput (items per second) are written as JSON. With --baseline, results
+are compared against a previous results file and the script exits non-zero
+when any benchmark's throughput drops by more than --tolerance.
+
+Usage:
+    python scripts/benchmark_suite.py --size small --output bench.json
+    python scripts/benchmark_suite.py --size medium --baseline bench.json --tolerance 0.2
+    python scripts/benchmark_suite.py --docs 200 --claims 2000 --only w2_map,w2_contradictions
+
+Exit codes:
+    0 - All benchmarks ran (and no regressions against the baseline)
+    1 - Throughput regression against the baseline
+    2 - A benchmark failed
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+# Add src to path
+repo_root = Path(__file__).parent.parent
+sys.path.insert(0, str(repo_root / "src"))
+
+SCHEMA_VERSION = "1.0"
+
+PRODUCT_NAME = "Synthlib"
+FAMILY = "3d"
+RUN_ID = "bench_run"
+
+FORMATS = ["OBJ", "STL", "FBX", "GLTF", "PLY", "3DS", "DAE", "USD", "AMF", "X3D"]
+FEATURES = [
+    "mesh simplification",
+    "scene graph traversal",
+    "material conversion",
+    "texture baking",
+    "animation export",
+    "point cloud import",
+    "geometry validation",
+    "coordinate transforms",
+]
+
+
+@dataclass(frozen=True)
+class SyntheticSizes:
+    """Size knobs for the synthetic repository and site."""
+
+    files: int = 60
+    docs: int = 12
+    examples: int = 10
+    claims: int = 120
+    pages: int = 40
+    events: int = 2000
+
+
+SIZE_PRESETS: Dict[str, SyntheticSizes] = {
+    "tiny": SyntheticSizes(files=12, docs=3, examples=2, claims=15, pages=6, events=200),
+    "small": SyntheticSizes(),
+    "medium": SyntheticSizes(files=300, docs=40, examples=40, claims=500, pages=150, events=10000),
+    "large": SyntheticSizes(files=1500, docs=150, examples=120, claims=2000, pages=600, events=50000),
+}
+
+
+# ---------------------------------------------------------------------------
+# Synthetic data generation
+# ---------------------------------------------------------------------------
+
+
+def _claim_sentence(i: int) -> str:
+    fmt = FORMATS[i % len(FORMATS)]
+    feature = FEATURES[(i // len(FORMATS)) % len(FEATURES)]
+    kind = i % 4
+    if kind == 0:
+        return f"{PRODUCT_NAME} supports {fmt} format for {feature} (variant {i})."
+    if kind == 1:
+        return f"The Scene{i} class provides {feature} for {fmt} files."
+    if kind == 2:
+        return f"You can read and write {fmt} documents with {feature} enabled in step {i}."
+    return f"{PRODUCT_NAME} does not support {feature} for {fmt} streams in mode {i}."
+
+
+def generate_synthetic_repo(repo_dir: Path, sizes: SyntheticSizes) -> Dict[str, int]:
+    """Write a synthetic Python product repository.
+
+    Claim sentences are spread evenly over README.md and the docs; source
+    modules pad the tree up to sizes.files files in total.
+
+    Returns:
+        Counts of the files written, by kind
+    """
+    repo_dir.mkdir(parents=True, exist_ok=True)
+    (repo_dir / "docs").mkdir(exist_ok=True)
+    (repo_dir / "examples").mkdir(exist_ok=True)
+    (repo_dir / "src" / "synthlib").mkdir(parents=True, exist_ok=True)
+
+    doc_count = max(sizes.docs, 1)
+    per_doc = [sizes.claims // doc_count] * doc_count
+    for i in range(sizes.claims % doc_count):
+        per_doc[i] += 1
+
+    claim = 0
+    for d in range(doc_count):
+        lines = [
+            "---",
+            f"title: {PRODUCT_NAME} Guide {d}",
+            "---",
+            "",
+            f"# {PRODUCT_NAME} Guide {d}" if d else f"# {PRODUCT_NAME}",
+            "",
+        ]
+        for _ in range(per_doc[d]):
+            lines.append(_claim_sentence(claim))
+            lines.append("")
+            claim += 1
+            if claim % 5 == 0:
+                lines.extend([
+                    "```python",
+                    "from synthlib import Scene",
+                    f"scene = Scene.from_file('model_{claim}.obj')",
+                    f"scene.save('model_{claim}.stl')",
+                    "```",
+                    "",
+                ])
+        path = repo_dir / "README.md" if d == 0 else repo_dir / "docs" / f"guide_{d:04d}.md"
+        path.write_text("\n".join(lines), encoding="utf-8")
+
+    for e in range(sizes.examples):
+        fmt = FORMATS[e % len(FORMATS)]
+        (repo_dir / "examples" / f"convert_{fmt.lower()}_{e:04d}.py").write_text(
+            f'"""Convert a scene to {fmt}."""\n'
+            "from synthlib import Scene\n\n\n"
+            f"def convert_{e}(path):\n"
+            f'    """Load a scene and save it as {fmt}."""\n'
+            "    scene = Scene.from_file(path)\n"
+            f"    scene.save(path + '.{fmt.lower()}')\n"
+            "    return scene\n\n\n"
+            'if __name__ == "__main__":\n'
+            f"    convert_{e}('input.obj')\n",
+            encoding="utf-8",
+        )
+
+    (repo_dir / "pyproject.toml").write_text(
+        '[project]\nname = "synthlib"\nversion = "1.0.0"\n', encoding="utf-8"
+    )
+    (repo_dir / "src" / "synthlib" / "__init__.py").write_text(
+        '"""Synthetic product package."""\n\nfrom .scene import Scene\n', encoding="utf-8"
+    )
+    (repo_dir / "src" / "synthlib" / "scene.py").write_text(
+        "class Scene:\n"
+        '    """A 3D scene."""\n\n'
+        "    @classmethod\n"
+        "    def from_file(cls, path):\n"
+        '        """Load a scene from a file."""\n'
+        "        return cls()\n\n"
+        "    def save(self, path):\n"
+        '        """Save the scene to a file."""\n'
+        "        return path\n",
+        encoding="utf-8",
+    )
+
+    written = doc_count + sizes.examples + 3
+    modules = max(sizes.files - written, 0)
+    for m in range(modules):
+        feature = FEATURES[m % len(FEATURES)]
+        (repo_dir / "src" / "synthlib" / f"module_{m:05d}.py").write_text(
+            f'"""{feature.capitalize()} helpers."""\n\n\n'
+            f"class Feature{m}:\n"
+            f'    """Implements {feature}."""\n\n'
+            "    def run(self, scene):\n"
+            f'        """Apply {feature} to a scene."""\n'
+            "        return scene\n",
+            encoding="utf-8",
+        )
+
+    return {"docs": doc_count, "examples": sizes.examples, "modules": modules + 3}
+
+
+def generate_synthetic_site(site_dir: Path, pages: int) -> int:
+    """Write a synthetic Hugo content tree of `pages` markdown pages.
+
+    Pages carry frontmatter, headings, claim markers, code fences and
+    internal/external links, so every content gate has work to do.
+
+    Returns:
+        Number of pages written
+    """
+    section_dir = site_dir / "content" / "docs.aspose.org" / FAMILY / "en" / "python"
+    section_dir.mkdir(parents=True, exist_ok=True)
+    for p in range(pages):
+        nxt = (p + 1) % max(pages, 1)
+        body = [
+            "---",
+            f'title: "{PRODUCT_NAME} Page {p}"',
+            f'description: "Working with {FEATURES[p % len(FEATURES)]} in {PRODUCT_NAME}"',
+            "weight: %d" % (p + 1),
+            "---",
+            "",
+            f"# {PRODUCT_NAME} Page {p}",
+            "",
+            "## Overview",
+            "",
+            f"{_claim_sentence(p)} <!-- claim_id: claim_{p:05d} -->",
+            "",
+            f"See [the next page](/{FAMILY}/python/page-{nxt:05d}/) and "
+            "[the reference](https://reference.aspose.org/3d/python/).",
+            "",
+            "## Example",
+            "",
+            "```python",
+            "from synthlib import Scene",
+            f"scene = Scene.from_file('page_{p}.obj')",
+            "```",
+            "",
+            "![Scene preview](/img/scene.png)",
+            "",
+        ]
+        (section_dir / f"page-{p:05d}.md").write_text("\n".join(body), encoding="utf-8")
+    return pages
+
+
+def generate_synthetic_events(events_file: Path, count: int) -> int:
+    """Write `count` hash-chained events to events_file.
+
+    Events cycle through work items (queued, started, artifact written,
+    finished), the shape a real run produces.
+
+    Returns:
+        Number of events written
+    """
+    from launch.models.event import Event
+    from launch.state.event_log import compute_event_hash
+
+    events_file.parent.mkdir(parents=True, exist_ok=True)
+    ts = datetime(2026, 1, 1, tzinfo=timezone.utc).isoformat()
+    types = ["WORK_ITEM_QUEUED", "WORK_ITEM_STARTED", "ARTIFACT_WRITTEN", "WORK_ITEM_FINISHED"]
+    prev_hash = ""
+    with open(events_file, "w", encoding="utf-8") as f:
+        for i in range(count):
+            item = i // len(types)
+            event_type = types[i % len(types)]
+            payload: Dict[str, Any] = {"work_item_id": f"wi_{item:06d}", "worker": f"w{item % 9 + 1}"}
+            if event_type == "ARTIFACT_WRITTEN":
+                payload.update({"name": f"artifact_{item % 50}.json", "path": f"artifacts/artifact_{item % 50}.json"})
+            event_id = f"evt_{i:08d}"
+            event_hash = compute_event_hash(event_id, ts, event_type, payload, prev_hash)
+            event = Event(
+                event_id=event_id,
+                run_id=RUN_ID,
+                ts=ts,
+                type=event_type,
+                payload=payload,
+                trace_id="bench-trace",
+                span_id=f"span-{item % 64}",
+                prev_hash=prev_hash,
+                event_hash=event_hash,
+            )
+            f.write(json.dumps(event.to_dict(), separators=(",", ":"), sort_keys=True) + "\n")
+            prev_hash = event_hash
+    return count
+
+
+# ---------------------------------------------------------------------------
+# Benchmarks
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class BenchmarkResult:
+    """Timing for one benchmark."""
+
+    name: str
+    unit: str
+    items: int
+    runs: List[float]
+    seconds: float
+    throughput: float
+
+
+class Workspace:
+    """Synthetic run directory shared by the benchmarks (pipeline order)."""
+
+    def __init__(self, root: Path, sizes: SyntheticSizes):
+        self.root = root
+        self.sizes = sizes
+        self.run_dir = root / "runs" / RUN_ID
+        self.repo_dir = self.run_dir / "work" / "repo"
+        self.site_dir = self.run_dir / "work" / "site"
+        self.artifacts_dir = self.run_dir / "artifacts"
+        self.run_config: Dict[str, Any] = {
+            "schema_version": "1.2",
+            "run_id": RUN_ID,
+            "product_slug": FAMILY,
+            "product_name": PRODUCT_NAME,
+            "family": FAMILY,
+            "target_platform": "python",
+            "github_repo_url": "https://github.com/synthetic/synthlib",
+            "github_ref": "main",
+            "required_sections": ["docs"],
+            "site_layout": {
+                "content_root": "content",
+                "subdomain_roots": {"docs": "content/docs.aspose.org"},
+                "localization": {"mode_by_section": {"docs": "dir"}},
+            },
+            "allowed_paths": [],
+            "llm": {"model": "mock", "provider": "mock"},
+            "mcp": {},
+            "telemetry": {"enabled": False},
+            "commit_service": {"type": "direct"},
+            "templates_version": "1.0",
+            "ruleset_version": "1.0",
+            "allow_inference": True,
+            "max_fix_attempts": 3,
+            "budgets": {},
+            "validation_profile": "local",
+            "enrich_claims": False,
+        }
+
+    def prepare(self) -> Dict[str, int]:
+        self.artifacts_dir.mkdir(parents=True, exist_ok=True)
+        counts = generate_synthetic_repo(self.repo_dir, self.sizes)
+        counts["pages"] = generate_synthetic_site(self.site_dir, self.sizes.pages)
+        (self.artifacts_dir / "resolved_refs.json").write_text(
+            json.dumps({
+                "repo": {
+                    "repo_url": self.run_config["github_repo_url"],
+                    "resolved_sha": "0" * 40,
+                }
+            }),
+            encoding="utf-8",
+        )
+        return counts
+
+    def artifact(self, name: str) -> Dict[str, Any]:
+        return json.loads((self.artifacts_dir / name).read_text(encoding="utf-8"))
+
+
+def _w1_fingerprint(ws: Workspace) -> Callable[[], int]:
+    from launch.workers.w1_repo_scout.fingerprint import fingerprint_repo
+
+    return lambda: fingerprint_repo(ws.repo_dir, ws.run_dir)["file_count"]
+
+
+def _w1_discover(ws: Workspace) -> Callable[[], int]:
+    from launch.workers.w1_repo_scout.discover_docs import discover_docs
+    from launch.workers.w1_repo_scout.discover_examples import discover_examples
+
+    def run() -> int:
+        docs = discover_docs(ws.repo_dir, ws.run_dir)
+        examples = discover_examples(ws.repo_dir, ws.run_dir)
+        return len(docs["doc_entrypoint_details"]) + len(examples["example_file_details"])
+
+    return run
+
+
+def _w2_extract(ws: Workspace) -> Callable[[], int]:
+    from launch.io.atomic import atomic_write_json
+    from launch.workers.w2_facts_builder.extract_claims import extract_claims
+
+    def run() -> int:
+        claims = extract_claims(ws.repo_dir, ws.run_dir)
+        atomic_write_json(ws.artifacts_dir / "extracted_claims.json", claims)
+        return len(claims["claims"])
+
+    return run
+
+
+def _w2_map(ws: Workspace) -> Callable[[], int]:
+    from launch.io.atomic import atomic_write_json
+    from launch.workers.w2_facts_builder.map_evidence import map_evidence
+
+    def run() -> int:
+        evidence_map = map_evidence(ws.repo_dir, ws.run_dir, run_id=RUN_ID)
+        atomic_write_json(ws.artifacts_dir / "evidence_map.json", evidence_map)
+        return len(evidence_map["claims"])
+
+    return run
+
+
+def _w2_contradictions(ws: Workspace) -> Callable[[], int]:
+    from launch.io.atomic import atomic_write_json
+    from launch.io.run_layout import RunLayout
+    from launch.workers.w2_facts_builder.detect_contradictions import detect_contradictions
+    from launch.workers.w2_facts_builder.worker import assemble_product_facts
+
+    # detect_contradictions updates evidence_map.json in place; keep the
+    # mapped version so every run sees the same input
+    mapped = (ws.artifacts_dir / "evidence_map.json").read_bytes()
+
+    def run() -> int:
+        (ws.artifacts_dir / "evidence_map.json").write_bytes(mapped)
+        evidence_map = detect_contradictions(ws.run_dir)
+        return len(evidence_map["claims"])
+
+    def finish() -> None:
+        product_facts = assemble_product_facts(RunLayout(run_dir=ws.run_dir), ws.artifact("evidence_map.json"))
+        atomic_write_json(ws.artifacts_dir / "product_facts.json", product_facts)
+
+    run.finish = finish  # type: ignore[attr-defined]
+    return run
+
+
+def _w3_extract(ws: Workspace) -> Callable[[], int]:
+    from launch.workers.w3_snippet_curator.worker import execute_snippet_curator
+
+    def run() -> int:
+        result = execute_snippet_curator(ws.run_dir, ws.run_config, run_id=RUN_ID)
+        if result["status"] != "success":
+            raise RuntimeError(f"W3 failed: {result.get('error')}")
+        return ws.sizes.docs + ws.sizes.examples
+
+    return run
+
+
+def _w4_plan(ws: Workspace) -> Callable[[], int]:
+    from launch.workers.w4_ia_planner.worker import execute_ia_planner
+
+    return lambda: execute_ia_planner(ws.run_dir, ws.run_config)["page_count"]
+
+
+def _w5_draft(ws: Workspace) -> Callable[[], int]:
+    from launch.clients.llm_mock_provider import MockLLMProvider
+    from launch.workers.w5_section_writer.worker import execute_section_writer
+
+    def run() -> int:
+        client = MockLLMProvider(seed=42, run_dir=ws.run_dir)
+        return execute_section_writer(ws.run_dir, ws.run_config, llm_client=client)["draft_count"]
+
+    return run
+
+
+def _w5_5_review(ws: Workspace) -> Callable[[], int]:
+    from launch.workers.w5_5_content_reviewer.worker import execute_content_reviewer
+
+    # Review applies auto-fixes to the drafts; restore them before each run
+    drafts = ws.run_dir / "drafts"
+    pristine = ws.root / "drafts.pristine"
+    if not pristine.exists():
+        shutil.copytree(drafts, pristine)
+
+    def run() -> int:
+        shutil.rmtree(drafts)
+        shutil.copytree(pristine, drafts)
+        return execute_content_reviewer(ws.run_dir, ws.run_config)["pages_reviewed"]
+
+    return run
+
+
+# Content gates that need no external tools (Hugo, network, git)
+W7_GATES = [
+    "gate_4_frontmatter_required_fields",
+    "gate_5_cross_page_link_validity",
+    "gate_6_accessibility",
+    "gate_7_content_quality",
+    "gate_9_navigation_integrity",
+    "gate_p1_page_size_limit",
+    "gate_s1_xss_prevention",
+    "gate_s2_sensitive_data_leak",
+]
+
+
+def _w7_gates(ws: Workspace) -> Callable[[], int]:
+    import importlib
+
+    gates = [
+        importlib.import_module(f"launch.workers.w7_validator.gates.{name}")
+        for name in W7_GATES
+    ]
+
+    def run() -> int:
+        for gate in gates:
+            gate.execute_gate(ws.run_dir, "local")
+        return ws.sizes.pages
+
+    return run
+
+
+def _event_replay(ws: Workspace) -> Callable[[], int]:
+    from launch.state.snapshot_manager import replay_events
+
+    events_file = ws.root / "replay" / "events.ndjson"
+    if not events_file.exists():
+        generate_synthetic_events(events_file, ws.sizes.events)
+
+    def run() -> int:
+        replay_events(events_file, RUN_ID)
+        return ws.sizes.events
+
+    return run
+
+
+@dataclass(frozen=True)
+class Benchmark:
+    name: str
+    unit: str
+    factory: Callable[[Workspace], Callable[[], int]]
+
+
+BENCHMARKS: List[Benchmark] = [
+    Benchmark("w1_fingerprint", "files", _w1_fingerprint),
+    Benchmark("w1_discover", "files", _w1_discover),
+    Benchmark("w2_extract", "claims", _w2_extract),
+    Benchmark("w2_map", "claims", _w2_map),
+    Benchmark("w2_contradictions", "claims", _w2_contradictions),
+    Benchmark("w3_extract", "files", _w3_extract),
+    Benchmark("w4_plan", "pages", _w4_plan),
+    Benchmark("w5_draft", "pages", _w5_draft),
+    Benchmark("w5_5_review", "pages", _w5_5_review),
+    Benchmark("w7_gates", "pages", _w7_gates),
+    Benchmark("event_replay", "events", _event_replay),
+]
+
+
+def run_benchmarks(
+    root: Path,
+    sizes: SyntheticSizes,
+    repeat: int = 3,
+    only: Optional[List[str]] = None,
+    log: Callable[[str], None] = lambda msg: None,
+) -> Dict[str, Any]:
+    """Generate the synthetic workspace under root and run the benchmarks.
+
+    Benchmarks run in pipeline order because each consumes the artifacts of
+    the previous ones; benchmarks not selected by `only` still run once
+    (untimed) when a selected one depends on their output.
+
+    Returns:
+        Results dictionary (see write_results)
+    """
+    ws = Workspace(root, sizes)
+    counts = ws.prepare()
+    selected = set(only) if only else {b.name for b in BENCHMARKS}
+    unknown = selected - {b.name for b in BENCHMARKS}
+    if unknown:
+        raise ValueError(f"Unknown benchmarks: {', '.join(sorted(unknown))}")
+    last = max(i for i, b in enumerate(BENCHMARKS) if b.name in selected)
+
+    results: Dict[str, Any] = {}
+    for bench in BENCHMARKS[: last + 1]:
+        run = bench.factory(ws)
+        timed = bench.name in selected
+        runs: List[float] = []
+        items = 0
+        for _ in range(repeat if timed else 1):
+            started = time.perf_counter()
+            items = run()
+            runs.append(time.perf_counter() - started)
+        finish = getattr(run, "finish", None)
+        if finish is not None:
+            finish()
+        if not timed:
+            continue
+        seconds = statistics.median(runs)
+        result = BenchmarkResult(
+            name=bench.name,
+            unit=bench.unit,
+            items=items,
+            runs=[round(r, 6) for r in runs],
+            seconds=round(seconds, 6),
+            throughput=round(items / seconds, 3) if seconds > 0 else 0.0,
+        )
+        results[bench.name] = asdict(result)
+        log(f"  {bench.name:<18} {seconds * 1000:10.1f} ms  {result.throughput:12.1f} {bench.unit}/s")
+
+    return {
+        "schema_version": SCHEMA_VERSION,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "sizes": asdict(sizes),
+        "generated": counts,
+        "repeat": repeat,
+        "benchmarks": results,
+    }
+
+
+def compare_to_baseline(
+    results: Dict[str, Any],
+    baseline: Dict[str, Any],
+    tolerance: float,
+) -> List[Dict[str, Any]]:
+    """Compare throughput against a baseline results file.
+
+    A benchmark regresses when its throughput falls below
+    baseline * (1 - tolerance). Benchmarks missing from either side are
+    skipped; a sizes mismatch makes every comparison meaningless and raises.
+
+    Returns:
+        One entry per compared benchmark: name, baseline, current, ratio, regressed
+    """
+    if baseline.get("sizes") != results.get("sizes"):
+        raise ValueError(
+            f"Baseline sizes {baseline.get('sizes')} differ from current sizes {results.get('sizes')}"
+        )
+    comparisons = []
+    for name, current in results["benchmarks"].items():
+        base = baseline.get("benchmarks", {}).get(name)
+        if not base or not base.get("throughput"):
+            continue
+        ratio = current["throughput"] / base["throughput"]
+        comparisons.append({
+            "name": name,
+            "baseline": base["throughput"],
+            "current": current["throughput"],
+            "ratio": round(ratio, 3),
+            "regressed": ratio < 1 - tolerance,
+        })
+    return comparisons
+
+
+def _sizes_from_args(args: argparse.Namespace) -> SyntheticSizes:
+    overrides = {
+        field: getattr(args, field)
+        for field in SyntheticSizes.__dataclass_fields__
+        if getattr(args, field) is not None
+    }
+    return SyntheticSizes(**{**asdict(SIZE_PRESETS[args.size]), **overrides})
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Benchmark worker hot paths against a synthetic repo and site"
+    )
+    parser.add_argument("--size", choices=sorted(SIZE_PRESETS), default="small", help="Size preset")
+    for field in SyntheticSizes.__dataclass_fields__:
+        parser.add_argument(f"--{field}", type=int, default=None, help=f"Override the preset's {field} count")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per benchmark (median is reported)")
+    parser.add_argument("--only", default=None, help="Comma-separated benchmark names")
+    parser.add_argument("--output", default=None, help="Write results JSON to this path")
+    parser.add_argument("--baseline", default=None, help="Baseline results JSON to compare against")
+    parser.add_argument(
+        "--tolerance", type=float, default=0.15,
+        help="Allowed fractional throughput drop before a regression is reported (default: 0.15)",
+    )
+    parser.add_argument("--workdir", default=None, help="Keep the synthetic workspace here (default: temp dir)")
+    parser.add_argument("--list", action="store_true", help="List benchmarks and exit")
+    args = parser.parse_args()
+
+    if args.list:
+        for bench in BENCHMARKS:
+            print(f"{bench.name:<18} ({bench.unit})")
+        return 0
+
+    sizes = _sizes_from_args(args)
+    only = [n.strip() for n in args.only.split(",") if n.strip()] if args.only else None
+
+    print(f"Synthetic sizes: {asdict(sizes)}")
+    try:
+        if args.workdir:
+            root = Path(args.workdir)
+            if root.exists():
+                shutil.rmtree(root)
+            results = run_benchmarks(root, sizes, args.repeat, only, log=print)
+        else:
+            with tempfile.TemporaryDirectory(prefix="launch_bench_") as tmp:
+                results = run_benchmarks(Path(tmp), sizes, args.repeat, only, log=print)
+    except Exception as e:
+        print(f"ERROR: benchmark failed: {type(e).__name__}: {e}", file=sys.stderr)
+        return 2
+
+    exit_code = 0
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text(encoding="utf-8"))
+        try:
+            comparisons = compare_to_baseline(results, baseline, args.tolerance)
+        except ValueError as e:
+            print(f"ERROR: {e}", file=sys.stderr)
+            return 2
+        results["baseline"] = {"path": args.baseline, "tolerance": args.tolerance, "comparisons": comparisons}
+        print()
+        print(f"Baseline comparison (tolerance {args.tolerance:.0%}):")
+        for c in comparisons:
+            flag = "REGRESSION" if c["regressed"] else "ok"
+            print(f"  {c['name']:<18} {c['ratio']:6.2f}x  {flag}")
+        if any(c["regressed"] for c in comparisons):
+            exit_code = 1
+
+    if args.output:
+        output = Path(args.output)
+        output.parent.mkdir(parents=True, exist_ok=True)
+        output.write_text(json.dumps(results, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+        print(f"\nResults written to {output}")
+
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
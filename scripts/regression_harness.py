@@ -5,12 +5,14 @@ TC-520: Regression harness for pilot testing.
 Usage:
     python scripts/regression_harness.py --list
     python scripts/regression_harness.py --run-all [--output <path>]
-    python scripts/regression_harness.py --determinism [--output <path>]
+    python scripts/regression_harness.py --determinism [--full-manifest] [--output <path>]
 
 Modes:
 - list: Enumerate and print all pilot IDs (sorted)
 - run-all: Execute each pilot once
 - determinism: Execute each pilot twice and compare artifact checksums
+  (--full-manifest also compares every normalized artifact and draft of the
+  two run directories, stopping at the first mismatch)
 """
 
 from __future__ import annotations
@@ -106,12 +108,57 @@ def run_all_pilots(output_path: Path | None = None) -> Dict[str, Any]:
     return summary
 
 
-def run_determinism_check(output_path: Path | None = None) -> Dict[str, Any]:
+def _resolve_run_dir(repo_root: Path, run_dir: str | None) -> Path | None:
+    """Resolve a report run_dir (relative or absolute) to an existing path."""
+    if not run_dir:
+        return None
+    path = Path(run_dir)
+    if not path.is_absolute():
+        path = repo_root / path
+    return path if path.exists() else None
+
+
+def compare_run_manifests(repo_root: Path, run_dir1: str | None, run_dir2: str | None) -> List[Dict[str, Any]]:
+    """
+    Compare all normalized artifacts of two run directories.
+
+    Uses the golden-run manifest verifier (parallel, cached, streaming hashes)
+    and stops at the first mismatch, since only pass/fail is needed here.
+
+    Returns:
+        List with at most one mismatch dict (empty if runs match or a run_dir is unavailable)
+    """
+    sys.path.insert(0, str(repo_root / "src"))
+    from launch.determinism.golden_run import compare_run_dirs
+
+    path1 = _resolve_run_dir(repo_root, run_dir1)
+    path2 = _resolve_run_dir(repo_root, run_dir2)
+    if path1 is None or path2 is None:
+        return []
+
+    mismatches = []
+    for mismatch in compare_run_dirs(path1, path2, fail_fast=True):
+        artifact = Path(mismatch.artifact_path)
+        if artifact.parts and artifact.parts[0] == "artifacts":
+            artifact = Path(*artifact.parts[1:])
+        mismatches.append({
+            "artifact": artifact.as_posix(),
+            "run1_sha256": mismatch.expected_hash,
+            "run2_sha256": mismatch.actual_hash
+        })
+    return mismatches
+
+
+def run_determinism_check(
+    output_path: Path | None = None,
+    full_manifest: bool = False,
+) -> Dict[str, Any]:
     """
     Run all pilots twice and compare artifact checksums for determinism.
 
     Args:
         output_path: Optional path to write summary JSON
+        full_manifest: Also compare every normalized artifact of both runs
 
     Returns:
         Summary dictionary with determinism check results
@@ -193,6 +240,11 @@ def run_determinism_check(output_path: Path | None = None) -> Dict[str, Any]:
                         "run2_sha256": hash2
                     })
 
+            if full_manifest and not mismatches:
+                mismatches = compare_run_manifests(
+                    repo_root, report1.get("run_dir"), report2.get("run_dir")
+                )
+
             pilot_result["mismatches"] = mismatches
             pilot_result["deterministic"] = len(mismatches) == 0
 
@@ -344,6 +396,11 @@ def main() -> int:
         type=Path,
         help="Path to write summary JSON report (for run-all and determinism modes)"
     )
+    parser.add_argument(
+        "--full-manifest",
+        action="store_true",
+        help="In determinism mode, also compare all normalized run artifacts and drafts"
+    )
 
     args = parser.parse_args()
 
@@ -360,7 +417,9 @@ def main() -> int:
             return 0 if summary["failed"] == 0 else 1
 
         elif args.determinism:
-            summary = run_determinism_check(output_path=args.output)
+            summary = run_determinism_check(
+                output_path=args.output, full_manifest=args.full_manifest
+            )
             return 0 if summary["non_deterministic"] == 0 and summary["failed"] == 0 else 1
 
     except Exception as e:
@@ -1,21 +1,234 @@
 #!/usr/bin/env python3
 """
-TC-903: Multi-pilot VFV batch execution (placeholder for future implementation).
+TC-903: Multi-pilot VFV batch execution.
 
 Usage:
-    python scripts/run_multi_pilot_vfv.py --output <path>
+    python scripts/run_multi_pilot_vfv.py --output <path> [--pilot <id> ...]
+        [--max-parallel N] [--goldenize] [--allow_placeholders] [--approve-branch]
 
-This script will execute VFV harness on all pilots in specs/pilots/.
-Currently a placeholder for future implementation.
+Runs the VFV harness (scripts/run_pilot_vfv.py) for every pilot in
+specs/pilots/ (or the --pilot subset) with up to --max-parallel pilots in
+flight, and writes an aggregated batch report.
+
+Isolation and sharing:
+- Each pilot runs in its own process with explicit RUN_DIRs under
+  runs/<batch_id>/, its own VFV report and its own log file
+- Pilots share the workspace caches: the worker output cache
+  (LAUNCH_WORKER_CACHE_DIR) and the bare clone mirrors
+  (LAUNCH_GIT_MIRROR_DIR), so a repo or product shared by several pilots
+  is cloned and analyzed once
+- The AG-001 approval marker is created once by the batch runner rather
+  than by each pilot, since it is a single shared file
+- A batch-wide LLM budget (LAUNCH_LLM_BATCH_RPM / LAUNCH_LLM_BATCH_TPM) is
+  split evenly across the pilots in flight and enforced in each pilot by
+  its LLM governor (LAUNCH_LLM_RPM / LAUNCH_LLM_TPM). A pilot's W5 section
+  processes split that share again, so the batch stays within the budget
+
+Exit codes:
+    0: all pilots PASS
+    1: at least one pilot FAIL (and none ERROR)
+    2: at least one pilot ERROR
 """
 
+from __future__ import annotations
+
 import argparse
+import contextlib
+import datetime
+import os
 import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from run_pilot import enumerate_pilots, get_repo_root
+from run_pilot_vfv import run_pilot_vfv, write_report
+
+
+def default_max_parallel(pilot_count: int) -> int:
+    """Return the default number of pilots to run at once."""
+    return max(1, min(pilot_count, os.cpu_count() or 1))
+
+
+def configure_shared_caches(repo_root: Path) -> Dict[str, str]:
+    """Point every pilot at the same workspace caches (unless already set).
+
+    Returns:
+        The effective cache environment variables
+    """
+    runs_dir = repo_root / "runs"
+    os.environ.setdefault("LAUNCH_WORKER_CACHE_DIR", str(runs_dir / ".worker_cache"))
+    os.environ.setdefault("LAUNCH_GIT_MIRROR_DIR", str(runs_dir / ".git_mirrors"))
+    return {
+        key: os.environ[key]
+        for key in ("LAUNCH_WORKER_CACHE_DIR", "LAUNCH_GIT_MIRROR_DIR")
+    }
+
+
+def split_llm_budget(max_parallel: int) -> Dict[str, str]:
+    """Divide the batch LLM rate budget between concurrently running pilots.
+
+    Returns:
+        The per-pilot LAUNCH_LLM_RPM/LAUNCH_LLM_TPM values that were set
+    """
+    per_pilot = {}
+    for batch_key, pilot_key in (
+        ("LAUNCH_LLM_BATCH_RPM", "LAUNCH_LLM_RPM"),
+        ("LAUNCH_LLM_BATCH_TPM", "LAUNCH_LLM_TPM"),
+    ):
+        total = os.environ.get(batch_key)
+        if total:
+            os.environ[pilot_key] = str(float(total) / max_parallel)
+            per_pilot[pilot_key] = os.environ[pilot_key]
+    return per_pilot
+
+
+def run_one_pilot(
+    pilot_id: str,
+    goldenize_flag: bool,
+    allow_placeholders: bool,
+    batch_dir: Path,
+) -> Dict[str, Any]:
+    """Run the VFV harness for one pilot with output redirected to its log.
+
+    Runs in a pool worker process. Never raises: harness exceptions are
+    reported as status ERROR.
+
+    Returns:
+        Per-pilot summary entry for the batch report
+    """
+    report_path = batch_dir / "reports" / f"{pilot_id}.json"
+    log_path = batch_dir / "logs" / f"{pilot_id}.log"
+    log_path.parent.mkdir(parents=True, exist_ok=True)
+
+    started = time.monotonic()
+    with open(log_path, "w", encoding="utf-8") as log, \
+            contextlib.redirect_stdout(log), contextlib.redirect_stderr(log):
+        try:
+            report = run_pilot_vfv(
+                pilot_id=pilot_id,
+                goldenize_flag=goldenize_flag,
+                allow_placeholders=allow_placeholders,
+                output_path=report_path,
+                approve_branch=False,
+                runs_dir=batch_dir / "runs",
+            )
+            entry = {
+                "status": report.get("status", "ERROR"),
+                "determinism": report.get("determinism", {}).get("status"),
+            }
+            if report.get("error"):
+                entry["error"] = report["error"]
+        except Exception as e:
+            print(f"ERROR: {e}")
+            entry = {"status": "ERROR", "determinism": None, "error": str(e)}
+
+    entry.update(
+        {
+            "pilot_id": pilot_id,
+            "report_path": str(report_path),
+            "log_path": str(log_path),
+            "duration_seconds": round(time.monotonic() - started, 3),
+        }
+    )
+    return entry
+
+
+def batch_status(pilots: List[Dict[str, Any]]) -> str:
+    """Aggregate per-pilot statuses: ERROR beats FAIL beats PASS."""
+    statuses = {entry["status"] for entry in pilots}
+    if "ERROR" in statuses or not statuses <= {"PASS", "FAIL"}:
+        return "ERROR"
+    if "FAIL" in statuses:
+        return "FAIL"
+    return "PASS"
+
+
+def run_multi_pilot_vfv(
+    output_path: Path,
+    pilot_ids: Optional[List[str]] = None,
+    goldenize_flag: bool = False,
+    allow_placeholders: bool = False,
+    approve_branch: bool = False,
+    max_parallel: Optional[int] = None,
+) -> Dict[str, Any]:
+    """Run the VFV harness for several pilots and write the batch report.
+
+    Args:
+        output_path: Path to write the aggregated JSON report
+        pilot_ids: Pilots to run (default: all pilots, sorted)
+        goldenize_flag: If True, goldenize each pilot's artifacts on PASS
+        allow_placeholders: If True, allow placeholder SHAs
+        approve_branch: If True, create the AG-001 approval marker for the batch
+        max_parallel: Pilots in flight at once (default: min(pilots, CPUs));
+                      1 runs the pilots sequentially in this process
+
+    Returns:
+        Batch report dict
+    """
+    repo_root = get_repo_root()
+    available = enumerate_pilots(repo_root)
+    pilots = sorted(pilot_ids) if pilot_ids else available
+    unknown = [p for p in pilots if p not in available]
+    if unknown:
+        raise ValueError(
+            f"Unknown pilots: {', '.join(unknown)}. Available pilots: {', '.join(available)}"
+        )
+
+    if max_parallel is None:
+        max_parallel = default_max_parallel(len(pilots))
+    max_parallel = max(1, min(max_parallel, len(pilots) or 1))
+
+    batch_id = datetime.datetime.now(datetime.UTC).strftime("vfv_batch_%Y%m%dT%H%M%SZ")
+    batch_dir = repo_root / "runs" / batch_id
+    cache_env = configure_shared_caches(repo_root)
+    llm_budget = split_llm_budget(max_parallel)
+
+    # TC-951: one marker for the whole batch
+    marker_path = repo_root / "runs" / ".git" / "AI_BRANCH_APPROVED"
+    marker_created = False
+    if approve_branch and not marker_path.exists():
+        marker_path.parent.mkdir(parents=True, exist_ok=True)
+        marker_path.write_text("vfv-pilot-validation", encoding="utf-8")
+        marker_created = True
+
+    started = time.monotonic()
+    try:
+        args = [(pilot_id, goldenize_flag, allow_placeholders, batch_dir) for pilot_id in pilots]
+        if max_parallel == 1:
+            entries = [run_one_pilot(*a) for a in args]
+        else:
+            with ProcessPoolExecutor(max_workers=max_parallel) as pool:
+                futures = [pool.submit(run_one_pilot, *a) for a in args]
+                entries = [future.result() for future in futures]
+    finally:
+        if marker_created and marker_path.exists():
+            marker_path.unlink()
+    wall_clock = time.monotonic() - started
+
+    report = {
+        "batch_id": batch_id,
+        "status": batch_status(entries),
+        "max_parallel": max_parallel,
+        "shared_caches": cache_env,
+        "llm_budget_per_pilot": llm_budget,
+        "pilots": {entry["pilot_id"]: entry for entry in entries},
+        "timing": {
+            "wall_clock_seconds": round(wall_clock, 3),
+            "sum_of_pilot_seconds": round(sum(e["duration_seconds"] for e in entries), 3),
+        },
+    }
+    write_report(report, output_path)
+    return report
+
 
 def main() -> int:
+    """Main entry point."""
     parser = argparse.ArgumentParser(
-        description="TC-903: Multi-pilot VFV batch execution (placeholder)"
+        description="TC-903: Multi-pilot VFV batch execution"
     )
     parser.add_argument(
         "--output",
@@ -23,12 +236,64 @@ def main() -> int:
         required=True,
         help="Path to write batch report"
     )
+    parser.add_argument(
+        "--pilot",
+        action="append",
+        dest="pilots",
+        help="Pilot ID to run (repeatable; default: all pilots)"
+    )
+    parser.add_argument(
+        "--max-parallel",
+        type=int,
+        default=None,
+        help="Pilots to run at once (default: min(pilot count, CPU count))"
+    )
+    parser.add_argument(
+        "--goldenize",
+        action="store_true",
+        help="Goldenize artifacts on PASS (only if no placeholders detected)"
+    )
+    parser.add_argument(
+        "--allow_placeholders",
+        action="store_true",
+        help="Allow placeholder SHAs (dev/testing only)"
+    )
+    parser.add_argument(
+        "--approve-branch",
+        action="store_true",
+        help="Automatically approve branch creation for pilot validation (bypasses AG-001)"
+    )
 
     args = parser.parse_args()
 
-    print("Multi-pilot VFV batch execution not yet implemented.")
-    print("Use scripts/run_pilot_vfv.py for single pilot execution.")
-    return 0
+    try:
+        report = run_multi_pilot_vfv(
+            output_path=args.output,
+            pilot_ids=args.pilots,
+            goldenize_flag=args.goldenize,
+            allow_placeholders=args.allow_placeholders,
+            approve_branch=args.approve_branch,
+            max_parallel=args.max_parallel,
+        )
+    except Exception as e:
+        print(f"ERROR: {e}", file=sys.stderr)
+        return 2
+
+    for pilot_id, entry in report["pilots"].items():
+        print(f"{pilot_id}: {entry['status']} ({entry['duration_seconds']}s)")
+    timing = report["timing"]
+    print(
+        f"Batch {report['status']}: wall clock {timing['wall_clock_seconds']}s, "
+        f"sum of pilots {timing['sum_of_pilot_seconds']}s"
+    )
+    print(f"Report written to: {args.output}")
+
+    if report["status"] == "PASS":
+        return 0
+    elif report["status"] == "FAIL":
+        return 1
+    return 2
+
 
 if __name__ == "__main__":
     sys.exit(main())
@@ -85,13 +85,20 @@ def compute_sha256(file_path: Path) -> str:
     return sha256_hash.hexdigest()
 
 
-def execute_pilot_cli(repo_root: Path, config_path: Path) -> Dict[str, Any]:
+def execute_pilot_cli(
+    repo_root: Path,
+    config_path: Path,
+    run_dir: Optional[Path] = None,
+) -> Dict[str, Any]:
     """
     Execute pilot via CLI and capture results.
 
     Args:
         repo_root: Repository root path
         config_path: Path to run_config.pinned.yaml
+        run_dir: Optional explicit RUN_DIR (passed as --run_dir). Concurrent
+                 pilot runs must set it: the newest-directory fallback below
+                 cannot tell their runs apart.
 
     Returns:
         Dictionary with exit_code, run_dir, start/end times
@@ -114,6 +121,8 @@ def execute_pilot_cli(repo_root: Path, config_path: Path) -> Dict[str, Any]:
         "--config",
         str(config_path)
     ]
+    if run_dir is not None:
+        cmd.extend(["--run_dir", str(run_dir)])
 
     started_at = datetime.datetime.now(datetime.UTC)
 
@@ -130,8 +139,10 @@ def execute_pilot_cli(repo_root: Path, config_path: Path) -> Dict[str, Any]:
     finished_at = datetime.datetime.now(datetime.UTC)
 
     # Parse output to find run_dir
-    run_dir = None
-    for line in result.stdout.split("\n") + result.stderr.split("\n"):
+    # (an explicit run_dir is authoritative)
+    run_dir = str(run_dir) if run_dir is not None else None
+    output_lines = [] if run_dir else result.stdout.split("\n") + result.stderr.split("\n")
+    for line in output_lines:
         if "run_dir" in line.lower() or "output directory" in line.lower():
             # Try to extract path
             parts = line.split()
@@ -218,6 +229,7 @@ def run_pilot(
     dry_run: bool = False,
     output_path: Optional[Path] = None,
     export_content: Optional[Path] = None,
+    run_dir: Optional[Path] = None,
 ) -> Dict[str, Any]:
     """
     Run a pilot with optional dry-run mode.
@@ -226,6 +238,8 @@ def run_pilot(
         pilot_id: Pilot identifier
         dry_run: If True, only validate config without execution
         output_path: Optional path to write JSON report
+        export_content: Optional directory to export content_preview into
+        run_dir: Optional explicit RUN_DIR for the CLI run
 
     Returns:
         Report dictionary
@@ -273,7 +287,10 @@ def run_pilot(
 
     # Execute pilot
     try:
-        exec_result = execute_pilot_cli(repo_root, config_path)
+        if run_dir is not None:
+            exec_result = execute_pilot_cli(repo_root, config_path, run_dir=run_dir)
+        else:
+            exec_result = execute_pilot_cli(repo_root, config_path)
         report.update(exec_result)
 
         # Collect artifacts
@@ -300,7 +300,8 @@ def run_pilot_vfv(
     goldenize_flag: bool,
     allow_placeholders: bool,
     output_path: Path,
-    approve_branch: bool = False
+    approve_branch: bool = False,
+    runs_dir: Optional[Path] = None,
 ) -> Dict[str, Any]:
     """
     Run VFV harness: 2 runs, verify both artifacts, check determinism, optionally goldenize.
@@ -311,6 +312,9 @@ def run_pilot_vfv(
         allow_placeholders: If True, allow placeholder SHAs
         output_path: Path to write JSON report
         approve_branch: If True, create approval marker for AG-001 bypass (TC-951)
+        runs_dir: Optional directory for explicit per-run RUN_DIRs
+                  (<runs_dir>/<pilot_id>_run<n>); set by the multi-pilot
+                  batch runner so concurrent pilots never share a RUN_DIR
 
     Returns:
         VFV report dict
@@ -361,7 +365,15 @@ def run_pilot_vfv(
             # Execute pilot
             temp_output = repo_root / "artifacts" / f"pilot_vfv_{pilot_id}_run{run_num}.json"
             try:
-                run_report = run_pilot(pilot_id=pilot_id, dry_run=False, output_path=temp_output)
+                if runs_dir is not None:
+                    run_report = run_pilot(
+                        pilot_id=pilot_id,
+                        dry_run=False,
+                        output_path=temp_output,
+                        run_dir=runs_dir / f"{pilot_id}_run{run_num}",
+                    )
+                else:
+                    run_report = run_pilot(pilot_id=pilot_id, dry_run=False, output_path=temp_output)
             except Exception as e:
                 run_report = {"error": str(e)}
     
@@ -95,7 +95,11 @@ def run_pilot(config_path: Path, run_dir: Path, env_overrides: Dict[str, str] =
         raise RuntimeError("No runs directory found")
 
     # Get most recent run
-    run_dirs = sorted(runs_dir.iterdir(), key=lambda p: p.stat().st_mtime, reverse=True)
+    run_dirs = sorted(
+        (p for p in runs_dir.iterdir() if p.is_dir() and not p.name.startswith(".")),
+        key=lambda p: p.stat().st_mtime,
+        reverse=True,
+    )
     if not run_dirs:
         raise RuntimeError("No run directories found")
 
@@ -20,12 +20,15 @@ import json
 import sys
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 import typer
 from rich.console import Console
 from rich.table import Table
 
+if TYPE_CHECKING:
+    from launch.state.event_index import EventIndex
+
 app = typer.Typer(
     name="launch",
     help="FOSS Launcher - Automated documentation generation system",
@@ -57,6 +60,19 @@ def _load_snapshot(run_dir: Path) -> Optional[Dict[str, Any]]:
         return None
 
 
+def _load_event_index(run_dir: Path) -> Optional[EventIndex]:
+    """Open the events.idx sidecar index for a run (building it if needed)."""
+    from launch.state.event_index import EventIndex
+
+    events_path = run_dir / "events.ndjson"
+    if not events_path.exists():
+        return None
+    try:
+        return EventIndex(events_path)
+    except Exception:
+        return None
+
+
 def _load_run_config(run_dir: Path) -> Optional[Dict[str, Any]]:
     """Load run_config.yaml if it exists."""
     import yaml
@@ -88,12 +104,17 @@ def run(
                                 help="Path to run_config YAML file"),
     run_dir: Optional[Path] = typer.Option(None, "--run_dir", help="Target RUN_DIR (runs/<run_id>)"),
     dry_run: bool = typer.Option(False, "--dry-run", help="Validate config without executing"),
+    delta_from: Optional[str] = typer.Option(
+        None, "--delta-from",
+        help="Base run_id: redraft only pages affected by repo changes since that run",
+    ),
     verbose: bool = typer.Option(False, "--verbose", "-v", help="Increase logging verbosity"),
 ) -> None:
     """Start a new documentation run.
 
     Example:
         launch run --config specs/pilots/pilot-aspose-note-foss-python/run_config.pinned.yaml
+        launch run --config <config> --delta-from <previous_run_id>
 
     Exit codes:
         0 - Success
@@ -127,6 +148,12 @@ def run(
         run_dir = run_dir.resolve()
         run_id = run_dir.name
 
+    if delta_from:
+        if not (run_dir.parent / delta_from).is_dir():
+            console.print(f"[red]ERROR:[/red] Base run not found: {run_dir.parent / delta_from}")
+            raise typer.Exit(1)
+        run_config["delta_from_run_id"] = delta_from
+
     # Check if run already exists
     if run_dir.exists():
         console.print(f"[yellow]WARNING:[/yellow] RUN_DIR already exists: {run_dir}")
@@ -241,6 +268,26 @@ def status(
     else:
         console.print("\n[yellow]No snapshot found[/yellow]")
 
+    # Show event log summary from the sidecar index (reads only the lines it needs)
+    event_index = _load_event_index(run_dir)
+    if event_index is not None and len(event_index):
+        console.print(
+            f"\nEvents: {len(event_index)} (last at {_format_timestamp(event_index.last_ts())})"
+        )
+        state_change = event_index.last("RUN_STATE_CHANGED")
+        if state_change:
+            payload = state_change.get("payload") or {}
+            console.print(
+                f"Last state change: {payload.get('old_state', 'N/A')} -> "
+                f"{payload.get('new_state', 'N/A')} at {_format_timestamp(state_change.get('ts'))}"
+            )
+        if verbose:
+            counts = event_index.count(["LLM_CALL_FINISHED", "ISSUE_OPENED", "ISSUE_RESOLVED"])
+            console.print(
+                f"LLM calls: {counts['LLM_CALL_FINISHED']}, issues opened: {counts['ISSUE_OPENED']}, "
+                f"resolved: {counts['ISSUE_RESOLVED']}"
+            )
+
     # Show config info
     if run_config:
         console.print(f"\n[blue]Configuration:[/blue]")
@@ -273,7 +320,7 @@ def list(
 
     # Get all run directories
     run_dirs = sorted(
-        [d for d in runs_dir.iterdir() if d.is_dir()],
+        [d for d in runs_dir.iterdir() if d.is_dir() and not d.name.startswith(".")],
         key=lambda d: d.stat().st_mtime,
         reverse=True,
     )
@@ -342,6 +389,31 @@ def validate(
         raise typer.Exit(1)
 
 
+@app.command()
+def reindex(
+    run_id: str = typer.Argument(..., help="Run ID whose event index to rebuild"),
+) -> None:
+    """Rebuild a run's events.idx sidecar index from events.ndjson.
+
+    Example:
+        launch reindex aspose-note-foss-python-main-20260128
+
+    Exit codes:
+        0 - Success
+        1 - Run or event log not found
+    """
+    from launch.state.event_index import rebuild_event_index
+
+    run_dir = _runs_dir() / run_id
+    events_path = run_dir / "events.ndjson"
+    if not events_path.exists():
+        console.print(f"[red]ERROR:[/red] No event log for run: {run_id}")
+        raise typer.Exit(1)
+
+    count = rebuild_event_index(events_path)
+    console.print(f"[green]Rebuilt event index:[/green] {count} events")
+
+
 @app.command()
 def cancel(
     run_id: str = typer.Argument(..., help="Run ID to cancel"),
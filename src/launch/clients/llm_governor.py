@@ -0,0 +1,419 @@
+"""Process-wide admission control for LLM provider calls.
+
+Every LLMProviderClient.chat_completion call is admitted through one shared
+governor, so the W2 claim classification/enrichment, W5 drafting, W5.5
+semantic checks and W5.5 regeneration paths cannot collectively exceed the
+provider's limits once they run concurrently.
+
+Admission rules:
+- Token buckets on requests/minute and tokens/minute (0 = unlimited).
+  Token cost is estimated up front and trued up with the reported usage
+- At most max_in_flight calls at once
+- Priority lanes: waiters are admitted strictly in lane order (drafting,
+  then extraction, then review), FIFO within a lane
+- Cooperative backoff: failures are classified with
+  resilience.retry_policy.classify_failure. A rate limit (HTTP 429) pauses
+  admission for every caller (Retry-After when the provider sends one,
+  exponential backoff otherwise); other transient failures back off only
+  the failing call. Permanent and unclassified failures are raised at once
+
+The governor is per process. Process pools that run LLM-calling workers
+(the DAG scheduler's W5 section fan-out) give each child an equal share of
+the parent's limits (GovernorConfig.split), so the pool as a whole stays
+within them.
+
+Configuration (environment):
+    LAUNCH_LLM_RPM            requests per minute (default: unlimited)
+    LAUNCH_LLM_TPM            tokens per minute (default: unlimited)
+    LAUNCH_LLM_MAX_IN_FLIGHT  concurrent calls (default: 4)
+    LAUNCH_LLM_MAX_RETRIES    retries of transient failures (default: 3)
+
+Spec references:
+- specs/28_coordination_and_handoffs.md (retry policy)
+- specs/34_strict_compliance_guarantees.md (Guarantee F: budgets)
+"""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import os
+import threading
+import time
+from dataclasses import dataclass, field, replace
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar
+
+from ..resilience.retry_policy import calculate_backoff, classify_failure
+from ..util.logging import get_logger
+
+logger = get_logger()
+
+T = TypeVar("T")
+
+# Lane name -> priority (lower is admitted first)
+LANE_DRAFTING = "drafting"
+LANE_EXTRACTION = "extraction"
+LANE_REVIEW = "review"
+LANE_DEFAULT = "default"
+
+LANE_PRIORITIES: Dict[str, int] = {
+    LANE_DRAFTING: 0,
+    LANE_EXTRACTION: 1,
+    LANE_DEFAULT: 1,
+    LANE_REVIEW: 2,
+}
+
+# Rough prompt size estimate used before the provider reports usage
+CHARS_PER_TOKEN = 4
+DEFAULT_COMPLETION_TOKENS = 1024
+
+
+def _env_number(name: str, default: float) -> float:
+    try:
+        return float(os.environ.get(name, default))
+    except ValueError:
+        return default
+
+
+@dataclass
+class GovernorConfig:
+    """LLM admission limits.
+
+    Attributes:
+        requests_per_minute: Request rate limit (0 = unlimited)
+        tokens_per_minute: Token rate limit (0 = unlimited)
+        max_in_flight: Maximum concurrent calls
+        max_retries: Retries of transient failures per call
+        base_delay_seconds: Backoff base delay
+        max_delay_seconds: Backoff delay cap
+    """
+
+    requests_per_minute: float = 0
+    tokens_per_minute: float = 0
+    max_in_flight: int = 4
+    max_retries: int = 3
+    base_delay_seconds: float = 1.0
+    max_delay_seconds: float = 60.0
+
+    @classmethod
+    def from_env(cls) -> "GovernorConfig":
+        """Build config from LAUNCH_LLM_* environment variables."""
+        return cls(
+            requests_per_minute=_env_number("LAUNCH_LLM_RPM", 0),
+            tokens_per_minute=_env_number("LAUNCH_LLM_TPM", 0),
+            max_in_flight=max(1, int(_env_number("LAUNCH_LLM_MAX_IN_FLIGHT", 4))),
+            max_retries=max(0, int(_env_number("LAUNCH_LLM_MAX_RETRIES", 3))),
+        )
+
+    def split(self, parts: int) -> "GovernorConfig":
+        """Return one share of these limits for parts independently admitting processes.
+
+        Rate limits are divided evenly (unlimited stays unlimited); each
+        share keeps at least one in-flight slot.
+        """
+        parts = max(1, parts)
+        return replace(
+            self,
+            requests_per_minute=self.requests_per_minute / parts,
+            tokens_per_minute=self.tokens_per_minute / parts,
+            max_in_flight=max(1, self.max_in_flight // parts),
+        )
+
+
+class TokenBucket:
+    """Token bucket refilled continuously at rate_per_minute, capacity one minute."""
+
+    def __init__(self, rate_per_minute: float, now: float):
+        self.rate_per_second = rate_per_minute / 60.0
+        self.capacity = rate_per_minute
+        self.tokens = rate_per_minute
+        self.updated = now
+
+    @property
+    def unlimited(self) -> bool:
+        return self.capacity <= 0
+
+    def _refill(self, now: float) -> None:
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate_per_second)
+        self.updated = now
+
+    def wait_time(self, amount: float, now: float) -> float:
+        """Seconds until amount can be taken (0 if available now)."""
+        if self.unlimited:
+            return 0.0
+        self._refill(now)
+        amount = min(amount, self.capacity)
+        if self.tokens >= amount:
+            return 0.0
+        return (amount - self.tokens) / self.rate_per_second
+
+    def take(self, amount: float, now: float) -> None:
+        if not self.unlimited:
+            self._refill(now)
+            self.tokens -= min(amount, self.capacity)
+
+    def adjust(self, delta: float) -> None:
+        """Charge (positive) or refund (negative) tokens after the fact; may go into debt."""
+        if not self.unlimited:
+            self.tokens = min(self.capacity, self.tokens - delta)
+
+
+@dataclass
+class Permit:
+    """An admitted call slot."""
+
+    lane: str
+    estimated_tokens: int
+    wait_ms: int = 0
+    attempts: int = 0
+    rate_limited: int = 0
+
+
+@dataclass
+class _LaneStats:
+    admitted: int = 0
+    wait_ms: int = 0
+
+
+@dataclass
+class _Metrics:
+    admitted: int = 0
+    retries: int = 0
+    rate_limited: int = 0
+    failed: int = 0
+    wait_ms: int = 0
+    max_in_flight_observed: int = 0
+    lanes: Dict[str, _LaneStats] = field(default_factory=dict)
+
+
+def estimate_tokens(prompt_chars: int, max_tokens: Optional[int]) -> int:
+    """Estimate the token cost of a call before it is made."""
+    return prompt_chars // CHARS_PER_TOKEN + (max_tokens or DEFAULT_COMPLETION_TOKENS)
+
+
+class LLMGovernor:
+    """Shared admission control for LLM calls.
+
+    Usage:
+        governor = get_llm_governor()
+        result, permit = governor.call(lambda: client._call_api(payload),
+                                       lane=LANE_DRAFTING, estimated_tokens=1500,
+                                       usage_tokens=lambda r: r["usage"]["total_tokens"])
+    """
+
+    def __init__(
+        self,
+        config: Optional[GovernorConfig] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.config = config or GovernorConfig.from_env()
+        self._clock = clock
+        now = clock()
+        self._requests = TokenBucket(self.config.requests_per_minute, now)
+        self._tokens = TokenBucket(self.config.tokens_per_minute, now)
+        self._cond = threading.Condition()
+        self._waiters: List[Tuple[int, int]] = []  # heap of (priority, seq)
+        self._seq = itertools.count()
+        self._in_flight = 0
+        self._paused_until = 0.0
+        self._metrics = _Metrics()
+
+    # ------------------------------------------------------------------
+    # Admission
+    # ------------------------------------------------------------------
+
+    def _admission_wait(self, estimated_tokens: int, now: float) -> Optional[float]:
+        """Seconds to wait before admission; 0 = admit now; None = wait for a release."""
+        if self._in_flight >= self.config.max_in_flight:
+            return None
+        return max(
+            self._paused_until - now,
+            self._requests.wait_time(1, now),
+            self._tokens.wait_time(estimated_tokens, now),
+            0.0,
+        )
+
+    def acquire(self, lane: str = LANE_DEFAULT, estimated_tokens: int = 0) -> Permit:
+        """Block until a call in lane may start."""
+        priority = LANE_PRIORITIES.get(lane, LANE_PRIORITIES[LANE_DEFAULT])
+        ticket = (priority, next(self._seq))
+        started = self._clock()
+        with self._cond:
+            heapq.heappush(self._waiters, ticket)
+            try:
+                while True:
+                    now = self._clock()
+                    wait = None
+                    if self._waiters[0] == ticket:
+                        wait = self._admission_wait(estimated_tokens, now)
+                        if wait == 0:
+                            break
+                    self._cond.wait(timeout=wait)
+                heapq.heappop(self._waiters)
+                self._requests.take(1, now)
+                self._tokens.take(estimated_tokens, now)
+                self._in_flight += 1
+
+                wait_ms = int((now - started) * 1000)
+                m = self._metrics
+                m.admitted += 1
+                m.wait_ms += wait_ms
+                m.max_in_flight_observed = max(m.max_in_flight_observed, self._in_flight)
+                lane_stats = m.lanes.setdefault(lane, _LaneStats())
+                lane_stats.admitted += 1
+                lane_stats.wait_ms += wait_ms
+            except BaseException:
+                if ticket in self._waiters:
+                    self._waiters.remove(ticket)
+                    heapq.heapify(self._waiters)
+                raise
+            finally:
+                # The next waiter may now be at the head
+                self._cond.notify_all()
+        return Permit(lane=lane, estimated_tokens=estimated_tokens, wait_ms=wait_ms)
+
+    def release(self, permit: Permit, actual_tokens: Optional[int] = None) -> None:
+        """Return a call slot, truing up the token estimate with actual usage."""
+        with self._cond:
+            self._in_flight -= 1
+            if actual_tokens is not None:
+                self._tokens.adjust(actual_tokens - permit.estimated_tokens)
+            self._cond.notify_all()
+
+    def pause(self, seconds: float) -> None:
+        """Stop admitting any call for the given number of seconds."""
+        with self._cond:
+            self._paused_until = max(self._paused_until, self._clock() + seconds)
+            self._cond.notify_all()
+
+    # ------------------------------------------------------------------
+    # Calls with cooperative backoff
+    # ------------------------------------------------------------------
+
+    def call(
+        self,
+        fn: Callable[[], T],
+        lane: str = LANE_DEFAULT,
+        estimated_tokens: int = 0,
+        usage_tokens: Optional[Callable[[T], Optional[int]]] = None,
+    ) -> Tuple[T, Permit]:
+        """Run fn under admission control, retrying transient failures.
+
+        Args:
+            fn: The provider call
+            lane: Priority lane
+            estimated_tokens: Token estimate charged at admission
+            usage_tokens: Extracts actual total tokens from fn's result
+
+        Returns:
+            (fn result, permit of the successful attempt with cumulative
+            attempts/wait/rate-limit counts)
+
+        Raises:
+            Exception: The last failure, once it is permanent, unclassified
+                       or out of retries
+        """
+        attempts = 0
+        total_wait_ms = 0
+        rate_limited = 0
+        while True:
+            permit = self.acquire(lane, estimated_tokens)
+            attempts += 1
+            total_wait_ms += permit.wait_ms
+            try:
+                result = fn()
+            except Exception as e:
+                self.release(permit)
+                delay, is_rate_limit = self._backoff(e, attempts)
+                if delay is None:
+                    with self._cond:
+                        self._metrics.failed += 1
+                    raise
+                with self._cond:
+                    self._metrics.retries += 1
+                if is_rate_limit:
+                    rate_limited += 1
+                    with self._cond:
+                        self._metrics.rate_limited += 1
+                    logger.warning("llm_governor_rate_limited", lane=lane, attempt=attempts, delay_s=delay)
+                    self.pause(delay)
+                else:
+                    logger.warning("llm_governor_retry", lane=lane, attempt=attempts, delay_s=delay, error=str(e))
+                    time.sleep(delay)
+                continue
+
+            actual = None
+            if usage_tokens is not None:
+                try:
+                    actual = usage_tokens(result)
+                except Exception:
+                    actual = None
+            self.release(permit, actual)
+            permit.attempts = attempts
+            permit.wait_ms = total_wait_ms
+            permit.rate_limited = rate_limited
+            return result, permit
+
+    def _backoff(self, error: Exception, attempts: int) -> Tuple[Optional[float], bool]:
+        """Return (delay before retrying, is rate limit); delay None = do not retry."""
+        classification = classify_failure(error)
+        is_rate_limit = getattr(error, "status_code", None) == 429 or classification.reason.startswith(
+            "API rate limit"
+        )
+        if not classification.is_transient or classification.suggested_action != "retry":
+            return None, is_rate_limit
+        if attempts > self.config.max_retries:
+            return None, is_rate_limit
+        retry_after = getattr(error, "retry_after", None)
+        if retry_after is not None:
+            return min(float(retry_after), self.config.max_delay_seconds), is_rate_limit
+        delay = calculate_backoff(
+            attempts - 1,
+            self.config.base_delay_seconds,
+            2.0,
+            self.config.max_delay_seconds,
+        )
+        return delay, is_rate_limit
+
+    # ------------------------------------------------------------------
+    # Metrics
+    # ------------------------------------------------------------------
+
+    def metrics(self) -> Dict[str, Any]:
+        """Snapshot of cumulative governor metrics."""
+        with self._cond:
+            m = self._metrics
+            return {
+                "admitted": m.admitted,
+                "retries": m.retries,
+                "rate_limited": m.rate_limited,
+                "failed": m.failed,
+                "wait_ms": m.wait_ms,
+                "in_flight": self._in_flight,
+                "max_in_flight_observed": m.max_in_flight_observed,
+                "lanes": {
+                    lane: {"admitted": s.admitted, "wait_ms": s.wait_ms}
+                    for lane, s in sorted(m.lanes.items())
+                },
+            }
+
+
+_GOVERNOR: Optional[LLMGovernor] = None
+_GOVERNOR_LOCK = threading.Lock()
+
+
+def get_llm_governor() -> LLMGovernor:
+    """Return the process-wide governor, creating it from the environment on first use."""
+    global _GOVERNOR
+    with _GOVERNOR_LOCK:
+        if _GOVERNOR is None:
+            _GOVERNOR = LLMGovernor()
+        return _GOVERNOR
+
+
+def reset_llm_governor(config: Optional[GovernorConfig] = None) -> LLMGovernor:
+    """Replace the process-wide governor (tests, or after changing limits)."""
+    global _GOVERNOR
+    with _GOVERNOR_LOCK:
+        _GOVERNOR = LLMGovernor(config)
+        return _GOVERNOR
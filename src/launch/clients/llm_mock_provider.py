@@ -16,6 +16,8 @@ import time
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from ..io.llm_evidence_store import get_llm_evidence_writer
+
 
 class MockLLMProvider:
     """Mock LLM provider for offline/deterministic testing.
@@ -67,6 +69,7 @@ class MockLLMProvider:
         max_tokens: Optional[int] = None,
         response_format: Optional[Dict[str, Any]] = None,
         tools: Optional[List[Dict[str, Any]]] = None,
+        priority: Optional[str] = None,
     ) -> Dict[str, Any]:
         """Generate deterministic mock response.
 
@@ -77,6 +80,7 @@ class MockLLMProvider:
             max_tokens: Ignored
             response_format: Optional response format hint
             tools: Optional tool definitions (ignored)
+            priority: Governor lane (ignored; the mock is never rate limited)
 
         Returns:
             Response dict with:
@@ -266,7 +270,7 @@ class MockLLMProvider:
         prompt_hash: str,
         latency_ms: int,
     ) -> Path:
-        """Save request/response evidence to disk.
+        """Append request/response evidence to the segmented evidence store.
 
         Args:
             call_id: Call identifier
@@ -276,10 +280,9 @@ class MockLLMProvider:
             latency_ms: Mock latency in milliseconds
 
         Returns:
-            Path to evidence file
+            Logical evidence path (<evidence_dir>/<call_id>.json), resolvable
+            with LLMEvidenceReader
         """
-        evidence_file = self.evidence_dir / f"{call_id}.json"
-
         evidence = {
             "call_id": call_id,
             "prompt_hash": prompt_hash,
@@ -296,15 +299,9 @@ class MockLLMProvider:
             },
         }
 
-        # Write atomically
-        tmp_file = evidence_file.with_suffix(".json.tmp")
-        with open(tmp_file, "w", encoding="utf-8") as f:
-            json.dump(evidence, f, ensure_ascii=False, indent=2, sort_keys=True)
-
-        import os
-        os.replace(tmp_file, evidence_file)
+        get_llm_evidence_writer(self.evidence_dir).append(evidence)
 
-        return evidence_file
+        return self.evidence_dir / f"{call_id}.json"
 
     def get_prompt_version(self, messages: List[Dict[str, str]]) -> str:
         """Get prompt version (hash) for telemetry.
@@ -19,7 +19,9 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 from .http import http_post
+from .llm_governor import LANE_DEFAULT, estimate_tokens, get_llm_governor
 from .llm_telemetry import LLMTelemetryContext
+from ..io.llm_evidence_store import get_llm_evidence_writer
 from ..state.event_log import generate_trace_id
 from ..util.logging import get_logger
 
@@ -35,6 +37,25 @@ class LLMError(Exception):
     pass
 
 
+class LLMHTTPError(Exception):
+    """Non-200 response from the provider API (classified by the governor)."""
+
+    def __init__(self, status_code: int, text: str, retry_after: Optional[float] = None):
+        super().__init__(f"LLM API error ({status_code}): {text}")
+        self.status_code = status_code
+        self.retry_after = retry_after
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header given in seconds (HTTP-date values are ignored)."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        return None
+
+
 class LLMProviderClient:
     """Client for OpenAI-compatible LLM provider with deterministic settings.
 
@@ -110,9 +131,15 @@ class LLMProviderClient:
         max_tokens: Optional[int] = None,
         response_format: Optional[Dict[str, Any]] = None,
         tools: Optional[List[Dict[str, Any]]] = None,
+        priority: str = LANE_DEFAULT,
     ) -> Dict[str, Any]:
         """Chat completion with evidence capture and telemetry tracking.
 
+        The provider call is admitted through the process-wide LLM governor
+        (see llm_governor.py), which rate-limits, bounds concurrency, orders
+        callers by priority lane and retries rate limits and transient
+        failures.
+
         Args:
             messages: List of message dicts (role, content)
             call_id: Optional call ID for evidence filename
@@ -120,6 +147,7 @@ class LLMProviderClient:
             max_tokens: Optional max_tokens override
             response_format: Optional response format (e.g., {"type": "json_object"})
             tools: Optional tool definitions for function calling
+            priority: Governor lane (llm_governor.LANE_*)
 
         Returns:
             Response dict with:
@@ -184,12 +212,30 @@ class LLMProviderClient:
             if tools:
                 request_payload["tools"] = tools
 
-            # Make API call
+            # Make API call under governor admission control
+            governor = get_llm_governor()
+            estimated = estimate_tokens(
+                sum(len(str(m.get("content", ""))) for m in messages),
+                effective_max_tokens,
+            )
             try:
-                response_data = self._call_api(request_payload)
+                response_data, permit = governor.call(
+                    lambda: self._call_api(request_payload),
+                    lane=priority,
+                    estimated_tokens=estimated,
+                    usage_tokens=lambda r: (r.get("usage") or {}).get("total_tokens"),
+                )
             except Exception as e:
                 logger.error("llm_call_failed", call_id=call_id, error=str(e))
                 raise LLMError(f"LLM API call failed: {str(e)}")
+            telemetry.record_governor(
+                {
+                    "lane": permit.lane,
+                    "attempts": permit.attempts,
+                    "wait_ms": permit.wait_ms,
+                    "rate_limited": permit.rate_limited,
+                }
+            )
 
             end_time = time.time()
             latency_ms = int((end_time - start_time) * 1000)
@@ -279,7 +325,8 @@ class LLMProviderClient:
             Response data dict
 
         Raises:
-            Exception: On API error
+            LLMHTTPError: On a non-200 response
+            Exception: On transport errors
         """
         url = f"{self.api_base_url}/chat/completions"
 
@@ -306,8 +353,11 @@ class LLMProviderClient:
         )
 
         if response.status_code != 200:
-            raise Exception(
-                f"LLM API error ({response.status_code}): {response.text}"
+            headers = getattr(response, "headers", None) or {}
+            raise LLMHTTPError(
+                response.status_code,
+                response.text,
+                retry_after=_parse_retry_after(headers.get("Retry-After")),
             )
 
         return response.json()
@@ -320,7 +370,7 @@ class LLMProviderClient:
         prompt_hash: str,
         latency_ms: int,
     ) -> Path:
-        """Save request/response evidence to disk.
+        """Append request/response evidence to the segmented evidence store.
 
         Args:
             call_id: Call identifier
@@ -330,10 +380,9 @@ class LLMProviderClient:
             latency_ms: Latency in milliseconds
 
         Returns:
-            Path to evidence file
+            Logical evidence path (<evidence_dir>/<call_id>.json), resolvable
+            with LLMEvidenceReader
         """
-        evidence_file = self.evidence_dir / f"{call_id}.json"
-
         evidence = {
             "call_id": call_id,
             "prompt_hash": prompt_hash,
@@ -345,12 +394,8 @@ class LLMProviderClient:
             "timestamp": time.time(),
         }
 
-        # Write atomically
-        tmp_file = evidence_file.with_suffix(".json.tmp")
-        with open(tmp_file, "w", encoding="utf-8") as f:
-            json.dump(evidence, f, ensure_ascii=False, indent=2, sort_keys=True)
-
-        os.replace(tmp_file, evidence_file)
+        get_llm_evidence_writer(self.evidence_dir).append(evidence)
+        evidence_file = self.evidence_dir / f"{call_id}.json"
 
         logger.info(
             "llm_evidence_saved",
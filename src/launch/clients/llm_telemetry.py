@@ -164,6 +164,9 @@ class LLMTelemetryContext:
         # Track token usage (populated by record_usage())
         self.usage: Optional[Dict[str, Any]] = None
 
+        # Track governor admission stats (populated by record_governor())
+        self.governor: Optional[Dict[str, Any]] = None
+
         # Track error (populated in __exit__ on exception)
         self.error: Optional[Exception] = None
 
@@ -293,6 +296,8 @@ class LLMTelemetryContext:
                         "total_tokens": self.usage.get("total_tokens", 0),
                         "finish_reason": self.usage.get("finish_reason", "stop"),
                     }
+                    if self.governor:
+                        metrics_json["governor"] = self.governor
 
                     # Calculate cost
                     input_tokens = self.usage.get("input_tokens", 0)
@@ -360,6 +365,7 @@ class LLMTelemetryContext:
                                 self.usage.get("input_tokens", 0),
                                 self.usage.get("output_tokens", 0),
                             ),
+                            **({"governor": self.governor} if self.governor else {}),
                         },
                         trace_id=self.trace_id,
                         span_id=self.span_id,
@@ -421,3 +427,14 @@ class LLMTelemetryContext:
         Spec reference: specs/16_local_telemetry_api.md (metrics_json Structure)
         """
         self.usage = usage
+
+    def record_governor(self, stats: Dict[str, Any]) -> None:
+        """Record LLM governor admission stats for this call.
+
+        Added to the LLM_CALL_FINISHED payload and telemetry metrics_json
+        under "governor".
+
+        Args:
+            stats: lane, attempts, wait_ms and rate_limited (see llm_governor.Permit)
+        """
+        self.governor = stats
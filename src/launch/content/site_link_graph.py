@@ -0,0 +1,416 @@
+"""
+Site Link Graph - In-memory index of pages, links and heading anchors.
+
+Built once per site directory from a single directory walk and one read per
+markdown page. Link validity (Gate 5) and navigation integrity (Gate 9) query
+the graph instead of resolving every link with filesystem syscalls.
+
+Graph model:
+- Nodes are markdown pages keyed by site-relative POSIX path
+- Each node carries its heading anchor set, raw front matter and outbound edges
+- Edges keep the raw URL, path and anchor; resolution against the in-memory
+  path set happens at query time, so adding/removing a page never requires
+  re-parsing the pages that link to it
+
+Incremental updates:
+- update_page() re-parses a single page
+- remove_page() drops a page and its edges
+- refresh() re-walks the tree and re-parses only pages whose (size, mtime_ns)
+  changed, which is what the validate -> fix loop needs
+
+Per specs/09_validation_gates.md (Gate 6 Internal Links) link resolution
+follows Hugo conventions: exact path, then <link>.md, <link>/_index.md and
+<link>/index.md.
+"""
+
+import bisect
+import os
+import posixpath
+import re
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from urllib.parse import urlparse
+
+# Markdown inline links: [text](url) or [text](url#anchor)
+LINK_PATTERN = re.compile(r"\[([^\]]+)\]\(([^)]+)\)")
+
+# ATX headings with optional explicit Hugo id: ## Title {#custom-id}
+_HEADING_PATTERN = re.compile(r"^\s{0,3}#{1,6}\s+(.*?)\s*#*\s*$")
+_EXPLICIT_ID_PATTERN = re.compile(r"\{#([^}\s]+)\}\s*$")
+_FRONTMATTER_PATTERN = re.compile(r"^---\s*\n(.*?\n)---\s*\n", re.DOTALL)
+
+_EXTERNAL_SCHEMES = {"http", "https", "mailto", "ftp"}
+
+# Directories never containing site pages; pruned from the walk
+_SKIP_DIRS = {".git", ".hg", ".svn", "node_modules"}
+
+
+def anchorize(heading: str) -> str:
+    """Convert heading text to a Hugo-style (GitHub flavored) anchor id.
+
+    Args:
+        heading: Heading text without leading #'s
+
+    Returns:
+        Anchor id (lowercase, punctuation removed, spaces -> hyphens)
+    """
+    text = re.sub(r"`|\*\*|__|\*|_(?=\W)|(?<=\W)_", "", heading.strip())
+    text = re.sub(r"\[([^\]]*)\]\([^)]*\)", r"\1", text)
+    text = text.lower()
+    text = re.sub(r"[^\w\- ]", "", text)
+    return text.replace(" ", "-")
+
+
+@dataclass(frozen=True)
+class LinkEdge:
+    """A relative link found in a page (external and absolute links are not edges)."""
+
+    source: str
+    url: str
+    path: str
+    anchor: str
+    line: int
+
+
+@dataclass
+class PageNode:
+    """A markdown page in the site."""
+
+    path: str
+    anchors: Set[str] = field(default_factory=set)
+    links: List[LinkEdge] = field(default_factory=list)
+    front_matter: Optional[str] = None
+    read_error: Optional[str] = None
+    stat_key: Tuple[int, int] = (0, 0)
+
+
+def _sort_key(rel_path: str) -> Tuple[str, ...]:
+    """Sort key matching Path ordering (component-wise)."""
+    return tuple(rel_path.split("/"))
+
+
+def _strip_code_blocks(content: str) -> Tuple[str, List[int], List[int]]:
+    """Drop fenced code blocks, keeping a map back to original line numbers.
+
+    Returns:
+        Tuple of (content_without_code, kept_line_offsets, kept_line_numbers)
+    """
+    kept: List[str] = []
+    offsets: List[int] = []
+    line_numbers: List[int] = []
+    in_code_block = False
+    offset = 0
+    for line_no, line in enumerate(content.split("\n"), start=1):
+        if line.strip().startswith("```"):
+            in_code_block = not in_code_block
+            continue
+        if not in_code_block:
+            offsets.append(offset)
+            line_numbers.append(line_no)
+            kept.append(line)
+            offset += len(line) + 1
+    return "\n".join(kept), offsets, line_numbers
+
+
+def parse_page(rel_path: str, content: str) -> PageNode:
+    """Parse a page's links, heading anchors and front matter.
+
+    Args:
+        rel_path: Site-relative POSIX path of the page
+        content: Page content
+
+    Returns:
+        PageNode (stat_key is filled in by the graph)
+    """
+    node = PageNode(path=rel_path)
+
+    fm_match = _FRONTMATTER_PATTERN.match(content)
+    if fm_match:
+        node.front_matter = fm_match.group(1)
+
+    content_no_code, offsets, line_numbers = _strip_code_blocks(content)
+
+    # Heading anchors (outside code blocks), with Hugo duplicate suffixes
+    seen: Dict[str, int] = {}
+    for line in content_no_code.split("\n"):
+        heading = _HEADING_PATTERN.match(line)
+        if not heading:
+            continue
+        text = heading.group(1)
+        explicit = _EXPLICIT_ID_PATTERN.search(text)
+        if explicit:
+            node.anchors.add(explicit.group(1))
+            continue
+        anchor = anchorize(text)
+        if not anchor:
+            continue
+        count = seen.get(anchor, 0)
+        seen[anchor] = count + 1
+        node.anchors.add(anchor if count == 0 else f"{anchor}-{count}")
+
+    for match in LINK_PATTERN.finditer(content_no_code):
+        link_url = match.group(2)
+        parsed = urlparse(link_url)
+        if parsed.scheme in _EXTERNAL_SCHEMES:
+            continue
+        # Absolute paths starting with / are Hugo-routed, not file links
+        if link_url.startswith("/"):
+            continue
+        kept_index = bisect.bisect_right(offsets, match.start()) - 1
+        node.links.append(
+            LinkEdge(
+                source=rel_path,
+                url=link_url,
+                path=parsed.path,
+                anchor=parsed.fragment,
+                line=line_numbers[kept_index] if kept_index >= 0 else 1,
+            )
+        )
+
+    return node
+
+
+class SiteLinkGraph:
+    """In-memory link graph of a Hugo site tree.
+
+    Usage:
+        graph = get_site_link_graph(site_dir)   # cached, refreshed on access
+        for edge, target in graph.iter_resolved_links():
+            if target is None:
+                ...  # broken link
+    """
+
+    def __init__(self, site_dir: Path) -> None:
+        """Initialize an empty graph for site_dir (call build() to populate)."""
+        self.site_dir = Path(site_dir)
+        self.nodes: Dict[str, PageNode] = {}
+        self.files: Dict[str, Tuple[int, int]] = {}
+        self.dirs: Set[str] = set()
+        self.pages_parsed = 0
+
+    # ------------------------------------------------------------------
+    # Construction and incremental updates
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def from_site_dir(cls, site_dir: Path) -> "SiteLinkGraph":
+        """Build a graph by walking site_dir once."""
+        graph = cls(site_dir)
+        graph.refresh()
+        return graph
+
+    def _walk(self) -> Dict[str, Tuple[int, int]]:
+        """List all files under site_dir with their (size, mtime_ns)."""
+        files: Dict[str, Tuple[int, int]] = {}
+        root = str(self.site_dir)
+        for dirpath, dirnames, filenames in os.walk(root):
+            dirnames[:] = [d for d in dirnames if d not in _SKIP_DIRS]
+            rel_dir = os.path.relpath(dirpath, root).replace(os.sep, "/")
+            for name in filenames:
+                rel = name if rel_dir == "." else f"{rel_dir}/{name}"
+                try:
+                    st = os.stat(os.path.join(dirpath, name))
+                except OSError:
+                    continue
+                files[rel] = (st.st_size, st.st_mtime_ns)
+        return files
+
+    def _rebuild_dirs(self) -> None:
+        dirs: Set[str] = set()
+        for rel in self.files:
+            parent = posixpath.dirname(rel)
+            while parent and parent not in dirs:
+                dirs.add(parent)
+                parent = posixpath.dirname(parent)
+        self.dirs = dirs
+
+    def refresh(self) -> List[str]:
+        """Re-walk the site and re-parse only new or changed pages.
+
+        Returns:
+            Sorted list of pages that were (re)parsed or removed
+        """
+        files = self._walk()
+        changed: List[str] = []
+
+        for rel in list(self.nodes):
+            if rel not in files:
+                self.nodes.pop(rel)
+                changed.append(rel)
+
+        for rel, stat_key in files.items():
+            if not rel.endswith(".md"):
+                continue
+            node = self.nodes.get(rel)
+            if node is None or node.stat_key != stat_key:
+                self._parse_into(rel, stat_key)
+                changed.append(rel)
+
+        self.files = files
+        self._rebuild_dirs()
+        return sorted(changed, key=_sort_key)
+
+    def update_page(self, rel_path: str, content: Optional[str] = None) -> None:
+        """Re-index a single page after it changed (or was created).
+
+        Args:
+            rel_path: Site-relative path of the page
+            content: New content; read from disk when None
+        """
+        rel_path = rel_path.replace("\\", "/")
+        file_path = self.site_dir / rel_path
+        try:
+            st = file_path.stat()
+            stat_key = (st.st_size, st.st_mtime_ns)
+        except OSError:
+            stat_key = (len(content or ""), 0)
+        if rel_path not in self.files:
+            self.files[rel_path] = stat_key
+            self._rebuild_dirs()
+        else:
+            self.files[rel_path] = stat_key
+        if rel_path.endswith(".md"):
+            self._parse_into(rel_path, stat_key, content=content)
+
+    def remove_page(self, rel_path: str) -> None:
+        """Remove a page (or any file) from the graph."""
+        rel_path = rel_path.replace("\\", "/")
+        self.nodes.pop(rel_path, None)
+        if self.files.pop(rel_path, None) is not None:
+            self._rebuild_dirs()
+
+    def _parse_into(
+        self,
+        rel_path: str,
+        stat_key: Tuple[int, int],
+        content: Optional[str] = None,
+    ) -> None:
+        if content is None:
+            try:
+                content = (self.site_dir / rel_path).read_text(encoding="utf-8")
+            except Exception as e:
+                self.nodes[rel_path] = PageNode(path=rel_path, read_error=str(e), stat_key=stat_key)
+                return
+        node = parse_page(rel_path, content)
+        node.stat_key = stat_key
+        self.nodes[rel_path] = node
+        self.pages_parsed += 1
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def pages(self) -> List[str]:
+        """All markdown pages, in deterministic (Path-compatible) order."""
+        return sorted(self.nodes, key=_sort_key)
+
+    def has_page(self, rel_path: str) -> bool:
+        """True if rel_path is a markdown page in the site."""
+        return rel_path in self.nodes
+
+    def path_exists(self, rel_path: str) -> bool:
+        """True if rel_path is a file or directory in the site (in-memory)."""
+        return rel_path == "" or rel_path in self.files or rel_path in self.dirs
+
+    def resolve_link(self, source: str, link_path: str) -> Optional[str]:
+        """Resolve a relative link from source using Hugo conventions.
+
+        Tries the exact path, then <link>.md, <link>/_index.md and
+        <link>/index.md. Targets escaping the site root fall back to a
+        filesystem check.
+
+        Args:
+            source: Site-relative path of the linking page
+            link_path: Link path without anchor/query
+
+        Returns:
+            Site-relative target path ("" for the site root), or None if broken
+        """
+        base = posixpath.dirname(source)
+        candidates = [posixpath.join(base, link_path)]
+        link_no_slash = link_path.rstrip("/")
+        if link_no_slash:
+            candidates.append(posixpath.join(base, f"{link_no_slash}.md"))
+            candidates.append(posixpath.join(base, link_no_slash, "_index.md"))
+            candidates.append(posixpath.join(base, link_no_slash, "index.md"))
+
+        for candidate in candidates:
+            normalized = posixpath.normpath(candidate)
+            if normalized == ".":
+                normalized = ""
+            if normalized == ".." or normalized.startswith("../"):
+                # Outside the indexed tree: defer to the filesystem
+                if (self.site_dir / normalized).resolve().exists():
+                    return normalized
+                continue
+            if self.path_exists(normalized):
+                return normalized
+        return None
+
+    def page_for_target(self, target: str) -> Optional[str]:
+        """Map a resolved target (file or directory) to the page holding its anchors."""
+        if target in self.nodes:
+            return target
+        for index_name in ("_index.md", "index.md"):
+            candidate = posixpath.join(target, index_name) if target else index_name
+            if candidate in self.nodes:
+                return candidate
+        return None
+
+    def anchor_exists(self, page: str, anchor: str) -> bool:
+        """True if page defines a heading anchor with this id."""
+        node = self.nodes.get(page)
+        return node is not None and anchor in node.anchors
+
+    def iter_resolved_links(self) -> Iterable[Tuple[LinkEdge, Optional[str]]]:
+        """Yield (edge, resolved_target) for every relative link, in page order.
+
+        Anchor-only links resolve to their own page.
+        """
+        for page in self.pages():
+            for edge in self.nodes[page].links:
+                if not edge.path:
+                    yield edge, page
+                else:
+                    yield edge, self.resolve_link(page, edge.path)
+
+    def inbound_links(self, page: str) -> List[LinkEdge]:
+        """All edges whose resolved target is page."""
+        result = []
+        for edge, target in self.iter_resolved_links():
+            if target is not None and self.page_for_target(target) == page and edge.source != page:
+                result.append(edge)
+        return result
+
+
+# ----------------------------------------------------------------------
+# Per-site cache shared by gates within a validation run
+# ----------------------------------------------------------------------
+
+_GRAPHS: Dict[str, SiteLinkGraph] = {}
+_GRAPHS_LOCK = threading.Lock()
+
+
+def get_site_link_graph(site_dir: Path) -> SiteLinkGraph:
+    """Return the cached graph for site_dir, refreshed against disk.
+
+    The first call builds the graph; later calls (Gate 9 after Gate 5, or the
+    next validation pass in the fix loop) only re-parse changed pages.
+    """
+    key = str(Path(site_dir).resolve())
+    with _GRAPHS_LOCK:
+        graph = _GRAPHS.get(key)
+        if graph is None:
+            graph = SiteLinkGraph.from_site_dir(Path(site_dir))
+            _GRAPHS[key] = graph
+        else:
+            graph.refresh()
+        return graph
+
+
+def clear_site_link_graphs() -> None:
+    """Drop all cached site graphs."""
+    with _GRAPHS_LOCK:
+        _GRAPHS.clear()
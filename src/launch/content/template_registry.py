@@ -0,0 +1,384 @@
+"""Precompiled registry of page templates (specs/templates).
+
+W4 IAPlanner used to rglob the template tree for every section of every
+plan, read each template to regex-extract placeholders, and read it again to
+parse the frontmatter title; W5 SectionWriter then read it a third time to
+apply token mappings. The registry scans the tree once and keeps, per
+template:
+
+- placeholders (__NAME__ tokens, without the underscores)
+- frontmatter title (or why it could not be extracted)
+- slug and variant (from the filename) and the "mandatory: true" marker
+- the raw body, read lazily on first use
+
+Design decisions:
+- Records are keyed by path relative to the templates root
+- The registry is keyed by a sha256 over every template's relative path and
+  content. It is persisted as JSON (LAUNCH_TEMPLATE_REGISTRY_DIR, or
+  <runs dir>/.template_registry for W4) and reused by later runs and other
+  processes with the same key
+- In-process, a registry is reused while the tree's (path, size, mtime_ns)
+  fingerprint is unchanged and the newest file is older than
+  RACY_WINDOW_NS; otherwise the content key is recomputed
+- Bodies are only served from memory while the file's size and mtime still
+  match the record; otherwise they are read from disk
+
+Spec references:
+- specs/07_section_templates.md (Template structure)
+- specs/10_determinism_and_caching.md (Caching)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import yaml
+
+from ..io.artifact_cache import RACY_WINDOW_NS
+from ..io.atomic import atomic_write_json
+
+# Bump when the record format or extraction rules change
+TEMPLATE_REGISTRY_VERSION = "1"
+
+# Registries kept in memory (one per templates root)
+MAX_REGISTRIES = 8
+
+PLACEHOLDER_RE = re.compile(r"__([A-Z_]+)__")
+
+# title_error values
+TITLE_MISSING = "missing_title"
+TITLE_MALFORMED = "malformed_frontmatter"
+TITLE_NO_FRONTMATTER = "no_frontmatter"
+TITLE_UNREADABLE = "unreadable"
+
+
+@dataclass(frozen=True)
+class TemplateRecord:
+    """Precompiled metadata for one template file.
+
+    Attributes:
+        relative_path: Path relative to the templates root (forward slashes)
+        filename: Template file name
+        slug: Filename without .md and .variant-* suffix (_index -> index)
+        variant: Variant from the .variant-* suffix ("default" if none)
+        placeholders: Sorted placeholder names found in the template
+        mandatory_marker: Template contains "mandatory: true"
+        title: Frontmatter title (None if title_error is set)
+        title_error: Why the title could not be extracted (TITLE_* or parse error)
+        size: File size when scanned
+        mtime_ns: File mtime when scanned
+    """
+
+    relative_path: str
+    filename: str
+    slug: str
+    variant: str
+    placeholders: Tuple[str, ...]
+    mandatory_marker: bool
+    title: Any
+    title_error: Optional[str]
+    size: int
+    mtime_ns: int
+
+    @property
+    def is_mandatory(self) -> bool:
+        """_index pages, templates under a mandatory/ directory, or marked templates."""
+        return (
+            self.filename == "_index.md"
+            or "/mandatory/" in "/" + self.relative_path
+            or self.mandatory_marker
+        )
+
+
+def _split_slug(filename: str) -> Tuple[str, str]:
+    slug = filename.replace(".md", "")
+    if ".variant-" in slug:
+        slug, variant = slug.split(".variant-", 1)
+    else:
+        variant = "default"
+    if slug == "_index":
+        slug = "index"
+    return slug, variant
+
+
+def _extract_title(content: str) -> Tuple[Any, Optional[str]]:
+    if not content.startswith("---"):
+        return None, TITLE_NO_FRONTMATTER
+    parts = content.split("---", 2)
+    if len(parts) < 3:
+        return None, TITLE_MALFORMED
+    try:
+        frontmatter = yaml.safe_load(parts[1])
+        if frontmatter and "title" in frontmatter:
+            return frontmatter["title"], None
+    except Exception as e:
+        return None, str(e)
+    return None, TITLE_MISSING
+
+
+def _compile(relative_path: str, data: Optional[bytes], st: os.stat_result) -> TemplateRecord:
+    filename = relative_path.rsplit("/", 1)[-1]
+    slug, variant = _split_slug(filename)
+    placeholders: Tuple[str, ...] = ()
+    mandatory_marker = False
+    title: Any = None
+    title_error: Optional[str] = TITLE_UNREADABLE
+    if data is not None:
+        try:
+            content = data.decode("utf-8")
+        except UnicodeDecodeError:
+            content = None
+        if content is not None:
+            placeholders = tuple(sorted(set(PLACEHOLDER_RE.findall(content))))
+            mandatory_marker = "mandatory: true" in content
+            title, title_error = _extract_title(content)
+    return TemplateRecord(
+        relative_path=relative_path,
+        filename=filename,
+        slug=slug,
+        variant=variant,
+        placeholders=placeholders,
+        mandatory_marker=mandatory_marker,
+        title=title,
+        title_error=title_error,
+        size=st.st_size,
+        mtime_ns=st.st_mtime_ns,
+    )
+
+
+def compile_template(path: Path) -> TemplateRecord:
+    """Compile a single template outside any registry.
+
+    Raises:
+        OSError: If the file cannot be read
+    """
+    path = Path(path)
+    st = path.stat()
+    return _compile(path.name, path.read_bytes(), st)
+
+
+def _scan(root: Path) -> List[Tuple[str, Path, os.stat_result]]:
+    """List templates under root as (relative path, path, stat), sorted by relative path."""
+    entries = []
+    for path in root.rglob("*.md"):
+        try:
+            st = path.stat()
+        except OSError:
+            continue
+        entries.append((path.relative_to(root).as_posix(), path, st))
+    entries.sort(key=lambda e: e[0])
+    return entries
+
+
+def _fingerprint(entries: List[Tuple[str, Path, os.stat_result]]) -> Tuple[Tuple[str, int, int], ...]:
+    return tuple((rel, st.st_size, st.st_mtime_ns) for rel, _, st in entries)
+
+
+class TemplateRegistry:
+    """Template metadata for one templates root.
+
+    Usage:
+        registry = get_template_registry(repo_root / "specs" / "templates")
+        for record in registry.for_family("docs.aspose.org", "cells"):
+            ...
+        body = registry.body(record)
+    """
+
+    def __init__(self, root: Path, key: str, records: Dict[str, TemplateRecord]):
+        self.root = Path(root)
+        self.key = key
+        self.records = records
+        self._bodies: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        self.fingerprint: Tuple[Tuple[str, int, int], ...] = ()
+        self.scanned_at_ns = 0
+
+    def for_family(self, subdomain: str, family: str) -> List[TemplateRecord]:
+        """Records under <subdomain>/<family>/, sorted by relative path."""
+        prefix = f"{subdomain}/{family}/"
+        return [r for rel, r in self.records.items() if rel.startswith(prefix)]
+
+    def get(self, template_path: Any) -> Optional[TemplateRecord]:
+        """Record for an absolute path (under root) or a root-relative path."""
+        path = Path(template_path)
+        if path.is_absolute():
+            try:
+                rel = path.relative_to(self.root).as_posix()
+            except ValueError:
+                try:
+                    rel = path.resolve().relative_to(self.root.resolve()).as_posix()
+                except (ValueError, OSError):
+                    return None
+        else:
+            rel = path.as_posix()
+        return self.records.get(rel)
+
+    def body(self, record: TemplateRecord) -> str:
+        """Raw template content, read once while the file is unchanged."""
+        path = self.root / record.relative_path
+        st = path.stat()
+        if (st.st_size, st.st_mtime_ns) != (record.size, record.mtime_ns):
+            return path.read_text(encoding="utf-8")
+        with self._lock:
+            cached = self._bodies.get(record.relative_path)
+        if cached is None:
+            cached = path.read_text(encoding="utf-8")
+            with self._lock:
+                self._bodies[record.relative_path] = cached
+        return cached
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "version": TEMPLATE_REGISTRY_VERSION,
+            "key": self.key,
+            "templates": [
+                {**asdict(r), "placeholders": list(r.placeholders)}
+                for r in self.records.values()
+            ],
+        }
+
+    @classmethod
+    def from_dict(cls, root: Path, data: Dict[str, Any]) -> "TemplateRegistry":
+        records = {}
+        for item in data["templates"]:
+            record = TemplateRecord(**{**item, "placeholders": tuple(item["placeholders"])})
+            records[record.relative_path] = record
+        return cls(root, data["key"], records)
+
+
+def _content_key(entries: List[Tuple[str, Path, os.stat_result]]) -> Tuple[str, Dict[str, Optional[bytes]]]:
+    h = hashlib.sha256(f"template-registry-v{TEMPLATE_REGISTRY_VERSION}\0".encode("utf-8"))
+    contents: Dict[str, Optional[bytes]] = {}
+    for rel, path, _ in entries:
+        try:
+            data = path.read_bytes()
+        except OSError:
+            data = None
+        contents[rel] = data
+        h.update(rel.encode("utf-8"))
+        h.update(b"\0")
+        h.update(hashlib.sha256(data).digest() if data is not None else b"-")
+    return h.hexdigest(), contents
+
+
+def _load_persisted(root: Path, cache_dir: Optional[Path], key: str) -> Optional[TemplateRegistry]:
+    if cache_dir is None:
+        return None
+    path = Path(cache_dir) / f"{key}.json"
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+        if data.get("version") != TEMPLATE_REGISTRY_VERSION or data.get("key") != key:
+            return None
+        return TemplateRegistry.from_dict(root, data)
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def _persist(registry: TemplateRegistry, cache_dir: Optional[Path]) -> None:
+    if cache_dir is None:
+        return
+    try:
+        Path(cache_dir).mkdir(parents=True, exist_ok=True)
+        atomic_write_json(Path(cache_dir) / f"{registry.key}.json", registry.to_dict())
+    except (OSError, TypeError, ValueError):
+        # Non-JSON titles or an unwritable cache only cost a rebuild next run
+        pass
+
+
+_REGISTRIES: "OrderedDict[str, TemplateRegistry]" = OrderedDict()
+_REGISTRIES_LOCK = threading.Lock()
+
+
+def _default_cache_dir() -> Optional[Path]:
+    override = os.environ.get("LAUNCH_TEMPLATE_REGISTRY_DIR")
+    return Path(override) if override else None
+
+
+def template_registry_dir(run_dir: Path) -> Path:
+    """Workspace-level directory for persisted registries (shared by all runs)."""
+    return _default_cache_dir() or Path(run_dir).parent / ".template_registry"
+
+
+def get_template_registry(root: Path, cache_dir: Optional[Path] = None) -> TemplateRegistry:
+    """Return the registry for a templates root, building it only if the tree changed.
+
+    Args:
+        root: Templates root (e.g. specs/templates)
+        cache_dir: Directory for persisted registries (default:
+                   LAUNCH_TEMPLATE_REGISTRY_DIR, or in-memory only)
+    """
+    root = Path(root)
+    if cache_dir is None:
+        cache_dir = _default_cache_dir()
+    entries = _scan(root) if root.exists() else []
+    fingerprint = _fingerprint(entries)
+    newest = max((st.st_mtime_ns for _, _, st in entries), default=0)
+    mem_key = str(root)
+
+    with _REGISTRIES_LOCK:
+        registry = _REGISTRIES.get(mem_key)
+        if (
+            registry is not None
+            and registry.fingerprint == fingerprint
+            and newest + RACY_WINDOW_NS < registry.scanned_at_ns
+        ):
+            _REGISTRIES.move_to_end(mem_key)
+            return registry
+
+    now_ns = time.time_ns()
+    key, contents = _content_key(entries)
+    if registry is None or registry.key != key:
+        registry = _load_persisted(root, cache_dir, key)
+        if registry is None:
+            records = {
+                rel: _compile(rel, contents[rel], st) for rel, _, st in entries
+            }
+            registry = TemplateRegistry(root, key, records)
+            _persist(registry, cache_dir)
+    registry.fingerprint = fingerprint
+    registry.scanned_at_ns = now_ns
+
+    with _REGISTRIES_LOCK:
+        _REGISTRIES[mem_key] = registry
+        _REGISTRIES.move_to_end(mem_key)
+        while len(_REGISTRIES) > MAX_REGISTRIES:
+            _REGISTRIES.popitem(last=False)
+    return registry
+
+
+def find_template(template_path: Any) -> Tuple[Optional[TemplateRegistry], Optional[TemplateRecord]]:
+    """Find the loaded registry and (still current) record for an absolute template_path."""
+    with _REGISTRIES_LOCK:
+        registries = list(_REGISTRIES.values())
+    path = Path(template_path)
+    if not path.is_absolute():
+        return None, None
+    for registry in registries:
+        record = registry.get(path)
+        if record is None:
+            continue
+        try:
+            st = path.stat()
+        except OSError:
+            return None, None
+        if (st.st_size, st.st_mtime_ns) != (record.size, record.mtime_ns):
+            return None, None  # changed since the registry was scanned
+        return registry, record
+    return None, None
+
+
+def read_template(template_path: Any) -> str:
+    """Template content from a loaded registry, falling back to a disk read."""
+    registry, record = find_template(template_path)
+    if record is not None:
+        return registry.body(record)
+    return Path(template_path).read_text(encoding="utf-8")
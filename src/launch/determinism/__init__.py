@@ -12,6 +12,9 @@ from launch.determinism.golden_run import (
     GoldenRunMetadata,
     VerificationResult,
     capture_golden_run,
+    clear_hash_cache,
+    compare_artifact_hashes,
+    compare_run_dirs,
     delete_golden_run,
     list_golden_runs,
     verify_against_golden,
@@ -24,6 +27,9 @@ __all__ = [
     "RegressionChecker",
     "VerificationResult",
     "capture_golden_run",
+    "clear_hash_cache",
+    "compare_artifact_hashes",
+    "compare_run_dirs",
     "delete_golden_run",
     "list_golden_runs",
     "verify_against_golden",
@@ -13,15 +13,36 @@ from __future__ import annotations
 import hashlib
 import json
 import os
+import re
 import shutil
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from dataclasses import asdict, dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 # Determinism guarantee: use fixed hash seed
 os.environ.setdefault("PYTHONHASHSEED", "0")
 
+# Chunk size for streaming normalized hashing (1 MB)
+HASH_CHUNK_SIZE = 1024 * 1024
+
+# Leading bytes inspected by the null-byte binary heuristic
+BINARY_SNIFF_BYTES = 8192
+
+# Default thread pool size for hashing artifacts
+DEFAULT_HASH_WORKERS = min(8, (os.cpu_count() or 1) + 4)
+
+# Files modified within this window are hashed but not cached, since a
+# same-size rewrite inside one filesystem timestamp tick would otherwise be
+# served stale (same rule git uses for "racily clean" index entries)
+RACY_WINDOW_NS = 2_000_000_000
+
+# Trailing whitespace (as stripped by bytes.rstrip) followed by a newline
+_TRAILING_WS_RE = re.compile(rb"[ \t\r\x0b\x0c]+\n")
+
 
 @dataclass
 class ArtifactMismatch:
@@ -149,64 +170,279 @@ def _strip_trailing_whitespace(content: bytes) -> bytes:
 def _compute_normalized_hash(file_path: Path) -> str:
     """Compute normalized hash (line endings + trailing whitespace).
 
+    The file is streamed in HASH_CHUNK_SIZE chunks; the digest is identical
+    to normalizing the whole content in memory with _normalize_line_endings
+    and _strip_trailing_whitespace.
+
     Args:
         file_path: Path to file
 
     Returns:
         SHA256 hash of normalized content
     """
+    sha256 = hashlib.sha256()
     with open(file_path, "rb") as f:
-        content = f.read()
+        first = f.read(HASH_CHUNK_SIZE)
+        # Skip whitespace stripping for binary files
+        # (simple heuristic: if null byte present, it's binary)
+        is_text = b"\x00" not in _normalize_line_endings(first)[:BINARY_SNIFF_BYTES]
+
+        pending = b""
+        chunk = first
+        while chunk:
+            buf = pending + chunk
+            if is_text:
+                # Hold back the incomplete last line until its newline arrives
+                cut = buf.rfind(b"\n") + 1
+                pending = buf[cut:]
+                sha256.update(_TRAILING_WS_RE.sub(b"\n", buf[:cut]))
+            elif buf.endswith(b"\r"):
+                # A CR at the chunk boundary may pair with a LF in the next chunk
+                pending = b"\r"
+                sha256.update(_normalize_line_endings(buf[:-1]))
+            else:
+                pending = b""
+                sha256.update(_normalize_line_endings(buf))
+            chunk = f.read(HASH_CHUNK_SIZE)
+
+        sha256.update(pending.rstrip() if is_text else pending)
+    return sha256.hexdigest()
 
-    # Normalize line endings
-    content = _normalize_line_endings(content)
 
-    # Strip trailing whitespace for text files
-    # Skip for binary files (simple heuristic: if null byte present, it's binary)
-    if b"\x00" not in content[:8192]:  # Check first 8KB
-        content = _strip_trailing_whitespace(content)
+# Normalized hash cache: resolved path -> ((size, mtime_ns), hash)
+_HASH_CACHE: Dict[str, Tuple[Tuple[int, int], str]] = {}
+_HASH_CACHE_LOCK = threading.Lock()
 
-    sha256 = hashlib.sha256()
-    sha256.update(content)
-    return sha256.hexdigest()
 
+def _cached_normalized_hash(file_path: Path) -> str:
+    """Return the normalized hash of a file, reusing a cached value.
+
+    Hashes are cached by (path, size, mtime_ns), so re-verifying an unchanged
+    run (or the same run against several golden baselines) skips re-reading.
+
+    Args:
+        file_path: Path to file
+
+    Returns:
+        SHA256 hash of normalized content
+    """
+    st = file_path.stat()
+    key = str(file_path.resolve())
+    stat_key = (st.st_size, st.st_mtime_ns)
+
+    with _HASH_CACHE_LOCK:
+        cached = _HASH_CACHE.get(key)
+    if cached is not None and cached[0] == stat_key:
+        return cached[1]
+
+    digest = _compute_normalized_hash(file_path)
+    if time.time_ns() - st.st_mtime_ns > RACY_WINDOW_NS:
+        with _HASH_CACHE_LOCK:
+            _HASH_CACHE[key] = (stat_key, digest)
+    return digest
 
-def _collect_artifacts(run_dir: Path, exclude_events: bool = True) -> Dict[str, str]:
-    """Collect all artifacts and compute their hashes.
+
+def clear_hash_cache() -> None:
+    """Drop all cached normalized hashes."""
+    with _HASH_CACHE_LOCK:
+        _HASH_CACHE.clear()
+
+
+def _list_artifact_paths(run_dir: Path, exclude_events: bool = True) -> List[str]:
+    """List artifact paths (relative to run_dir) in collection order.
 
     Args:
         run_dir: Path to run directory
-        exclude_events: If True, exclude events.ndjson from collection
+        exclude_events: If True, exclude events.ndjson
 
     Returns:
-        Dictionary mapping relative artifact path to SHA256 hash
+        Relative paths of artifacts/** files followed by drafts/**/*.md files
     """
-    artifact_hashes: Dict[str, str] = {}
+    rel_paths: List[str] = []
     artifacts_dir = run_dir / "artifacts"
 
     if not artifacts_dir.exists():
-        return artifact_hashes
+        return rel_paths
 
     # Collect all files in artifacts directory
     for file_path in sorted(artifacts_dir.rglob("*")):
         if file_path.is_file():
-            # Exclude events.ndjson per spec (timestamps/UUIDs vary)
-            if exclude_events and file_path.name == "events.ndjson":
+            # Exclude events.ndjson (and its events.idx index) per spec (timestamps/UUIDs vary)
+            if exclude_events and file_path.name in ("events.ndjson", "events.idx"):
                 continue
 
             # Use relative path from run_dir for portability
-            rel_path = str(file_path.relative_to(run_dir))
-            artifact_hashes[rel_path] = _compute_normalized_hash(file_path)
+            rel_paths.append(str(file_path.relative_to(run_dir)))
 
     # Also collect drafts
     drafts_dir = run_dir / "drafts"
     if drafts_dir.exists():
         for file_path in sorted(drafts_dir.rglob("*.md")):
             if file_path.is_file():
-                rel_path = str(file_path.relative_to(run_dir))
-                artifact_hashes[rel_path] = _compute_normalized_hash(file_path)
+                rel_paths.append(str(file_path.relative_to(run_dir)))
+
+    return rel_paths
 
-    return artifact_hashes
+
+def _collect_artifacts(
+    run_dir: Path,
+    exclude_events: bool = True,
+    max_workers: Optional[int] = None,
+) -> Dict[str, str]:
+    """Collect all artifacts and compute their hashes.
+
+    Files are hashed concurrently on a thread pool; the returned mapping
+    keeps the deterministic (sorted) collection order.
+
+    Args:
+        run_dir: Path to run directory
+        exclude_events: If True, exclude events.ndjson from collection
+        max_workers: Thread pool size (defaults to DEFAULT_HASH_WORKERS)
+
+    Returns:
+        Dictionary mapping relative artifact path to SHA256 hash
+    """
+    rel_paths = _list_artifact_paths(run_dir, exclude_events=exclude_events)
+    if len(rel_paths) <= 1:
+        return {rel: _cached_normalized_hash(run_dir / rel) for rel in rel_paths}
+
+    with ThreadPoolExecutor(max_workers=max_workers or DEFAULT_HASH_WORKERS) as pool:
+        hashes = pool.map(lambda rel: _cached_normalized_hash(run_dir / rel), rel_paths)
+        return dict(zip(rel_paths, hashes, strict=True))
+
+
+def compare_artifact_hashes(
+    run_dir: Path,
+    expected_hashes: Dict[str, str],
+    golden_run_dir: Optional[Path] = None,
+    fail_fast: bool = False,
+    max_workers: Optional[int] = None,
+) -> List[ArtifactMismatch]:
+    """Compare a run directory against an expected artifact manifest.
+
+    Missing and unexpected artifacts are detected from the directory listing
+    before any file is hashed. Present artifacts are hashed concurrently.
+
+    Args:
+        run_dir: Path to run directory to check
+        expected_hashes: Manifest of relative artifact path -> SHA256 hash
+        golden_run_dir: Optional directory holding golden artifact copies,
+                        used to report size differences
+        fail_fast: If True, stop at the first mismatch and return only it
+                   (use when only a pass/fail answer is needed)
+        max_workers: Thread pool size (defaults to DEFAULT_HASH_WORKERS)
+
+    Returns:
+        List of ArtifactMismatch: golden-manifest entries in sorted order,
+        followed by artifacts not present in the golden manifest
+    """
+    current_paths = _list_artifact_paths(run_dir, exclude_events=True)
+    current_set = set(current_paths)
+
+    missing: Dict[str, ArtifactMismatch] = {}
+    for artifact_path, expected_hash in sorted(expected_hashes.items()):
+        if artifact_path not in current_set:
+            # Artifact missing in current run
+            missing[artifact_path] = ArtifactMismatch(
+                artifact_path=artifact_path,
+                expected_hash=expected_hash,
+                actual_hash="MISSING",
+                size_difference=-1,
+            )
+            if fail_fast:
+                return [missing[artifact_path]]
+
+    unexpected: List[str] = [p for p in sorted(current_paths) if p not in expected_hashes]
+    if fail_fast and unexpected:
+        unexpected = unexpected[:1]
+    unexpected_hashes: Dict[str, str] = {}
+
+    def _mismatch(artifact_path: str, actual_hash: str) -> ArtifactMismatch:
+        golden_size = 0
+        if golden_run_dir is not None:
+            golden_file = golden_run_dir / artifact_path
+            golden_size = golden_file.stat().st_size if golden_file.exists() else 0
+        current_file = run_dir / artifact_path
+        current_size = current_file.stat().st_size if current_file.exists() else 0
+        return ArtifactMismatch(
+            artifact_path=artifact_path,
+            expected_hash=expected_hashes[artifact_path],
+            actual_hash=actual_hash,
+            size_difference=current_size - golden_size,
+        )
+
+    to_hash = [p for p in sorted(expected_hashes) if p in current_set]
+    changed: Dict[str, ArtifactMismatch] = {}
+
+    with ThreadPoolExecutor(max_workers=max_workers or DEFAULT_HASH_WORKERS) as pool:
+        futures = {pool.submit(_cached_normalized_hash, run_dir / p): p for p in to_hash}
+        pending = set(futures)
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                artifact_path = futures[future]
+                actual_hash = future.result()
+                if actual_hash != expected_hashes[artifact_path]:
+                    changed[artifact_path] = _mismatch(artifact_path, actual_hash)
+            if fail_fast and changed:
+                for future in pending:
+                    future.cancel()
+                first = min(changed)
+                return [changed[first]]
+
+        if fail_fast and unexpected:
+            unexpected_hashes[unexpected[0]] = _cached_normalized_hash(run_dir / unexpected[0])
+        else:
+            unexpected_hashes = dict(
+                zip(unexpected, pool.map(lambda p: _cached_normalized_hash(run_dir / p), unexpected), strict=True)
+            )
+
+    mismatches: List[ArtifactMismatch] = []
+    for artifact_path in sorted(expected_hashes):
+        if artifact_path in missing:
+            mismatches.append(missing[artifact_path])
+        elif artifact_path in changed:
+            mismatches.append(changed[artifact_path])
+
+    # Unexpected artifacts in current run
+    for artifact_path in unexpected:
+        mismatches.append(
+            ArtifactMismatch(
+                artifact_path=artifact_path,
+                expected_hash="NOT_IN_GOLDEN",
+                actual_hash=unexpected_hashes[artifact_path],
+                size_difference=0,
+            )
+        )
+
+    return mismatches[:1] if fail_fast else mismatches
+
+
+def compare_run_dirs(
+    run_dir_a: Path,
+    run_dir_b: Path,
+    fail_fast: bool = False,
+    max_workers: Optional[int] = None,
+) -> List[ArtifactMismatch]:
+    """Compare the normalized artifacts of two run directories.
+
+    Args:
+        run_dir_a: Reference run directory (treated as the expected side)
+        run_dir_b: Run directory to compare
+        fail_fast: If True, stop at the first mismatch
+        max_workers: Thread pool size (defaults to DEFAULT_HASH_WORKERS)
+
+    Returns:
+        List of ArtifactMismatch (empty if the runs are equivalent)
+    """
+    expected = _collect_artifacts(run_dir_a, exclude_events=True, max_workers=max_workers)
+    return compare_artifact_hashes(
+        run_dir_b,
+        expected,
+        golden_run_dir=run_dir_a,
+        fail_fast=fail_fast,
+        max_workers=max_workers,
+    )
 
 
 def _get_golden_runs_dir(product_name: str, git_ref: str) -> Path:
@@ -301,6 +537,7 @@ def verify_against_golden(
     golden_run_id: str,
     product_name: Optional[str] = None,
     git_ref: Optional[str] = None,
+    fail_fast: bool = False,
 ) -> VerificationResult:
     """Verify a run against a golden baseline.
 
@@ -309,6 +546,9 @@ def verify_against_golden(
         golden_run_id: ID of golden run to compare against
         product_name: Optional product name (for locating golden run)
         git_ref: Optional git ref (for locating golden run)
+        fail_fast: If True, stop at the first mismatch. The result's
+                   ``passed`` flag is exact but ``mismatches`` holds at most
+                   one entry.
 
     Returns:
         VerificationResult with comparison details
@@ -350,54 +590,13 @@ def verify_against_golden(
         golden_data = json.load(f)
         golden_metadata = GoldenRunMetadata.from_dict(golden_data)
 
-    # Collect current run artifacts
-    current_hashes = _collect_artifacts(run_dir, exclude_events=True)
-
-    # Compare hashes
-    mismatches: List[ArtifactMismatch] = []
-
-    # Check all golden artifacts exist in current run
-    for artifact_path, expected_hash in sorted(golden_metadata.artifact_hashes.items()):
-        actual_hash = current_hashes.get(artifact_path)
-
-        if actual_hash is None:
-            # Artifact missing in current run
-            mismatches.append(
-                ArtifactMismatch(
-                    artifact_path=artifact_path,
-                    expected_hash=expected_hash,
-                    actual_hash="MISSING",
-                    size_difference=-1,
-                )
-            )
-        elif actual_hash != expected_hash:
-            # Hash mismatch
-            golden_file = golden_run_dir / artifact_path
-            current_file = run_dir / artifact_path
-
-            golden_size = golden_file.stat().st_size if golden_file.exists() else 0
-            current_size = current_file.stat().st_size if current_file.exists() else 0
-
-            mismatches.append(
-                ArtifactMismatch(
-                    artifact_path=artifact_path,
-                    expected_hash=expected_hash,
-                    actual_hash=actual_hash,
-                    size_difference=current_size - golden_size,
-                )
-            )
-
-    # Check for unexpected artifacts in current run
-    for artifact_path in sorted(current_hashes.keys()):
-        if artifact_path not in golden_metadata.artifact_hashes:
-            mismatches.append(
-                ArtifactMismatch(
-                    artifact_path=artifact_path,
-                    expected_hash="NOT_IN_GOLDEN",
-                    actual_hash=current_hashes[artifact_path],
-                    size_difference=0,
-                )
-            )
+    # Compare current run against the golden manifest
+    mismatches = compare_artifact_hashes(
+        run_dir,
+        golden_metadata.artifact_hashes,
+        golden_run_dir=golden_run_dir,
+        fail_fast=fail_fast,
+    )
 
     # Create verification result
     result = VerificationResult(
@@ -58,6 +58,7 @@ class RegressionChecker:
         product_name: str,
         git_ref: str,
         golden_run_id: Optional[str] = None,
+        fail_fast: bool = False,
     ) -> RegressionReport:
         """Check for regressions against golden run.
 
@@ -67,6 +68,8 @@ class RegressionChecker:
             git_ref: Git reference
             golden_run_id: Optional specific golden run ID.
                           If not provided, uses most recent for product+ref.
+            fail_fast: If True, stop at the first mismatch (pass/fail check).
+                       Mismatch counts then cover at most one artifact.
 
         Returns:
             RegressionReport with detailed results
@@ -88,6 +91,7 @@ class RegressionChecker:
             golden_run_id=golden_run_id,
             product_name=product_name,
             git_ref=git_ref,
+            fail_fast=fail_fast,
         )
 
         # Analyze mismatches
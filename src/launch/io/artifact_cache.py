@@ -0,0 +1,244 @@
+"""Run-scoped cache of parsed JSON artifacts with read-only views.
+
+Large artifacts (product_facts.json, page_plan.json, evidence_map.json, ...)
+are read by most downstream workers, and W7 re-reads them on every fix-loop
+iteration. This cache parses each artifact once and hands every consumer the
+same read-only view until the file changes.
+
+Design decisions:
+- Views are FrozenDict/FrozenList: dict/list subclasses whose mutators raise
+  TypeError. Unlike MappingProxyType they still serialize with json and yaml
+  and pass isinstance(x, dict) checks in existing worker code
+- copy.deepcopy()/thaw() of a view returns plain mutable dicts and lists
+- Entries are keyed by resolved path and validated by content sha256, with a
+  stat fast path: an unchanged (inode, size, mtime_ns) is trusted only when
+  the file's mtime is older than the entry by more than RACY_WINDOW_NS
+  (timestamps are coarse, so a same-size rewrite right after caching would
+  otherwise be served stale)
+- A byte budget (sum of file sizes) with LRU eviction bounds memory
+- One process-wide cache; the run loop releases a run's entries when the
+  run finishes
+
+Spec references:
+- specs/10_determinism_and_caching.md (Caching)
+- specs/21_worker_contracts.md (Artifact contracts)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+import yaml
+
+# Default byte budget for cached artifacts (MB of source JSON)
+DEFAULT_BUDGET_MB = float(os.environ.get("LAUNCH_ARTIFACT_CACHE_BUDGET_MB", "256"))
+
+# Files modified this recently relative to caching are revalidated by content
+RACY_WINDOW_NS = 2_000_000_000
+
+
+def _readonly(self: Any, *args: Any, **kwargs: Any) -> Any:
+    raise TypeError(
+        f"{type(self).__name__} is a read-only artifact view; "
+        "use copy.deepcopy() or thaw() for a mutable copy"
+    )
+
+
+class FrozenDict(dict):
+    """Read-only dict view of a parsed artifact object."""
+
+    __slots__ = ()
+
+    __setitem__ = _readonly
+    __delitem__ = _readonly
+    __ior__ = _readonly
+    clear = _readonly
+    pop = _readonly
+    popitem = _readonly
+    setdefault = _readonly
+    update = _readonly
+
+    def __copy__(self) -> Dict[Any, Any]:
+        return dict(self)
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> Dict[Any, Any]:
+        return thaw(self)
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return (FrozenDict, (dict(self),))
+
+
+class FrozenList(list):
+    """Read-only list view of a parsed artifact array."""
+
+    __slots__ = ()
+
+    __setitem__ = _readonly
+    __delitem__ = _readonly
+    __iadd__ = _readonly
+    __imul__ = _readonly
+    append = _readonly
+    extend = _readonly
+    insert = _readonly
+    pop = _readonly
+    remove = _readonly
+    clear = _readonly
+    sort = _readonly
+    reverse = _readonly
+
+    def __copy__(self) -> list:
+        return list(self)
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> list:
+        return thaw(self)
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return (FrozenList, (list(self),))
+
+
+def freeze(value: Any) -> Any:
+    """Recursively convert dicts and lists into FrozenDict/FrozenList."""
+    if isinstance(value, dict):
+        return FrozenDict((k, freeze(v)) for k, v in value.items())
+    if isinstance(value, list):
+        return FrozenList(freeze(v) for v in value)
+    return value
+
+
+def thaw(value: Any) -> Any:
+    """Recursively convert a view (or any dict/list tree) into plain dicts and lists."""
+    if isinstance(value, dict):
+        return {k: thaw(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [thaw(v) for v in value]
+    return value
+
+
+# Views dump like plain mappings/sequences instead of python/object tags
+for _dumper in (yaml.Dumper, yaml.SafeDumper):
+    yaml.add_representer(FrozenDict, yaml.representer.SafeRepresenter.represent_dict, Dumper=_dumper)
+    yaml.add_representer(FrozenList, yaml.representer.SafeRepresenter.represent_list, Dumper=_dumper)
+
+
+@dataclass
+class _Entry:
+    stat_key: Tuple[int, int, int]
+    sha256: str
+    cached_at_ns: int
+    view: Any
+    size: int
+
+
+def _stat_key(st: os.stat_result) -> Tuple[int, int, int]:
+    return (st.st_ino, st.st_size, st.st_mtime_ns)
+
+
+class ParsedArtifactCache:
+    """Parse-once cache of JSON files, returning shared read-only views.
+
+    Usage:
+        cache = get_parsed_artifact_cache()
+        facts = cache.load(run_dir / "artifacts" / "product_facts.json")
+    """
+
+    def __init__(self, budget_mb: float = DEFAULT_BUDGET_MB) -> None:
+        self.budget_bytes = int(budget_mb * 1024 * 1024)
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._bytes_used = 0
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "revalidated": 0, "evictions": 0}
+
+    def load(self, path: Path) -> Any:
+        """Return the parsed contents of a JSON file as a read-only view.
+
+        Raises:
+            FileNotFoundError: If the file does not exist
+            json.JSONDecodeError: If the file contains invalid JSON
+        """
+        key = str(Path(path).resolve())
+        st = os.stat(key)
+        stat_key = _stat_key(st)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if (
+                entry is not None
+                and entry.stat_key == stat_key
+                and st.st_mtime_ns + RACY_WINDOW_NS < entry.cached_at_ns
+            ):
+                self._entries.move_to_end(key)
+                self.stats["hits"] += 1
+                return entry.view
+
+        data = Path(key).read_bytes()
+        sha256 = hashlib.sha256(data).hexdigest()
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.sha256 == sha256:
+                entry.stat_key = stat_key
+                self._entries.move_to_end(key)
+                self.stats["revalidated"] += 1
+                return entry.view
+
+        view = freeze(json.loads(data.decode("utf-8")))
+
+        with self._lock:
+            self.stats["misses"] += 1
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes_used -= old.size
+            if len(data) <= self.budget_bytes:
+                self._entries[key] = _Entry(stat_key, sha256, time.time_ns(), view, len(data))
+                self._bytes_used += len(data)
+                self._evict()
+        return view
+
+    def invalidate(self, path: Path) -> None:
+        """Drop the entry for path (called after the file is rewritten)."""
+        with self._lock:
+            entry = self._entries.pop(str(Path(path).resolve()), None)
+            if entry is not None:
+                self._bytes_used -= entry.size
+
+    def release(self, directory: Optional[Path] = None) -> None:
+        """Drop entries under directory, or every entry when None."""
+        with self._lock:
+            if directory is None:
+                self._entries.clear()
+                self._bytes_used = 0
+                return
+            prefix = str(Path(directory).resolve()) + os.sep
+            for key in [k for k in self._entries if k.startswith(prefix)]:
+                self._bytes_used -= self._entries.pop(key).size
+
+    def _evict(self) -> None:
+        while self._bytes_used > self.budget_bytes and self._entries:
+            _, evicted = self._entries.popitem(last=False)
+            self._bytes_used -= evicted.size
+            self.stats["evictions"] += 1
+
+
+_CACHE = ParsedArtifactCache()
+
+
+def get_parsed_artifact_cache() -> ParsedArtifactCache:
+    """Return the process-wide parsed artifact cache."""
+    return _CACHE
+
+
+def release_parsed_artifacts(directory: Optional[Path] = None) -> None:
+    """Release cached artifacts under directory, or all of them when None.
+
+    Called by the run loop when a run finishes so parsed artifacts do not
+    outlive the run.
+    """
+    _CACHE.release(directory)
@@ -11,6 +11,9 @@ Design decisions:
 - Reuses schema_validation.py for optional schema validation
 - Event emission follows the events.ndjson append-only pattern
 - All JSON output is deterministic: indent=2, sort_keys=True, ensure_ascii=False
+- load_artifact_view() serves read-only views from the run-scoped parsed
+  artifact cache (artifact_cache.py), so an artifact read by several workers
+  is parsed once; load_artifact() still returns a fresh mutable dict
 
 Spec references:
 - specs/11_state_and_events.md (Event log format)
@@ -27,6 +30,7 @@ import uuid
 from pathlib import Path
 from typing import Any, Dict, Optional
 
+from .artifact_cache import get_parsed_artifact_cache
 from .atomic import atomic_write_json, atomic_write_text
 from .hashing import sha256_bytes
 from .schema_validation import load_schema, validate
@@ -124,6 +128,41 @@ class ArtifactStore:
 
         return data
 
+    def load_artifact_view(self, name: str, *, validate_schema: bool = True) -> Any:
+        """Load a JSON artifact as a shared, read-only view.
+
+        The parsed artifact is cached for the run and shared by every caller
+        until the file changes. The view is a FrozenDict/FrozenList tree:
+        reads behave like dict/list, mutation raises TypeError, and
+        copy.deepcopy() returns a mutable copy.
+
+        Args:
+            name: Artifact filename
+            validate_schema: If True and a matching schema exists in
+                           schemas_dir, validate the artifact against it.
+
+        Returns:
+            Read-only view of the parsed JSON.
+
+        Raises:
+            FileNotFoundError: If the artifact file does not exist.
+            json.JSONDecodeError: If the file contains invalid JSON.
+            ValueError: If schema validation fails.
+        """
+        artifact_path = self.artifact_path(name)
+        if not artifact_path.is_file():
+            raise FileNotFoundError(
+                f"Required artifact not found: {name} "
+                f"(expected at {artifact_path})"
+            )
+
+        data = get_parsed_artifact_cache().load(artifact_path)
+
+        if validate_schema:
+            self._validate_if_schema_exists(name, data)
+
+        return data
+
     def load_artifact_or_default(
         self,
         name: str,
@@ -198,6 +237,7 @@ class ArtifactStore:
         # - deterministic JSON serialization
         # - Guarantee B path validation
         atomic_write_json(artifact_path, data)
+        get_parsed_artifact_cache().invalidate(artifact_path)
 
         # Compute metadata from the written file for the index entry
         written_bytes = artifact_path.read_bytes()
@@ -243,6 +283,7 @@ class ArtifactStore:
         # Import here to avoid circular dependency at module level.
         # The Event model is in models/ which may import from io/.
         from ..models.event import Event
+        from ..state.event_log import write_event_line
 
         event = Event(
             event_id=str(uuid.uuid4()),
@@ -260,11 +301,8 @@ class ArtifactStore:
         events_file.parent.mkdir(parents=True, exist_ok=True)
 
         # Append to events.ndjson (append-only log)
-        event_line = json.dumps(
-            event.to_dict(), ensure_ascii=False, sort_keys=True
-        ) + "\n"
-        with events_file.open("a", encoding="utf-8") as f:
-            f.write(event_line)
+        event_line = json.dumps(event.to_dict(), ensure_ascii=False, sort_keys=True)
+        write_event_line(events_file, event_line)
 
     def _validate_if_schema_exists(self, artifact_name: str, data: Any) -> None:
         """Validate artifact data against schema if one exists.
@@ -12,14 +12,10 @@ from __future__ import annotations
 import json
 import os
 from pathlib import Path
-from typing import Any, List, Optional
+from typing import Any, Iterable, List, Optional
 
-from ..util.path_validation import (
-    PathValidationError,
-    is_source_code_path,
-    validate_no_path_traversal,
-    validate_path_matches_patterns,
-)
+from ..util.path_validation import validate_no_path_traversal
+from ..util.write_fence import get_write_fence
 
 
 def get_enforcement_mode() -> str:
@@ -50,6 +46,8 @@ def validate_taskcard_authorization(
     """Validate write authorization via taskcard (Layer 3 enforcement).
 
     This is the STRONGEST enforcement point in the defense-in-depth system.
+    Delegates to the shared WriteFence for this configuration, so patterns
+    are compiled and the taskcard parsed once rather than per write.
 
     Args:
         path: File path to write
@@ -66,53 +64,36 @@ def validate_taskcard_authorization(
         - POLICY_TASKCARD_INACTIVE: Taskcard status is Draft/Blocked
         - POLICY_TASKCARD_PATH_VIOLATION: Path not in allowed_paths
     """
-    # Skip enforcement in disabled mode
-    if enforcement_mode == "disabled":
-        return
-
-    # Check if path is protected (requires taskcard)
-    if is_source_code_path(path, repo_root):
-        if taskcard_id is None:
-            raise PathValidationError(
-                f"Write to protected path '{path}' requires taskcard authorization. "
-                f"Protected paths: src/launch/**, specs/**, plans/taskcards/**. "
-                f"Set LAUNCH_TASKCARD_ENFORCEMENT=disabled for local development.",
-                error_code="POLICY_TASKCARD_MISSING",
-            )
-
-        # Load and validate taskcard
-        from ..util.taskcard_loader import get_allowed_paths, load_taskcard
-        from ..util.taskcard_validation import validate_taskcard_active
-
-        try:
-            taskcard = load_taskcard(taskcard_id, repo_root)
-        except Exception as e:
-            raise PathValidationError(
-                f"Failed to load taskcard {taskcard_id}: {e}",
-                error_code="POLICY_TASKCARD_MISSING",
-            ) from e
-
-        # Validate taskcard is active
-        try:
-            validate_taskcard_active(taskcard)
-        except Exception as e:
-            raise PathValidationError(
-                f"Taskcard {taskcard_id} is not active: {e}",
-                error_code="POLICY_TASKCARD_INACTIVE",
-            ) from e
-
-        # Get allowed paths
-        if allowed_paths is None:
-            allowed_paths = get_allowed_paths(taskcard)
-
-        # Validate path matches patterns
-        if not validate_path_matches_patterns(path, allowed_paths, repo_root=repo_root):
-            raise PathValidationError(
-                f"Path '{path}' not authorized by taskcard {taskcard_id}. "
-                f"Allowed paths: {allowed_paths}. "
-                f"Add this path to the taskcard's allowed_paths or use a different taskcard.",
-                error_code="POLICY_TASKCARD_PATH_VIOLATION",
-            )
+    get_write_fence(repo_root, taskcard_id, allowed_paths, enforcement_mode).check(path)
+
+
+def _validate_write_path(
+    path: Path,
+    validate_boundary: Optional[Path],
+    taskcard_id: Optional[str],
+    allowed_paths: Optional[List[str]],
+    enforcement_mode: Optional[str],
+    repo_root: Optional[Path],
+) -> None:
+    """Run the traversal, boundary and taskcard checks shared by atomic writes."""
+    # Basic path traversal check
+    validate_no_path_traversal(path)
+
+    # Boundary validation if provided
+    if validate_boundary:
+        from ..util.path_validation import validate_path_in_boundary
+        validate_path_in_boundary(path, validate_boundary)
+
+    # Layer 3: Taskcard authorization enforcement
+    if enforcement_mode is None:
+        enforcement_mode = get_enforcement_mode()
+
+    if repo_root is None:
+        repo_root = Path.cwd()
+
+    validate_taskcard_authorization(
+        path, taskcard_id, allowed_paths, enforcement_mode, repo_root
+    )
 
 
 def atomic_write_text(
@@ -143,29 +124,61 @@ def atomic_write_text(
     Raises:
         PathValidationError: If path validation or taskcard authorization fails
     """
-    # Basic path traversal check
-    validate_no_path_traversal(path)
+    _validate_write_path(
+        path, validate_boundary, taskcard_id, allowed_paths, enforcement_mode, repo_root
+    )
 
-    # Boundary validation if provided
-    if validate_boundary:
-        from ..util.path_validation import validate_path_in_boundary
-        validate_path_in_boundary(path, validate_boundary)
+    # Perform atomic write
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(path.suffix + '.tmp')
+    tmp.write_text(text, encoding=encoding)
+    os.replace(tmp, path)
 
-    # Layer 3: Taskcard authorization enforcement
-    if enforcement_mode is None:
-        enforcement_mode = get_enforcement_mode()
 
-    if repo_root is None:
-        repo_root = Path.cwd()
+def atomic_write_chunks(
+    path: Path,
+    chunks: Iterable[str],
+    encoding: str = 'utf-8',
+    *,
+    validate_boundary: Optional[Path] = None,
+    taskcard_id: Optional[str] = None,
+    allowed_paths: Optional[List[str]] = None,
+    enforcement_mode: Optional[str] = None,
+    repo_root: Optional[Path] = None,
+) -> None:
+    """Write text produced incrementally to file atomically with path validation.
 
-    validate_taskcard_authorization(
-        path, taskcard_id, allowed_paths, enforcement_mode, repo_root
+    Same validation and replace-on-success semantics as atomic_write_text,
+    but the text is written chunk by chunk so it never has to exist in
+    memory as one string. If the iterable raises, the destination is left
+    untouched.
+
+    Args:
+        path: Destination file path
+        chunks: Text chunks, written in order
+        encoding: Text encoding (default: utf-8)
+        validate_boundary: Optional boundary to enforce (e.g., RUN_DIR)
+        taskcard_id: Taskcard ID authorizing write (e.g., "TC-100")
+        allowed_paths: Explicit allowed paths (overrides taskcard)
+        enforcement_mode: "strict" or "disabled" (defaults to env var)
+        repo_root: Repository root (defaults to cwd)
+
+    Raises:
+        PathValidationError: If path validation or taskcard authorization fails
+    """
+    _validate_write_path(
+        path, validate_boundary, taskcard_id, allowed_paths, enforcement_mode, repo_root
     )
 
-    # Perform atomic write
     path.parent.mkdir(parents=True, exist_ok=True)
     tmp = path.with_suffix(path.suffix + '.tmp')
-    tmp.write_text(text, encoding=encoding)
+    try:
+        with tmp.open('w', encoding=encoding) as f:
+            for chunk in chunks:
+                f.write(chunk)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
     os.replace(tmp, path)
 
 
@@ -0,0 +1,260 @@
+"""Lazy, memory-bounded access to evidence_map.json.
+
+evidence_map.json holds every claim with its supporting evidence and can
+grow to hundreds of MB on docs-heavy repos. Most consumers only need a
+derived set (which claim IDs exist, which paths are cited) or a single
+pass over the claims. EvidenceMapReader streams the claims array one
+element at a time instead of parsing the whole document, and caches the
+derived sets until the file changes.
+
+The reader is a read-only Mapping, so code written against the parsed
+dict (evidence_map.get("claims", []), evidence_map["metadata"]) keeps
+working; "claims" is then a re-iterable view that streams from disk.
+
+Spec references:
+- specs/03_product_facts_and_evidence.md (Evidence map structure)
+- specs/schemas/evidence_map.schema.json (EvidenceMap schema)
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any, Dict, FrozenSet, Iterator, Optional, TextIO, Tuple
+
+_CHUNK_SIZE = 1 << 16
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_DECODER = json.JSONDecoder()
+
+# Yielded by _iter_document when the claims array opens (so empty arrays are seen)
+_CLAIMS_START = object()
+
+
+class _JsonTokenStream:
+    """Incremental reader for one JSON document, one value at a time."""
+
+    def __init__(self, f: TextIO):
+        self._f = f
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self, min_size: int = _CHUNK_SIZE) -> bool:
+        if self._eof:
+            return False
+        more = self._f.read(max(min_size, _CHUNK_SIZE))
+        if not more:
+            self._eof = True
+            return False
+        self._buf = self._buf[self._pos:] + more
+        self._pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Return the next non-whitespace character ('' at end of input)."""
+        while True:
+            self._pos = _WHITESPACE.match(self._buf, self._pos).end()
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, char: str) -> None:
+        found = self.peek()
+        if found != char:
+            raise json.JSONDecodeError(f"Expected {char!r}, found {found!r}", self._buf, self._pos)
+        self._pos += 1
+
+    def value(self) -> Any:
+        """Decode the next complete JSON value."""
+        self.peek()
+        while True:
+            try:
+                obj, end = _DECODER.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError:
+                # Value not fully buffered yet: read at least as much again
+                if not self._fill(len(self._buf) - self._pos):
+                    raise
+                continue
+            # A number ending exactly at the buffer edge may continue in the next chunk
+            if end == len(self._buf) and not self._eof and self._fill():
+                continue
+            self._pos = end
+            return obj
+
+
+def _iter_document(path: Path) -> Iterator[Tuple[str, Any]]:
+    """Yield (key, value) for each top-level member; "claims" yields each claim.
+
+    A claims array yields ("claims", _CLAIMS_START) and then one
+    ("claims", claim) pair per element, so the array is never held in
+    memory as a whole.
+    """
+    with path.open("r", encoding="utf-8") as f:
+        stream = _JsonTokenStream(f)
+        stream.expect("{")
+        if stream.peek() == "}":
+            return
+        while True:
+            key = stream.value()
+            stream.expect(":")
+            if key == "claims" and stream.peek() == "[":
+                stream.expect("[")
+                yield key, _CLAIMS_START
+                if stream.peek() != "]":
+                    while True:
+                        yield key, stream.value()
+                        if stream.peek() != ",":
+                            break
+                        stream.expect(",")
+                stream.expect("]")
+            else:
+                yield key, stream.value()
+            if stream.peek() != ",":
+                break
+            stream.expect(",")
+        stream.expect("}")
+
+
+class _ClaimsView:
+    """Re-iterable view over the claims array that streams from disk."""
+
+    def __init__(self, reader: "EvidenceMapReader"):
+        self._reader = reader
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        return self._reader.iter_claims()
+
+    def __len__(self) -> int:
+        return self._reader.claim_count()
+
+    def __bool__(self) -> bool:
+        return self._reader.claim_count() > 0
+
+
+class EvidenceMapReader(Mapping):
+    """Read-only, lazily parsed view of an evidence_map.json file."""
+
+    def __init__(self, path: Path):
+        """Open an evidence map without parsing it.
+
+        Args:
+            path: Path to evidence_map.json
+        """
+        self.path = Path(path)
+        self._stamp: Optional[Tuple[int, int]] = None
+        self._derived: Dict[str, Any] = {}
+
+    @classmethod
+    def from_artifacts_dir(cls, artifacts_dir: Path) -> Optional["EvidenceMapReader"]:
+        """Return a reader for artifacts_dir/evidence_map.json, or None if it doesn't exist."""
+        path = Path(artifacts_dir) / "evidence_map.json"
+        return cls(path) if path.exists() else None
+
+    def _cached(self, name: str, compute) -> Any:
+        """Return a derived value, recomputing it when the file changed."""
+        st = self.path.stat()
+        stamp = (st.st_mtime_ns, st.st_size)
+        if stamp != self._stamp:
+            self._stamp = stamp
+            self._derived = {}
+        if name not in self._derived:
+            self._derived[name] = compute()
+        return self._derived[name]
+
+    def _scan(self) -> Dict[str, Any]:
+        """One streaming pass: top-level members except claims, plus claim-derived sets."""
+        header: Dict[str, Any] = {}
+        keys = []
+        claim_ids = set()
+        cited_paths = set()
+        count = 0
+        has_claims = False
+        for key, value in _iter_document(self.path):
+            if value is _CLAIMS_START:
+                has_claims = True
+                keys.append(key)
+                continue
+            if key != "claims" or not has_claims:
+                header[key] = value
+                keys.append(key)
+                continue
+            if not isinstance(value, dict):
+                continue
+            count += 1
+            if value.get("claim_id"):
+                claim_ids.add(value["claim_id"])
+            for citation in value.get("citations") or ():
+                if isinstance(citation, dict) and citation.get("path"):
+                    cited_paths.add(citation["path"])
+        return {
+            "header": header,
+            "keys": tuple(keys),
+            "has_claims": has_claims,
+            "count": count,
+            "claim_ids": frozenset(claim_ids),
+            "cited_paths": frozenset(cited_paths),
+        }
+
+    def _summary(self) -> Dict[str, Any]:
+        return self._cached("summary", self._scan)
+
+    def iter_claims(self) -> Iterator[Dict[str, Any]]:
+        """Stream claims in file order, holding one claim in memory at a time."""
+        streaming = False
+        for key, value in _iter_document(self.path):
+            if value is _CLAIMS_START:
+                streaming = True
+            elif key == "claims" and streaming:
+                yield value
+
+    def get_claim(self, claim_id: str) -> Optional[Dict[str, Any]]:
+        """Return the first claim with claim_id, or None (one streaming pass)."""
+        if claim_id not in self.claim_ids():
+            return None
+        return next((c for c in self.iter_claims() if c.get("claim_id") == claim_id), None)
+
+    def claim_count(self) -> int:
+        """Number of claims in the map."""
+        return self._summary()["count"]
+
+    def claim_ids(self) -> FrozenSet[str]:
+        """IDs of all claims in the map."""
+        return self._summary()["claim_ids"]
+
+    def cited_paths(self) -> FrozenSet[str]:
+        """Paths cited by any claim's citations."""
+        return self._summary()["cited_paths"]
+
+    def __getitem__(self, key: str) -> Any:
+        summary = self._summary()
+        if key == "claims" and summary["has_claims"]:
+            return _ClaimsView(self)
+        return summary["header"][key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._summary()["keys"])
+
+    def __len__(self) -> int:
+        return len(self._summary()["keys"])
+
+
+def evidence_claim_ids(evidence_map: Mapping) -> FrozenSet[str]:
+    """IDs of all claims in an evidence map (parsed dict or EvidenceMapReader)."""
+    if isinstance(evidence_map, EvidenceMapReader):
+        return evidence_map.claim_ids()
+    return frozenset(c["claim_id"] for c in evidence_map.get("claims", []) if c.get("claim_id"))
+
+
+def evidence_cited_paths(evidence_map: Mapping) -> FrozenSet[str]:
+    """Paths cited by any claim in an evidence map (parsed dict or EvidenceMapReader)."""
+    if isinstance(evidence_map, EvidenceMapReader):
+        return evidence_map.cited_paths()
+    return frozenset(
+        citation["path"]
+        for claim in evidence_map.get("claims", [])
+        for citation in claim.get("citations", [])
+        if citation.get("path")
+    )
@@ -14,3 +14,10 @@ def sha256_file(path: Path) -> str:
         for chunk in iter(lambda: f.read(1024 * 1024), b''):
             h.update(chunk)
     return h.hexdigest()
+
+
+def git_blob_sha(data: bytes) -> str:
+    """Object id git assigns to a blob with this content (SHA-1)."""
+    h = hashlib.sha1(b'blob %d\0' % len(data))
+    h.update(data)
+    return h.hexdigest()
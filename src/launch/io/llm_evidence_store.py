@@ -0,0 +1,316 @@
+"""Append-only segmented store for LLM call evidence.
+
+Previously each LLM call wrote evidence/llm_calls/<call_id>.json holding the
+full request and response. A rich launch produced thousands of small files,
+each repeating the same system prompts. This store appends compressed
+records to a few segment files in the same directory instead:
+
+    evidence/llm_calls/
+        segment-<writer>-000001.bin   records: header + compressed payload
+        index-<writer>.ndjson         one line per record (offset index)
+
+Design decisions:
+- Records are zstd-compressed when the zstandard library is installed and
+  zlib-compressed otherwise. The codec is stored per record, so a directory
+  can mix both
+- Message bodies of at least DEDUP_MIN_CHARS characters are stored once as
+  content-addressed blob records and referenced by sha256 from call records
+- The index maps call_id and prompt_hash to (segment, offset, length); it is
+  append-only NDJSON, and a torn last line from a crash is ignored
+- One writer per process (writer id = pid), so concurrent worker processes
+  never share a segment. Threads within a process share the writer lock
+- Segments roll over at SEGMENT_MAX_BYTES
+- Evidence paths keep their logical form (evidence/llm_calls/<call_id>.json)
+  in results and telemetry; LLMEvidenceReader resolves them, and also reads
+  legacy per-call JSON files from older runs
+
+Spec references:
+- specs/11_state_and_events.md (Evidence capture)
+- specs/10_determinism_and_caching.md (Prompt hashing)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import struct
+import threading
+import zlib
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+# Directory (relative to RUN_DIR) holding LLM call evidence
+LLM_EVIDENCE_DIR = Path("evidence") / "llm_calls"
+
+# Segments roll over once they reach this size
+SEGMENT_MAX_BYTES = 64 * 1024 * 1024
+
+# Message bodies at least this long are deduplicated as blobs
+DEDUP_MIN_CHARS = 256
+
+CODEC_ZLIB = 1
+CODEC_ZSTD = 2
+
+# Record header: magic, codec, payload length
+_MAGIC = b"LEV1"
+_HEADER = struct.Struct("<4sBI")
+
+_BLOB_REF = "$blob"
+
+
+def _zstandard() -> Any:
+    try:
+        import zstandard
+    except ImportError:
+        return None
+    return zstandard
+
+
+def _compress(data: bytes) -> Tuple[int, bytes]:
+    zstandard = _zstandard()
+    if zstandard is not None:
+        return CODEC_ZSTD, zstandard.ZstdCompressor(level=3).compress(data)
+    return CODEC_ZLIB, zlib.compress(data, 6)
+
+
+def _decompress(codec: int, payload: bytes) -> bytes:
+    if codec == CODEC_ZLIB:
+        return zlib.decompress(payload)
+    if codec == CODEC_ZSTD:
+        zstandard = _zstandard()
+        if zstandard is None:
+            raise ImportError(
+                "zstandard library required to read zstd LLM evidence records. "
+                "Install with: pip install zstandard"
+            )
+        return zstandard.ZstdDecompressor().decompress(payload)
+    raise ValueError(f"Unknown LLM evidence codec: {codec}")
+
+
+def evidence_ref(call_id: str) -> str:
+    """Logical evidence path for a call (relative to RUN_DIR)."""
+    return (LLM_EVIDENCE_DIR / f"{call_id}.json").as_posix()
+
+
+class LLMEvidenceWriter:
+    """Appends LLM call evidence to this process's segment files.
+
+    Usage:
+        writer = get_llm_evidence_writer(run_dir / "evidence" / "llm_calls")
+        writer.append(evidence)
+    """
+
+    def __init__(self, evidence_dir: Path, writer_id: Optional[str] = None):
+        self.evidence_dir = Path(evidence_dir)
+        self.writer_id = writer_id or str(os.getpid())
+        self._lock = threading.Lock()
+        self._index_path = self.evidence_dir / f"index-{self.writer_id}.ndjson"
+        self._blobs: set = set()
+        self._segment_seq = 0
+        self._segment_path: Optional[Path] = None
+        self._load_own_index()
+
+    def _load_own_index(self) -> None:
+        """Resume after a restart: known blobs and the last segment."""
+        for entry in _read_index(self._index_path):
+            if entry["kind"] == "blob":
+                self._blobs.add(entry["sha256"])
+        segments = sorted(self.evidence_dir.glob(f"segment-{self.writer_id}-*.bin"))
+        if segments:
+            self._segment_path = segments[-1]
+            self._segment_seq = int(self._segment_path.stem.rsplit("-", 1)[1])
+
+    def _segment(self, incoming: int) -> Path:
+        path = self._segment_path
+        if path is None or (path.exists() and path.stat().st_size + incoming > SEGMENT_MAX_BYTES):
+            self._segment_seq += 1
+            path = self.evidence_dir / f"segment-{self.writer_id}-{self._segment_seq:06d}.bin"
+            self._segment_path = path
+        return path
+
+    def _write_record(self, data: bytes, index_entry: Dict[str, Any]) -> None:
+        codec, payload = _compress(data)
+        record = _HEADER.pack(_MAGIC, codec, len(payload)) + payload
+        segment = self._segment(len(record))
+        with open(segment, "ab") as f:
+            offset = f.tell()
+            f.write(record)
+        index_entry.update({"segment": segment.name, "offset": offset, "length": len(record)})
+        with open(self._index_path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(index_entry, sort_keys=True) + "\n")
+
+    def _dedup_messages(self, messages: List[Any]) -> List[Any]:
+        out = []
+        for message in messages:
+            content = message.get("content") if isinstance(message, dict) else None
+            if isinstance(content, str) and len(content) >= DEDUP_MIN_CHARS:
+                body = content.encode("utf-8")
+                sha256 = hashlib.sha256(body).hexdigest()
+                if sha256 not in self._blobs:
+                    self._write_record(body, {"kind": "blob", "sha256": sha256})
+                    self._blobs.add(sha256)
+                message = {**message, "content": {_BLOB_REF: sha256}}
+            out.append(message)
+        return out
+
+    def append(self, evidence: Dict[str, Any]) -> str:
+        """Append one call's evidence (must contain call_id and prompt_hash).
+
+        Returns:
+            Logical evidence path for the call
+        """
+        with self._lock:
+            self.evidence_dir.mkdir(parents=True, exist_ok=True)
+            record = dict(evidence)
+            request = record.get("request")
+            if isinstance(request, dict) and isinstance(request.get("messages"), list):
+                record["request"] = {**request, "messages": self._dedup_messages(request["messages"])}
+            data = json.dumps(record, ensure_ascii=False, sort_keys=True).encode("utf-8")
+            self._write_record(
+                data,
+                {
+                    "kind": "call",
+                    "call_id": evidence["call_id"],
+                    "prompt_hash": evidence.get("prompt_hash", ""),
+                },
+            )
+        return evidence_ref(evidence["call_id"])
+
+
+_WRITERS: Dict[Tuple[int, str], LLMEvidenceWriter] = {}
+_WRITERS_LOCK = threading.Lock()
+
+
+def get_llm_evidence_writer(evidence_dir: Path) -> LLMEvidenceWriter:
+    """Return this process's writer for evidence_dir."""
+    key = (os.getpid(), str(Path(evidence_dir).resolve()))
+    with _WRITERS_LOCK:
+        writer = _WRITERS.get(key)
+        if writer is None:
+            writer = LLMEvidenceWriter(Path(evidence_dir))
+            _WRITERS[key] = writer
+        return writer
+
+
+def _read_index(path: Path) -> Iterator[Dict[str, Any]]:
+    if not path.exists():
+        return
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                continue  # torn write
+            if isinstance(entry, dict) and "kind" in entry:
+                yield entry
+
+
+class LLMEvidenceReader:
+    """Read LLM call evidence from segments (and legacy per-call files).
+
+    Usage:
+        reader = LLMEvidenceReader(run_dir / "evidence" / "llm_calls")
+        for call_id in reader.call_ids():
+            evidence = reader.get(call_id)
+    """
+
+    def __init__(self, evidence_dir: Path):
+        self.evidence_dir = Path(evidence_dir)
+        self._calls: Dict[str, Dict[str, Any]] = {}
+        self._blobs: Dict[str, Dict[str, Any]] = {}
+        self._legacy: Dict[str, Path] = {}
+        self._blob_cache: Dict[str, str] = {}
+        if not self.evidence_dir.is_dir():
+            return
+        for index_path in sorted(self.evidence_dir.glob("index-*.ndjson")):
+            for entry in _read_index(index_path):
+                if entry["kind"] == "call":
+                    self._calls[entry["call_id"]] = entry
+                elif entry["kind"] == "blob":
+                    self._blobs.setdefault(entry["sha256"], entry)
+        for path in sorted(self.evidence_dir.glob("*.json")):
+            self._legacy.setdefault(path.stem, path)
+
+    @classmethod
+    def for_run(cls, run_dir: Path) -> "LLMEvidenceReader":
+        """Reader for RUN_DIR/evidence/llm_calls."""
+        return cls(Path(run_dir) / LLM_EVIDENCE_DIR)
+
+    def call_ids(self) -> List[str]:
+        """All recorded call IDs, sorted."""
+        return sorted(set(self._calls) | set(self._legacy))
+
+    def __contains__(self, call_id: object) -> bool:
+        return call_id in self._calls or call_id in self._legacy
+
+    def __len__(self) -> int:
+        return len(set(self._calls) | set(self._legacy))
+
+    def find_by_prompt_hash(self, prompt_hash: str) -> List[str]:
+        """Call IDs recorded with the given prompt hash (segmented calls only)."""
+        return sorted(c for c, e in self._calls.items() if e.get("prompt_hash") == prompt_hash)
+
+    def _read_record(self, entry: Dict[str, Any]) -> bytes:
+        with open(self.evidence_dir / entry["segment"], "rb") as f:
+            f.seek(entry["offset"])
+            raw = f.read(entry["length"])
+        magic, codec, length = _HEADER.unpack_from(raw)
+        if magic != _MAGIC or length != len(raw) - _HEADER.size:
+            raise ValueError(
+                f"Corrupt LLM evidence record at {entry['segment']}:{entry['offset']}"
+            )
+        return _decompress(codec, raw[_HEADER.size:])
+
+    def _blob(self, sha256: str) -> str:
+        if sha256 not in self._blob_cache:
+            entry = self._blobs.get(sha256)
+            if entry is None:
+                raise KeyError(f"LLM evidence blob not found: {sha256}")
+            self._blob_cache[sha256] = self._read_record(entry).decode("utf-8")
+        return self._blob_cache[sha256]
+
+    def get(self, call_id: str) -> Dict[str, Any]:
+        """Full evidence for call_id, with deduplicated messages restored.
+
+        Raises:
+            KeyError: If call_id was not recorded
+        """
+        entry = self._calls.get(call_id)
+        if entry is None:
+            legacy = self._legacy.get(call_id)
+            if legacy is None:
+                raise KeyError(f"LLM evidence not found: {call_id}")
+            return json.loads(legacy.read_text(encoding="utf-8"))
+
+        record = json.loads(self._read_record(entry).decode("utf-8"))
+        request = record.get("request")
+        if isinstance(request, dict) and isinstance(request.get("messages"), list):
+            messages = []
+            for message in request["messages"]:
+                content = message.get("content") if isinstance(message, dict) else None
+                if isinstance(content, dict) and _BLOB_REF in content:
+                    message = {**message, "content": self._blob(content[_BLOB_REF])}
+                messages.append(message)
+            request["messages"] = messages
+        return record
+
+    def resolve(self, evidence_path: str) -> Dict[str, Any]:
+        """Evidence for a logical path such as evidence/llm_calls/<call_id>.json."""
+        return self.get(Path(evidence_path).stem)
+
+    def iter_evidence(self) -> Iterator[Dict[str, Any]]:
+        """Evidence for every call, in call_id order."""
+        for call_id in self.call_ids():
+            yield self.get(call_id)
+
+    def stats(self) -> Dict[str, Any]:
+        """Call/blob/segment counts and on-disk size."""
+        segments = sorted(self.evidence_dir.glob("segment-*.bin")) if self.evidence_dir.is_dir() else []
+        return {
+            "calls": len(self),
+            "legacy_files": len(self._legacy),
+            "blobs": len(self._blobs),
+            "segments": len(segments),
+            "segment_bytes": sum(p.stat().st_size for p in segments),
+        }
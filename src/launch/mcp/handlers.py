@@ -22,15 +22,18 @@ import hashlib
 import base64
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, TYPE_CHECKING
 
-import mcp.types as types
+if TYPE_CHECKING:
+    import mcp.types as types
 
+from launch.io.llm_evidence_store import LLM_EVIDENCE_DIR, LLMEvidenceReader
 from launch.io.run_layout import create_run_skeleton, RunLayout
+from launch.models.event import Event
 from launch.models.state import RUN_STATE_CREATED
-from launch.orchestrator import execute_run
-from launch.state.event_log import read_events
-from launch.state.snapshot_manager import read_snapshot, replay_events
+from launch.state.event_log import iter_events
+from launch.state.event_index import EventIndex
+from launch.state.snapshot_manager import read_snapshot, replay_indexed_events
 
 
 # Error codes per specs/24_mcp_tool_schemas.md:33-44
@@ -85,7 +88,7 @@ def _error_response(
     if run_id:
         response["run_id"] = run_id
 
-    return [types.TextContent(type="text", text=json.dumps(response))]
+    return _text_content(response)
 
 
 def _success_response(data: Dict[str, Any]) -> List[types.TextContent]:
@@ -98,6 +101,14 @@ def _success_response(data: Dict[str, Any]) -> List[types.TextContent]:
         MCP success response as TextContent list
     """
     response = {"ok": True, **data}
+    return _text_content(response)
+
+
+def _text_content(response: Dict[str, Any]) -> List[types.TextContent]:
+    # Deferred: mcp.types dominates the import time of launch.mcp, and
+    # entry points that only parse arguments never build a response
+    import mcp.types as types
+
     return [types.TextContent(type="text", text=json.dumps(response))]
 
 
@@ -144,9 +155,9 @@ def _get_run_status_from_snapshot(run_dir: Path, run_id: str) -> Dict[str, Any]:
     snapshot_file = run_dir / "snapshot.json"
     events_file = run_dir / "events.ndjson"
 
-    # Replay events to get current snapshot
+    # Replay the state-affecting events (located via events.idx) to get current snapshot
     if events_file.exists():
-        snapshot = replay_events(events_file, run_id)
+        snapshot = replay_indexed_events(events_file, run_id)
     elif snapshot_file.exists():
         snapshot = read_snapshot(snapshot_file)
     else:
@@ -327,7 +338,8 @@ async def handle_launch_list_runs(arguments: Dict[str, Any]) -> List[types.TextC
 
         runs = []
         for run_dir in WORKSPACE_DIR.iterdir():
-            if not run_dir.is_dir():
+            # Skip files and workspace-level caches (e.g. .worker_cache)
+            if not run_dir.is_dir() or run_dir.name.startswith("."):
                 continue
 
             run_id = run_dir.name
@@ -338,7 +350,7 @@ async def handle_launch_list_runs(arguments: Dict[str, Any]) -> List[types.TextC
 
             try:
                 if events_file.exists():
-                    snapshot = replay_events(events_file, run_id)
+                    snapshot = replay_indexed_events(events_file, run_id)
                 elif snapshot_file.exists():
                     snapshot = read_snapshot(snapshot_file)
                 else:
@@ -360,10 +372,13 @@ async def handle_launch_list_runs(arguments: Dict[str, Any]) -> List[types.TextC
                 if state_filter and snapshot.run_state != state_filter:
                     continue
 
-                # Get timestamps from events
-                events = read_events(events_file) if events_file.exists() else []
-                started_at = events[0].ts if events else None
-                finished_at = events[-1].ts if events and snapshot.run_state in ["DONE", "FAILED", "CANCELLED"] else None
+                # Get timestamps from the first and last indexed events
+                started_at = finished_at = None
+                if events_file.exists():
+                    index = EventIndex(events_file)
+                    started_at, finished_at = index.first_ts(), index.last_ts()
+                if snapshot.run_state not in ["DONE", "FAILED", "CANCELLED"]:
+                    finished_at = None
 
                 runs.append({
                     "run_id": run_id,
@@ -390,7 +405,9 @@ async def handle_launch_list_runs(arguments: Dict[str, Any]) -> List[types.TextC
 async def handle_launch_get_artifact(arguments: Dict[str, Any]) -> List[types.TextContent]:
     """Handle launch_get_artifact tool invocation.
 
-    Retrieve artifact from run directory.
+    Retrieve artifact from run directory. LLM call evidence
+    (evidence/llm_calls/<call_id>.json) is read from the segmented evidence
+    store.
 
     Spec references:
     - specs/24_mcp_tool_schemas.md:254-262 (Tool schema)
@@ -440,7 +457,19 @@ async def handle_launch_get_artifact(arguments: Dict[str, Any]) -> List[types.Te
                 artifact_path = loc
                 break
 
-        if not artifact_path:
+        content = None
+        if artifact_path:
+            content = artifact_path.read_text(encoding="utf-8")
+        elif Path(artifact_name).parent.as_posix() == LLM_EVIDENCE_DIR.as_posix():
+            llm_evidence = LLMEvidenceReader.for_run(run_dir)
+            try:
+                evidence = llm_evidence.resolve(artifact_name)
+            except KeyError:
+                evidence = None
+            if evidence is not None:
+                content = json.dumps(evidence, ensure_ascii=False, indent=2, sort_keys=True)
+
+        if content is None:
             return _error_response(
                 ERROR_INVALID_INPUT,
                 f"Artifact not found: {artifact_name}",
@@ -448,9 +477,6 @@ async def handle_launch_get_artifact(arguments: Dict[str, Any]) -> List[types.Te
                 run_id=run_id,
             )
 
-        # Read artifact content
-        content = artifact_path.read_text(encoding="utf-8")
-
         # Compute SHA256
         sha256 = hashlib.sha256(content.encode("utf-8")).hexdigest()
 
@@ -900,21 +926,22 @@ async def handle_get_run_telemetry(arguments: Dict[str, Any]) -> List[types.Text
                 },
             })
 
-        events = read_events(events_file)
-
-        # Build telemetry summary
+        # Build events and telemetry summary in one streaming pass
+        events: List[Dict[str, Any]] = []
         event_types: Dict[str, int] = {}
-        for event in events:
+        for event_data in iter_events(events_file):
+            event = Event.from_dict(event_data)
             event_types[event.type] = event_types.get(event.type, 0) + 1
+            events.append(event.to_dict())
 
         telemetry_data = {
             "run_id": run_id,
-            "events": [e.to_dict() for e in events],
+            "events": events,
             "summary": {
                 "total_events": len(events),
                 "event_types": event_types,
-                "first_event": events[0].ts if events else None,
-                "last_event": events[-1].ts if events else None,
+                "first_event": events[0]["ts"] if events else None,
+                "last_event": events[-1]["ts"] if events else None,
             },
         }
 
@@ -3,7 +3,7 @@ Observability and Evidence Packaging module.
 
 Provides functionality for:
 - Reports index generation with metadata extraction
-- Evidence packaging with ZIP creation and manifest generation
+- Evidence packaging with ZIP (or tar.zst) creation and manifest generation
 - Run summary report generation
 - Evidence completeness validation
 
@@ -1,20 +1,53 @@
 """
 Evidence Package Creation.
 
-Creates ZIP archives containing all run artifacts with manifest generation
-and file hashing.
+Creates ZIP archives (or zstd-compressed tar archives) containing all run
+artifacts with manifest generation and file hashing.
+
+Each file is read exactly once: the SHA-256 hash, CRC and compressed stream
+are produced in the same pass. ZIP entries are deflated on a thread pool
+(zlib and hashlib release the GIL) and written in deterministic path order.
+Incremental packaging skips files whose hashes match a previous manifest.
+LLM call evidence is packaged as its segment and index files (see
+io/llm_evidence_store.py), and the manifest records the store's stats.
 """
 
 from __future__ import annotations
 
+import hashlib
+import io
 import json
+import os
+import struct
+import tarfile
+import time
 import zipfile
-from dataclasses import asdict, dataclass
+import zlib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import IO, Any, Callable, Iterable, Iterator, Optional, TypeVar
+
+from ..io.llm_evidence_store import LLMEvidenceReader
+
+# Read size for streaming files through hash + compressor
+CHUNK_SIZE = 1024 * 1024
+
+# Default worker pool size for parallel compression
+DEFAULT_PACKAGE_WORKERS = min(8, os.cpu_count() or 1)
+
+# Supported archive formats
+ARCHIVE_FORMATS = ("zip", "tar.zst")
 
-from ..io.hashing import sha256_file
+# Above these limits the hand-written (non-ZIP64) writer is not usable and
+# packaging falls back to zipfile with ZIP64 support
+_ZIP32_MAX_ENTRIES = 0xFFFF
+_ZIP32_MAX_BYTES = 0x7FFFFFFF
+
+_T = TypeVar("_T")
+_R = TypeVar("_R")
 
 
 @dataclass
@@ -40,6 +73,12 @@ class PackageManifest:
     total_files: int
     total_size_bytes: int
     files: list[PackageFile]
+    archive_format: str = "zip"
+    # Files listed in `files` but left out of the archive because their hash
+    # matched the previous manifest (incremental packaging)
+    skipped_files: list[str] = field(default_factory=list)
+    # LLMEvidenceReader.stats() for the run's LLM call evidence
+    llm_evidence: dict[str, Any] = field(default_factory=dict)
 
     def to_dict(self) -> dict[str, Any]:
         """Serialize to dictionary."""
@@ -49,37 +88,221 @@ class PackageManifest:
             "total_files": self.total_files,
             "total_size_bytes": self.total_size_bytes,
             "files": [f.to_dict() for f in self.files],
+            "archive_format": self.archive_format,
+            "skipped_files": list(self.skipped_files),
+            "llm_evidence": dict(self.llm_evidence),
         }
 
     def to_json(self) -> str:
         """Serialize to JSON string."""
         return json.dumps(self.to_dict(), indent=2, sort_keys=True)
 
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> PackageManifest:
+        """Deserialize from dictionary."""
+        return cls(
+            package_created_at=data["package_created_at"],
+            run_id=data["run_id"],
+            total_files=data["total_files"],
+            total_size_bytes=data["total_size_bytes"],
+            files=[PackageFile(**f) for f in data["files"]],
+            archive_format=data.get("archive_format", "zip"),
+            skipped_files=list(data.get("skipped_files", [])),
+            llm_evidence=dict(data.get("llm_evidence", {})),
+        )
+
+    @classmethod
+    def load(cls, path: Path) -> PackageManifest:
+        """Load a manifest previously written with to_json()."""
+        return cls.from_dict(json.loads(path.read_text(encoding="utf-8")))
+
+
+@dataclass
+class _PackedEntry:
+    """A file read, hashed and (for ZIP) deflated in one pass."""
+
+    arcname: str
+    size_bytes: int
+    sha256: str
+    mtime: float
+    crc32: int = 0
+    data: Optional[bytes] = None  # raw deflate stream (ZIP only)
+
+
+def _deflate_file(file_path: Path, arcname: str, level: int) -> _PackedEntry:
+    """Read a file once, producing its SHA-256, CRC-32 and raw deflate stream."""
+    sha = hashlib.sha256()
+    crc = 0
+    size = 0
+    compressor = zlib.compressobj(level, zlib.DEFLATED, -15)
+    parts: list[bytes] = []
+    st = file_path.stat()
+    with open(file_path, "rb") as f:
+        while chunk := f.read(CHUNK_SIZE):
+            sha.update(chunk)
+            crc = zlib.crc32(chunk, crc)
+            size += len(chunk)
+            parts.append(compressor.compress(chunk))
+    parts.append(compressor.flush())
+    return _PackedEntry(
+        arcname=arcname,
+        size_bytes=size,
+        sha256=sha.hexdigest(),
+        mtime=st.st_mtime,
+        crc32=crc,
+        data=b"".join(parts),
+    )
+
+
+def _ordered_pool_map(
+    fn: Callable[[_T], _R],
+    items: Iterable[_T],
+    max_workers: int,
+) -> Iterator[_R]:
+    """Map fn over items on a thread pool, yielding results in input order.
+
+    At most 2 * max_workers results are in flight, bounding the memory held
+    by compressed-but-unwritten entries.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        window: deque = deque()
+        for item in items:
+            window.append(pool.submit(fn, item))
+            if len(window) >= max_workers * 2:
+                yield window.popleft().result()
+        while window:
+            yield window.popleft().result()
+
+
+def _dos_datetime(mtime: float) -> tuple[int, int]:
+    """Convert a timestamp to ZIP (DOS) time and date fields, as zipfile does."""
+    year, month, day, hour, minute, second = time.localtime(mtime)[:6]
+    if year < 1980:
+        year, month, day, hour, minute, second = 1980, 1, 1, 0, 0, 0
+    dos_time = (hour << 11) | (minute << 5) | (second // 2)
+    dos_date = ((year - 1980) << 9) | (month << 5) | day
+    return dos_time, dos_date
+
+
+class _DeflatedZipWriter:
+    """Minimal ZIP writer for entries that are already deflated.
+
+    zipfile can only compress on the writing thread; this writer appends
+    precompressed entries so compression can run on a worker pool. Archives
+    are standard (non-ZIP64) ZIP files readable by zipfile and unzip.
+    """
+
+    _LOCAL = struct.Struct("<IHHHHHIIIHH")
+    _CENTRAL = struct.Struct("<IHHHHHHIIIHHHHHII")
+    _END = struct.Struct("<IHHHHIIH")
+
+    def __init__(self, fp: IO[bytes]) -> None:
+        self._fp = fp
+        self._central: list[bytes] = []
+
+    def add(self, entry: _PackedEntry) -> None:
+        assert entry.data is not None
+        name = entry.arcname.encode("utf-8")
+        dos_time, dos_date = _dos_datetime(entry.mtime)
+        offset = self._fp.tell()
+        flags = 0x800  # UTF-8 file names
+        self._fp.write(
+            self._LOCAL.pack(
+                0x04034B50, 20, flags, zipfile.ZIP_DEFLATED, dos_time, dos_date,
+                entry.crc32, len(entry.data), entry.size_bytes, len(name), 0,
+            )
+        )
+        self._fp.write(name)
+        self._fp.write(entry.data)
+        self._central.append(
+            self._CENTRAL.pack(
+                0x02014B50, (3 << 8) | 20, 20, flags, zipfile.ZIP_DEFLATED, dos_time, dos_date,
+                entry.crc32, len(entry.data), entry.size_bytes, len(name), 0, 0, 0, 0,
+                (0o100644 << 16), offset,
+            )
+            + name
+        )
+
+    def close(self) -> None:
+        start = self._fp.tell()
+        for record in self._central:
+            self._fp.write(record)
+        size = self._fp.tell() - start
+        count = len(self._central)
+        self._fp.write(self._END.pack(0x06054B50, 0, 0, count, count, size, start, 0))
+
+
+class _HashingReader:
+    """File wrapper that hashes bytes as tarfile reads them."""
+
+    def __init__(self, fp: IO[bytes]) -> None:
+        self._fp = fp
+        self.sha = hashlib.sha256()
+
+    def read(self, size: int = -1) -> bytes:
+        data = self._fp.read(size)
+        self.sha.update(data)
+        return data
+
+
+def _import_zstandard() -> Any:
+    try:
+        import zstandard
+    except ImportError as e:
+        raise ImportError(
+            "zstandard library required for tar.zst evidence packages. "
+            "Install with: pip install zstandard"
+        ) from e
+    return zstandard
+
 
 def create_evidence_package(
     run_dir: Path,
     output_path: Path,
     include_patterns: list[str] | None = None,
+    archive_format: str = "zip",
+    previous_manifest: PackageManifest | Path | None = None,
+    max_workers: int | None = None,
+    compression_level: int | None = None,
 ) -> PackageManifest:
     """
     Create evidence package ZIP with all run artifacts.
 
     Args:
         run_dir: Path to run directory (e.g., runs/<run_id>)
-        output_path: Path to output ZIP file (e.g., runs/<run_id>/evidence.zip)
+        output_path: Path to output archive (e.g., runs/<run_id>/evidence.zip)
         include_patterns: List of glob patterns to include (default: all files)
+        archive_format: "zip" (default) or "tar.zst" (requires zstandard)
+        previous_manifest: Manifest (or path to its JSON) of a previous package.
+            Files whose hash matches it are listed in the manifest but left out
+            of the archive; files with unchanged size and mtime are not re-read.
+        max_workers: Compression worker pool size (default: DEFAULT_PACKAGE_WORKERS)
+        compression_level: Compression level (default: 6 for zip, 3 for tar.zst)
 
     Returns:
         PackageManifest with metadata for all packaged files
+
+    Raises:
+        FileNotFoundError: If run_dir does not exist
+        ValueError: If archive_format is not supported
+        ImportError: If tar.zst is requested and zstandard is not installed
     """
     if not run_dir.exists():
         raise FileNotFoundError(f"Run directory does not exist: {run_dir}")
 
+    if archive_format not in ARCHIVE_FORMATS:
+        raise ValueError(
+            f"Unsupported archive_format: {archive_format!r} (expected one of {ARCHIVE_FORMATS})"
+        )
+    if compression_level is None:
+        compression_level = 3 if archive_format == "tar.zst" else 6
+
     # Default patterns: include all artifacts, reports, events, and snapshot
     if include_patterns is None:
         include_patterns = [
             "artifacts/**/*",
             "reports/**/*",
+            "evidence/llm_calls/*",
             "events.ndjson",
             "snapshot.json",
             "run_config.yaml",
@@ -92,42 +315,65 @@ def create_evidence_package(
     for pattern in include_patterns:
         files_to_package.extend(run_dir.glob(pattern))
 
-    # Filter to only actual files (not directories)
-    files_to_package = [f for f in files_to_package if f.is_file()]
+    # Filter to only actual files (not directories); overlapping patterns
+    # must not package a file twice
+    files_to_package = list({f for f in files_to_package if f.is_file()})
 
     # Sort for deterministic ordering
     files_to_package.sort()
 
-    # Create ZIP archive
+    # Incremental packaging: reuse hashes for files unchanged since the
+    # previous package and leave hash-identical files out of the archive
+    previous: dict[str, PackageFile] = {}
+    if previous_manifest is not None:
+        if not isinstance(previous_manifest, PackageManifest):
+            previous_manifest = PackageManifest.load(Path(previous_manifest))
+        previous = {f.relative_path: f for f in previous_manifest.files}
+
+    to_pack: list[tuple[Path, str]] = []
     package_files: list[PackageFile] = []
-    total_size = 0
+    skipped_files: list[str] = []
+    by_arcname: dict[str, PackageFile] = {}
 
-    with zipfile.ZipFile(output_path, "w", zipfile.ZIP_DEFLATED) as zipf:
-        for file_path in files_to_package:
-            relative_path = file_path.relative_to(run_dir)
-            arcname = str(relative_path).replace("\\", "/")  # Use forward slashes
-
-            # Add to ZIP
-            zipf.write(file_path, arcname=arcname)
-
-            # Compute metadata
-            size_bytes = file_path.stat().st_size
-            sha256_hash = sha256_file(file_path)
-            modified_at = datetime.fromtimestamp(
-                file_path.stat().st_mtime,
-                tz=timezone.utc,
-            ).isoformat()
-
-            package_files.append(
-                PackageFile(
-                    relative_path=arcname,
-                    size_bytes=size_bytes,
-                    sha256=sha256_hash,
-                    modified_at=modified_at,
-                )
-            )
+    for file_path in files_to_package:
+        relative_path = file_path.relative_to(run_dir)
+        arcname = str(relative_path).replace("\\", "/")  # Use forward slashes
+        prior = previous.get(arcname)
+        if prior is not None:
+            st = file_path.stat()
+            if st.st_size == prior.size_bytes and _isoformat_mtime(st.st_mtime) == prior.modified_at:
+                # Unchanged since the previous package: no need to read it
+                by_arcname[arcname] = prior
+                skipped_files.append(arcname)
+                continue
+        to_pack.append((file_path, arcname))
+
+    def _record(entry: _PackedEntry) -> bool:
+        """Record manifest metadata; return False if the entry can be skipped."""
+        by_arcname[entry.arcname] = PackageFile(
+            relative_path=entry.arcname,
+            size_bytes=entry.size_bytes,
+            sha256=entry.sha256,
+            modified_at=_isoformat_mtime(entry.mtime),
+        )
+        prior = previous.get(entry.arcname)
+        if prior is not None and prior.sha256 == entry.sha256:
+            skipped_files.append(entry.arcname)
+            return False
+        return True
 
-            total_size += size_bytes
+    workers = max_workers or DEFAULT_PACKAGE_WORKERS
+    prior_names = set(previous)
+    if archive_format == "tar.zst":
+        _write_tar_zst(output_path, to_pack, _record, compression_level, workers, prior_names)
+    else:
+        _write_zip(output_path, to_pack, _record, compression_level, workers, prior_names)
+
+    total_size = 0
+    for file_path in files_to_package:
+        arcname = str(file_path.relative_to(run_dir)).replace("\\", "/")
+        package_files.append(by_arcname[arcname])
+        total_size += by_arcname[arcname].size_bytes
 
     # Extract run_id from directory name
     run_id = run_dir.name
@@ -139,6 +385,109 @@ def create_evidence_package(
         total_files=len(package_files),
         total_size_bytes=total_size,
         files=package_files,
+        archive_format=archive_format,
+        skipped_files=sorted(skipped_files),
+        llm_evidence=LLMEvidenceReader.for_run(run_dir).stats(),
     )
 
     return manifest
+
+
+def _isoformat_mtime(mtime: float) -> str:
+    return datetime.fromtimestamp(mtime, tz=timezone.utc).isoformat()
+
+
+def _write_zip(
+    output_path: Path,
+    to_pack: list[tuple[Path, str]],
+    record: Callable[[_PackedEntry], bool],
+    level: int,
+    workers: int,
+    prior_names: set[str],
+) -> None:
+    """Write a ZIP archive, deflating entries in parallel."""
+    total_bytes = sum(path.stat().st_size for path, _ in to_pack)
+    if len(to_pack) >= _ZIP32_MAX_ENTRIES or total_bytes >= _ZIP32_MAX_BYTES:
+        _write_zip64(output_path, to_pack, record, level, prior_names)
+        return
+
+    with open(output_path, "wb") as fp:
+        writer = _DeflatedZipWriter(fp)
+        entries = _ordered_pool_map(
+            lambda item: _deflate_file(item[0], item[1], level), to_pack, workers
+        )
+        for entry in entries:
+            if record(entry):
+                writer.add(entry)
+        writer.close()
+
+
+def _write_zip64(
+    output_path: Path,
+    to_pack: list[tuple[Path, str]],
+    record: Callable[[_PackedEntry], bool],
+    level: int,
+    prior_names: set[str],
+) -> None:
+    """Write a ZIP64 archive with zipfile, hashing while streaming each file.
+
+    Files present in the previous manifest are hashed before they are added,
+    so hash-identical files are never written.
+    """
+    with zipfile.ZipFile(output_path, "w", zipfile.ZIP_DEFLATED, compresslevel=level) as zipf:
+        for file_path, arcname in to_pack:
+            st = file_path.stat()
+            zinfo = zipfile.ZipInfo.from_file(file_path, arcname=arcname)
+            zinfo.compress_type = zipfile.ZIP_DEFLATED
+            if arcname in prior_names:
+                data = file_path.read_bytes()
+                entry = _PackedEntry(arcname, len(data), hashlib.sha256(data).hexdigest(), st.st_mtime)
+                if record(entry):
+                    zipf.writestr(zinfo, data)
+                continue
+
+            sha = hashlib.sha256()
+            size = 0
+            with open(file_path, "rb") as src, zipf.open(zinfo, "w", force_zip64=True) as dst:
+                while chunk := src.read(CHUNK_SIZE):
+                    sha.update(chunk)
+                    size += len(chunk)
+                    dst.write(chunk)
+            record(_PackedEntry(arcname, size, sha.hexdigest(), st.st_mtime))
+
+
+def _write_tar_zst(
+    output_path: Path,
+    to_pack: list[tuple[Path, str]],
+    record: Callable[[_PackedEntry], bool],
+    level: int,
+    workers: int,
+    prior_names: set[str],
+) -> None:
+    """Write a deterministic tar stream through a multi-threaded zstd compressor.
+
+    Files present in the previous manifest are hashed before they are added,
+    so hash-identical files are never compressed.
+    """
+    zstandard = _import_zstandard()
+    compressor = zstandard.ZstdCompressor(level=level, threads=workers)
+    with open(output_path, "wb") as raw, compressor.stream_writer(raw, closefd=False) as zfp:
+        with tarfile.open(fileobj=zfp, mode="w|", format=tarfile.PAX_FORMAT) as tar:
+            for file_path, arcname in to_pack:
+                st = file_path.stat()
+                tarinfo = tarfile.TarInfo(name=arcname)
+                tarinfo.mtime = int(st.st_mtime)
+                tarinfo.mode = 0o644
+                if arcname in prior_names:
+                    data = file_path.read_bytes()
+                    entry = _PackedEntry(arcname, len(data), hashlib.sha256(data).hexdigest(), st.st_mtime)
+                    if record(entry):
+                        tarinfo.size = len(data)
+                        tar.addfile(tarinfo, io.BytesIO(data))
+                    continue
+
+                tarinfo.size = st.st_size
+                with open(file_path, "rb") as src:
+                    reader = _HashingReader(src)
+                    tar.addfile(tarinfo, reader)
+                record(_PackedEntry(arcname, st.st_size, reader.sha.hexdigest(), st.st_mtime))
@@ -13,6 +13,9 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+from ..io.llm_evidence_store import LLMEvidenceReader
+from ..state.event_log import iter_events
+
 
 @dataclass
 class TimelineEvent:
@@ -193,36 +196,23 @@ def _parse_timeline_from_events(events_path: Path) -> list[TimelineEvent]:
         "RUN_STATE_CHANGED",
     }
 
-    with events_path.open(encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-
-            try:
-                event = json.loads(line)
-            except json.JSONDecodeError:
-                continue
-
-            event_type = event.get("type", "")
-            if event_type not in major_event_types:
-                continue
-
-            timestamp = event.get("ts", "")
-            payload = event.get("payload", {})
-            worker = payload.get("worker") or payload.get("gate_name")
-
-            # Generate message based on event type
-            message = _generate_event_message(event_type, payload)
-
-            timeline.append(
-                TimelineEvent(
-                    timestamp=timestamp,
-                    event_type=event_type,
-                    worker=worker,
-                    message=message,
-                )
+    for event in iter_events(events_path, types=major_event_types, skip_invalid=True):
+        event_type = event.get("type", "")
+        timestamp = event.get("ts", "")
+        payload = event.get("payload", {})
+        worker = payload.get("worker") or payload.get("gate_name")
+
+        # Generate message based on event type
+        message = _generate_event_message(event_type, payload)
+
+        timeline.append(
+            TimelineEvent(
+                timestamp=timestamp,
+                event_type=event_type,
+                worker=worker,
+                message=message,
             )
+        )
 
     return timeline
 
@@ -259,7 +249,8 @@ def validate_evidence_completeness(run_dir: Path) -> dict[str, Any]:
     """
     Validate evidence completeness for a run.
 
-    Checks for required artifacts and worker reports.
+    Checks for required artifacts, worker reports, and recorded evidence for
+    every finished LLM call (LLM_CALL_FINISHED events).
 
     Args:
         run_dir: Path to run directory (e.g., runs/<run_id>)
@@ -269,6 +260,8 @@ def validate_evidence_completeness(run_dir: Path) -> dict[str, Any]:
         - completeness_score: float (0-100%)
         - missing_artifacts: list[str]
         - missing_reports: list[str]
+        - missing_llm_evidence: list[str] (call IDs)
+        - llm_evidence: LLMEvidenceReader.stats()
         - is_complete: bool
     """
     required_artifacts = [
@@ -300,6 +293,14 @@ def validate_evidence_completeness(run_dir: Path) -> dict[str, Any]:
                 # In real implementation, would check reports/agents/<agent>/TC-<id>/
                 pass
 
+    # Check every finished LLM call has recorded evidence
+    llm_evidence = LLMEvidenceReader.for_run(run_dir)
+    missing_llm_evidence = [
+        call_id
+        for call_id in _finished_llm_call_ids(run_dir / "events.ndjson")
+        if call_id not in llm_evidence
+    ]
+
     # Calculate completeness score
     total_checks = len(required_artifacts)
     passed_checks = total_checks - len(missing_artifacts)
@@ -309,5 +310,26 @@ def validate_evidence_completeness(run_dir: Path) -> dict[str, Any]:
         "completeness_score": completeness_score,
         "missing_artifacts": missing_artifacts,
         "missing_reports": missing_reports,
-        "is_complete": len(missing_artifacts) == 0 and len(missing_reports) == 0,
+        "missing_llm_evidence": missing_llm_evidence,
+        "llm_evidence": llm_evidence.stats(),
+        "is_complete": (
+            len(missing_artifacts) == 0
+            and len(missing_reports) == 0
+            and len(missing_llm_evidence) == 0
+        ),
+    }
+
+
+def _finished_llm_call_ids(events_path: Path) -> list[str]:
+    """Return call IDs of LLM_CALL_FINISHED events, sorted and deduplicated."""
+    if not events_path.exists():
+        return []
+
+    call_ids = {
+        event["payload"]["call_id"]
+        for event in iter_events(
+            events_path, types={"LLM_CALL_FINISHED"}, payload_keys=["call_id"], skip_invalid=True
+        )
+        if event["payload"].get("call_id")
     }
+    return sorted(call_ids)
@@ -12,9 +12,21 @@ Spec references:
 - specs/21_worker_contracts.md (Worker contracts)
 """
 
-from .graph import build_orchestrator_graph, OrchestratorState
-from .run_loop import execute_run, execute_batch, RunResult
-from .worker_invoker import WorkerInvoker
+from __future__ import annotations
+
+import importlib
+from typing import Any
+
+# Exports are imported on first access so that importing a submodule (e.g.
+# launch.orchestrator.worker_cache) does not pull in LangGraph and the workers
+_EXPORTS = {
+    "build_orchestrator_graph": ".graph",
+    "OrchestratorState": ".graph",
+    "execute_run": ".run_loop",
+    "execute_batch": ".run_loop",
+    "RunResult": ".run_loop",
+    "WorkerInvoker": ".worker_invoker",
+}
 
 __all__ = [
     "build_orchestrator_graph",
@@ -24,3 +36,16 @@ __all__ = [
     "RunResult",
     "WorkerInvoker",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,328 @@
+"""Dataflow scheduler for orchestrator work items.
+
+Runs a batch of work items concurrently wherever their declared inputs and
+outputs allow, while producing the same artifacts and the same event order
+as running them one after another in declaration order.
+
+Dependencies are derived from artifact hazards between items (in
+declaration order):
+- read-after-write: a later item reads what an earlier item writes
+- write-after-read: a later item writes what an earlier item reads
+- write-after-write: both items write the same artifact
+
+Reads include the artifacts a worker is known to read without declaring
+them (worker_cache.CACHEABLE_WORKERS extra_inputs). Directory entries such
+as "drafts/" overlap every path below them.
+
+Determinism:
+- Each work item runs with its events captured (state.event_log.capture_events)
+  and the captured events are flushed in declaration order, so events.ndjson
+  has the same order as a serial run (only ts/event_id differ)
+- Workers in EXCLUSIVE_WORKERS run alone, uncaptured: they append to
+  events.ndjson directly or own a single-writer critical section. Cacheable
+  workers also run alone, since output memoization diffs the whole
+  artifacts directory around the invocation
+
+Spec references:
+- specs/28_coordination_and_handoffs.md (Work item contract, Concurrency model)
+- specs/10_determinism_and_caching.md (Allowed run-to-run variance)
+"""
+
+from __future__ import annotations
+
+import os
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from typing import Any, Dict, FrozenSet, List, Optional, Set, Tuple
+
+from launch.clients.llm_governor import get_llm_governor, reset_llm_governor
+from launch.orchestrator.worker_cache import CACHEABLE_WORKERS
+from launch.orchestrator.worker_invoker import WorkerInvoker
+from launch.state.event_log import capture_events, flush_captured_events
+
+# Workers that never overlap with other work items
+EXCLUSIVE_WORKERS: FrozenSet[str] = frozenset(
+    {
+        "W1.RepoScout",  # clones into RUN_DIR/work; sub-steps append events directly
+        "W3.SnippetCurator",  # extraction steps append events directly
+        "W6.LinkerAndPatcher",  # single writer of the site worktree
+        "W8.Fixer",
+        "W9.PRManager",
+    }
+)
+
+# run_config entries that only make sense inside the orchestrator process
+PROCESS_LOCAL_CONFIG_KEYS: FrozenSet[str] = frozenset({"_telemetry_client"})
+
+# Default bound on concurrently running work items
+DEFAULT_MAX_PARALLEL = min(8, os.cpu_count() or 1)
+
+
+@dataclass
+class WorkSpec:
+    """A work item to schedule.
+
+    Attributes:
+        worker: Worker name (e.g., "W5.SectionWriter")
+        inputs: Declared input artifact names or paths
+        outputs: Declared output artifact names or paths
+        scope_key: Scope key (required when several items share a worker)
+        run_config: Run configuration passed to the worker
+    """
+
+    worker: str
+    inputs: List[str]
+    outputs: List[str]
+    scope_key: Optional[str] = None
+    run_config: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def reads(self) -> List[str]:
+        """Declared inputs plus artifacts the worker reads without declaring them."""
+        spec = CACHEABLE_WORKERS.get(self.worker)
+        extra = list(spec.extra_inputs) if spec else []
+        return list(self.inputs) + [name for name in extra if name not in self.inputs]
+
+    @property
+    def exclusive(self) -> bool:
+        """Whether the item must run with no other item in flight."""
+        return self.worker in EXCLUSIVE_WORKERS or self.worker in CACHEABLE_WORKERS
+
+
+class SchedulerError(Exception):
+    """Invalid batch of work items."""
+
+
+def _overlaps(a: str, b: str) -> bool:
+    if a == b:
+        return True
+    if a.endswith("/") and b.startswith(a):
+        return True
+    return b.endswith("/") and a.startswith(b)
+
+
+def _any_overlap(left: List[str], right: List[str]) -> bool:
+    return any(_overlaps(a, b) for a in left for b in right)
+
+
+def build_dependencies(specs: List[WorkSpec]) -> List[Set[int]]:
+    """Compute, for every spec, the indices of earlier specs it must wait for.
+
+    Args:
+        specs: Work items in declaration (serial) order
+
+    Returns:
+        deps[i] = set of indices j < i that item i depends on
+
+    Raises:
+        SchedulerError: If two items share worker and scope_key
+    """
+    seen: Set[Tuple[str, Optional[str]]] = set()
+    for spec in specs:
+        key = (spec.worker, spec.scope_key)
+        if key in seen:
+            raise SchedulerError(
+                f"Duplicate work item {spec.worker} scope_key={spec.scope_key!r}; "
+                "parallel work items need distinct scope keys"
+            )
+        seen.add(key)
+
+    deps: List[Set[int]] = []
+    for i, later in enumerate(specs):
+        item_deps: Set[int] = set()
+        for j, earlier in enumerate(specs[:i]):
+            if (
+                later.exclusive
+                or earlier.exclusive
+                or _any_overlap(earlier.outputs, later.reads)
+                or _any_overlap(earlier.reads, later.outputs)
+                or _any_overlap(earlier.outputs, later.outputs)
+            ):
+                item_deps.add(j)
+        deps.append(item_deps)
+    return deps
+
+
+def plan_levels(specs: List[WorkSpec]) -> List[List[int]]:
+    """Group specs into levels whose items may run concurrently.
+
+    Level n holds the items whose longest dependency chain has length n.
+    Informational only; DagScheduler.run starts items as soon as they are
+    ready rather than level by level.
+    """
+    deps = build_dependencies(specs)
+    depth: List[int] = []
+    for item_deps in deps:
+        depth.append(1 + max((depth[j] for j in item_deps), default=-1))
+    levels: List[List[int]] = [[] for _ in range(max(depth, default=-1) + 1)]
+    for i, d in enumerate(depth):
+        levels[d].append(i)
+    return levels
+
+
+def _run_captured(
+    invoker: WorkerInvoker, spec: WorkSpec
+) -> Tuple[Optional[Dict[str, Any]], Optional[BaseException], List[Tuple[Path, str]]]:
+    """Invoke one work item with its events captured (runs in a pool worker)."""
+    with capture_events() as buffer:
+        try:
+            return _invoke(invoker, spec), None, buffer
+        except Exception as e:
+            return None, e, buffer
+
+
+def _invoke(invoker: WorkerInvoker, spec: WorkSpec) -> Dict[str, Any]:
+    return invoker.invoke_worker(
+        worker=spec.worker,
+        inputs=spec.inputs,
+        outputs=spec.outputs,
+        scope_key=spec.scope_key,
+        run_config=spec.run_config,
+    )
+
+
+class DagScheduler:
+    """Runs work items through a WorkerInvoker as a dataflow graph.
+
+    Usage:
+        scheduler = DagScheduler(invoker, max_parallel=4)
+        results = scheduler.run([WorkSpec(...), WorkSpec(...)])
+    """
+
+    def __init__(
+        self,
+        invoker: WorkerInvoker,
+        max_parallel: Optional[int] = None,
+        use_processes: bool = False,
+    ):
+        """Initialize scheduler.
+
+        Args:
+            invoker: Worker invoker for the run
+            max_parallel: Bound on concurrently running items
+                          (default: LAUNCH_MAX_PARALLEL or DEFAULT_MAX_PARALLEL)
+            use_processes: Run concurrent items in a process pool instead of
+                           threads (for CPU-bound workers). Process-local
+                           run_config entries (PROCESS_LOCAL_CONFIG_KEYS) are
+                           not passed to child processes, and each child's
+                           LLM governor gets an equal share of this
+                           process's limits.
+        """
+        if max_parallel is None:
+            max_parallel = int(os.environ.get("LAUNCH_MAX_PARALLEL", DEFAULT_MAX_PARALLEL))
+        self.invoker = invoker
+        self.max_parallel = max(1, max_parallel)
+        self.use_processes = use_processes
+
+    def _make_pool(self, size: int) -> Executor:
+        if not self.use_processes:
+            return ThreadPoolExecutor(max_workers=size)
+        # Children admit LLM calls through their own governors: split the limits between them
+        return ProcessPoolExecutor(
+            max_workers=size,
+            initializer=reset_llm_governor,
+            initargs=(get_llm_governor().config.split(size),),
+        )
+
+    def _submit(self, pool: Executor, spec: WorkSpec) -> Future:
+        if self.use_processes:
+            run_config = {
+                k: v for k, v in spec.run_config.items() if k not in PROCESS_LOCAL_CONFIG_KEYS
+            }
+            spec = replace(spec, run_config=run_config)
+        return pool.submit(_run_captured, self.invoker, spec)
+
+    def run(self, specs: List[WorkSpec]) -> List[Dict[str, Any]]:
+        """Run all specs, overlapping independent ones.
+
+        Exclusive items and single-item batches run inline in the calling
+        thread; everything else runs in the pool.
+
+        Args:
+            specs: Work items in declaration (serial) order
+
+        Returns:
+            Worker results in declaration order
+
+        Raises:
+            SchedulerError: If the batch is invalid
+            Exception: The first failure in declaration order; no new items
+                       are started after a failure
+        """
+        deps = build_dependencies(specs)
+        if len(specs) == 1:
+            return [_invoke(self.invoker, specs[0])]
+
+        results: List[Optional[Dict[str, Any]]] = [None] * len(specs)
+        errors: Dict[int, BaseException] = {}
+        buffers: Dict[int, List[Tuple[Path, str]]] = {}
+        done: Set[int] = set()
+        flushed = 0
+        pending = list(range(len(specs)))
+        running: Dict[Future, int] = {}
+
+        pool_size = min(self.max_parallel, sum(1 for spec in specs if not spec.exclusive))
+        pool: Optional[Executor] = None
+        try:
+            while pending or running:
+                for i in list(pending):
+                    if errors:
+                        break
+                    if not deps[i] <= done:
+                        continue
+                    if specs[i].exclusive:
+                        if running:
+                            break
+                        # Nothing else is in flight: events go straight to the log
+                        pending.remove(i)
+                        try:
+                            results[i] = _invoke(self.invoker, specs[i])
+                        except Exception as e:
+                            errors[i] = e
+                        buffers[i] = []
+                        done.add(i)
+                        continue
+                    if len(running) >= self.max_parallel:
+                        break
+                    if pool is None:
+                        pool = self._make_pool(pool_size)
+                    pending.remove(i)
+                    running[self._submit(pool, specs[i])] = i
+
+                if errors and not running:
+                    break
+
+                if running:
+                    finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                    for future in finished:
+                        i = running.pop(future)
+                        result, error, buffers[i] = future.result()
+                        done.add(i)
+                        if error is not None:
+                            errors[i] = error
+                        else:
+                            results[i] = result
+
+                # Retire in declaration order
+                while flushed in buffers:
+                    flush_captured_events(buffers.pop(flushed))
+                    flushed += 1
+        finally:
+            if pool is not None:
+                pool.shutdown(wait=True)
+
+        # Items after a gap left by a failure retire in declaration order too
+        for i in sorted(buffers):
+            flush_captured_events(buffers[i])
+
+        if errors:
+            raise errors[min(errors)]
+        return [result for result in results if result is not None]
@@ -0,0 +1,299 @@
+"""Delta relaunch: redraft only the pages a product repo change affects.
+
+A run started with run_config["delta_from_run_id"] names an earlier run of
+the same product (its RUN_DIR is a sibling of this one). W1-W4 run as usual
+(W2-W4 mostly hit the worker cache); before drafting, the orchestrator
+computes a delta plan:
+
+1. Changed files: git diff between the two resolved repo SHAs, falling back
+   to comparing blob SHAs of both clones when the current clone is too
+   shallow to reach the base commit.
+2. Affected claims: claims whose evidence_map.json citations point at a
+   changed file (in either run's evidence map).
+3. Changed product inputs: product-level product_facts fields W5 folds into
+   pages beyond their required claims (PRODUCT_INPUT_FIELDS), compared
+   between both runs' product_facts.json.
+4. Affected pages: pages whose required_claim_ids include an affected claim,
+   whose required_snippet_tags match a snippet sourced from a changed file,
+   whose page_plan.json entry differs from the base run, that have no base
+   draft, whose page_role draws on the whole of product_facts
+   (GLOBAL_PAGE_ROLES), or that use a changed product input (every page
+   for positioning; pages with a Limitations heading for limitations).
+
+Every other page reuses the base run's draft. The plan is written to
+artifacts/delta_plan.json; W5 copies reused drafts instead of generating
+them and W5.5 reviews only the redrafted ones. W7 still validates the whole
+site, since its gates (links, navigation, Hugo build) are site-wide.
+
+When no plan can be computed (base run missing, SHAs unknown, base commit
+unreachable) the run falls back to a full redraft.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from launch.io.atomic import atomic_write_json
+from launch.util.logging import get_logger
+from launch.workers._git.clone_helpers import diff_changed_paths, list_blob_shas
+from launch.workers.w5_section_writer import generate_page_id
+
+logger = get_logger()
+
+# run_config key naming the base run of a delta relaunch
+DELTA_FROM_RUN_KEY = "delta_from_run_id"
+
+# Artifact (under artifacts/) recording the delta plan
+DELTA_PLAN_ARTIFACT = "delta_plan.json"
+
+# Page roles whose content is built from all of product_facts rather than
+# from required_claim_ids, so any repo change redrafts them
+GLOBAL_PAGE_ROLES = frozenset({"toc", "comprehensive_guide", "feature_showcase"})
+
+# Product-level inputs W5 uses beyond a page's required claims: "positioning"
+# (product name, short description, tagline) goes into every page's prompt,
+# "limitations" (all claim_groups["limitations"] claims) into every page with
+# a Limitations heading
+PRODUCT_INPUT_FIELDS = ("positioning", "limitations")
+LIMITATIONS_HEADING = "Limitations"
+
+
+@dataclass
+class DeltaPlan:
+    """Pages to redraft and drafts to reuse for a delta relaunch.
+
+    Attributes:
+        base_run_id: Run whose drafts are reused
+        base_repo_sha: Product repo SHA of the base run
+        repo_sha: Product repo SHA of this run
+        changed_files: Repo-relative paths that differ between the SHAs
+        affected_claim_ids: Claims citing a changed file
+        changed_product_inputs: PRODUCT_INPUT_FIELDS that differ between the runs
+        redraft_page_ids: Pages W5 must generate
+        reused_drafts: page_id -> absolute path of the base run's draft
+    """
+
+    base_run_id: str
+    base_repo_sha: str
+    repo_sha: str
+    changed_files: List[str] = field(default_factory=list)
+    affected_claim_ids: List[str] = field(default_factory=list)
+    changed_product_inputs: List[str] = field(default_factory=list)
+    redraft_page_ids: List[str] = field(default_factory=list)
+    reused_drafts: Dict[str, str] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary."""
+        return {"schema_version": "1.0", **asdict(self)}
+
+
+def _load_json(path: Path) -> Optional[Dict[str, Any]]:
+    """Load a JSON object, returning None if missing or unreadable."""
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def _repo_sha(run_dir: Path) -> Optional[str]:
+    """Return the resolved product repo SHA recorded by W1."""
+    refs = _load_json(run_dir / "artifacts" / "resolved_refs.json") or {}
+    return refs.get("repo", {}).get("resolved_sha")
+
+
+def changed_repo_files(base_run_dir: Path, run_dir: Path) -> Optional[List[str]]:
+    """List product repo files that changed between two runs.
+
+    Args:
+        base_run_dir: RUN_DIR of the base run
+        run_dir: RUN_DIR of the current run (W1 must have run)
+
+    Returns:
+        Sorted repo-relative paths, or None if the change set is unknown
+    """
+    base_sha, sha = _repo_sha(base_run_dir), _repo_sha(run_dir)
+    if not base_sha or not sha:
+        return None
+    if base_sha == sha:
+        return []
+
+    changed = diff_changed_paths(run_dir / "work" / "repo", base_sha, sha)
+    if changed is not None:
+        return changed
+
+    # Shallow clone: compare both checkouts' trees when the base clone is kept
+    base_blobs = list_blob_shas(base_run_dir / "work" / "repo")
+    blobs = list_blob_shas(run_dir / "work" / "repo")
+    if not base_blobs or not blobs:
+        return None
+    return sorted(p for p in base_blobs.keys() | blobs.keys() if base_blobs.get(p) != blobs.get(p))
+
+
+def claims_citing(evidence_maps: Iterable[Dict[str, Any]], paths: Set[str]) -> Set[str]:
+    """Return claim IDs with at least one citation in paths."""
+    return {
+        claim["claim_id"]
+        for evidence_map in evidence_maps
+        for claim in evidence_map.get("claims", [])
+        if any(c.get("path") in paths for c in claim.get("citations", []))
+    }
+
+
+def snippet_tags_from(snippet_catalogs: Iterable[Dict[str, Any]], paths: Set[str]) -> Set[str]:
+    """Return tags of snippets sourced from a file in paths."""
+    return {
+        tag
+        for catalog in snippet_catalogs
+        for snippet in catalog.get("snippets", [])
+        if snippet.get("source", {}).get("path") in paths
+        for tag in snippet.get("tags", [])
+    }
+
+
+def _digest(value: Any) -> str:
+    return hashlib.sha256(json.dumps(value, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+
+def product_input_digests(product_facts: Optional[Dict[str, Any]]) -> Dict[str, Optional[str]]:
+    """Digest each of PRODUCT_INPUT_FIELDS (None when product_facts is missing)."""
+    if product_facts is None:
+        return {name: None for name in PRODUCT_INPUT_FIELDS}
+    positioning = product_facts.get("positioning") or {}
+    limitation_ids = set((product_facts.get("claim_groups") or {}).get("limitations", []))
+    return {
+        "positioning": _digest(
+            [
+                product_facts.get("product_name"),
+                positioning.get("short_description"),
+                positioning.get("tagline"),
+            ]
+        ),
+        "limitations": _digest(
+            [c for c in product_facts.get("claims", []) if c.get("claim_id") in limitation_ids]
+        ),
+    }
+
+
+def changed_product_inputs(
+    base_product_facts: Optional[Dict[str, Any]],
+    product_facts: Optional[Dict[str, Any]],
+) -> Set[str]:
+    """Return the PRODUCT_INPUT_FIELDS that differ (or cannot be compared) between two runs."""
+    base, current = product_input_digests(base_product_facts), product_input_digests(product_facts)
+    return {name for name in PRODUCT_INPUT_FIELDS if base[name] is None or base[name] != current[name]}
+
+
+def compute_delta_plan(run_dir: Path, base_run_id: str) -> Optional[DeltaPlan]:
+    """Compute which pages to redraft relative to a base run.
+
+    Must run after W4 (page_plan.json) and before W5.
+
+    Args:
+        run_dir: RUN_DIR of the current run
+        base_run_id: Run ID of the base run (a sibling RUN_DIR)
+
+    Returns:
+        DeltaPlan, or None if this run must draft every page
+    """
+    base_run_dir = run_dir.parent / base_run_id
+    artifacts, base_artifacts = run_dir / "artifacts", base_run_dir / "artifacts"
+
+    page_plan = _load_json(artifacts / "page_plan.json")
+    base_page_plan = _load_json(base_artifacts / "page_plan.json")
+    base_manifest = _load_json(base_artifacts / "draft_manifest.json")
+    if page_plan is None or base_page_plan is None or base_manifest is None:
+        logger.warning("delta_plan_unavailable", base_run_id=base_run_id, reason="missing base artifacts")
+        return None
+
+    changed = changed_repo_files(base_run_dir, run_dir)
+    if changed is None:
+        logger.warning("delta_plan_unavailable", base_run_id=base_run_id, reason="unknown repo change set")
+        return None
+
+    changed_set = set(changed)
+    evidence_maps = [
+        m for m in (_load_json(base_artifacts / "evidence_map.json"), _load_json(artifacts / "evidence_map.json"))
+        if m is not None
+    ]
+    catalogs = [
+        c for c in (_load_json(base_artifacts / "snippet_catalog.json"), _load_json(artifacts / "snippet_catalog.json"))
+        if c is not None
+    ]
+    affected_claims = claims_citing(evidence_maps, changed_set)
+    affected_tags = snippet_tags_from(catalogs, changed_set)
+    changed_inputs = changed_product_inputs(
+        _load_json(base_artifacts / "product_facts.json"), _load_json(artifacts / "product_facts.json")
+    )
+
+    base_pages = {generate_page_id(p): p for p in base_page_plan.get("pages", [])}
+    base_drafts = {
+        d["page_id"]: base_run_dir / d["draft_path"]
+        for d in base_manifest.get("drafts", [])
+    }
+
+    redraft: List[str] = []
+    reused: Dict[str, str] = {}
+    for page in page_plan.get("pages", []):
+        page_id = generate_page_id(page)
+        draft = base_drafts.get(page_id)
+        if (
+            base_pages.get(page_id) != page
+            or draft is None
+            or not draft.is_file()
+            or (changed and page.get("page_role") in GLOBAL_PAGE_ROLES)
+            or affected_claims.intersection(page.get("required_claim_ids", []))
+            or affected_tags.intersection(page.get("required_snippet_tags", []))
+            or "positioning" in changed_inputs
+            or (
+                "limitations" in changed_inputs
+                and LIMITATIONS_HEADING in page.get("required_headings", [])
+            )
+        ):
+            redraft.append(page_id)
+        else:
+            reused[page_id] = str(draft.resolve())
+
+    return DeltaPlan(
+        base_run_id=base_run_id,
+        base_repo_sha=_repo_sha(base_run_dir) or "",
+        repo_sha=_repo_sha(run_dir) or "",
+        changed_files=changed,
+        affected_claim_ids=sorted(affected_claims),
+        changed_product_inputs=sorted(changed_inputs),
+        redraft_page_ids=sorted(redraft),
+        reused_drafts=dict(sorted(reused.items())),
+    )
+
+
+def write_delta_plan(run_dir: Path, plan: DeltaPlan) -> Path:
+    """Write artifacts/delta_plan.json and return its path."""
+    path = run_dir / "artifacts" / DELTA_PLAN_ARTIFACT
+    atomic_write_json(path, plan.to_dict())
+    return path
+
+
+def load_delta_plan(run_dir: Path) -> Optional[Dict[str, Any]]:
+    """Load artifacts/delta_plan.json, or None if this is not a delta run."""
+    return _load_json(run_dir / "artifacts" / DELTA_PLAN_ARTIFACT)
+
+
+def review_scope(run_dir: Path) -> Optional[List[str]]:
+    """Return the redrafted draft paths W5.5 should review.
+
+    Args:
+        run_dir: RUN_DIR of the current run (W5 must have run)
+
+    Returns:
+        Draft paths relative to run_dir, or None if every draft is reviewed
+    """
+    plan = load_delta_plan(run_dir)
+    manifest = _load_json(run_dir / "artifacts" / "draft_manifest.json")
+    if plan is None or manifest is None:
+        return None
+    redrafted = set(plan.get("redraft_page_ids", []))
+    return [d["draft_path"] for d in manifest.get("drafts", []) if d["page_id"] in redrafted]
@@ -11,6 +11,7 @@ Spec references:
 
 from __future__ import annotations
 
+import json
 import os
 from pathlib import Path
 from typing import Annotated, Any, Dict, List, Optional, TypedDict
@@ -39,7 +40,16 @@ from launch.models.state import (
 )
 from launch.state.event_log import generate_span_id, generate_trace_id
 from launch.util.logging import get_logger
+from launch.workers.w5_5_content_reviewer import REVIEW_SCOPE_KEY
+from launch.workers.w5_section_writer import (
+    REUSED_DRAFTS_KEY,
+    SECTION_SCOPE_KEY,
+    merge_draft_manifests,
+    planned_sections,
+)
 
+from .dag_scheduler import DagScheduler, WorkSpec
+from .delta import DELTA_FROM_RUN_KEY, compute_delta_plan, review_scope, write_delta_plan
 from .worker_invoker import WorkerInvoker
 
 logger = get_logger()
@@ -234,25 +244,28 @@ def ingest_node(state: OrchestratorState) -> OrchestratorState:
 def build_facts_node(state: OrchestratorState) -> OrchestratorState:
     """Build product facts and evidence map.
 
-    TC-300: Invokes W2 FactsBuilder → W3 SnippetCurator (ordered).
+    TC-300: Invokes W2 FactsBuilder → W3 SnippetCurator through the DAG
+    scheduler. W2 reads snippet_catalog.json when present, which W3 writes,
+    so the scheduler keeps them ordered.
     Per specs/state-graph.md:66-74 (Node 3: build_facts).
     """
     invoker = _create_worker_invoker(state)
 
-    # Invoke W2 FactsBuilder
-    invoker.invoke_worker(
-        worker="W2.FactsBuilder",
-        inputs=["repo_inventory.json"],
-        outputs=["product_facts.json", "evidence_map.json"],
-        run_config=state["run_config"],
-    )
-
-    # Invoke W3 SnippetCurator (ordered after W2)
-    invoker.invoke_worker(
-        worker="W3.SnippetCurator",
-        inputs=["product_facts.json", "evidence_map.json"],
-        outputs=["snippet_catalog.json"],
-        run_config=state["run_config"],
+    DagScheduler(invoker).run(
+        [
+            WorkSpec(
+                worker="W2.FactsBuilder",
+                inputs=["repo_inventory.json"],
+                outputs=["product_facts.json", "evidence_map.json"],
+                run_config=state["run_config"],
+            ),
+            WorkSpec(
+                worker="W3.SnippetCurator",
+                inputs=["product_facts.json", "evidence_map.json"],
+                outputs=["snippet_catalog.json"],
+                run_config=state["run_config"],
+            ),
+        ]
     )
 
     state["run_state"] = RUN_STATE_FACTS_READY
@@ -285,20 +298,66 @@ def draft_sections_node(state: OrchestratorState) -> OrchestratorState:
     TC-300: Invokes W5 SectionWriter per section (fan-out).
     Per specs/state-graph.md:84-94 (Node 5: draft_sections).
 
-    Note: For TC-300, we invoke sequentially. True parallelism can be added later.
+    Each planned section is its own work item (scope_key=section); items run
+    in a process pool and write section-local drafts plus a partial manifest,
+    which are merged into draft_manifest.json in deterministic order. On a
+    re-run, sections whose inputs and drafts are unchanged are reused, so a
+    failed section is retried on its own.
+
+    With run_config["delta_from_run_id"] set, pages unaffected by the repo
+    change since that run reuse its drafts (see launch.orchestrator.delta).
     """
     invoker = _create_worker_invoker(state)
+    run_dir = Path(state["run_dir"])
+    run_config = state["run_config"]
 
     state["run_state"] = RUN_STATE_DRAFTING
 
-    # TODO: For TC-300, invoke once for all sections
-    # Full fan-out implementation would read page_plan.json and invoke per section
-    invoker.invoke_worker(
-        worker="W5.SectionWriter",
-        inputs=["page_plan.json", "product_facts.json", "evidence_map.json", "snippet_catalog.json"],
-        outputs=["drafts/"],
-        run_config=state["run_config"],
-    )
+    base_run_id = run_config.get(DELTA_FROM_RUN_KEY)
+    if base_run_id:
+        delta_plan = compute_delta_plan(run_dir, base_run_id)
+        if delta_plan is not None:
+            write_delta_plan(run_dir, delta_plan)
+            logger.info(
+                "delta_plan_computed",
+                run_id=state["run_id"],
+                base_run_id=base_run_id,
+                changed_files=len(delta_plan.changed_files),
+                redraft_pages=len(delta_plan.redraft_page_ids),
+                reused_pages=len(delta_plan.reused_drafts),
+            )
+            if delta_plan.reused_drafts:
+                run_config = {**run_config, REUSED_DRAFTS_KEY: delta_plan.reused_drafts}
+
+    inputs = ["page_plan.json", "product_facts.json", "evidence_map.json", "snippet_catalog.json"]
+    page_plan_path = run_dir / "artifacts" / "page_plan.json"
+    sections: List[str] = []
+    if page_plan_path.exists():
+        sections = planned_sections(json.loads(page_plan_path.read_text(encoding="utf-8")))
+
+    if not sections:
+        # Nothing to fan out over: W5 reports the missing plan itself
+        invoker.invoke_worker(
+            worker="W5.SectionWriter",
+            inputs=inputs,
+            outputs=["drafts/"],
+            run_config=run_config,
+        )
+    else:
+        DagScheduler(invoker, use_processes=len(sections) > 1).run(
+            [
+                WorkSpec(
+                    worker="W5.SectionWriter",
+                    inputs=inputs,
+                    outputs=[f"drafts/{section}/", f"draft_manifests/{section}.json"],
+                    scope_key=section,
+                    run_config={**run_config, SECTION_SCOPE_KEY: section},
+                )
+                for section in sections
+            ]
+        )
+        # Same run_id fallback W5 uses when writing the manifest itself
+        merge_draft_manifests(run_dir, run_config.get("run_id", "unknown"))
 
     state["run_state"] = RUN_STATE_DRAFT_READY
     return state
@@ -327,6 +386,11 @@ def review_content_node(state: OrchestratorState) -> OrchestratorState:
     invoker = _create_worker_invoker(state)
     state["run_state"] = RUN_STATE_REVIEWING
 
+    # Delta relaunch: drafts reused from the base run were reviewed there
+    scope = review_scope(run_dir) if run_config.get(DELTA_FROM_RUN_KEY) else None
+    if scope is not None:
+        run_config = {**run_config, REVIEW_SCOPE_KEY: scope}
+
     try:
         result = invoker.invoke_worker(
             worker="W5.5.ContentReviewer",
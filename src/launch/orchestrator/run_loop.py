@@ -18,6 +18,7 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, Optional
 
+from launch.io.artifact_cache import release_parsed_artifacts
 from launch.io.run_layout import create_run_skeleton
 from launch.models.event import (
     EVENT_RUN_CREATED,
@@ -28,6 +29,7 @@ from launch.models.event import (
 from launch.models.state import RUN_STATE_CREATED, Snapshot
 from launch.state.event_log import append_event, generate_event_id, generate_span_id, generate_trace_id
 from launch.state.snapshot_manager import create_initial_snapshot, replay_events, write_snapshot
+from launch.workers._shared.repo_content_store import release_repo_content_stores
 
 from .graph import OrchestratorState, build_orchestrator_graph
 
@@ -162,35 +164,41 @@ def execute_run(
     final_state_dict: Optional[OrchestratorState] = None
     previous_run_state = RUN_STATE_CREATED  # Track previous state for correct old_state emission
 
-    for state_update in compiled_graph.stream(initial_state):
-        # state_update is a dict with node name as key
-        for node_name, node_output in state_update.items():
-            final_state_dict = node_output
-
-            # Emit state change event if state changed
-            new_run_state = node_output.get("run_state")
-            if new_run_state and new_run_state != previous_run_state:
-                state_change_event = Event(
-                    event_id=generate_event_id(),
-                    run_id=run_id,
-                    ts=datetime.now(timezone.utc).isoformat(),
-                    type=EVENT_RUN_STATE_CHANGED,
-                    payload={
-                        "old_state": previous_run_state,
-                        "new_state": new_run_state,
-                    },
-                    trace_id=trace_id,
-                    span_id=generate_span_id(),
-                    parent_span_id=parent_span_id,
-                )
-                append_event(run_dir / "events.ndjson", state_change_event)
-
-                # Update previous state tracker
-                previous_run_state = new_run_state
-
-                # Replay events to reconstruct snapshot (ensures snapshot = f(events))
-                snapshot = replay_events(run_dir / "events.ndjson", run_id)
-                write_snapshot(run_dir / "snapshot.json", snapshot)
+    try:
+        for state_update in compiled_graph.stream(initial_state):
+            # state_update is a dict with node name as key
+            for node_name, node_output in state_update.items():
+                final_state_dict = node_output
+
+                # Emit state change event if state changed
+                new_run_state = node_output.get("run_state")
+                if new_run_state and new_run_state != previous_run_state:
+                    state_change_event = Event(
+                        event_id=generate_event_id(),
+                        run_id=run_id,
+                        ts=datetime.now(timezone.utc).isoformat(),
+                        type=EVENT_RUN_STATE_CHANGED,
+                        payload={
+                            "old_state": previous_run_state,
+                            "new_state": new_run_state,
+                        },
+                        trace_id=trace_id,
+                        span_id=generate_span_id(),
+                        parent_span_id=parent_span_id,
+                    )
+                    append_event(run_dir / "events.ndjson", state_change_event)
+
+                    # Update previous state tracker
+                    previous_run_state = new_run_state
+
+                    # Replay events to reconstruct snapshot (ensures snapshot = f(events))
+                    snapshot = replay_events(run_dir / "events.ndjson", run_id)
+                    write_snapshot(run_dir / "snapshot.json", snapshot)
+    finally:
+        # Drop cached repo content for this run (see RepoContentStore)
+        release_repo_content_stores(run_dir / "work" / "repo")
+        # Drop parsed artifacts for this run (see ParsedArtifactCache)
+        release_parsed_artifacts(run_dir)
 
     # Determine exit code
     final_run_state = final_state_dict["run_state"] if final_state_dict else RUN_STATE_CREATED
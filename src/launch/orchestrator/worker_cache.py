@@ -0,0 +1,313 @@
+"""Workspace-level memoization of worker outputs.
+
+Caches the artifacts produced by deterministic workers, keyed on everything
+that can influence them, and restores them instead of re-invoking the worker
+when the key matches a previous run.
+
+Cache key = sha256 over:
+- worker name
+- worker code version (hash of the worker package, shared worker sources and
+  any other launch packages the worker depends on)
+- sha256 of each input artifact (declared inputs plus artifacts the worker
+  is known to read without declaring them)
+- sha256 of repo files the worker reads (e.g. the ruleset) and the content
+  key of template trees it enumerates
+- the run_config subset relevant to the worker (site/workflow/telemetry
+  settings and private "_" keys are excluded)
+
+Only workers listed in CACHEABLE_WORKERS are memoized. W1 is deliberately
+not cacheable: it clones the product and site repos into RUN_DIR/work, which
+later workers and gates read directly. Its repo_inventory.json pins the
+product repo SHA, so when only the site repo moved W1 re-runs but W2-W4 hit.
+
+Cache layout (default: <runs dir>/.worker_cache, or LAUNCH_WORKER_CACHE_DIR):
+    <key[:2]>/<key>/manifest.json    worker, key, outputs (path -> sha256), result
+    <key[:2]>/<key>/files/<path>     output artifacts relative to RUN_DIR
+
+Set LAUNCH_WORKER_CACHE=0 to disable.
+
+Spec references:
+- specs/10_determinism_and_caching.md (What to cache)
+- specs/21_worker_contracts.md (Worker I/O contracts)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import sys
+import tempfile
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Tuple
+
+from launch.content.template_registry import get_template_registry, template_registry_dir
+from launch.io.hashing import sha256_file
+
+# Bump to invalidate every cached entry (e.g. when the entry format changes)
+WORKER_CACHE_SCHEMA_VERSION = "1"
+
+# Repository root (holds specs/), for repo_files and template_trees
+REPO_ROOT = Path(__file__).resolve().parents[3]
+
+# run_config keys that never influence W2-W4 outputs
+NON_CONTENT_CONFIG_KEYS: FrozenSet[str] = frozenset(
+    {
+        "run_id",
+        "site_repo_url",
+        "site_ref",
+        "workflows_repo_url",
+        "workflows_ref",
+        "commit_service",
+        "telemetry",
+        "mcp",
+        "validation_profile",
+        "ci_strictness",
+        "max_fix_attempts",
+        "allow_manual_edits",
+    }
+)
+
+
+@dataclass(frozen=True)
+class WorkerCacheSpec:
+    """Cache declaration for one worker.
+
+    Attributes:
+        extra_inputs: Artifacts the worker reads beyond its declared inputs
+        repo_files: Files (relative to the repo root) the worker reads
+        template_trees: Template roots (relative to the repo root) the worker enumerates
+        code_packages: launch packages beyond launch.workers the worker's output depends on
+    """
+
+    extra_inputs: Tuple[str, ...] = field(default_factory=tuple)
+    repo_files: Tuple[str, ...] = field(default_factory=tuple)
+    template_trees: Tuple[str, ...] = field(default_factory=tuple)
+    code_packages: Tuple[str, ...] = field(default_factory=tuple)
+
+
+CACHEABLE_WORKERS: Dict[str, WorkerCacheSpec] = {
+    "W2.FactsBuilder": WorkerCacheSpec(
+        extra_inputs=("discovered_docs.json", "discovered_examples.json", "snippet_catalog.json"),
+    ),
+    "W3.SnippetCurator": WorkerCacheSpec(
+        extra_inputs=("repo_inventory.json", "discovered_docs.json"),
+    ),
+    "W4.IAPlanner": WorkerCacheSpec(
+        repo_files=("specs/rulesets/ruleset.v1.yaml",),
+        template_trees=("specs/templates",),
+        code_packages=("content",),
+    ),
+}
+
+
+@dataclass
+class CachedOutputs:
+    """A cache entry: output files plus the worker's JSON-safe result."""
+
+    key: str
+    worker: str
+    outputs: Dict[str, str]  # path relative to RUN_DIR -> sha256
+    result: Dict[str, Any]
+    entry_dir: Path
+
+
+def is_worker_cache_enabled() -> bool:
+    """Return False when LAUNCH_WORKER_CACHE disables memoization."""
+    return os.environ.get("LAUNCH_WORKER_CACHE", "1").lower() not in ("0", "false", "no", "off")
+
+
+def default_cache_dir(run_dir: Path) -> Path:
+    """Return the workspace-level cache directory for a run."""
+    override = os.environ.get("LAUNCH_WORKER_CACHE_DIR")
+    if override:
+        return Path(override)
+    return Path(run_dir).parent / ".worker_cache"
+
+
+@lru_cache(maxsize=None)
+def _hash_source_tree(directory: str) -> str:
+    h = hashlib.sha256()
+    root = Path(directory)
+    for path in sorted(root.rglob("*.py")):
+        if "__pycache__" in path.parts:
+            continue
+        h.update(str(path.relative_to(root)).replace("\\", "/").encode("utf-8"))
+        h.update(b"\0")
+        h.update(path.read_bytes())
+    return h.hexdigest()
+
+
+def worker_code_version(executor: Callable[..., Any], code_packages: Tuple[str, ...] = ()) -> str:
+    """Hash the source code that implements a worker executor.
+
+    For launch.workers.<package> executors this covers the whole worker
+    package plus launch.workers._shared and each launch.<code_packages>
+    package; for other callables (e.g. test stubs) it covers the defining
+    module's source file.
+    """
+    module_name = getattr(executor, "__module__", "") or ""
+    parts = module_name.split(".")
+    module = sys.modules.get(module_name)
+    module_file = getattr(module, "__file__", None)
+
+    h = hashlib.sha256(WORKER_CACHE_SCHEMA_VERSION.encode("utf-8"))
+    h.update(f"{module_name}.{getattr(executor, '__qualname__', '')}".encode("utf-8"))
+    if len(parts) >= 3 and parts[:2] == ["launch", "workers"] and module_file:
+        workers_dir = Path(module_file).resolve()
+        while workers_dir.name != "workers":
+            workers_dir = workers_dir.parent
+        h.update(_hash_source_tree(str(workers_dir / parts[2])).encode("ascii"))
+        h.update(_hash_source_tree(str(workers_dir / "_shared")).encode("ascii"))
+        for package in code_packages:
+            h.update(_hash_source_tree(str(workers_dir.parent / package)).encode("ascii"))
+    elif module_file and Path(module_file).exists():
+        h.update(Path(module_file).read_bytes())
+    return h.hexdigest()
+
+
+def _config_subset(run_config: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        k: v
+        for k, v in run_config.items()
+        if not k.startswith("_") and k not in NON_CONTENT_CONFIG_KEYS
+    }
+
+
+def snapshot_artifacts(run_dir: Path) -> Dict[str, Tuple[int, int]]:
+    """Return {path relative to RUN_DIR: (size, mtime_ns)} for RUN_DIR/artifacts."""
+    artifacts_dir = run_dir / "artifacts"
+    snapshot: Dict[str, Tuple[int, int]] = {}
+    if not artifacts_dir.exists():
+        return snapshot
+    for path in artifacts_dir.rglob("*"):
+        if path.is_file():
+            st = path.stat()
+            snapshot[path.relative_to(run_dir).as_posix()] = (st.st_size, st.st_mtime_ns)
+    return snapshot
+
+
+def changed_artifacts(
+    before: Dict[str, Tuple[int, int]],
+    after: Dict[str, Tuple[int, int]],
+) -> List[str]:
+    """Return sorted paths created or modified between two snapshots."""
+    return sorted(path for path, stat_key in after.items() if before.get(path) != stat_key)
+
+
+class WorkerOutputCache:
+    """Content-addressed store of worker outputs shared across runs."""
+
+    def __init__(self, cache_dir: Path, repo_root: Optional[Path] = None) -> None:
+        self.cache_dir = Path(cache_dir)
+        self.repo_root = Path(repo_root) if repo_root is not None else REPO_ROOT
+
+    def compute_key(
+        self,
+        worker: str,
+        executor: Callable[..., Any],
+        run_dir: Path,
+        inputs: List[str],
+        run_config: Dict[str, Any],
+    ) -> Optional[str]:
+        """Compute the cache key, or None if the worker is not cacheable."""
+        spec = CACHEABLE_WORKERS.get(worker)
+        if spec is None:
+            return None
+
+        input_hashes: Dict[str, str] = {}
+        for name in sorted(set(inputs) | set(spec.extra_inputs)):
+            path = run_dir / "artifacts" / name
+            input_hashes[name] = sha256_file(path) if path.is_file() else "MISSING"
+
+        repo_hashes: Dict[str, str] = {}
+        for rel in spec.repo_files:
+            path = self.repo_root / rel
+            repo_hashes[rel] = sha256_file(path) if path.is_file() else "MISSING"
+        for rel in spec.template_trees:
+            # The registry's content key is a digest of every template in the tree
+            registry = get_template_registry(self.repo_root / rel, cache_dir=template_registry_dir(run_dir))
+            repo_hashes[rel] = registry.key
+
+        material = {
+            "worker": worker,
+            "code_version": worker_code_version(executor, spec.code_packages),
+            "inputs": input_hashes,
+            "repo_inputs": repo_hashes,
+            "run_config": _config_subset(run_config),
+        }
+        encoded = json.dumps(material, sort_keys=True, default=str).encode("utf-8")
+        return hashlib.sha256(encoded).hexdigest()
+
+    def _entry_dir(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / key
+
+    def lookup(self, key: str) -> Optional[CachedOutputs]:
+        """Return the cache entry for key, or None if absent or corrupt."""
+        entry_dir = self._entry_dir(key)
+        manifest_path = entry_dir / "manifest.json"
+        if not manifest_path.exists():
+            return None
+        try:
+            manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return None
+        if manifest.get("schema_version") != WORKER_CACHE_SCHEMA_VERSION or manifest.get("key") != key:
+            return None
+        outputs = manifest.get("outputs", {})
+        if not all((entry_dir / "files" / rel).is_file() for rel in outputs):
+            return None
+        return CachedOutputs(
+            key=key,
+            worker=manifest["worker"],
+            outputs=outputs,
+            result=manifest.get("result", {}),
+            entry_dir=entry_dir,
+        )
+
+    def restore(self, entry: CachedOutputs, run_dir: Path) -> List[str]:
+        """Copy cached output artifacts into run_dir; return restored paths."""
+        for rel in sorted(entry.outputs):
+            dst = run_dir / rel
+            dst.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(entry.entry_dir / "files" / rel, dst)
+        return sorted(entry.outputs)
+
+    def store(
+        self,
+        key: str,
+        worker: str,
+        run_dir: Path,
+        outputs: List[str],
+        result: Dict[str, Any],
+    ) -> None:
+        """Store outputs for key. Entries are written atomically and never overwritten."""
+        entry_dir = self._entry_dir(key)
+        if entry_dir.exists():
+            return
+        entry_dir.parent.mkdir(parents=True, exist_ok=True)
+        tmp_dir = Path(tempfile.mkdtemp(prefix=f".{key[:8]}-", dir=entry_dir.parent))
+        try:
+            hashes: Dict[str, str] = {}
+            for rel in outputs:
+                dst = tmp_dir / "files" / rel
+                dst.parent.mkdir(parents=True, exist_ok=True)
+                shutil.copyfile(run_dir / rel, dst)
+                hashes[rel] = sha256_file(dst)
+            manifest = {
+                "schema_version": WORKER_CACHE_SCHEMA_VERSION,
+                "key": key,
+                "worker": worker,
+                "outputs": hashes,
+                "result": json.loads(json.dumps(result, sort_keys=True, default=str)),
+            }
+            (tmp_dir / "manifest.json").write_text(
+                json.dumps(manifest, indent=2, sort_keys=True) + "\n", encoding="utf-8"
+            )
+            os.replace(tmp_dir, entry_dir)
+        except OSError:
+            # A concurrent run stored the same key first, or the cache is not writable
+            shutil.rmtree(tmp_dir, ignore_errors=True)
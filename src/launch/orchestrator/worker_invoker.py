@@ -12,7 +12,7 @@ from __future__ import annotations
 
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Mapping, Optional
 
 from launch.models.event import (
     EVENT_WORK_ITEM_FINISHED,
@@ -21,34 +21,26 @@ from launch.models.event import (
     Event,
 )
 from launch.models.state import WORK_ITEM_STATUS_QUEUED, WorkItem
+from launch.orchestrator.worker_cache import (
+    WorkerOutputCache,
+    changed_artifacts,
+    default_cache_dir,
+    is_worker_cache_enabled,
+    snapshot_artifacts,
+)
+from launch.orchestrator.worker_registry import (
+    BUILTIN_WORKERS,
+    WORKER_ENTRY_POINT_GROUP,
+    LazyWorkerRegistry,
+)
 from launch.state.event_log import append_event, generate_event_id, generate_span_id
 
-# Import all worker executors for dispatch
-from launch.workers.w1_repo_scout import execute_repo_scout
-from launch.workers.w2_facts_builder import execute_facts_builder
-from launch.workers.w3_snippet_curator import execute_snippet_curator
-from launch.workers.w4_ia_planner import execute_ia_planner
-from launch.workers.w5_section_writer import execute_section_writer
-from launch.workers.w5_5_content_reviewer import execute_content_reviewer
-from launch.workers.w6_linker_and_patcher import execute_linker_and_patcher
-from launch.workers.w7_validator import execute_validator
-from launch.workers.w8_fixer import execute_fixer
-from launch.workers.w9_pr_manager import execute_pr_manager
-
-
-# Worker dispatch map: maps worker names to their execute functions
-WORKER_DISPATCH: Dict[str, Callable[[Path, Dict[str, Any]], Dict[str, Any]]] = {
-    "W1.RepoScout": execute_repo_scout,
-    "W2.FactsBuilder": execute_facts_builder,
-    "W3.SnippetCurator": execute_snippet_curator,
-    "W4.IAPlanner": execute_ia_planner,
-    "W5.SectionWriter": execute_section_writer,
-    "W5.5.ContentReviewer": execute_content_reviewer,
-    "W6.LinkerAndPatcher": execute_linker_and_patcher,
-    "W7.Validator": execute_validator,
-    "W8.Fixer": execute_fixer,
-    "W9.PRManager": execute_pr_manager,
-}
+
+# Worker dispatch map: maps worker names to their execute functions.
+# Workers are imported on first dispatch (see worker_registry).
+WORKER_DISPATCH: Mapping[str, Callable[[Path, Dict[str, Any]], Dict[str, Any]]] = LazyWorkerRegistry(
+    BUILTIN_WORKERS, entry_point_group=WORKER_ENTRY_POINT_GROUP
+)
 
 
 class WorkerInvoker:
@@ -57,7 +49,14 @@ class WorkerInvoker:
     Implements the work item contract per specs/28_coordination_and_handoffs.md:42-56.
     """
 
-    def __init__(self, run_id: str, run_dir: Path, trace_id: str, parent_span_id: str):
+    def __init__(
+        self,
+        run_id: str,
+        run_dir: Path,
+        trace_id: str,
+        parent_span_id: str,
+        output_cache: Optional[WorkerOutputCache] = None,
+    ):
         """Initialize worker invoker.
 
         Args:
@@ -65,11 +64,16 @@ class WorkerInvoker:
             run_dir: Path to RUN_DIR
             trace_id: Trace ID for telemetry
             parent_span_id: Parent span ID for telemetry
+            output_cache: Worker output cache (default: workspace-level cache
+                          next to RUN_DIR, unless LAUNCH_WORKER_CACHE=0)
         """
         self.run_id = run_id
         self.run_dir = run_dir
         self.trace_id = trace_id
         self.parent_span_id = parent_span_id
+        if output_cache is None and is_worker_cache_enabled():
+            output_cache = WorkerOutputCache(default_cache_dir(run_dir))
+        self.output_cache = output_cache
 
     def queue_work_item(
         self,
@@ -146,6 +150,7 @@ class WorkerInvoker:
         work_item_id: str,
         success: bool = True,
         error: Optional[Dict[str, Any]] = None,
+        cache_hit: bool = False,
     ) -> None:
         """Mark work item as finished.
 
@@ -153,6 +158,7 @@ class WorkerInvoker:
             work_item_id: Work item ID
             success: Whether work item succeeded
             error: Error details (if failed)
+            cache_hit: Whether outputs were restored from the worker output cache
 
         Spec reference: specs/21_worker_contracts.md:33-39
         """
@@ -165,6 +171,7 @@ class WorkerInvoker:
                 "work_item_id": work_item_id,
                 "success": success,
                 "error": error,
+                "cache_hit": cache_hit,
             },
             trace_id=self.trace_id,
             span_id=generate_span_id(),
@@ -184,6 +191,11 @@ class WorkerInvoker:
 
         TC-300: Real worker invocation via dispatch map.
 
+        Cacheable workers (see worker_cache.CACHEABLE_WORKERS) are skipped
+        when their inputs, code version and relevant run_config match a
+        previous invocation; the cached output artifacts are restored and
+        WORK_ITEM_FINISHED records cache_hit=True.
+
         Args:
             worker: Worker name (e.g., "W1.RepoScout")
             inputs: List of input artifact names or paths
@@ -216,8 +228,30 @@ class WorkerInvoker:
             # Invoke worker with standard signature: executor(run_dir: Path, run_config: Dict)
             # All workers follow this contract per specs/21_worker_contracts.md
             worker_run_config = run_config or {}
+
+            cache_key = None
+            if self.output_cache is not None:
+                cache_key = self.output_cache.compute_key(
+                    worker, executor, self.run_dir, inputs, worker_run_config
+                )
+            cached = self.output_cache.lookup(cache_key) if cache_key else None
+
+            if cached is not None:
+                self.output_cache.restore(cached, self.run_dir)
+                result = dict(cached.result)
+                result["cache_hit"] = True
+                self.finish_work_item(work_item_id, success=True, cache_hit=True)
+                result["work_item_id"] = work_item_id
+                return result
+
+            before = snapshot_artifacts(self.run_dir) if cache_key else {}
             result = executor(self.run_dir, worker_run_config)
 
+            if cache_key:
+                produced = changed_artifacts(before, snapshot_artifacts(self.run_dir))
+                if produced:
+                    self.output_cache.store(cache_key, worker, self.run_dir, produced, result)
+
             # Finish work item (success)
             self.finish_work_item(work_item_id, success=True)
 
@@ -0,0 +1,123 @@
+"""Lazy worker registry for orchestrator dispatch.
+
+Maps worker names to "module:attribute" targets and imports a worker's
+module only when it is first dispatched, so importing the orchestrator (and
+every read-only CLI/MCP command that touches it) does not pay for importing
+all ten workers and their dependencies.
+
+Additional workers can be registered by installed distributions through the
+"launch.workers" entry point group (name = worker name, value =
+"module:attribute"); built-in registrations take precedence. Entry points
+are only scanned when a name is not registered.
+
+Spec references:
+- specs/21_worker_contracts.md (Global worker rules and I/O contracts)
+"""
+
+from __future__ import annotations
+
+import importlib
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, Optional
+
+WorkerExecutor = Callable[[Path, Dict[str, Any]], Dict[str, Any]]
+
+# Entry point group for externally provided workers
+WORKER_ENTRY_POINT_GROUP = "launch.workers"
+
+# Built-in workers: name -> "module:attribute"
+BUILTIN_WORKERS: Dict[str, str] = {
+    "W1.RepoScout": "launch.workers.w1_repo_scout:execute_repo_scout",
+    "W2.FactsBuilder": "launch.workers.w2_facts_builder:execute_facts_builder",
+    "W3.SnippetCurator": "launch.workers.w3_snippet_curator:execute_snippet_curator",
+    "W4.IAPlanner": "launch.workers.w4_ia_planner:execute_ia_planner",
+    "W5.SectionWriter": "launch.workers.w5_section_writer:execute_section_writer",
+    "W5.5.ContentReviewer": "launch.workers.w5_5_content_reviewer:execute_content_reviewer",
+    "W6.LinkerAndPatcher": "launch.workers.w6_linker_and_patcher:execute_linker_and_patcher",
+    "W7.Validator": "launch.workers.w7_validator:execute_validator",
+    "W8.Fixer": "launch.workers.w8_fixer:execute_fixer",
+    "W9.PRManager": "launch.workers.w9_pr_manager:execute_pr_manager",
+}
+
+
+def resolve_target(target: str) -> WorkerExecutor:
+    """Import and return the callable named by a "module:attribute" target.
+
+    Raises:
+        ValueError: If target is not of the form "module:attribute"
+        ImportError / AttributeError: If the target cannot be resolved
+    """
+    module_name, sep, attr = target.partition(":")
+    if not sep or not module_name or not attr:
+        raise ValueError(f"Invalid worker target {target!r}; expected 'module:attribute'")
+    obj: Any = importlib.import_module(module_name)
+    for part in attr.split("."):
+        obj = getattr(obj, part)
+    return obj
+
+
+class LazyWorkerRegistry(Mapping):
+    """Read-only mapping of worker name -> executor, resolved on first access.
+
+    Usage:
+        registry = LazyWorkerRegistry(BUILTIN_WORKERS)
+        "W7.Validator" in registry     # no import
+        registry["W7.Validator"]       # imports launch.workers.w7_validator
+    """
+
+    def __init__(self, targets: Dict[str, str], entry_point_group: Optional[str] = None):
+        """Initialize registry.
+
+        Args:
+            targets: Worker name -> "module:attribute" target
+            entry_point_group: Entry point group scanned for names not in targets
+        """
+        self._targets: Dict[str, str] = dict(targets)
+        self._resolved: Dict[str, WorkerExecutor] = {}
+        self._entry_point_group = entry_point_group
+        self._entry_points_loaded = entry_point_group is None
+
+    def _load_entry_points(self) -> None:
+        if self._entry_points_loaded:
+            return
+        self._entry_points_loaded = True
+        from importlib.metadata import entry_points
+
+        for ep in entry_points(group=self._entry_point_group):
+            self._targets.setdefault(ep.name, ep.value)
+
+    def register(self, name: str, target: str) -> None:
+        """Register (or replace) a worker target."""
+        self._targets[name] = target
+        self._resolved.pop(name, None)
+
+    def is_loaded(self, name: str) -> bool:
+        """Whether the worker's executor has already been imported."""
+        return name in self._resolved
+
+    def __getitem__(self, name: str) -> WorkerExecutor:
+        executor = self._resolved.get(name)
+        if executor is not None:
+            return executor
+        if name not in self._targets:
+            self._load_entry_points()
+        if name not in self._targets:
+            raise KeyError(name)
+        executor = resolve_target(self._targets[name])
+        self._resolved[name] = executor
+        return executor
+
+    def __contains__(self, name: object) -> bool:
+        if name in self._targets:
+            return True
+        self._load_entry_points()
+        return name in self._targets
+
+    def __iter__(self) -> Iterator[str]:
+        self._load_entry_points()
+        return iter(list(self._targets))
+
+    def __len__(self) -> int:
+        self._load_entry_points()
+        return len(self._targets)
@@ -12,10 +12,34 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
-from typing import Any
+from typing import Any, List
 
 from .redactor import redact_value
-from .secret_detector import detect_secrets
+from .secret_detector import PATTERN_SET, detect_secrets
+
+
+def _collect_strings(value: Any, out: List[str]) -> List[str]:
+    """Collect every string (keys excluded) nested in value."""
+    if isinstance(value, dict):
+        for item in value.values():
+            _collect_strings(item, out)
+    elif isinstance(value, list):
+        for item in value:
+            _collect_strings(item, out)
+    elif isinstance(value, str):
+        out.append(value)
+    return out
+
+
+def _may_contain_secrets(value: Any) -> bool:
+    """Single-pass prefilter over all strings of an event.
+
+    Strings are joined with newlines, which are word boundaries and
+    whitespace just like string edges, so any pattern that matches inside
+    one string also matches the joined text. A miss proves the event is
+    clean and lets it skip per-string detection entirely.
+    """
+    return PATTERN_SET.may_match("\n".join(_collect_strings(value, [])))
 
 
 def redact_events_log(input_path: Path, output_path: Path) -> int:
@@ -44,8 +68,11 @@ def redact_events_log(input_path: Path, output_path: Path) -> int:
             try:
                 event = json.loads(line)
 
-                # Redact the event recursively
-                redacted_event = redact_value(event, detect_secrets)
+                # Redact the event recursively (clean events pass through)
+                if _may_contain_secrets(event):
+                    redacted_event = redact_value(event, detect_secrets)
+                else:
+                    redacted_event = event
 
                 # Write back as JSON line
                 redacted_events.append(json.dumps(redacted_event, sort_keys=True))
@@ -11,13 +11,21 @@ Provides:
 
 from __future__ import annotations
 
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime, timezone
 from dataclasses import dataclass, field
+from functools import partial
 from pathlib import Path
 from typing import List, Optional, Set
 
+from .scan_engine import DEFAULT_EXCLUDE_DIRS, iter_files
 from .secret_detector import SecretMatch, detect_secrets
 
+# Below this many files, process startup costs more than it saves
+PARALLEL_SCAN_MIN_FILES = 64
+
 
 @dataclass
 class ScanResult:
@@ -150,39 +158,47 @@ def scan_directory(
     allowlist: Optional[List[str]] = None,
     recursive: bool = True,
     exclude_dirs: Optional[Set[str]] = None,
+    max_workers: Optional[int] = None,
 ) -> List[ScanResult]:
     """Scan a directory for secrets.
 
+    Excluded directories are pruned during the walk (never descended into).
+    Large directories are scanned on a process pool.
+
     Args:
         directory: Directory to scan
         allowlist: List of allowlist patterns
         recursive: Whether to scan subdirectories
         exclude_dirs: Set of directory names to exclude (e.g., {".git", "node_modules"})
+        max_workers: Process pool size (defaults to os.cpu_count(); 1 scans serially)
 
     Returns:
         List of ScanResults for all files scanned
     """
     if exclude_dirs is None:
-        exclude_dirs = {".git", ".svn", "node_modules", "__pycache__", ".venv", "venv"}
+        exclude_dirs = set(DEFAULT_EXCLUDE_DIRS)
 
     results: List[ScanResult] = []
 
     if not directory.exists() or not directory.is_dir():
         return results
 
-    # Get all files
-    if recursive:
-        # Filter out excluded directories
-        for item in directory.rglob("*"):
-            if item.is_file():
-                # Check if any parent is in exclude_dirs
-                if any(part in exclude_dirs for part in item.parts):
-                    continue
-                results.append(scan_file(item, allowlist))
-    else:
-        for item in directory.iterdir():
-            if item.is_file():
-                results.append(scan_file(item, allowlist))
+    files = iter_files(directory, exclude_dirs=exclude_dirs, recursive=recursive)
+
+    workers = max_workers or os.cpu_count() or 1
+    scanned = False
+    if workers > 1 and len(files) >= PARALLEL_SCAN_MIN_FILES:
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                chunksize = max(1, len(files) // (workers * 4))
+                results = list(pool.map(partial(scan_file, allowlist=allowlist), files, chunksize=chunksize))
+            scanned = True
+        except (BrokenProcessPool, OSError):
+            # Process pools unavailable (restricted sandbox); fall back to serial scan
+            pass
+
+    if not scanned:
+        results = [scan_file(item, allowlist) for item in files]
 
     # Sort by file path for determinism
     results.sort(key=lambda r: r.file_path or "")
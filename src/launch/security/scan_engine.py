@@ -0,0 +1,141 @@
+"""Shared multi-pattern scanning engine for secret and sensitive-data detection.
+
+Binding contract: specs/34_strict_compliance_guarantees.md (security requirements)
+
+Used by:
+1. secret_detector.detect_secrets (and through it file_scanner, the security
+   validation gate and event_redactor)
+2. Gate S2 (sensitive data leak) in the W7 validator
+
+Design decisions:
+- Every pattern is compiled once at import time
+- All patterns of a set are also combined into one alternation that acts as a
+  single-pass prefilter: text without any hit is rejected after one scan, and
+  only texts with a hit run the individual patterns (whose match semantics,
+  including overlaps between patterns, are unchanged)
+- Line numbers come from a prefix index of newline offsets (bisect, O(log n))
+  instead of counting newlines in text[:pos] for every match
+- Directory walks prune excluded directories before descending into them
+"""
+
+from __future__ import annotations
+
+import os
+import re
+from bisect import bisect_right
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterator, List, Optional, Sequence, Set, Tuple
+
+# Directories never worth scanning (VCS metadata, dependency trees, caches)
+DEFAULT_EXCLUDE_DIRS = frozenset({".git", ".svn", "node_modules", "__pycache__", ".venv", "venv"})
+
+
+def _scoped(pattern: str) -> str:
+    """Wrap a pattern for use inside an alternation.
+
+    Global inline flags such as a leading ``(?i)`` are only allowed at the
+    start of a whole expression, so they are rewritten as scoped groups.
+    """
+    match = re.match(r"^\(\?([aiLmsux]+)\)", pattern)
+    if match:
+        return f"(?{match.group(1)}:{pattern[match.end():]})"
+    return f"(?:{pattern})"
+
+
+@dataclass(frozen=True)
+class CompiledPattern:
+    """A named, precompiled pattern with its base confidence."""
+
+    name: str
+    regex: "re.Pattern[str]"
+    confidence: float = 1.0
+
+
+class PatternSet:
+    """An ordered set of precompiled patterns with a combined prefilter.
+
+    Usage:
+        patterns = PatternSet([(r"AKIA[0-9A-Z]{16}", "aws_access_key_id", 1.0)])
+        if patterns.may_match(text):
+            for compiled, match in patterns.finditer(text):
+                ...
+    """
+
+    def __init__(self, patterns: Sequence[Tuple[str, str, float]], flags: int = 0) -> None:
+        """Compile patterns.
+
+        Args:
+            patterns: (regex, name, confidence) tuples, in priority order
+            flags: re flags applied to every pattern
+        """
+        self.patterns: List[CompiledPattern] = [
+            CompiledPattern(name=name, regex=re.compile(regex, flags), confidence=confidence)
+            for regex, name, confidence in patterns
+        ]
+        self._combined = re.compile("|".join(_scoped(regex) for regex, _, _ in patterns), flags)
+
+    def may_match(self, text: str) -> bool:
+        """Return True if any pattern matches somewhere in text (one pass)."""
+        return self._combined.search(text) is not None
+
+    def finditer(self, text: str) -> Iterator[Tuple[CompiledPattern, "re.Match[str]"]]:
+        """Yield (pattern, match) for every pattern in priority order.
+
+        Matches of one pattern are non-overlapping; matches of different
+        patterns may overlap, exactly as with separate re.finditer calls.
+        """
+        if not self.may_match(text):
+            return
+        for compiled in self.patterns:
+            for match in compiled.regex.finditer(text):
+                yield compiled, match
+
+    def matching_names(self, text: str) -> List[str]:
+        """Return names of patterns that match anywhere in text, in priority order."""
+        if not self.may_match(text):
+            return []
+        return [p.name for p in self.patterns if p.regex.search(text)]
+
+
+class LineIndex:
+    """Prefix index of newline offsets for O(log n) position-to-line lookup."""
+
+    def __init__(self, text: str) -> None:
+        self._newlines = [m.start() for m in re.finditer("\n", text)]
+
+    def line_of(self, pos: int) -> int:
+        """Return the 1-indexed line number containing character position pos."""
+        return bisect_right(self._newlines, pos - 1) + 1
+
+
+def iter_files(
+    directory: Path,
+    exclude_dirs: Optional[Set[str]] = None,
+    recursive: bool = True,
+) -> List[Path]:
+    """List files under directory, pruning excluded directories during the walk.
+
+    Args:
+        directory: Root directory
+        exclude_dirs: Directory names to skip entirely (defaults to DEFAULT_EXCLUDE_DIRS)
+        recursive: Whether to descend into subdirectories
+
+    Returns:
+        Sorted list of file paths
+    """
+    if exclude_dirs is None:
+        exclude_dirs = set(DEFAULT_EXCLUDE_DIRS)
+
+    files: List[Path] = []
+    for root, dirnames, filenames in os.walk(directory):
+        if recursive:
+            dirnames[:] = [d for d in dirnames if d not in exclude_dirs]
+        else:
+            dirnames[:] = []
+        for name in filenames:
+            path = Path(root) / name
+            if path.is_file():
+                files.append(path)
+
+    return sorted(files)
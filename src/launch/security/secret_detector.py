@@ -16,7 +16,9 @@ from __future__ import annotations
 import math
 import re
 from dataclasses import dataclass, field
-from typing import List
+from typing import List, Optional
+
+from .scan_engine import LineIndex, PatternSet
 
 
 @dataclass
@@ -96,6 +98,20 @@ PATTERNS = [
 ]
 
 
+# Compiled once; the combined prefilter rejects clean text in a single pass
+PATTERN_SET = PatternSet(PATTERNS)
+
+# Common false positives
+_FALSE_POSITIVE_PATTERNS = [
+    re.compile(r"^https?://", re.IGNORECASE),  # URLs
+    re.compile(r"^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$", re.IGNORECASE),  # UUIDs
+    re.compile(r"^[A-Z_]{3,}$"),  # ALL_CAPS constants (case sensitive!)
+    re.compile(r"^(password|passwd|pwd|api[_-]?key|apikey)$", re.IGNORECASE),  # Just the keyword itself
+    re.compile(r"^\*+$"),  # Just asterisks (already redacted)
+    re.compile(r"^\[REDACTED"),  # Already redacted
+]
+
+
 def calculate_entropy(data: str) -> float:
     """Calculate Shannon entropy of a string.
 
@@ -151,33 +167,26 @@ def is_likely_false_positive(value: str) -> bool:
     Returns:
         True if likely false positive, False otherwise
     """
-    # Common false positives
-    false_positive_patterns = [
-        (r"^https?://", re.IGNORECASE),  # URLs
-        (r"^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$", re.IGNORECASE),  # UUIDs
-        (r"^[A-Z_]{3,}$", 0),  # ALL_CAPS constants (case sensitive!)
-        (r"^(password|passwd|pwd|api[_-]?key|apikey)$", re.IGNORECASE),  # Just the keyword itself
-        (r"^\*+$", 0),  # Just asterisks (already redacted)
-        (r"^\[REDACTED", 0),  # Already redacted
-    ]
-
-    for pattern, flags in false_positive_patterns:
-        if re.match(pattern, value, flags):
+    for pattern in _FALSE_POSITIVE_PATTERNS:
+        if pattern.match(value):
             return True
 
     return False
 
 
-def get_line_number(text: str, pos: int) -> int:
+def get_line_number(text: str, pos: int, line_index: Optional[LineIndex] = None) -> int:
     """Get line number for a position in text.
 
     Args:
         text: Full text
         pos: Character position
+        line_index: Optional prebuilt LineIndex for text (O(log n) lookup)
 
     Returns:
         Line number (1-indexed)
     """
+    if line_index is not None:
+        return line_index.line_of(pos)
     return text[:pos].count("\n") + 1
 
 
@@ -216,50 +225,56 @@ def detect_secrets(text: str) -> List[SecretMatch]:
     """
     matches: List[SecretMatch] = []
     seen_positions: set[tuple[int, int]] = set()
-
-    for pattern, secret_type, base_confidence in PATTERNS:
-        for match in re.finditer(pattern, text):
-            # Extract the actual secret value (might be in a group)
-            if match.lastindex and match.lastindex > 0:
-                # If there are groups, use the last group (the value)
-                value = match.group(match.lastindex)
-                # Find the actual position of this group
-                start_pos = match.start(match.lastindex)
-                end_pos = match.end(match.lastindex)
-            else:
-                value = match.group(0)
-                start_pos = match.start()
-                end_pos = match.end()
-
-            # Skip if we've already matched this position
-            if (start_pos, end_pos) in seen_positions:
-                continue
-
-            # Skip false positives
-            if is_likely_false_positive(value):
-                continue
-
-            # Adjust confidence based on entropy for certain types
-            confidence = base_confidence
-            if secret_type in ("aws_secret_key", "api_key"):
-                if not is_high_entropy(value):
-                    continue  # Skip low entropy matches for these types
-                # Boost confidence for high entropy
-                confidence = min(1.0, confidence + 0.2)
-
-            # Create match
-            secret_match = SecretMatch(
-                secret_type=secret_type,
-                value=value,
-                start_pos=start_pos,
-                end_pos=end_pos,
-                line_number=get_line_number(text, start_pos),
-                context=get_context(text, start_pos, end_pos),
-                confidence=confidence,
-            )
-
-            matches.append(secret_match)
-            seen_positions.add((start_pos, end_pos))
+    line_index: Optional[LineIndex] = None
+
+    for pattern, match in PATTERN_SET.finditer(text):
+        secret_type = pattern.name
+        base_confidence = pattern.confidence
+
+        # Extract the actual secret value (might be in a group)
+        if match.lastindex and match.lastindex > 0:
+            # If there are groups, use the last group (the value)
+            value = match.group(match.lastindex)
+            # Find the actual position of this group
+            start_pos = match.start(match.lastindex)
+            end_pos = match.end(match.lastindex)
+        else:
+            value = match.group(0)
+            start_pos = match.start()
+            end_pos = match.end()
+
+        # Skip if we've already matched this position
+        if (start_pos, end_pos) in seen_positions:
+            continue
+
+        # Skip false positives
+        if is_likely_false_positive(value):
+            continue
+
+        # Adjust confidence based on entropy for certain types
+        confidence = base_confidence
+        if secret_type in ("aws_secret_key", "api_key"):
+            if not is_high_entropy(value):
+                continue  # Skip low entropy matches for these types
+            # Boost confidence for high entropy
+            confidence = min(1.0, confidence + 0.2)
+
+        if line_index is None:
+            line_index = LineIndex(text)
+
+        # Create match
+        secret_match = SecretMatch(
+            secret_type=secret_type,
+            value=value,
+            start_pos=start_pos,
+            end_pos=end_pos,
+            line_number=get_line_number(text, start_pos, line_index),
+            context=get_context(text, start_pos, end_pos),
+            confidence=confidence,
+        )
+
+        matches.append(secret_match)
+        seen_positions.add((start_pos, end_pos))
 
     # Sort by position for deterministic ordering
     matches.sort(key=lambda m: (m.start_pos, m.end_pos))
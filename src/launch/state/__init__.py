@@ -2,6 +2,7 @@
 
 Provides:
 - Event log management (append, read, validate chain)
+- events.idx sidecar index (indexed lookup, repair)
 - Snapshot persistence (write, read, replay)
 - Replay algorithm (event sourcing)
 
@@ -11,12 +12,16 @@ Spec references:
 - specs/schemas/event.schema.json (Event schema)
 """
 
+from .event_index import EventIndex, rebuild_event_index
 from .event_log import (
     append_event,
     compute_event_hash,
+    count_events,
     generate_event_id,
     generate_span_id,
     generate_trace_id,
+    iter_event_lines,
+    iter_events,
     read_events,
     validate_event_chain,
 )
@@ -25,6 +30,7 @@ from .snapshot_manager import (
     create_initial_snapshot,
     read_snapshot,
     replay_events,
+    replay_indexed_events,
     write_snapshot,
 )
 
@@ -32,15 +38,22 @@ __all__ = [
     # Event log
     "append_event",
     "read_events",
+    "iter_events",
+    "iter_event_lines",
+    "count_events",
     "validate_event_chain",
     "compute_event_hash",
     "generate_event_id",
     "generate_trace_id",
     "generate_span_id",
+    # Event index
+    "EventIndex",
+    "rebuild_event_index",
     # Snapshot
     "write_snapshot",
     "read_snapshot",
     "replay_events",
+    "replay_indexed_events",
     "apply_event_reducer",
     "create_initial_snapshot",
 ]
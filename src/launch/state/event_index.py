@@ -0,0 +1,327 @@
+"""Fixed-width binary sidecar index for events.ndjson.
+
+events.idx sits next to the event log and holds one 32-byte record per
+event line, in log order:
+
+    offset (u64) | line length (u32) | type code (u32) | ts micros (i64) | work item hash (u64)
+
+The type code is crc32 of the event type and the work item hash is the
+first 8 bytes of blake2b(payload.work_item_id) (0 when absent). Because
+records are fixed width, the last event of a type is found by scanning
+records backwards from the end, and matching events are fetched by
+seeking straight to their lines. Code and hash collisions are harmless:
+every fetched line is parsed and checked against the query.
+
+The index is derived data. Readers catch up on lines appended without an
+index record and rebuild it when it no longer lines up with the log (records
+that are not contiguous, or that point past its end), and
+rebuild_event_index() repairs it explicitly.
+
+Spec references:
+- specs/11_state_and_events.md (Event log fields)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import struct
+import zlib
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+EVENT_INDEX_SUFFIX = ".idx"
+
+# offset, line length, type code, ts (microseconds since epoch), work item hash
+_RECORD = struct.Struct("<QIIqQ")
+RECORD_SIZE = _RECORD.size
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def event_index_path(events_file: Path) -> Path:
+    """Return the sidecar index path for an event log (events.ndjson -> events.idx)."""
+    return events_file.with_suffix(EVENT_INDEX_SUFFIX)
+
+
+def event_type_code(event_type: str) -> int:
+    """Return the 32-bit code stored for an event type."""
+    return zlib.crc32(event_type.encode("utf-8"))
+
+
+def work_item_hash(work_item_id: Optional[str]) -> int:
+    """Return the 64-bit hash stored for a work item ID (0 when absent)."""
+    if not work_item_id:
+        return 0
+    digest = hashlib.blake2b(str(work_item_id).encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "little")
+
+
+def _ts_micros(ts: Union[str, datetime, None]) -> int:
+    """Convert an event timestamp to integer microseconds since the epoch (0 if unparseable)."""
+    try:
+        parsed = ts if isinstance(ts, datetime) else datetime.fromisoformat(ts)
+    except (TypeError, ValueError):
+        return 0
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    delta = parsed - _EPOCH
+    return (delta.days * 86_400 + delta.seconds) * 1_000_000 + delta.microseconds
+
+
+def _work_item_id(event: Dict[str, Any]) -> Optional[str]:
+    payload = event.get("payload")
+    return payload.get("work_item_id") if isinstance(payload, dict) else None
+
+
+def index_record(offset: int, line: bytes) -> bytes:
+    """Build the index record for one raw event line (including its newline).
+
+    Lines that are not JSON objects are indexed with type code 0 so that
+    offsets stay contiguous.
+    """
+    try:
+        event = json.loads(line)
+    except ValueError:
+        event = None
+    if not isinstance(event, dict):
+        return _RECORD.pack(offset, len(line), 0, 0, 0)
+    return _RECORD.pack(
+        offset,
+        len(line),
+        event_type_code(str(event.get("type", ""))),
+        _ts_micros(event.get("ts")),
+        work_item_hash(_work_item_id(event)),
+    )
+
+
+def append_index_record(events_file: Path, offset: int, line: bytes) -> None:
+    """Append the index record for a line just written at offset.
+
+    A log that already has lines but no index is left alone; readers build
+    the whole index on first use. Index failures never fail the event write.
+    """
+    index_file = event_index_path(events_file)
+    try:
+        if offset > 0 and not index_file.exists():
+            return
+        with index_file.open("ab") as f:
+            f.write(index_record(offset, line))
+    except OSError:
+        pass
+
+
+def _index_lines(events_file: Path, since_offset: int) -> bytes:
+    """Build index records for every line from since_offset to end of file."""
+    records = bytearray()
+    with events_file.open("rb") as f:
+        f.seek(since_offset)
+        offset = since_offset
+        for line in f:
+            if not line.endswith(b"\n"):
+                # Partial trailing line (writer mid-append): index it later
+                break
+            records += index_record(offset, line)
+            offset += len(line)
+    return bytes(records)
+
+
+def rebuild_event_index(events_file: Path) -> int:
+    """Rebuild events.idx from scratch by scanning the event log.
+
+    Args:
+        events_file: Path to events.ndjson
+
+    Returns:
+        Number of indexed events
+    """
+    index_file = event_index_path(events_file)
+    records = _index_lines(events_file, 0) if events_file.exists() else b""
+    tmp = index_file.with_name(index_file.name + ".tmp")
+    tmp.write_bytes(records)
+    tmp.replace(index_file)
+    return len(records) // RECORD_SIZE
+
+
+def _contiguous_end(records: bytes) -> Optional[int]:
+    """Return the log offset just past the last indexed line, or None if records leave gaps.
+
+    Lines appended to the log without an index record (e.g. by a writer that
+    bypassed write_event_line) would otherwise be invisible to lookups.
+    """
+    end = 0
+    for offset, length, _, _, _ in _RECORD.iter_unpack(records):
+        if offset != end:
+            return None
+        end = offset + length
+    return end
+
+
+class EventIndex:
+    """Read access to an event log through its sidecar index.
+
+    Construction brings the index up to date with the log (catching up on
+    unindexed lines, or rebuilding when the two disagree), so a freshly
+    built EventIndex always covers every complete line in the log.
+    """
+
+    def __init__(self, events_file: Path):
+        """Load (and if needed repair) the index for events_file.
+
+        Args:
+            events_file: Path to events.ndjson
+        """
+        self.events_file = Path(events_file)
+        self.index_file = event_index_path(self.events_file)
+        self._records = self._load()
+
+    def _load(self) -> bytes:
+        if not self.events_file.exists():
+            return b""
+        log_size = self.events_file.stat().st_size
+        try:
+            data = self.index_file.read_bytes()
+        except OSError:
+            data = None
+
+        if data is not None and len(data) % RECORD_SIZE:
+            # Torn trailing record: drop it so later appends stay aligned
+            data = data[: len(data) - len(data) % RECORD_SIZE]
+            try:
+                with self.index_file.open("r+b") as f:
+                    f.truncate(len(data))
+            except OSError:
+                data = None
+
+        if data is not None:
+            end = _contiguous_end(data)
+            if end is not None and end <= log_size:
+                if end < log_size:
+                    data += self._catch_up(end)
+                return data
+
+        rebuild_event_index(self.events_file)
+        return self.index_file.read_bytes()
+
+    def _catch_up(self, end: int) -> bytes:
+        records = _index_lines(self.events_file, end)
+        if records:
+            try:
+                with self.index_file.open("ab") as f:
+                    f.write(records)
+            except OSError:
+                pass
+        return records
+
+    def __len__(self) -> int:
+        return len(self._records) // RECORD_SIZE
+
+    def _iter_records(self, reverse: bool = False) -> Iterator[Tuple[int, int, int, int, int]]:
+        records = _RECORD.iter_unpack(self._records)
+        if not reverse:
+            yield from records
+            return
+        for pos in range(len(self._records) - RECORD_SIZE, -1, -RECORD_SIZE):
+            yield _RECORD.unpack_from(self._records, pos)
+
+    def _select(
+        self,
+        types: Optional[Iterable[str]],
+        work_item_id: Optional[str],
+        since_ts: Union[str, datetime, None],
+        reverse: bool = False,
+    ) -> Iterator[Tuple[int, int]]:
+        codes = {event_type_code(t) for t in types} if types is not None else None
+        item_hash = work_item_hash(work_item_id) if work_item_id is not None else None
+        since = _ts_micros(since_ts) if since_ts is not None else None
+        for offset, length, code, ts, item in self._iter_records(reverse):
+            if codes is not None and code not in codes:
+                continue
+            if item_hash is not None and item != item_hash:
+                continue
+            if since is not None and ts < since:
+                continue
+            yield offset, length
+
+    def _fetch(
+        self,
+        locations: Iterable[Tuple[int, int]],
+        types: Optional[Iterable[str]],
+        work_item_id: Optional[str],
+    ) -> Iterator[Dict[str, Any]]:
+        wanted = set(types) if types is not None else None
+        with self.events_file.open("rb") as f:
+            for offset, length in locations:
+                f.seek(offset)
+                try:
+                    event = json.loads(f.read(length))
+                except ValueError:
+                    continue
+                if not isinstance(event, dict):
+                    continue
+                # Filter again: codes and hashes may collide
+                if wanted is not None and event.get("type") not in wanted:
+                    continue
+                if work_item_id is not None and _work_item_id(event) != work_item_id:
+                    continue
+                yield event
+
+    def events(
+        self,
+        types: Optional[Iterable[str]] = None,
+        *,
+        work_item_id: Optional[str] = None,
+        since_ts: Union[str, datetime, None] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield matching events (as dicts) in log order, reading only their lines.
+
+        Args:
+            types: Event types to include (None for all)
+            work_item_id: Only events whose payload.work_item_id matches
+            since_ts: Only events with ts >= since_ts
+
+        Yields:
+            Event dictionaries
+        """
+        if types is not None:
+            types = list(types)
+        yield from self._fetch(self._select(types, work_item_id, since_ts), types, work_item_id)
+
+    def last(self, event_type: str) -> Optional[Dict[str, Any]]:
+        """Return the most recent event of a type, or None."""
+        types = [event_type]
+        return next(self._fetch(self._select(types, None, None, reverse=True), types, None), None)
+
+    def first_ts(self) -> Optional[str]:
+        """Return the timestamp of the first event, or None for an empty log."""
+        return self._ts_at(0)
+
+    def last_ts(self) -> Optional[str]:
+        """Return the timestamp of the last event, or None for an empty log."""
+        return self._ts_at(len(self) - 1)
+
+    def _ts_at(self, position: int) -> Optional[str]:
+        if not 0 <= position < len(self):
+            return None
+        offset, length, _, _, _ = _RECORD.unpack_from(self._records, position * RECORD_SIZE)
+        event = next(self._fetch([(offset, length)], None, None), None)
+        return event.get("ts") if event else None
+
+    def count(self, types: Iterable[str]) -> Dict[str, int]:
+        """Count events per type from the index alone (no log reads).
+
+        Args:
+            types: Event types to count
+
+        Returns:
+            Mapping of event type to count (0 for types never seen)
+        """
+        by_code: Dict[int, List[str]] = {}
+        for event_type in types:
+            by_code.setdefault(event_type_code(event_type), []).append(event_type)
+        counts = {event_type: 0 for names in by_code.values() for event_type in names}
+        for _, _, code, _, _ in self._iter_records():
+            for event_type in by_code.get(code, ()):
+                counts[event_type] += 1
+        return counts
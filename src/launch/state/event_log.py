@@ -11,12 +11,68 @@ from __future__ import annotations
 
 import hashlib
 import json
+from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 from launch.models.event import Event
 
+from .event_index import append_index_record
+
+# Active event capture buffer for the current context (see capture_events)
+_EVENT_CAPTURE: ContextVar[Optional[List[Tuple[Path, str]]]] = ContextVar(
+    "launch_event_capture", default=None
+)
+
+
+@contextmanager
+def capture_events() -> Iterator[List[Tuple[Path, str]]]:
+    """Buffer event log lines written in the current context instead of appending them.
+
+    Used by the DAG scheduler to run work items concurrently while keeping
+    events.ndjson in declaration order: each work item's events are captured
+    in its own thread and flushed with flush_captured_events afterwards.
+
+    Yields:
+        List of (events_file, line) tuples, in write order
+    """
+    buffer: List[Tuple[Path, str]] = []
+    token = _EVENT_CAPTURE.set(buffer)
+    try:
+        yield buffer
+    finally:
+        _EVENT_CAPTURE.reset(token)
+
+
+def write_event_line(events_file: Path, line: str) -> None:
+    """Append one serialized event line, or buffer it while capture is active.
+
+    Also appends the line's record to the events.idx sidecar index.
+
+    Args:
+        events_file: Path to events.ndjson file
+        line: Serialized event without trailing newline
+    """
+    buffer = _EVENT_CAPTURE.get()
+    if buffer is not None:
+        buffer.append((events_file, line))
+        return
+    data = (line + "\n").encode("utf-8")
+    with events_file.open("ab") as f:
+        f.write(data)
+        f.flush()
+        # The append fd's position is the end of this write, even with concurrent writers
+        offset = f.tell() - len(data)
+    append_index_record(events_file, offset, data)
+
+
+def flush_captured_events(buffer: List[Tuple[Path, str]]) -> None:
+    """Append captured event lines to their event logs, preserving order."""
+    for events_file, line in buffer:
+        write_event_line(events_file, line)
+
 
 def append_event(
     events_file: Path,
@@ -34,13 +90,133 @@ def append_event(
     event_json = json.dumps(event.to_dict(), separators=(",", ":"), sort_keys=True)
 
     # Append to file (newline-delimited JSON)
-    with events_file.open("a", encoding="utf-8") as f:
-        f.write(event_json + "\n")
+    write_event_line(events_file, event_json)
+
+
+def iter_event_lines(events_file: Path, since_offset: int = 0) -> Iterator[Tuple[int, bytes]]:
+    """Stream raw event lines with their byte offsets.
+
+    Reads in binary so offsets are exact and resumable: pass the offset
+    after the last line seen (offset + len(line)) as since_offset to
+    continue where a previous read stopped. Only one line is held in
+    memory at a time.
+
+    Args:
+        events_file: Path to events.ndjson file
+        since_offset: Byte offset to start reading from (a line boundary)
+
+    Yields:
+        (byte offset of the line, raw line including its newline)
+    """
+    if not events_file.exists():
+        return
+    with events_file.open("rb") as f:
+        f.seek(since_offset)
+        offset = since_offset
+        for line in f:
+            yield offset, line
+            offset += len(line)
+
+
+def _parse_ts(ts: Union[str, datetime]) -> datetime:
+    """Parse an event timestamp, treating naive values as UTC."""
+    parsed = ts if isinstance(ts, datetime) else datetime.fromisoformat(ts)
+    return parsed if parsed.tzinfo is not None else parsed.replace(tzinfo=timezone.utc)
+
+
+def iter_events(
+    events_file: Path,
+    *,
+    types: Optional[Iterable[str]] = None,
+    since_offset: int = 0,
+    since_ts: Optional[Union[str, datetime]] = None,
+    payload_keys: Optional[Iterable[str]] = None,
+    skip_invalid: bool = False,
+) -> Iterator[Dict[str, Any]]:
+    """Stream events from an NDJSON event log, filtered and projected.
+
+    Memory stays bounded by the largest single event. With types given, a
+    line is only decoded if it contains one of the quoted type names, so
+    unrelated events cost a substring check rather than a json.loads.
+
+    Args:
+        events_file: Path to events.ndjson file
+        types: Only yield events of these types
+        since_offset: Byte offset to start reading from (see iter_event_lines)
+        since_ts: Only yield events at or after this ISO8601 timestamp
+        payload_keys: Reduce each payload to these keys
+        skip_invalid: Skip undecodable lines instead of raising
+
+    Yields:
+        Event dicts (as written) in append order
+
+    Raises:
+        json.JSONDecodeError: On an undecodable line unless skip_invalid
+    """
+    type_set = frozenset(types) if types is not None else None
+    needles = [f'"{t}"'.encode("utf-8") for t in type_set] if type_set is not None else None
+    since = _parse_ts(since_ts) if since_ts is not None else None
+    keys = tuple(payload_keys) if payload_keys is not None else None
+
+    for _, line in iter_event_lines(events_file, since_offset):
+        if needles is not None and not any(needle in line for needle in needles):
+            continue
+        if not line.strip():
+            continue
+        try:
+            event = json.loads(line)
+        except json.JSONDecodeError:
+            if skip_invalid:
+                continue
+            raise
+        if type_set is not None and event.get("type") not in type_set:
+            continue
+        if since is not None:
+            try:
+                if _parse_ts(event.get("ts", "")) < since:
+                    continue
+            except ValueError:
+                continue
+        if keys is not None:
+            payload = event.get("payload")
+            payload = payload if isinstance(payload, dict) else {}
+            event["payload"] = {k: payload[k] for k in keys if k in payload}
+        yield event
+
+
+def count_events(
+    events_file: Path,
+    *,
+    types: Optional[Iterable[str]] = None,
+    since_offset: int = 0,
+    since_ts: Optional[Union[str, datetime]] = None,
+) -> Dict[str, int]:
+    """Count events per type without materializing them.
+
+    Args:
+        events_file: Path to events.ndjson file
+        types: Only count events of these types
+        since_offset: Byte offset to start reading from
+        since_ts: Only count events at or after this timestamp
+
+    Returns:
+        Event type -> count, in first-seen order
+    """
+    counts: Dict[str, int] = {}
+    for event in iter_events(
+        events_file, types=types, since_offset=since_offset, since_ts=since_ts,
+        payload_keys=(), skip_invalid=True,
+    ):
+        counts[event.get("type", "")] = counts.get(event.get("type", ""), 0) + 1
+    return counts
 
 
 def read_events(events_file: Path) -> List[Event]:
     """Read all events from NDJSON event log.
 
+    Prefer iter_events when only some events (by type, time window or
+    offset) or only counts are needed.
+
     Args:
         events_file: Path to events.ndjson file
 
@@ -49,19 +225,7 @@ def read_events(events_file: Path) -> List[Event]:
 
     Spec reference: specs/11_state_and_events.md:122-127
     """
-    if not events_file.exists():
-        return []
-
-    events: List[Event] = []
-    with events_file.open("r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            event_data = json.loads(line)
-            events.append(Event.from_dict(event_data))
-
-    return events
+    return [Event.from_dict(event_data) for event_data in iter_events(events_file)]
 
 
 def validate_event_chain(events: List[Event]) -> None:
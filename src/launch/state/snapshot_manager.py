@@ -36,11 +36,23 @@ from launch.models.state import (
     WorkItem,
 )
 
+from .event_index import EventIndex
 from .event_log import read_events, validate_event_chain
 
 
 SNAPSHOT_SCHEMA_VERSION = "1.0.0"
 
+# Event types apply_event_reducer changes the snapshot for
+REDUCED_EVENT_TYPES = (
+    EVENT_RUN_STATE_CHANGED,
+    EVENT_ARTIFACT_WRITTEN,
+    EVENT_WORK_ITEM_QUEUED,
+    EVENT_WORK_ITEM_STARTED,
+    EVENT_WORK_ITEM_FINISHED,
+    EVENT_ISSUE_OPENED,
+    EVENT_ISSUE_RESOLVED,
+)
+
 
 def write_snapshot(snapshot_file: Path, snapshot: Snapshot) -> None:
     """Write snapshot atomically to disk.
@@ -116,6 +128,28 @@ def replay_events(events_file: Path, run_id: str) -> Snapshot:
     return snapshot
 
 
+def replay_indexed_events(events_file: Path, run_id: str) -> Snapshot:
+    """Reconstruct the snapshot from only the events the reducer acts on.
+
+    Produces the same snapshot as replay_events, but locates the
+    state-affecting events through the events.idx sidecar index and reads
+    only their lines, skipping the (usually far more numerous) telemetry
+    events. Chain validation needs every event and is not performed; use
+    replay_events when it is required.
+
+    Args:
+        events_file: Path to events.ndjson
+        run_id: Run ID
+
+    Returns:
+        Reconstructed snapshot
+    """
+    snapshot = create_initial_snapshot(run_id)
+    for data in EventIndex(events_file).events(REDUCED_EVENT_TYPES):
+        snapshot = apply_event_reducer(snapshot, Event.from_dict(data))
+    return snapshot
+
+
 def apply_event_reducer(snapshot: Snapshot, event: Event) -> Snapshot:
     """Apply event to snapshot (reducer function).
 
@@ -8,8 +8,24 @@ Binding contract: specs/34_strict_compliance_guarantees.md (Guarantee B)
 
 from __future__ import annotations
 
+import os
+import re
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Union
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+# Paths that require taskcard authorization (see is_source_code_path)
+PROTECTED_PATH_PATTERNS: Tuple[str, ...] = (
+    "src/launch/**",  # Protect entire src/launch directory
+    "specs/**",  # Protect entire specs directory
+    "plans/taskcards/**",  # Protect entire taskcards directory
+)
+
+# PurePath.match() is case-insensitive on Windows
+_MATCH_FLAGS = re.IGNORECASE if os.name == "nt" else 0
+
+# Trie node key marking the end of a prefix
+_END = ""
 
 
 class PathValidationError(Exception):
@@ -203,6 +219,9 @@ def validate_path_matches_patterns(
     - Wildcard dir: src/launch/workers/w1_*/** (matches w1_repo_scout, w1_*)
     - Wildcard file: src/**/*.py (matches all .py files under src/)
 
+    Patterns are compiled once per (patterns, repo_root) and cached; see
+    PathPatternMatcher.
+
     Args:
         path: Path to check (absolute or relative)
         patterns: List of glob patterns (relative to repo_root)
@@ -233,45 +252,7 @@ def validate_path_matches_patterns(
         ... )
         True
     """
-    path_obj = Path(path)
-    repo_root_obj = Path(repo_root).resolve()
-
-    # Make path relative to repo_root for matching
-    try:
-        # Try to make path relative to repo_root
-        if path_obj.is_absolute():
-            relative_path = path_obj.relative_to(repo_root_obj)
-        else:
-            # Path is already relative, use as-is
-            relative_path = path_obj
-    except ValueError:
-        # Path is not under repo_root
-        return False
-
-    # Check against each pattern
-    for pattern in patterns:
-        pattern_str = str(pattern).replace("\\", "/")  # Normalize separators
-        relative_path_str = str(relative_path).replace("\\", "/")
-
-        # Exact match
-        if pattern_str == relative_path_str:
-            return True
-
-        # Glob match using pathlib
-        # Convert pattern to Path for matching
-        pattern_path = Path(pattern_str)
-
-        # Use match() for glob patterns
-        if relative_path.match(pattern_str):
-            return True
-
-        # Special case: pattern/** should match pattern/anything
-        if pattern_str.endswith("/**"):
-            prefix = pattern_str[:-3]  # Remove /**
-            if relative_path_str.startswith(prefix + "/") or relative_path_str == prefix:
-                return True
-
-    return False
+    return compile_path_patterns(patterns, repo_root).matches(path)
 
 
 def is_source_code_path(path: Union[str, Path], repo_root: Union[str, Path]) -> bool:
@@ -296,10 +277,163 @@ def is_source_code_path(path: Union[str, Path], repo_root: Union[str, Path]) ->
         >>> is_source_code_path("reports/test.md", Path("."))
         False
     """
-    protected_patterns = [
-        "src/launch/**",  # Protect entire src/launch directory
-        "specs/**",  # Protect entire specs directory
-        "plans/taskcards/**",  # Protect entire taskcards directory
-    ]
+    return compile_path_patterns(PROTECTED_PATH_PATTERNS, repo_root).matches(path)
+
+
+class PathPrefixTrie:
+    """Character trie answering "does any prefix start this string?".
+
+    Used for pattern/** rules (segment-aligned) and for plain prefix
+    allow-lists such as W6's allowed_paths (not aligned).
+    """
+
+    __slots__ = ("_root",)
+
+    def __init__(self, prefixes: Iterable[str]):
+        self._root: Dict[str, dict] = {}
+        for prefix in prefixes:
+            node = self._root
+            for ch in prefix:
+                node = node.setdefault(ch, {})
+            node[_END] = {}
+
+    def has_prefix_of(self, text: str, *, aligned: bool = False) -> bool:
+        """Return True if some prefix p satisfies text.startswith(p).
+
+        Args:
+            text: String to test
+            aligned: Only accept p == text or text.startswith(p + "/")
+
+        Returns:
+            True if a stored prefix matches
+        """
+        node = self._root
+        for ch in text:
+            if _END in node and (not aligned or ch == "/"):
+                return True
+            node = node.get(ch)
+            if node is None:
+                return False
+        return _END in node
+
+
+def _translate_segment(segment: str) -> str:
+    """Translate one glob path segment to a regex that never spans '/'."""
+    out: List[str] = []
+    i, n = 0, len(segment)
+    while i < n:
+        c = segment[i]
+        i += 1
+        if c == "*":
+            if not out or out[-1] != "[^/]*":
+                out.append("[^/]*")
+        elif c == "?":
+            out.append("[^/]")
+        elif c == "[":
+            j = i
+            if j < n and segment[j] == "!":
+                j += 1
+            if j < n and segment[j] == "]":
+                j += 1
+            while j < n and segment[j] != "]":
+                j += 1
+            if j >= n:
+                out.append("\\[")
+                continue
+            stuff, i = segment[i:j], j + 1
+            negate = stuff.startswith("!")
+            if negate:
+                stuff = stuff[1:]
+            stuff = stuff.replace("\\", "\\\\").replace("[", "\\[")
+            if not negate and stuff.startswith("^"):
+                stuff = "\\" + stuff
+            out.append(f"[^/{stuff}]" if negate else f"(?!/)[{stuff}]")
+        else:
+            out.append(re.escape(c))
+    return "".join(out)
+
+
+class PathPatternMatcher:
+    """Compiled allow-list with the semantics of validate_path_matches_patterns.
+
+    A path (made relative to repo_root) matches when, for some pattern:
+    - it equals the pattern exactly (set lookup),
+    - the pattern ends in /** and the path is that prefix or lies under it
+      (segment-aligned prefix trie), or
+    - PurePath.match(pattern) holds: the pattern's segments glob-match the
+      path's trailing segments, ** acting like * (one combined regex).
+
+    repo_root is resolved once, at construction. Empty and absolute
+    patterns never match via the glob rule (PurePath.match rejects the
+    former and cannot match a relative path with the latter).
+    """
+
+    def __init__(self, patterns: Iterable[str], repo_root: Union[str, Path]):
+        self.repo_root = Path(repo_root).resolve()
+        self._root_str = str(self.repo_root)
+        self._root_prefix = self._root_str.rstrip(os.sep) + os.sep
+        self.patterns: Tuple[str, ...] = tuple(str(p).replace("\\", "/") for p in patterns)
+        self._exact = frozenset(self.patterns)
+        self._prefixes = PathPrefixTrie(p[:-3] for p in self.patterns if p.endswith("/**"))
+
+        alternatives = []
+        for pattern in self.patterns:
+            parts = Path(pattern).parts
+            if not parts or Path(pattern).is_absolute():
+                continue
+            alternatives.append("/".join(_translate_segment(part) for part in parts))
+        self._regex: Optional[re.Pattern[str]] = None
+        if alternatives:
+            self._regex = re.compile(
+                "(?:.*/)?(?:" + "|".join(alternatives) + ")", _MATCH_FLAGS | re.DOTALL
+            )
+
+    def matches(self, path: Union[str, Path]) -> bool:
+        """Return True if path matches any pattern."""
+        path_obj = Path(path)
+        relative = str(path_obj)
+        if path_obj.is_absolute():
+            # String prefix test: Path.relative_to costs tens of microseconds
+            if relative == self._root_str:
+                relative = "."
+            elif relative.startswith(self._root_prefix):
+                relative = relative[len(self._root_prefix):]
+            else:
+                return False
+        relative = relative.replace("\\", "/")
+
+        if relative in self._exact:
+            return True
+        if self._prefixes.has_prefix_of(relative, aligned=True):
+            return True
+        return (
+            self._regex is not None
+            and relative != "."
+            and self._regex.fullmatch(relative) is not None
+        )
+
+
+def root_cache_key(repo_root: Union[str, Path]) -> Tuple[str, str]:
+    """Return a cache key for a repo root (relative roots depend on the cwd)."""
+    root = str(repo_root)
+    return ("", root) if Path(root).is_absolute() else (os.getcwd(), root)
+
+
+@lru_cache(maxsize=256)
+def _compile_path_patterns(patterns: Tuple[str, ...], root_key: Tuple[str, str]) -> PathPatternMatcher:
+    cwd, root = root_key
+    return PathPatternMatcher(patterns, Path(cwd) / root if cwd else root)
+
+
+def compile_path_patterns(
+    patterns: Iterable[str],
+    repo_root: Union[str, Path],
+) -> PathPatternMatcher:
+    """Return the cached PathPatternMatcher for patterns under repo_root."""
+    return _compile_path_patterns(tuple(str(p) for p in patterns), root_cache_key(repo_root))
+
 
-    return validate_path_matches_patterns(path, protected_patterns, repo_root=repo_root)
+@lru_cache(maxsize=256)
+def compile_path_prefixes(prefixes: Tuple[str, ...]) -> PathPrefixTrie:
+    """Return a cached PathPrefixTrie for a tuple of prefixes."""
+    return PathPrefixTrie(prefixes)
@@ -0,0 +1,213 @@
+"""Compiled write-fence policy (taskcard authorization, Layer 3/4).
+
+WriteFence answers "may this path be written?" for one (repo_root,
+taskcard_id, allowed_paths, enforcement_mode) combination. It is built once
+and reused for every write: the repo root is resolved once, the protected
+patterns and allowed_paths are compiled into a PathPatternMatcher, and the
+taskcard is parsed only when its file changes (cached by mtime and size).
+
+Shared by io/atomic.py (every atomic write) and Gate U (post-run audit).
+
+Spec references:
+- specs/34_strict_compliance_guarantees.md (Guarantee E: Write fence)
+- plans/taskcards/00_TASKCARD_CONTRACT.md (Taskcard structure)
+"""
+
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from .path_validation import (
+    PROTECTED_PATH_PATTERNS,
+    PathPatternMatcher,
+    PathValidationError,
+    compile_path_patterns,
+    root_cache_key,
+)
+from .taskcard_loader import (
+    TaskcardNotFoundError,
+    find_taskcard_file,
+    get_allowed_paths,
+    load_taskcard,
+)
+from .taskcard_validation import validate_taskcard_active
+
+
+@dataclass(frozen=True)
+class TaskcardPolicy:
+    """A parsed taskcard and its compiled allowed_paths.
+
+    Attributes:
+        taskcard_id: Taskcard ID (e.g., "TC-100")
+        taskcard: Taskcard frontmatter dictionary
+        allowed_paths: allowed_paths from the frontmatter
+        matcher: Compiled allowed_paths
+    """
+
+    taskcard_id: str
+    taskcard: Dict[str, Any]
+    allowed_paths: Tuple[str, ...]
+    matcher: PathPatternMatcher
+
+
+_POLICY_LOCK = threading.Lock()
+# (root key, taskcard_id) -> (taskcard file, (mtime_ns, size), policy)
+_POLICIES: Dict[Tuple[Tuple[str, str], str], Tuple[Path, Tuple[int, int], TaskcardPolicy]] = {}
+
+
+def load_taskcard_policy(taskcard_id: str, repo_root: Union[str, Path]) -> TaskcardPolicy:
+    """Load a taskcard's policy, reparsing only when its file changed.
+
+    Args:
+        taskcard_id: Taskcard ID (e.g., "TC-100")
+        repo_root: Repository root directory
+
+    Returns:
+        TaskcardPolicy
+
+    Raises:
+        TaskcardNotFoundError: If taskcard file doesn't exist
+        TaskcardParseError: If YAML parsing fails
+    """
+    key = (root_cache_key(repo_root), taskcard_id)
+    with _POLICY_LOCK:
+        cached = _POLICIES.get(key)
+    if cached is not None:
+        path, stamp, policy = cached
+        try:
+            st = path.stat()
+            if (st.st_mtime_ns, st.st_size) == stamp:
+                return policy
+        except OSError:
+            pass
+
+    root = Path(repo_root)
+    path = find_taskcard_file(taskcard_id, root)
+    if path is None:
+        raise TaskcardNotFoundError(taskcard_id)
+    st = path.stat()
+    taskcard = load_taskcard(taskcard_id, root)
+    allowed_paths = tuple(get_allowed_paths(taskcard))
+    policy = TaskcardPolicy(
+        taskcard_id=taskcard_id,
+        taskcard=taskcard,
+        allowed_paths=allowed_paths,
+        matcher=compile_path_patterns(allowed_paths, root),
+    )
+    with _POLICY_LOCK:
+        _POLICIES[key] = (path, (st.st_mtime_ns, st.st_size), policy)
+    return policy
+
+
+class WriteFence:
+    """Write authorization policy for one taskcard configuration."""
+
+    def __init__(
+        self,
+        repo_root: Union[str, Path],
+        taskcard_id: Optional[str] = None,
+        allowed_paths: Optional[List[str]] = None,
+        enforcement_mode: str = "strict",
+    ):
+        """Initialize the fence.
+
+        Args:
+            repo_root: Repository root for pattern matching
+            taskcard_id: Taskcard ID authorizing writes (e.g., "TC-100")
+            allowed_paths: Explicit allowed paths (if None, loaded from taskcard)
+            enforcement_mode: "strict" or "disabled"
+        """
+        self.repo_root = Path(repo_root)
+        self.taskcard_id = taskcard_id
+        self.allowed_paths = list(allowed_paths) if allowed_paths is not None else None
+        self.enforcement_mode = enforcement_mode
+        self._protected = compile_path_patterns(PROTECTED_PATH_PATTERNS, self.repo_root)
+        self._allowed = (
+            compile_path_patterns(self.allowed_paths, self.repo_root)
+            if self.allowed_paths is not None
+            else None
+        )
+
+    def is_protected(self, path: Union[str, Path]) -> bool:
+        """Return True if writing path requires taskcard authorization."""
+        return self._protected.matches(path)
+
+    def check(self, path: Union[str, Path]) -> None:
+        """Validate write authorization for path.
+
+        Raises:
+            PathValidationError: If write not authorized
+
+        Error codes:
+            - POLICY_TASKCARD_MISSING: Protected path write without taskcard
+            - POLICY_TASKCARD_INACTIVE: Taskcard status is Draft/Blocked
+            - POLICY_TASKCARD_PATH_VIOLATION: Path not in allowed_paths
+        """
+        if self.enforcement_mode == "disabled" or not self._protected.matches(path):
+            return
+
+        if self.taskcard_id is None:
+            raise PathValidationError(
+                f"Write to protected path '{path}' requires taskcard authorization. "
+                f"Protected paths: src/launch/**, specs/**, plans/taskcards/**. "
+                f"Set LAUNCH_TASKCARD_ENFORCEMENT=disabled for local development.",
+                error_code="POLICY_TASKCARD_MISSING",
+            )
+
+        try:
+            policy = load_taskcard_policy(self.taskcard_id, self.repo_root)
+        except Exception as e:
+            raise PathValidationError(
+                f"Failed to load taskcard {self.taskcard_id}: {e}",
+                error_code="POLICY_TASKCARD_MISSING",
+            ) from e
+
+        try:
+            validate_taskcard_active(policy.taskcard)
+        except Exception as e:
+            raise PathValidationError(
+                f"Taskcard {self.taskcard_id} is not active: {e}",
+                error_code="POLICY_TASKCARD_INACTIVE",
+            ) from e
+
+        matcher = self._allowed if self._allowed is not None else policy.matcher
+        if not matcher.matches(path):
+            allowed_paths = (
+                self.allowed_paths if self.allowed_paths is not None else list(policy.allowed_paths)
+            )
+            raise PathValidationError(
+                f"Path '{path}' not authorized by taskcard {self.taskcard_id}. "
+                f"Allowed paths: {allowed_paths}. "
+                f"Add this path to the taskcard's allowed_paths or use a different taskcard.",
+                error_code="POLICY_TASKCARD_PATH_VIOLATION",
+            )
+
+
+_FENCE_LOCK = threading.Lock()
+_FENCES: Dict[Tuple[Any, ...], WriteFence] = {}
+_MAX_FENCES = 256
+
+
+def get_write_fence(
+    repo_root: Union[str, Path],
+    taskcard_id: Optional[str] = None,
+    allowed_paths: Optional[List[str]] = None,
+    enforcement_mode: str = "strict",
+) -> WriteFence:
+    """Return the shared WriteFence for this configuration, building it once."""
+    key = (
+        root_cache_key(repo_root),
+        taskcard_id,
+        tuple(allowed_paths) if allowed_paths is not None else None,
+        enforcement_mode,
+    )
+    with _FENCE_LOCK:
+        fence = _FENCES.get(key)
+        if fence is None:
+            if len(_FENCES) >= _MAX_FENCES:
+                _FENCES.clear()
+            fence = _FENCES[key] = WriteFence(repo_root, taskcard_id, allowed_paths, enforcement_mode)
+    return fence
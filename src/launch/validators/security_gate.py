@@ -19,6 +19,7 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 from ..security.file_scanner import scan_directory, filter_results_with_secrets, count_total_secrets
+from ..security.scan_engine import DEFAULT_EXCLUDE_DIRS
 
 
 def run_security_gate(
@@ -48,7 +49,7 @@ def run_security_gate(
         run_dir,
         allowlist=allowlist,
         recursive=True,
-        exclude_dirs={".git", "node_modules", "__pycache__", ".venv", "venv", ".pytest_cache"},
+        exclude_dirs=set(DEFAULT_EXCLUDE_DIRS) | {".pytest_cache"},
     )
 
     # Filter to only results with secrets
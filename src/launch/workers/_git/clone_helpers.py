@@ -8,15 +8,26 @@ Spec references:
 - specs/21_worker_contracts.md (W1 binding requirements)
 
 TC-401: W1.1 Clone inputs and resolve SHAs deterministically
+
+Shared clone mirror: when LAUNCH_GIT_MIRROR_DIR is set, every remote is kept
+as a bare mirror under that directory and clones borrow its objects
+(--reference-if-able, then --dissociate so the clone stays self-contained).
+Concurrent runs of pilots that share a repo then fetch it from the network
+once. Mirror maintenance is best-effort: any mirror failure falls back to a
+plain clone, and the checked-out commit is the same either way.
 """
 
 from __future__ import annotations
 
+import hashlib
+import os
+import shutil
 import subprocess
+import tempfile
 from launch.util.subprocess import run as subprocess_run
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional
 
 
 @dataclass(frozen=True)
@@ -69,6 +80,78 @@ def is_commit_sha(ref: str) -> bool:
     return True
 
 
+def get_mirror_path(repo_url: str) -> Optional[Path]:
+    """Return the shared mirror path for a repo URL, or None if mirroring is off.
+
+    Args:
+        repo_url: Git repository URL
+
+    Returns:
+        <LAUNCH_GIT_MIRROR_DIR>/<sha256(url)[:16]>.git, or None
+    """
+    mirror_dir = os.environ.get("LAUNCH_GIT_MIRROR_DIR")
+    if not mirror_dir:
+        return None
+    digest = hashlib.sha256(repo_url.encode("utf-8")).hexdigest()[:16]
+    return Path(mirror_dir) / f"{digest}.git"
+
+
+def refresh_mirror(repo_url: str) -> Optional[Path]:
+    """Create or update the shared bare mirror for repo_url.
+
+    New mirrors are cloned into a temporary directory and renamed into
+    place, so concurrent runs never see a half-written mirror.
+
+    Args:
+        repo_url: Git repository URL
+
+    Returns:
+        Mirror path usable with --reference-if-able, or None
+    """
+    mirror_path = get_mirror_path(repo_url)
+    if mirror_path is None:
+        return None
+
+    try:
+        if mirror_path.exists():
+            # Best-effort: a concurrent fetch holding ref locks only means
+            # this clone borrows fewer objects
+            subprocess_run(
+                ["git", "--git-dir", str(mirror_path), "remote", "update", "--prune"],
+                capture_output=True,
+                text=True,
+                check=False,
+            )
+            return mirror_path
+
+        mirror_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = Path(tempfile.mkdtemp(prefix=f".{mirror_path.stem}-", dir=mirror_path.parent))
+        result = subprocess_run(
+            ["git", "clone", "--mirror", "--quiet", repo_url, str(tmp_path)],
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+        if result.returncode != 0:
+            shutil.rmtree(tmp_path, ignore_errors=True)
+            return None
+        try:
+            os.replace(tmp_path, mirror_path)
+        except OSError:
+            # Another run created the mirror first
+            shutil.rmtree(tmp_path, ignore_errors=True)
+        return mirror_path if mirror_path.exists() else None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def _reference_args(repo_url: str) -> List[str]:
+    mirror_path = refresh_mirror(repo_url)
+    if mirror_path is None:
+        return []
+    return ["--reference-if-able", str(mirror_path), "--dissociate"]
+
+
 def clone_and_resolve(
     repo_url: str,
     ref: str,
@@ -137,7 +220,7 @@ def clone_and_resolve(
         if ref_is_sha:
             # SHAs cannot use --branch flag
             # Strategy: clone without --branch, then checkout SHA
-            clone_cmd = ["git", "clone"]
+            clone_cmd = ["git", "clone", *_reference_args(repo_url)]
 
             if shallow:
                 # For shallow SHA clones, we need to:
@@ -200,7 +283,7 @@ def clone_and_resolve(
 
         else:
             # Branch or tag - use --branch flag (or placeholder)
-            clone_cmd = ["git", "clone"]
+            clone_cmd = ["git", "clone", *_reference_args(repo_url)]
             if shallow:
                 clone_cmd.extend(["--depth", "1"])
 
@@ -365,3 +448,78 @@ def resolve_remote_ref(repo_url: str, ref: str) -> str:
         raise GitResolveError(
             "Git executable not found. Please ensure git is installed and in PATH."
         )
+
+
+def list_blob_shas(repo_dir: Path) -> Dict[str, str]:
+    """Map repo-relative POSIX paths to git blob SHAs for a clone's checkout.
+
+    Reads HEAD's tree with one ``git ls-tree`` call instead of hashing file
+    contents. Tracked files with uncommitted changes are omitted, so every
+    SHA returned matches the file on disk; callers hash missing paths
+    themselves (see launch.io.hashing.git_blob_sha).
+
+    Args:
+        repo_dir: Clone directory (e.g. RUN_DIR/work/repo)
+
+    Returns:
+        Path -> blob SHA, or an empty dict if repo_dir is not a git checkout
+    """
+    try:
+        tree = subprocess_run(
+            ["git", "-C", str(repo_dir), "ls-tree", "-r", "-z", "--full-tree", "HEAD"],
+            capture_output=True,
+            check=False,
+        )
+        if tree.returncode != 0:
+            return {}
+        dirty = subprocess_run(
+            ["git", "-C", str(repo_dir), "diff", "--name-only", "-z", "HEAD"],
+            capture_output=True,
+            check=False,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return {}
+
+    shas: Dict[str, str] = {}
+    for record in tree.stdout.decode("utf-8", errors="surrogateescape").split("\0"):
+        # <mode> SP <type> SP <sha> TAB <path>
+        meta, sep, path = record.partition("\t")
+        if not sep:
+            continue
+        parts = meta.split()
+        if len(parts) == 3 and parts[1] == "blob":
+            shas[path] = parts[2]
+    if dirty.returncode != 0:
+        return {}
+    for path in dirty.stdout.decode("utf-8", errors="surrogateescape").split("\0"):
+        shas.pop(path, None)
+    return shas
+
+
+def diff_changed_paths(repo_dir: Path, old_sha: str, new_sha: str) -> Optional[List[str]]:
+    """List repo-relative POSIX paths that differ between two commits.
+
+    Renames are reported as a deletion plus an addition, so both the old and
+    the new path appear.
+
+    Args:
+        repo_dir: Clone directory containing both commits
+        old_sha: Base commit SHA
+        new_sha: Target commit SHA
+
+    Returns:
+        Sorted changed paths, or None if either commit is unavailable (e.g.
+        a shallow clone that does not reach old_sha)
+    """
+    try:
+        result = subprocess_run(
+            ["git", "-C", str(repo_dir), "diff", "--name-only", "--no-renames", "-z", old_sha, new_sha],
+            capture_output=True,
+            check=False,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    if result.returncode != 0:
+        return None
+    paths = result.stdout.decode("utf-8", errors="surrogateescape").split("\0")
+    return sorted(p for p in paths if p)
@@ -0,0 +1,313 @@
+"""Run-scoped repository content store shared by W1, W2 and W3.
+
+The same product-repo files are opened and decoded by several workers in a
+single run: W1 binary/heading/front-matter detection, W1 frontmatter contract
+building, W2 claim extraction and evidence mapping, and W3 doc snippet
+extraction. This module loads each file once, caches its decoded text plus
+derived forms (lowercase text, token sets), and hands the cached values to
+every consumer in the run.
+
+Design decisions:
+- Entries are keyed by repo-relative POSIX path (same keys as discovered_docs.json)
+- Text is decoded exactly like ``Path.read_text(encoding="utf-8", errors="ignore")``,
+  including universal newline translation, so cached and uncached reads agree.
+  Callers that decode with errors="replace" get the cached text when the file
+  is valid UTF-8 and a fresh decode otherwise
+- Binary checks on files not yet loaded sniff the first 8 KB without caching,
+  so repo-wide scans do not pull every file (or large binaries) into the store;
+  files are only admitted when their text is requested
+- Binary files are detected once and only the flag is retained, never the bytes
+- A byte budget with LRU eviction bounds memory; evicted files are re-read on demand
+- Entries are revalidated against (size, mtime_ns) so edits are never served stale
+- Stores are shared through a process-wide registry keyed by resolved repo_dir,
+  so successive worker invocations in the same run reuse one store
+
+Spec references:
+- specs/10_determinism_and_caching.md (Caching)
+- specs/02_repo_ingestion.md (Docs discovery)
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+# Default memory budget for cached text and derived values (MB)
+DEFAULT_BUDGET_MB = float(os.environ.get("LAUNCH_REPO_CONTENT_BUDGET_MB", "256"))
+
+# Number of leading bytes inspected by the null-byte binary heuristic
+BINARY_SNIFF_BYTES = 8192
+
+
+@dataclass
+class _Entry:
+    """Cached state for a single repository file."""
+
+    stat_key: Tuple[int, int]
+    is_binary: bool
+    text: Optional[str] = None
+    lossy: bool = False  # text dropped undecodable bytes
+    derived: Dict[str, Any] = field(default_factory=dict)
+    size: int = 0
+
+
+def _estimate_size(value: Any) -> int:
+    """Roughly estimate the memory footprint of a cached value in bytes."""
+    if value is None:
+        return 0
+    if isinstance(value, (str, bytes)):
+        return len(value)
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return sum(_estimate_size(v) + 8 for v in value)
+    if isinstance(value, dict):
+        return sum(_estimate_size(k) + _estimate_size(v) + 16 for k, v in value.items())
+    return 64
+
+
+def _decode_text(data: bytes, errors: str = "ignore") -> str:
+    """Decode bytes the same way ``Path.read_text(errors=errors)`` does."""
+    text = data.decode("utf-8", errors=errors)
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+class RepoContentStore:
+    """Load-once cache of repository file contents and derived forms.
+
+    Usage:
+        store = get_repo_content_store(repo_dir)
+        text = store.get_text("docs/intro.md")          # None if unreadable
+        lower = store.get_lower("docs/intro.md")
+        tokens = store.get_derived("docs/intro.md", "tokens", tokenize)
+
+    All accessors are thread-safe. ``stats`` exposes read/hit/eviction
+    counters so callers and tests can confirm files are read once per run.
+    """
+
+    def __init__(self, repo_dir: Path, *, max_bytes: Optional[int] = None) -> None:
+        """Initialize store for a repository root.
+
+        Args:
+            repo_dir: Repository root directory
+            max_bytes: Budget for cached text and derived values. Defaults to
+                       LAUNCH_REPO_CONTENT_BUDGET_MB (256 MB).
+        """
+        self.repo_dir = Path(repo_dir)
+        self.max_bytes = max_bytes if max_bytes is not None else int(DEFAULT_BUDGET_MB * 1024 * 1024)
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._bytes_used = 0
+        self._lock = threading.RLock()
+        self.stats: Dict[str, int] = {"reads": 0, "hits": 0, "evictions": 0}
+        self.read_counts: Dict[str, int] = {}
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def is_binary(self, rel_path: str) -> bool:
+        """Return True if the file looks binary (null byte in first 8 KB).
+
+        Files already in the store answer from their entry; others are
+        sniffed without being loaded or cached. Unreadable files are treated
+        as binary, matching discover_docs.is_binary_file().
+        """
+        key = self._norm(rel_path)
+        file_path = self._path(key)
+        try:
+            st = file_path.stat()
+        except OSError:
+            return True
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.stat_key == (st.st_size, st.st_mtime_ns):
+                self._entries.move_to_end(key)
+                self.stats["hits"] += 1
+                return entry.is_binary
+        try:
+            with file_path.open("rb") as f:
+                return b"\x00" in f.read(BINARY_SNIFF_BYTES)
+        except OSError:
+            return True
+
+    def get_text(self, rel_path: str, errors: str = "ignore") -> Optional[str]:
+        """Return decoded file text, or None if missing/unreadable.
+
+        Binary files, and files with undecodable bytes when errors is not
+        "ignore", are decoded on demand (without caching) so callers that
+        previously called read_text() on them keep identical results.
+        """
+        entry = self._get_entry(rel_path)
+        if entry is None:
+            return None
+        if entry.text is not None and (errors == "ignore" or not entry.lossy):
+            return entry.text
+        try:
+            return _decode_text(self._path(self._norm(rel_path)).read_bytes(), errors)
+        except OSError:
+            return None
+
+    def get_lower(self, rel_path: str) -> Optional[str]:
+        """Return lowercased file text (cached)."""
+        return self.get_derived(rel_path, "lower", str.lower)
+
+    def get_derived(
+        self,
+        rel_path: str,
+        key: str,
+        builder: Callable[[str], Any],
+    ) -> Any:
+        """Return a value derived from the file text, computing it once.
+
+        Args:
+            rel_path: Repo-relative path
+            key: Cache key for the derived value (e.g. "w2.word_set")
+            builder: Function of the decoded text producing the value
+
+        Returns:
+            Derived value, or None if the file is missing/unreadable.
+            Values derived from binary files are computed but not cached.
+        """
+        with self._lock:
+            entry = self._get_entry(rel_path)
+            if entry is None:
+                return None
+            if entry.text is None:
+                text = self.get_text(rel_path)
+                return builder(text) if text is not None else None
+            if key in entry.derived:
+                return entry.derived[key]
+            value = builder(entry.text)
+            entry.derived[key] = value
+            added = _estimate_size(value)
+            entry.size += added
+            self._bytes_used += added
+            self._evict_if_needed(keep=self._norm(rel_path))
+            return value
+
+    def invalidate(self, rel_path: Optional[str] = None) -> None:
+        """Drop one entry, or every entry when rel_path is None."""
+        with self._lock:
+            if rel_path is None:
+                self._entries.clear()
+                self._bytes_used = 0
+                return
+            entry = self._entries.pop(self._norm(rel_path), None)
+            if entry is not None:
+                self._bytes_used -= entry.size
+
+    @property
+    def bytes_used(self) -> int:
+        """Approximate bytes currently held by the cache."""
+        return self._bytes_used
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _norm(self, rel_path: Any) -> str:
+        """Normalize a relative (or repo-absolute) path to a POSIX cache key."""
+        path = Path(rel_path)
+        if path.is_absolute():
+            try:
+                path = path.relative_to(self.repo_dir)
+            except ValueError:
+                pass
+        return str(path).replace("\\", "/")
+
+    def _path(self, key: str) -> Path:
+        return Path(key) if Path(key).is_absolute() else self.repo_dir / key
+
+    def _get_entry(self, rel_path: str) -> Optional[_Entry]:
+        key = self._norm(rel_path)
+        file_path = self._path(key)
+        try:
+            st = file_path.stat()
+        except OSError:
+            return None
+        stat_key = (st.st_size, st.st_mtime_ns)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.stat_key == stat_key:
+                self._entries.move_to_end(key)
+                self.stats["hits"] += 1
+                return entry
+            if entry is not None:
+                # File changed on disk since it was cached
+                self._entries.pop(key)
+                self._bytes_used -= entry.size
+
+            try:
+                data = file_path.read_bytes()
+            except OSError:
+                return None
+            self.stats["reads"] += 1
+            self.read_counts[key] = self.read_counts.get(key, 0) + 1
+
+            if b"\x00" in data[:BINARY_SNIFF_BYTES]:
+                entry = _Entry(stat_key=stat_key, is_binary=True)
+            else:
+                try:
+                    text, lossy = _decode_text(data, "strict"), False
+                except UnicodeDecodeError:
+                    text, lossy = _decode_text(data), True
+                entry = _Entry(stat_key=stat_key, is_binary=False, text=text, lossy=lossy, size=len(text))
+
+            self._entries[key] = entry
+            self._bytes_used += entry.size
+            self._evict_if_needed(keep=key)
+            return entry
+
+    def _evict_if_needed(self, keep: str) -> None:
+        """Evict least-recently-used entries until under budget."""
+        while self._bytes_used > self.max_bytes and len(self._entries) > 1:
+            oldest_key = next(iter(self._entries))
+            if oldest_key == keep:
+                self._entries.move_to_end(oldest_key)
+                oldest_key = next(iter(self._entries))
+                if oldest_key == keep:
+                    break
+            evicted = self._entries.pop(oldest_key)
+            self._bytes_used -= evicted.size
+            self.stats["evictions"] += 1
+
+
+# ----------------------------------------------------------------------
+# Run-scoped registry
+# ----------------------------------------------------------------------
+
+_STORES: Dict[str, RepoContentStore] = {}
+_STORES_LOCK = threading.Lock()
+
+
+def get_repo_content_store(repo_dir: Path) -> RepoContentStore:
+    """Return the shared store for repo_dir, creating it on first use.
+
+    Workers invoked in the same process for the same run share one store,
+    so each repository file is read at most once per run.
+    """
+    key = str(Path(repo_dir).resolve())
+    with _STORES_LOCK:
+        store = _STORES.get(key)
+        if store is None:
+            store = RepoContentStore(Path(repo_dir))
+            _STORES[key] = store
+        return store
+
+
+def release_repo_content_stores(repo_dir: Optional[Path] = None) -> None:
+    """Release the shared store for repo_dir, or all stores when None.
+
+    Called by the run loop when a run finishes so cached content does not
+    outlive the run.
+    """
+    with _STORES_LOCK:
+        if repo_dir is None:
+            _STORES.clear()
+        else:
+            _STORES.pop(str(Path(repo_dir).resolve()), None)
@@ -38,6 +38,8 @@ from ...models.event import (
     EVENT_WORK_ITEM_FINISHED,
     EVENT_ARTIFACT_WRITTEN,
 )
+from ...state.event_log import append_event
+from .._shared.repo_content_store import RepoContentStore, get_repo_content_store
 
 
 # Pattern-based detection patterns (per specs/02_repo_ingestion.md:88-93)
@@ -116,7 +118,24 @@ def matches_pattern_based_detection(file_path: Path) -> Tuple[bool, Optional[str
     return False, None
 
 
-def check_content_based_detection(file_path: Path) -> bool:
+def _has_keyword_heading(lines) -> bool:
+    """Return True if any markdown heading line contains a content keyword."""
+    for line in lines:
+        # Check for headings (lines starting with #)
+        if line.strip().startswith("#"):
+            heading_text = line.strip().lstrip("#").strip()
+
+            # Check if heading contains any keywords
+            for keyword in CONTENT_KEYWORDS:
+                if keyword.lower() in heading_text.lower():
+                    return True
+    return False
+
+
+def check_content_based_detection(
+    file_path: Path,
+    content_store: Optional[RepoContentStore] = None,
+) -> bool:
     """Check if file content matches content-based detection rules.
 
     Performs a full-file scan for key headings (TC-1022: no line limit).
@@ -125,24 +144,22 @@ def check_content_based_detection(file_path: Path) -> bool:
 
     Args:
         file_path: Path to file
+        content_store: Optional shared content store; when given, the cached
+                       file text is scanned instead of re-opening the file
 
     Returns:
         True if content matches keywords
 
     Spec reference: specs/02_repo_ingestion.md:94-97
     """
+    if content_store is not None:
+        text = content_store.get_text(file_path)
+        return _has_keyword_heading(text.split("\n")) if text else False
+
     try:
         with file_path.open("r", encoding="utf-8", errors="ignore") as f:
             # TC-1022: Full file scan (no 50-line limit)
-            for line in f:
-                # Check for headings (lines starting with #)
-                if line.strip().startswith("#"):
-                    heading_text = line.strip().lstrip("#").strip()
-
-                    # Check if heading contains any keywords
-                    for keyword in CONTENT_KEYWORDS:
-                        if keyword.lower() in heading_text.lower():
-                            return True
+            return _has_keyword_heading(f)
     except (OSError, UnicodeDecodeError):
         # Cannot read file, skip
         pass
@@ -150,35 +167,47 @@ def check_content_based_detection(file_path: Path) -> bool:
     return False
 
 
-def extract_front_matter(file_path: Path) -> Optional[Dict[str, Any]]:
+def _parse_front_matter(content: str) -> Optional[Dict[str, Any]]:
+    """Parse simple key: value YAML front matter from markdown text."""
+    # Check for YAML front matter (--- at start)
+    if content.startswith("---\n"):
+        # Find closing ---
+        end_idx = content.find("\n---\n", 4)
+        if end_idx > 0:
+            front_matter_text = content[4:end_idx]
+
+            # Simple YAML parsing (key: value pairs)
+            # Note: This is a simplified parser. Production code should use PyYAML.
+            front_matter = {}
+            for line in front_matter_text.split("\n"):
+                if ":" in line:
+                    key, value = line.split(":", 1)
+                    front_matter[key.strip()] = value.strip()
+
+            return front_matter if front_matter else None
+    return None
+
+
+def extract_front_matter(
+    file_path: Path,
+    content_store: Optional[RepoContentStore] = None,
+) -> Optional[Dict[str, Any]]:
     """Extract YAML front matter from markdown file.
 
     Args:
         file_path: Path to markdown file
+        content_store: Optional shared content store for cached file text
 
     Returns:
         Front matter dictionary or None
     """
+    if content_store is not None:
+        text = content_store.get_text(file_path)
+        return _parse_front_matter(text) if text is not None else None
+
     try:
         with file_path.open("r", encoding="utf-8", errors="ignore") as f:
-            content = f.read()
-
-            # Check for YAML front matter (--- at start)
-            if content.startswith("---\n"):
-                # Find closing ---
-                end_idx = content.find("\n---\n", 4)
-                if end_idx > 0:
-                    front_matter_text = content[4:end_idx]
-
-                    # Simple YAML parsing (key: value pairs)
-                    # Note: This is a simplified parser. Production code should use PyYAML.
-                    front_matter = {}
-                    for line in front_matter_text.split("\n"):
-                        if ":" in line:
-                            key, value = line.split(":", 1)
-                            front_matter[key.strip()] = value.strip()
-
-                    return front_matter if front_matter else None
+            return _parse_front_matter(f.read())
     except (OSError, UnicodeDecodeError):
         pass
 
@@ -202,13 +231,19 @@ BINARY_EXTENSIONS = {
 }
 
 
-def is_binary_file(file_path: Path) -> bool:
+def is_binary_file(
+    file_path: Path,
+    content_store: Optional[RepoContentStore] = None,
+) -> bool:
     """Detect whether a file is binary.
 
     Uses extension-based check first, then a heuristic byte scan.
 
     Args:
         file_path: Path to file
+        content_store: Optional shared content store; a file it already holds
+                       answers from its cached entry, others are sniffed
+                       without being loaded into it
 
     Returns:
         True if file appears to be binary
@@ -217,6 +252,9 @@ def is_binary_file(file_path: Path) -> bool:
     if file_path.suffix.lower() in BINARY_EXTENSIONS:
         return True
 
+    if content_store is not None:
+        return content_store.is_binary(file_path)
+
     # Heuristic: read first 8192 bytes and look for null bytes
     try:
         with file_path.open("rb") as f:
@@ -283,6 +321,7 @@ def compute_doc_relevance_score(file_path: Path, repo_dir: Path) -> int:
 def discover_documentation_files(
     repo_dir: Path,
     gitignore_mode: str = "respect",
+    content_store: Optional[RepoContentStore] = None,
 ) -> List[Dict[str, Any]]:
     """Discover ALL files in repository (exhaustive scan, TC-1022).
 
@@ -300,12 +339,20 @@ def discover_documentation_files(
     Args:
         repo_dir: Repository root directory
         gitignore_mode: .gitignore handling mode (TC-1024)
+        content_store: Content store to read files through. Defaults to the
+                       run-scoped store for repo_dir, so the text of
+                       DOC_EXTENSIONS files loaded here is reused by W1
+                       frontmatter discovery, W2 and W3. Other files are
+                       only sniffed for binary content, never loaded.
 
     Returns:
         List of discovered files with metadata
 
     Spec reference: specs/02_repo_ingestion.md:78-142
     """
+    if content_store is None:
+        content_store = get_repo_content_store(repo_dir)
+
     # TC-1024: Parse gitignore if applicable
     gitignore_patterns: List[str] = []
     if gitignore_mode != "ignore":
@@ -337,7 +384,7 @@ def discover_documentation_files(
         file_extension = file_path.suffix.lower()
 
         # Check if binary
-        binary = is_binary_file(file_path)
+        binary = is_binary_file(file_path, content_store)
 
         # TC-1024: Check gitignore status
         rel_str = str(relative_path).replace("\\", "/")
@@ -385,7 +432,7 @@ def discover_documentation_files(
             else:
                 # Content-based detection for text files with doc extensions
                 if file_extension in DOC_EXTENSIONS:
-                    if check_content_based_detection(file_path):
+                    if check_content_based_detection(file_path, content_store):
                         evidence_priority = "medium"
 
         # Compute relevance score
@@ -399,7 +446,7 @@ def discover_documentation_files(
         # Extract front matter (only for markdown/text files)
         front_matter = None
         if file_extension in DOC_EXTENSIONS:
-            front_matter = extract_front_matter(file_path)
+            front_matter = extract_front_matter(file_path, content_store)
 
         doc_entry = {
             "path": rel_str,
@@ -607,11 +654,7 @@ def emit_discover_docs_events(
             span_id=span_id,
         )
 
-        event_line = json.dumps(event.to_dict()) + "\n"
-
-        # Append to events.ndjson (append-only log)
-        with events_file.open("a", encoding="utf-8") as f:
-            f.write(event_line)
+        append_event(events_file, event)
 
     # WORK_ITEM_STARTED
     write_event(
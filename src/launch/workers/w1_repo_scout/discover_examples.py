@@ -40,6 +40,7 @@ from ...models.event import (
     EVENT_WORK_ITEM_FINISHED,
     EVENT_ARTIFACT_WRITTEN,
 )
+from ...state.event_log import append_event
 
 
 # Standard example directory patterns (per specs/02_repo_ingestion.md:146)
@@ -618,11 +619,7 @@ def emit_discover_examples_events(
             span_id=span_id,
         )
 
-        event_line = json.dumps(event.to_dict()) + "\n"
-
-        # Append to events.ndjson (append-only log)
-        with events_file.open("a", encoding="utf-8") as f:
-            f.write(event_line)
+        append_event(events_file, event)
 
     # WORK_ITEM_STARTED
     write_event(
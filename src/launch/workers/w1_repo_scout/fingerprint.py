@@ -38,6 +38,7 @@ from ...models.event import (
     EVENT_WORK_ITEM_FINISHED,
     EVENT_ARTIFACT_WRITTEN,
 )
+from ...state.event_log import append_event
 
 logger = logging.getLogger(__name__)
 
@@ -808,11 +809,7 @@ def emit_fingerprint_events(
             span_id=span_id,
         )
 
-        event_line = json.dumps(event.to_dict()) + "\n"
-
-        # Append to events.ndjson (append-only log)
-        with events_file.open("a", encoding="utf-8") as f:
-            f.write(event_line)
+        append_event(events_file, event)
 
     # WORK_ITEM_STARTED
     write_event(
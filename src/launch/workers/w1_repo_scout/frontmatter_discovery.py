@@ -26,6 +26,7 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
 from ...models.frontmatter import FrontmatterContract, SectionContract
+from .._shared.repo_content_store import get_repo_content_store
 
 logger = logging.getLogger(__name__)
 
@@ -283,6 +284,9 @@ def build_frontmatter_contract(
     if not doc_entries:
         doc_entries = discovered_docs.get("doc_entrypoints", [])
 
+    # Reuse text already loaded by discover_docs in this run
+    content_store = get_repo_content_store(repo_dir)
+
     for entry in doc_entries:
         # Handle both dict entries (doc_entrypoint_details) and string entries (doc_entrypoints)
         if isinstance(entry, dict):
@@ -302,14 +306,9 @@ def build_frontmatter_contract(
             continue
 
         # Read and parse frontmatter
-        file_path = repo_dir / rel_path
-        if not file_path.exists():
-            continue
-
-        try:
-            content = file_path.read_text(encoding="utf-8", errors="replace")
-        except OSError:
-            logger.debug("Could not read %s, skipping", file_path)
+        content = content_store.get_text(rel_path, errors="replace")
+        if content is None:
+            logger.debug("Could not read %s, skipping", repo_dir / rel_path)
             continue
 
         fm = _parse_yaml_frontmatter_simple(content)
@@ -13,6 +13,7 @@ Spec references:
 
 # Main integrator entry point (TC-410)
 from .worker import (
+    EVIDENCE_STREAMING_KEY,
     execute_facts_builder,
     FactsBuilderError,
     FactsBuilderClaimsError,
@@ -47,6 +48,7 @@ __all__ = [
     'FactsBuilderEvidenceError',
     'FactsBuilderContradictionError',
     'FactsBuilderAssemblyError',
+    'EVIDENCE_STREAMING_KEY',
     # Sub-worker functions
     'extract_claims',
     'map_evidence',
@@ -17,6 +17,7 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 from ...clients.llm_provider import LLMProviderClient, LLMError
+from ...clients.llm_governor import LANE_EXTRACTION
 from ...io.atomic import atomic_write_json
 from ...util.logging import get_logger
 
@@ -311,6 +312,7 @@ def _classify_batch_llm(
         temperature=0.0,
         max_tokens=2048,
         response_format={"type": "json_object"},
+        priority=LANE_EXTRACTION,
     )
 
     content = response["content"]
@@ -9,6 +9,17 @@ Outputs:
 - constants: {version: str, supported_formats: [str]}
 - positioning: {tagline: str, short_description: str}
 
+Per-file analysis (the API-surface index) covers every source file:
+- Results are cached per file, keyed by the git blob SHA of the file content
+  plus its extension, in a workspace-level directory shared across runs
+  (api_index_dir); unchanged files are never re-parsed
+- Uncached files are parsed on a process pool (AST parsing is CPU-bound, so
+  threads do not help); small batches run serially
+- A wall-clock time budget bounds the analysis instead of a file count;
+  files left when the budget runs out are reported in metadata
+- Results are merged in sorted file order, so the output is deterministic
+  regardless of completion order or cache state
+
 Spec: specs/07_code_analysis_and_enrichment.md
 """
 
@@ -16,11 +27,17 @@ from __future__ import annotations
 
 import ast
 import json
+import os
 import re
 import logging
+import time
 from pathlib import Path
-from typing import Dict, Any, List, Optional
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Any, List, Optional, Tuple
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+
+from ...io.atomic import atomic_write_json
+from ...io.hashing import git_blob_sha
 
 try:
     import tomllib  # Python 3.11+
@@ -32,6 +49,18 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Bump when the per-file result shape changes (invalidates cached entries)
+API_INDEX_VERSION = 2
+
+# Wall-clock budget for per-file analysis, in seconds
+DEFAULT_TIME_BUDGET_S = float(os.environ.get("LAUNCH_CODE_ANALYSIS_BUDGET_S", "120"))
+
+# Below this many uncached files, process startup costs more than it saves
+PARALLEL_ANALYSIS_MIN_FILES = 64
+
+# Files handed to a pool worker per task
+ANALYSIS_CHUNK_SIZE = 32
+
 
 def analyze_python_file(file_path: Path) -> Dict[str, Any]:
     """Analyze Python file using AST.
@@ -310,12 +339,127 @@ def _detect_public_entrypoints(repo_dir: Path, source_roots: List[str]) -> List[
     return entrypoints if entrypoints else ['__init__.py']  # Default fallback
 
 
+def api_index_dir(run_dir: Path) -> Path:
+    """Workspace-level directory for cached per-file analysis (shared by all runs)."""
+    override = os.environ.get("LAUNCH_API_INDEX_DIR")
+    if override:
+        return Path(override)
+    return Path(run_dir).parent / ".api_index"
+
+
+def analyze_source_file(file_path: Path) -> Dict[str, Any]:
+    """Per-file API-surface entry: analyze_file_safe plus __init__ modules."""
+    result = dict(analyze_file_safe(file_path))
+    if file_path.name == "__init__.py":
+        result["modules"] = _extract_modules_from_init(file_path)
+    return result
+
+
+def _analyze_chunk(paths: List[str]) -> List[Dict[str, Any]]:
+    """Process-pool task: analyze a batch of files."""
+    return [analyze_source_file(Path(p)) for p in paths]
+
+
+def _cache_path(cache_dir: Path, key: str) -> Path:
+    return cache_dir / f"v{API_INDEX_VERSION}" / key[:2] / f"{key}.json"
+
+
+def _cache_key(file_path: Path) -> Optional[str]:
+    try:
+        data = file_path.read_bytes()
+    except OSError:
+        return None
+    # __init__.py entries also carry "modules", so they must not share a key
+    # with a byte-identical module
+    kind = ".init" if file_path.name == "__init__.py" else ""
+    return git_blob_sha(data) + kind + file_path.suffix.lower()
+
+
+def _load_cached(cache_dir: Optional[Path], key: Optional[str]) -> Optional[Dict[str, Any]]:
+    if cache_dir is None or key is None:
+        return None
+    try:
+        return json.loads(_cache_path(cache_dir, key).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+
+def _store_cached(cache_dir: Optional[Path], key: Optional[str], result: Dict[str, Any]) -> None:
+    if cache_dir is None or key is None:
+        return
+    try:
+        atomic_write_json(_cache_path(cache_dir, key), result)
+    except (OSError, TypeError, ValueError):
+        # Non-JSON constants or an unwritable cache only cost a re-parse next run
+        pass
+
+
+def _analyze_pending(
+    pending: List[Path],
+    deadline: float,
+    max_workers: Optional[int],
+) -> Tuple[Dict[Path, Dict[str, Any]], int]:
+    """Analyze uncached files until the deadline.
+
+    Returns:
+        (results by path, parsing failures)
+    """
+    results: Dict[Path, Dict[str, Any]] = {}
+    failures = 0
+    workers = max_workers or os.cpu_count() or 1
+
+    if workers > 1 and len(pending) >= PARALLEL_ANALYSIS_MIN_FILES:
+        chunks = [pending[i:i + ANALYSIS_CHUNK_SIZE] for i in range(0, len(pending), ANALYSIS_CHUNK_SIZE)]
+        try:
+            pool = ProcessPoolExecutor(max_workers=workers)
+        except OSError:
+            pool = None  # Process pools unavailable (restricted sandbox)
+        if pool is not None:
+            try:
+                futures = {pool.submit(_analyze_chunk, [str(p) for p in chunk]): chunk for chunk in chunks}
+                remaining = set(futures)
+                while remaining:
+                    timeout = deadline - time.monotonic()
+                    if timeout <= 0:
+                        break
+                    done, remaining = wait(remaining, timeout=timeout, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        chunk = futures[future]
+                        try:
+                            results.update(zip(chunk, future.result(), strict=True))
+                        except BrokenProcessPool:
+                            raise
+                        except Exception as e:
+                            logger.warning(f"Failed to analyze {len(chunk)} files from {chunk[0]}: {e}")
+                            failures += len(chunk)
+                return results, failures
+            except BrokenProcessPool:
+                # Fall through and finish serially what the pool did not
+                pass
+            finally:
+                pool.shutdown(wait=False, cancel_futures=True)
+
+    for file_path in pending:
+        if file_path in results:
+            continue
+        if time.monotonic() >= deadline:
+            break
+        try:
+            results[file_path] = analyze_source_file(file_path)
+        except Exception as e:
+            logger.warning(f"Failed to analyze {file_path}: {e}")
+            failures += 1
+    return results, failures
+
+
 def analyze_repository_code(
     repo_dir: Path,
     repo_inventory: Dict[str, Any],
     product_name: str,
-    max_files: int = 100,
-    timeout_per_file_ms: int = 500,
+    max_files: Optional[int] = None,
+    time_budget_s: Optional[float] = None,
+    cache_dir: Optional[Path] = None,
+    max_workers: Optional[int] = None,
 ) -> Dict[str, Any]:
     """Analyze repository code to extract structured information.
 
@@ -323,8 +467,12 @@ def analyze_repository_code(
         repo_dir: Repository root directory
         repo_inventory: Repository inventory from W1
         product_name: Product name
-        max_files: Maximum files to analyze (default: 100)
-        timeout_per_file_ms: Timeout per file in milliseconds (default: 500)
+        max_files: Optional cap on files analyzed (default: all source files)
+        time_budget_s: Wall-clock budget for per-file analysis
+            (default: DEFAULT_TIME_BUDGET_S)
+        cache_dir: Directory for cached per-file results (default:
+            LAUNCH_API_INDEX_DIR, or no persistent cache)
+        max_workers: Process pool size (defaults to os.cpu_count(); 1 analyzes serially)
 
     Returns:
         {
@@ -332,11 +480,18 @@ def analyze_repository_code(
             code_structure: {source_roots, public_entrypoints, package_names},
             constants: {version, supported_formats},
             positioning: {tagline, short_description},
-            metadata: {files_analyzed, parsing_failures},
+            metadata: {files_analyzed, parsing_failures, files_discovered,
+                       cache_hits, files_skipped, time_budget_exhausted},
         }
 
     Spec: specs/07_code_analysis_and_enrichment.md
     """
+    if time_budget_s is None:
+        time_budget_s = DEFAULT_TIME_BUDGET_S
+    if cache_dir is None and os.environ.get("LAUNCH_API_INDEX_DIR"):
+        cache_dir = Path(os.environ["LAUNCH_API_INDEX_DIR"])
+    deadline = time.monotonic() + time_budget_s
+
     # Discover source files (prioritize src/ > lib/ > tests/)
     source_files = discover_source_files(repo_dir, max_files)
 
@@ -346,27 +501,45 @@ def analyze_repository_code(
     # Discover README
     readme_path = find_readme(repo_dir)
 
-    # Analyze files in parallel
+    # Serve unchanged files from the cache; analyze the rest
+    per_file: Dict[Path, Dict[str, Any]] = {}
+    keys: Dict[Path, Optional[str]] = {}
+    pending: List[Path] = []
+    for file_path in source_files:
+        key = _cache_key(file_path) if cache_dir is not None else None
+        cached = _load_cached(cache_dir, key)
+        if cached is not None:
+            per_file[file_path] = cached
+        else:
+            keys[file_path] = key
+            pending.append(file_path)
+    cache_hits = len(per_file)
+
+    analyzed, parsing_failures = _analyze_pending(pending, deadline, max_workers)
+    for file_path, result in analyzed.items():
+        per_file[file_path] = result
+        _store_cached(cache_dir, keys[file_path], result)
+
+    files_skipped = len(pending) - len(analyzed) - parsing_failures
+    if files_skipped > 0:
+        logger.warning(
+            f"Code analysis time budget ({time_budget_s}s) exhausted: "
+            f"{files_skipped} of {len(source_files)} files not analyzed"
+        )
+
+    # Merge in discovery order (deterministic)
     all_classes = []
     all_functions = []
     all_constants = {}
-    parsing_failures = 0
-
-    with ThreadPoolExecutor(max_workers=4) as executor:
-        futures = {}
-        for file_path in source_files:
-            future = executor.submit(analyze_file_safe, file_path)
-            futures[future] = file_path
-
-        for future in as_completed(futures):
-            try:
-                result = future.result(timeout=timeout_per_file_ms/1000)
-                all_classes.extend(result.get("classes", []))
-                all_functions.extend(result.get("functions", []))
-                all_constants.update(result.get("constants", {}))
-            except Exception as e:
-                logger.warning(f"Failed to analyze {futures[future]}: {e}")
-                parsing_failures += 1
+    modules = []
+    for file_path in source_files:
+        result = per_file.get(file_path)
+        if result is None:
+            continue
+        all_classes.extend(result.get("classes", []))
+        all_functions.extend(result.get("functions", []))
+        all_constants.update(result.get("constants", {}))
+        modules.extend(result.get("modules", []))
 
     # Parse manifests
     manifest_data = {}
@@ -387,13 +560,6 @@ def analyze_repository_code(
     if not positioning.get("short_description") and manifest_data.get("description"):
         positioning["short_description"] = manifest_data["description"]
 
-    # Extract modules from __init__.py files
-    modules = []
-    for file_path in source_files:
-        if file_path.name == '__init__.py':
-            extracted = _extract_modules_from_init(file_path)
-            modules.extend(extracted)
-
     # Detect public entrypoints
     source_roots = detect_source_roots(repo_dir)
     public_entrypoints = _detect_public_entrypoints(repo_dir, source_roots)
@@ -416,14 +582,18 @@ def analyze_repository_code(
         },
         "positioning": positioning,
         "metadata": {
-            "files_analyzed": len(source_files),
+            "files_analyzed": len(per_file),
             "parsing_failures": parsing_failures,
+            "files_discovered": len(source_files),
+            "cache_hits": cache_hits,
+            "files_skipped": files_skipped,
+            "time_budget_exhausted": files_skipped > 0,
         },
     }
 
 
-def discover_source_files(repo_dir: Path, max_files: int) -> List[Path]:
-    """Discover source files, prioritizing src/ > lib/ > tests/."""
+def discover_source_files(repo_dir: Path, max_files: Optional[int] = None) -> List[Path]:
+    """Discover source files, prioritizing src/ > lib/ > tests/ (then by path)."""
     candidates = []
     for ext in [".py", ".js", ".cs"]:
         candidates.extend(repo_dir.glob(f"**/*{ext}"))
@@ -439,8 +609,8 @@ def discover_source_files(repo_dir: Path, max_files: int) -> List[Path]:
             return 4
         return 3
 
-    candidates.sort(key=priority)
-    return candidates[:max_files]
+    candidates.sort(key=lambda p: (priority(p), p.as_posix()))
+    return candidates if max_files is None else candidates[:max_files]
 
 
 def discover_manifests(repo_dir: Path) -> List[Path]:
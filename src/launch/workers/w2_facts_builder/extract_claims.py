@@ -13,23 +13,42 @@ Spec references:
 - specs/10_determinism_and_caching.md (Stable ordering and determinism)
 
 TC-411: W2.1 Extract claims from product repo
+
+Incremental extraction: claims are extracted per document and cached under
+claims_cache_dir(run_dir), keyed by the document's git blob SHA (from one
+``git ls-tree`` on the clone), its path and the product name. Relaunching at
+a newer commit re-extracts only the documents that changed; cached and fresh
+per-document claims are merged with deduplicate_claims as before. Uncached
+documents fan out over a process pool when there are enough of them.
 """
 
 from __future__ import annotations
 
 import hashlib
 import json
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
 from ...clients.llm_provider import LLMProviderClient, LLMError
 from ...io.atomic import atomic_write_json
+from ...io.hashing import git_blob_sha
 from ...io.run_layout import RunLayout
 from ...util.logging import get_logger
+from .._git.clone_helpers import list_blob_shas
+from .._shared.repo_content_store import get_repo_content_store
 
 logger = get_logger()
 
+# Bump when per-document extraction output changes (invalidates cached entries)
+CLAIMS_CACHE_VERSION = 1
+
+# Below this many uncached docs, process startup costs more than it saves
+PARALLEL_EXTRACTION_MIN_DOCS = 32
+
 
 class ClaimsExtractionError(Exception):
     """Raised when claims extraction fails."""
@@ -271,8 +290,16 @@ def determine_source_type(file_path: Path, repo_dir: Path) -> str:
     if 'readme' in path_lower:
         # Technical sections usually have code/install/usage
         try:
-            if file_path.exists():
-                content_preview = file_path.read_text(encoding='utf-8', errors='ignore')[:1000]
+            # Prefer the run-scoped content store (file already loaded by W1)
+            try:
+                content = get_repo_content_store(repo_dir).get_text(file_path.relative_to(repo_dir))
+            except ValueError:
+                content = (
+                    file_path.read_text(encoding='utf-8', errors='ignore')
+                    if file_path.exists() else None
+                )
+            if content is not None:
+                content_preview = content[:1000]
                 if any(marker in content_preview.lower() for marker in [
                     'install', 'usage', 'api', 'import', 'pip install', 'npm install'
                 ]):
@@ -348,6 +375,9 @@ def extract_candidate_statements_from_text(
     current_sentence = []
     start_line = 1
 
+    # Source type depends only on the file, so classify it once (lazily)
+    source_type: Optional[str] = None
+
     for line_num, line in enumerate(lines, start=1):
         line = line.strip()
         if not line:
@@ -375,7 +405,8 @@ def extract_candidate_statements_from_text(
                     'does not', 'cannot', 'limitation', 'not yet',
                     'class', 'function', 'method', 'api', 'interface',
                 ])
-                source_type = determine_source_type(file_path, repo_dir)
+                if source_type is None:
+                    source_type = determine_source_type(file_path, repo_dir)
                 candidates.append({
                     'claim_text': sentence,
                     'source_file': str(file_path.relative_to(repo_dir)) if file_path.is_absolute() else str(file_path),
@@ -392,11 +423,173 @@ def extract_candidate_statements_from_text(
     return candidates
 
 
+def extract_claims_from_doc(
+    content: str,
+    file_path: Path,
+    repo_dir: Path,
+    product_name: str,
+) -> List[Dict[str, Any]]:
+    """Build structured claims from one document's candidate statements.
+
+    Args:
+        content: Document text
+        file_path: Document path (absolute, under repo_dir)
+        repo_dir: Repository root directory
+        product_name: Product name for claim IDs
+
+    Returns:
+        Claims in document order (not deduplicated)
+    """
+    claims = []
+    for candidate in extract_candidate_statements_from_text(content, file_path, repo_dir):
+        claim_kind = classify_claim_kind(candidate['claim_text'])
+        claim_id = compute_claim_id(
+            candidate['claim_text'], claim_kind, product_name
+        )
+        source_type = candidate['source_type']
+        source_priority = determine_source_priority(source_type)
+
+        # Determine truth_status based on source priority
+        # Per specs/04_claims_compiler_truth_lock.md:50-54
+        truth_status = 'fact' if source_priority <= 3 else 'inference'
+
+        claims.append({
+            'claim_id': claim_id,
+            'claim_text': candidate['claim_text'],
+            'claim_kind': claim_kind,
+            'truth_status': truth_status,
+            'confidence': 'high' if source_priority <= 2 else 'medium' if source_priority <= 5 else 'low',
+            'source_priority': source_priority,
+            'citations': [{
+                'path': candidate['source_file'],
+                'start_line': candidate['start_line'],
+                'end_line': candidate['end_line'],
+                'source_type': source_type,
+            }],
+        })
+    return claims
+
+
+def claims_cache_dir(run_dir: Path) -> Path:
+    """Workspace-level directory for cached per-document claims (shared by all runs)."""
+    override = os.environ.get("LAUNCH_CLAIMS_CACHE_DIR")
+    if override:
+        return Path(override)
+    return Path(run_dir).parent / ".claims_cache"
+
+
+def _doc_cache_key(rel_path: str, blob_sha: str, product_name: str) -> str:
+    data = f"{CLAIMS_CACHE_VERSION}\0{rel_path}\0{product_name}\0{blob_sha}"
+    return hashlib.sha256(data.encode('utf-8')).hexdigest()
+
+
+def _extract_doc_task(
+    repo_dir: str,
+    rel_path: str,
+    product_name: str,
+) -> Optional[List[Dict[str, Any]]]:
+    """Extract one document's claims (None if unreadable); process-pool safe."""
+    root = Path(repo_dir)
+    content = get_repo_content_store(root).get_text(rel_path)
+    if content is None:
+        return None
+    return extract_claims_from_doc(content, root / rel_path, root, product_name)
+
+
+def _extract_docs(
+    repo_dir: Path,
+    rel_paths: List[str],
+    product_name: str,
+    max_workers: Optional[int],
+) -> List[Optional[List[Dict[str, Any]]]]:
+    workers = max_workers or os.cpu_count() or 1
+    if workers > 1 and len(rel_paths) >= PARALLEL_EXTRACTION_MIN_DOCS:
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                chunksize = max(1, len(rel_paths) // (workers * 4))
+                n = len(rel_paths)
+                return list(pool.map(
+                    _extract_doc_task, [str(repo_dir)] * n, rel_paths, [product_name] * n,
+                    chunksize=chunksize,
+                ))
+        except (BrokenProcessPool, OSError):
+            # Process pools unavailable (restricted sandbox); fall back to serial extraction
+            pass
+    return [_extract_doc_task(str(repo_dir), rel, product_name) for rel in rel_paths]
+
+
+def extract_doc_claims_incremental(
+    doc_files: List[Dict[str, Any]],
+    repo_dir: Path,
+    product_name: str,
+    cache_dir: Optional[Path] = None,
+    max_workers: Optional[int] = None,
+) -> Tuple[List[Dict[str, Any]], Dict[str, int]]:
+    """Extract claims from every document, reusing cached per-document results.
+
+    Args:
+        doc_files: Discovered documentation files (doc_entrypoint_details)
+        repo_dir: Repository root directory
+        product_name: Product name for claim IDs
+        cache_dir: Per-document claims cache (None disables caching)
+        max_workers: Process pool size (defaults to os.cpu_count(); 1 extracts serially)
+
+    Returns:
+        (claims in document order, not deduplicated; {docs_cached, docs_extracted})
+    """
+    blob_shas = list_blob_shas(repo_dir) if cache_dir is not None else {}
+
+    per_doc: Dict[str, Optional[List[Dict[str, Any]]]] = {}
+    keys: Dict[str, Optional[str]] = {}
+    for doc_file in doc_files:
+        rel_path = doc_file['path']
+        if rel_path in per_doc or rel_path in keys:
+            continue
+        key = None
+        if cache_dir is not None:
+            blob_sha = blob_shas.get(rel_path)
+            if blob_sha is None:
+                try:
+                    blob_sha = git_blob_sha((repo_dir / rel_path).read_bytes())
+                except OSError:
+                    blob_sha = None
+            if blob_sha is not None:
+                key = _doc_cache_key(rel_path, blob_sha, product_name)
+                try:
+                    per_doc[rel_path] = json.loads(
+                        (cache_dir / key[:2] / f"{key}.json").read_text(encoding='utf-8')
+                    )
+                    continue
+                except (OSError, ValueError):
+                    pass
+        keys[rel_path] = key
+    docs_cached = len(per_doc)
+
+    pending = list(keys)
+    for rel_path, claims in zip(pending, _extract_docs(repo_dir, pending, product_name, max_workers), strict=True):
+        per_doc[rel_path] = claims
+        key = keys[rel_path]
+        if claims is None:
+            logger.warning("doc_file_not_found", path=str(repo_dir / rel_path))
+        elif key is not None:
+            try:
+                atomic_write_json(cache_dir / key[:2] / f"{key}.json", claims)
+            except (OSError, TypeError, ValueError):
+                # An unwritable cache only costs a re-extraction next run
+                pass
+
+    all_claims: List[Dict[str, Any]] = []
+    for doc_file in doc_files:
+        all_claims.extend(per_doc.get(doc_file['path']) or [])
+    return all_claims, {'docs_cached': docs_cached, 'docs_extracted': len(pending)}
+
+
 def extract_claims_with_llm(
     doc_files: List[Dict[str, Any]],
     repo_dir: Path,
     product_name: str,
     llm_client: LLMProviderClient,
+    cache_dir: Optional[Path] = None,
 ) -> List[Dict[str, Any]]:
     """Extract structured claims using LLM.
 
@@ -407,6 +600,7 @@ def extract_claims_with_llm(
         repo_dir: Repository root directory
         product_name: Product name for normalization
         llm_client: LLM client with deterministic settings
+        cache_dir: Optional per-document claims cache (see claims_cache_dir)
 
     Returns:
         List of extracted claim dictionaries
@@ -414,59 +608,9 @@ def extract_claims_with_llm(
     Raises:
         ClaimsExtractionError: If LLM extraction fails
     """
-    all_claims = []
-
-    # Build prompt with documentation context
     # TC-1026: Process ALL discovered docs (no count limit).
-    for doc_file in doc_files:
-        file_path = repo_dir / doc_file['path']
-
-        if not file_path.exists():
-            logger.warning("doc_file_not_found", path=str(file_path))
-            continue
-
-        try:
-            content = file_path.read_text(encoding='utf-8', errors='ignore')
-        except Exception as e:
-            logger.warning("doc_file_read_error", path=str(file_path), error=str(e))
-            continue
-
-        # Extract candidate statements using heuristics
-        candidates = extract_candidate_statements_from_text(
-            content, file_path, repo_dir
-        )
-
-        # Build structured claims from candidates
-        for candidate in candidates:
-            claim_kind = classify_claim_kind(candidate['claim_text'])
-            claim_id = compute_claim_id(
-                candidate['claim_text'], claim_kind, product_name
-            )
-            source_type = candidate['source_type']
-            source_priority = determine_source_priority(source_type)
-
-            # Determine truth_status based on source priority
-            # Per specs/04_claims_compiler_truth_lock.md:50-54
-            truth_status = 'fact' if source_priority <= 3 else 'inference'
-
-            claim = {
-                'claim_id': claim_id,
-                'claim_text': candidate['claim_text'],
-                'claim_kind': claim_kind,
-                'truth_status': truth_status,
-                'confidence': 'high' if source_priority <= 2 else 'medium' if source_priority <= 5 else 'low',
-                'source_priority': source_priority,
-                'citations': [{
-                    'path': candidate['source_file'],
-                    'start_line': candidate['start_line'],
-                    'end_line': candidate['end_line'],
-                    'source_type': source_type,
-                }],
-            }
-
-            all_claims.append(claim)
-
-    return all_claims
+    claims, _ = extract_doc_claims_incremental(doc_files, repo_dir, product_name, cache_dir=cache_dir)
+    return claims
 
 
 def validate_claim_structure(claim: Dict[str, Any]) -> None:
@@ -702,7 +846,8 @@ def extract_claims(
             message="No documentation files found. Proceeding with empty claims."
         )
 
-    # Extract claims
+    # Extract claims (per document; unchanged documents come from the cache)
+    cache_dir = claims_cache_dir(run_dir)
     if llm_client:
         # Use LLM-based extraction
         try:
@@ -711,53 +856,16 @@ def extract_claims(
                 repo_dir,
                 product_name,
                 llm_client,
+                cache_dir=cache_dir,
             )
         except LLMError as e:
             raise ClaimsExtractionError(f"LLM extraction failed: {e}") from e
+        extraction_stats = None
     else:
         # Use heuristic extraction (no LLM)
-        claims = []
-        for doc_file in doc_entrypoint_details:
-            file_path = repo_dir / doc_file['path']
-            if not file_path.exists():
-                continue
-
-            try:
-                content = file_path.read_text(encoding='utf-8', errors='ignore')
-            except Exception as e:
-                logger.warning("doc_read_error", path=str(file_path), error=str(e))
-                continue
-
-            candidates = extract_candidate_statements_from_text(
-                content, file_path, repo_dir
-            )
-
-            for candidate in candidates:
-                claim_kind = classify_claim_kind(candidate['claim_text'])
-                claim_id = compute_claim_id(
-                    candidate['claim_text'], claim_kind, product_name
-                )
-                source_type = candidate['source_type']
-                source_priority = determine_source_priority(source_type)
-
-                truth_status = 'fact' if source_priority <= 3 else 'inference'
-
-                claim = {
-                    'claim_id': claim_id,
-                    'claim_text': candidate['claim_text'],
-                    'claim_kind': claim_kind,
-                    'truth_status': truth_status,
-                    'confidence': 'high' if source_priority <= 2 else 'medium' if source_priority <= 5 else 'low',
-                    'source_priority': source_priority,
-                    'citations': [{
-                        'path': candidate['source_file'],
-                        'start_line': candidate['start_line'],
-                        'end_line': candidate['end_line'],
-                        'source_type': source_type,
-                    }],
-                }
-
-                claims.append(claim)
+        claims, extraction_stats = extract_doc_claims_incremental(
+            doc_entrypoint_details, repo_dir, product_name, cache_dir=cache_dir
+        )
 
     # Deduplicate claims
     claims = deduplicate_claims(claims)
@@ -808,6 +916,7 @@ def extract_claims(
         inference_claims=len(inference_claims),
         claims_extracted_count=len(claims),
         docs_processed_count=len(doc_entrypoint_details),
+        **(extraction_stats or {}),
         output_path=str(output_path),
     )
 
@@ -23,15 +23,20 @@ TC-412: W2.2 Map claims to evidence in docs and examples
 from __future__ import annotations
 
 import hashlib
+import heapq
 import json
 import os
 import re
+import tempfile
+from array import array
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
-from ...io.atomic import atomic_write_json
+from ...io.atomic import atomic_write_chunks, atomic_write_json
+from ...io.evidence_map_reader import EvidenceMapReader
 from ...io.run_layout import RunLayout
 from ...util.logging import get_logger
+from .._shared.repo_content_store import get_repo_content_store
 from ._shared import STOPWORDS
 
 logger = get_logger()
@@ -176,6 +181,55 @@ def score_evidence_relevance(
     return min(final_score, 1.0)
 
 
+def _build_word_set(text: str) -> frozenset:
+    """Build the lenient (>= 2 chars, no stopwords) word set used for pre-filtering."""
+    return frozenset(
+        w for w in re.findall(r'\w+', text.lower())
+        if w not in STOPWORDS and len(w) >= 2
+    )
+
+
+def _read_mapped_file(
+    file_info: Dict[str, Any],
+    repo_dir: Path,
+    content_store: Any,
+    label: str,
+) -> Optional[str]:
+    """Read one doc/example file for evidence mapping.
+
+    Returns None (after logging why) if the file is missing, larger than
+    MAX_FILE_SIZE_MB, or unreadable.
+    """
+    file_path = repo_dir / file_info['path']
+    if not file_path.exists():
+        logger.warning(f"{label}_file_not_found", path=str(file_path))
+        return None
+
+    # Check file size before reading (TC-1050-T4: Memory safety)
+    try:
+        file_size_mb = file_path.stat().st_size / (1024 * 1024)
+    except (OSError, FileNotFoundError) as e:
+        logger.warning(f"{label}_stat_failed", path=file_info['path'], error=str(e))
+        return None
+    if file_size_mb > MAX_FILE_SIZE_MB:
+        logger.warning(
+            f"{label}_too_large_skipped",
+            path=file_info['path'],
+            size_mb=round(file_size_mb, 2),
+            max_size_mb=MAX_FILE_SIZE_MB
+        )
+        return None
+
+    try:
+        content = content_store.get_text(file_info['path'])
+        if content is None:
+            raise OSError(f"unreadable: {file_info['path']}")
+    except Exception as e:
+        logger.warning(f"{label}_read_error", path=str(file_path), error=str(e))
+        return None
+    return content
+
+
 def _load_and_tokenize_files(
     files: List[Dict[str, Any]],
     repo_dir: Path,
@@ -186,7 +240,9 @@ def _load_and_tokenize_files(
 
     Performance optimization: reads each file once, tokenizes once,
     lowercases once, builds word set once. Avoids O(claims × files) I/O,
-    tokenization, and string lowering overhead.
+    tokenization, and string lowering overhead. Text and derived forms come
+    from the run-scoped RepoContentStore, so files already loaded by W1 are
+    not read again.
 
     The word_set enables O(1) set-intersection pre-filtering instead of
     O(keywords × doc_length) substring scanning.
@@ -203,40 +259,24 @@ def _load_and_tokenize_files(
     from .embeddings import precompute_token_cache
 
     cache: Dict[str, Tuple] = {}
+    content_store = get_repo_content_store(repo_dir)
     total = len(files)
     for i, file_info in enumerate(files, 1):
-        file_path = repo_dir / file_info['path']
-
-        # Process file (may skip if not found, too large, or read error)
-        if not file_path.exists():
-            logger.warning(f"{label}_file_not_found", path=str(file_path))
-        else:
-            # Check file size before reading (TC-1050-T4: Memory safety)
+        content = _read_mapped_file(file_info, repo_dir, content_store, label)
+        if content is not None:
             try:
-                file_size_mb = file_path.stat().st_size / (1024 * 1024)
-                if file_size_mb > MAX_FILE_SIZE_MB:
-                    logger.warning(
-                        f"{label}_too_large_skipped",
-                        path=file_info['path'],
-                        size_mb=round(file_size_mb, 2),
-                        max_size_mb=MAX_FILE_SIZE_MB
-                    )
-                else:
-                    # File size is acceptable, try to read and tokenize
-                    try:
-                        content = file_path.read_text(encoding='utf-8', errors='ignore')
-                        token_cache = precompute_token_cache(content)
-                        content_lower = content.lower()
-                        # Pre-build word set for fast set-intersection pre-filtering
-                        word_set = frozenset(
-                            w for w in re.findall(r'\w+', content_lower)
-                            if w not in STOPWORDS and len(w) >= 2
-                        )
-                        cache[file_info['path']] = (content, token_cache, content_lower, word_set)
-                    except Exception as e:
-                        logger.warning(f"{label}_read_error", path=str(file_path), error=str(e))
-            except (OSError, FileNotFoundError) as e:
-                logger.warning(f"{label}_stat_failed", path=file_info['path'], error=str(e))
+                path_key = file_info['path']
+                token_cache = content_store.get_derived(
+                    path_key, "w2.token_cache", precompute_token_cache
+                )
+                content_lower = content_store.get_lower(path_key)
+                # Pre-build word set for fast set-intersection pre-filtering
+                word_set = content_store.get_derived(
+                    path_key, "w2.word_set", _build_word_set
+                )
+                cache[path_key] = (content, token_cache, content_lower, word_set)
+            except Exception as e:
+                logger.warning(f"{label}_read_error", path=str(repo_dir / file_info['path']), error=str(e))
 
         # Emit progress every 10 files or on completion (regardless of whether file was processed)
         if emit_event and (i % 10 == 0 or i == total):
@@ -555,12 +595,21 @@ def validate_evidence_map_structure(evidence_map: Dict[str, Any]) -> None:
 
     # Validate each claim
     for claim in evidence_map['claims']:
-        claim_required = ['claim_id', 'claim_text', 'claim_kind', 'truth_status', 'citations']
-        for field in claim_required:
-            if field not in claim:
-                raise EvidenceValidationError(
-                    f"Claim {claim.get('claim_id', 'unknown')} missing required field: {field}"
-                )
+        _validate_claim_structure(claim)
+
+
+def _validate_claim_structure(claim: Dict[str, Any]) -> None:
+    """Validate one evidence map claim has the required fields.
+
+    Raises:
+        EvidenceValidationError: If a required field is missing
+    """
+    claim_required = ['claim_id', 'claim_text', 'claim_kind', 'truth_status', 'citations']
+    for field in claim_required:
+        if field not in claim:
+            raise EvidenceValidationError(
+                f"Claim {claim.get('claim_id', 'unknown')} missing required field: {field}"
+            )
 
 
 def sort_claims_deterministically(claims: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
@@ -577,6 +626,404 @@ def sort_claims_deterministically(claims: List[Dict[str, Any]]) -> List[Dict[str
     """
     return sorted(claims, key=lambda c: c['claim_id'])
 
+# Streaming mode: enriched claims buffered per sorted spill run
+STREAMING_SPILL_CLAIMS = 1000
+
+# Evidence acceptance thresholds (same as find_supporting_evidence_in_docs/_examples)
+_DOC_EVIDENCE_THRESHOLD = 0.05
+_EXAMPLE_EVIDENCE_THRESHOLD = 0.1
+
+
+class _EvidenceIndex:
+    """Inverted word index over doc or example files for streaming mode.
+
+    Holds no file text: each file is reduced to its lenient word set
+    (the same set _build_word_set produces), words are interned to integer
+    IDs shared across indexes, and each word maps to a compact array of the
+    profiles (unique paths) containing it. Scoring a claim then touches only
+    the postings of the claim's own words, and gives exactly the scores of
+    find_supporting_evidence_in_docs/_examples with a populated content cache.
+    """
+
+    def __init__(
+        self,
+        files: List[Dict[str, Any]],
+        repo_dir: Path,
+        vocab: Dict[str, int],
+        label: str,
+        emit_event=None,
+    ):
+        self.files = files
+        self.repo_dir = repo_dir
+        self.vocab = vocab
+        self.postings: Dict[int, array] = {}
+        # Distinct similarity tokens (words longer than 2 chars) per profile
+        self.token_counts = array('I')
+        # Profile per position in files; -1 when the file was not indexed
+        self.profile_at = array('i')
+        # Positions of files that exist but were not indexed (legacy per-claim read)
+        self.fallback_positions: List[int] = []
+
+        content_store = get_repo_content_store(repo_dir)
+        profiles: Dict[str, int] = {}
+        total = len(files)
+        for i, file_info in enumerate(files, 1):
+            path_key = file_info['path']
+            profile = profiles.get(path_key)
+            if profile is None:
+                content = _read_mapped_file(file_info, repo_dir, content_store, label)
+                if content is not None:
+                    profile = profiles[path_key] = len(self.token_counts)
+                    self._add_profile(profile, content)
+                    del content
+            if profile is None:
+                profile = -1
+                if (repo_dir / path_key).exists():
+                    self.fallback_positions.append(i - 1)
+            self.profile_at.append(profile)
+
+            if emit_event and (i % 10 == 0 or i == total):
+                emit_event({
+                    "event_type": "WORK_PROGRESS",
+                    "label": f"{label}_tokenization",
+                    "progress": {"current": i, "total": total}
+                })
+
+        self.positions_by_profile: Dict[int, List[int]] = {}
+        for position, profile in enumerate(self.profile_at):
+            if profile >= 0:
+                self.positions_by_profile.setdefault(profile, []).append(position)
+
+    def _add_profile(self, profile: int, content: str) -> None:
+        token_count = 0
+        for word in _build_word_set(content):
+            word_id = self.vocab.setdefault(word, len(self.vocab))
+            postings = self.postings.get(word_id)
+            if postings is None:
+                postings = self.postings[word_id] = array('I')
+            postings.append(profile)
+            if len(word) > 2:
+                token_count += 1
+        self.token_counts.append(token_count)
+
+    def score(self, claim: Dict[str, Any], threshold: float) -> List[Tuple[int, float]]:
+        """Return (file position, relevance score) above threshold, in file order."""
+        from .embeddings import tokenize
+
+        claim_text = claim['claim_text']
+        claim_kind = claim['claim_kind']
+        source_priority = claim.get('source_priority', 7)
+        base_score = (8 - source_priority) / 7.0
+
+        keywords = extract_keywords_from_claim(claim_text, claim_kind)
+        n_keywords = len(keywords)
+        claim_token_set = set(tokenize(claim_text))
+        prefilter_kws = frozenset(
+            w for w in re.findall(r'\w+', claim_text.lower())
+            if w not in STOPWORDS and len(w) >= 2
+        ) | frozenset({claim_kind})
+
+        empty = array('I')
+        candidates = set()
+        for word in prefilter_kws:
+            word_id = self.vocab.get(word)
+            if word_id is not None:
+                candidates.update(self.postings.get(word_id, empty))
+        if not candidates:
+            return []
+
+        shared_tokens: Dict[int, int] = {}
+        for word in claim_token_set:
+            word_id = self.vocab.get(word)
+            if word_id is not None:
+                for profile in self.postings.get(word_id, empty):
+                    shared_tokens[profile] = shared_tokens.get(profile, 0) + 1
+
+        keyword_hits: Dict[int, int] = {}
+        for word in keywords:
+            word_id = self.vocab.get(word)
+            if word_id is not None:
+                for profile in self.postings.get(word_id, empty):
+                    keyword_hits[profile] = keyword_hits.get(profile, 0) + 1
+
+        scored: List[Tuple[int, float]] = []
+        for profile in candidates:
+            shared = shared_tokens.get(profile, 0)
+            similarity = (
+                shared / (len(claim_token_set) + self.token_counts[profile] - shared)
+                if shared else 0.0
+            )
+            kw_score = keyword_hits.get(profile, 0) / n_keywords if n_keywords else 0.0
+            relevance_score = min(
+                (_SCORE_WEIGHT_BASE * base_score)
+                + (_SCORE_WEIGHT_SIMILARITY * similarity)
+                + (_SCORE_WEIGHT_KEYWORDS * kw_score),
+                1.0
+            )
+            if relevance_score > threshold:
+                for position in self.positions_by_profile[profile]:
+                    scored.append((position, relevance_score))
+        scored.sort()
+        return scored
+
+
+def _find_indexed_evidence(
+    claim: Dict[str, Any],
+    index: _EvidenceIndex,
+    evidence_type: str,
+    max_evidence_per_claim: int,
+) -> List[Dict[str, Any]]:
+    """Streaming counterpart of find_supporting_evidence_in_docs/_examples."""
+    if evidence_type == 'documentation':
+        threshold, detail_key, find_one = _DOC_EVIDENCE_THRESHOLD, 'doc_type', find_supporting_evidence_in_docs
+        detail_field = 'type'
+    else:
+        threshold, detail_key, find_one = _EXAMPLE_EVIDENCE_THRESHOLD, 'language', find_supporting_evidence_in_examples
+        detail_field = 'language'
+
+    scored = index.score(claim, threshold)
+    items = [
+        (position, {
+            'path': index.files[position]['path'],
+            'type': evidence_type,
+            'relevance_score': score,
+            detail_key: index.files[position].get(detail_field, 'unknown'),
+        })
+        for position, score in scored
+    ]
+
+    # Files too large (or unreadable) to index keep the legacy per-claim read
+    for position in index.fallback_positions:
+        for item in find_one(claim, [index.files[position]], index.repo_dir):
+            items.append((position, item))
+
+    items.sort(key=lambda pair: pair[0])
+    evidence = [item for _, item in items]
+    evidence.sort(key=lambda x: x['relevance_score'], reverse=True)
+    return evidence[:max_evidence_per_claim]
+
+
+def _enrich_claim_streaming(
+    claim: Dict[str, Any],
+    doc_index: _EvidenceIndex,
+    example_index: _EvidenceIndex,
+) -> Dict[str, Any]:
+    """Streaming counterpart of enrich_claim_with_evidence."""
+    all_evidence = (
+        _find_indexed_evidence(claim, doc_index, 'documentation', 20)
+        + _find_indexed_evidence(claim, example_index, 'example', 10)
+    )
+    all_evidence.sort(key=lambda x: x['relevance_score'], reverse=True)
+
+    enriched_claim = claim.copy()
+    enriched_claim['supporting_evidence'] = all_evidence
+    enriched_claim['evidence_count'] = len(all_evidence)
+    return enriched_claim
+
+
+def _write_sorted_run(spill_dir: Path, run_number: int, claims: List[Dict[str, Any]]) -> Path:
+    """Write one spill run: claims stably sorted by claim_id, one JSON object per line."""
+    run_path = spill_dir / f"run_{run_number:05d}.jsonl"
+    with run_path.open('w', encoding='utf-8') as f:
+        for claim in sort_claims_deterministically(claims):
+            f.write(json.dumps(claim, ensure_ascii=False, sort_keys=True) + '\n')
+    return run_path
+
+
+def _iter_run(run_path: Path) -> Iterator[Dict[str, Any]]:
+    with run_path.open('r', encoding='utf-8') as f:
+        for line in f:
+            yield json.loads(line)
+
+
+def _merged_evidence_map_chunks(
+    run_paths: List[Path],
+    header: Dict[str, Any],
+) -> Iterator[str]:
+    """Yield evidence_map.json text: the k-way merge of the sorted runs plus header fields.
+
+    The output is byte-identical to atomic_write_json() of the full map
+    (indent=2, sorted keys), so streaming and in-memory runs agree.
+    heapq.merge breaks claim_id ties by run order, which keeps the merge
+    equal to a stable sort of all claims in processing order.
+    """
+    text = json.dumps({**header, 'claims': []}, ensure_ascii=False, indent=2, sort_keys=True) + '\n'
+    marker = '{\n  "claims": [],'
+    if not text.startswith(marker):
+        raise EvidenceMappingError("evidence_map header must sort 'claims' first")
+
+    merged = heapq.merge(*(_iter_run(p) for p in run_paths), key=lambda c: c['claim_id'])
+    first = True
+    for claim in merged:
+        _validate_claim_structure(claim)
+        rendered = json.dumps(claim, ensure_ascii=False, indent=2, sort_keys=True)
+        yield ('{\n  "claims": [\n    ' if first else ',\n    ') + rendered.replace('\n', '\n    ')
+        first = False
+    yield text if first else '\n  ],' + text[len(marker):]
+
+
+def _map_evidence_streaming(
+    claims: List[Dict[str, Any]],
+    doc_files: List[Dict[str, Any]],
+    example_files: List[Dict[str, Any]],
+    repo_dir: Path,
+    output_path: Path,
+    header: Dict[str, Any],
+    progress,
+) -> Tuple[Dict[str, Any], float]:
+    """Map evidence with bounded memory and write evidence_map.json incrementally.
+
+    Files are reduced to interned word IDs (no text kept), enriched claims
+    are spilled every STREAMING_SPILL_CLAIMS claims as sorted JSON Lines
+    runs, and the runs are merged into evidence_map.json.
+
+    Returns:
+        (metadata block of the written evidence map, unrounded average evidence per claim)
+    """
+    vocab: Dict[str, int] = {}
+    doc_index = _EvidenceIndex(
+        doc_files, repo_dir, vocab, "doc",
+        emit_event=lambda e: logger.info("doc_tokenization_progress", **e),
+    )
+    example_index = _EvidenceIndex(
+        example_files, repo_dir, vocab, "example",
+        emit_event=lambda e: logger.info("example_tokenization_progress", **e),
+    )
+
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    with tempfile.TemporaryDirectory(prefix=".evidence_map_runs_", dir=output_path.parent) as spill_dir:
+        run_paths: List[Path] = []
+        pending: List[Dict[str, Any]] = []
+        claims_with_evidence = 0
+        total_evidence = 0
+        for idx, claim in enumerate(claims, 1):
+            progress(idx)
+            try:
+                enriched_claim = _enrich_claim_streaming(claim, doc_index, example_index)
+            except Exception as e:
+                logger.warning(
+                    "claim_evidence_mapping_failed",
+                    claim_id=claim.get('claim_id'),
+                    error=str(e),
+                )
+                # Include claim without evidence enrichment
+                enriched_claim = claim
+            evidence_count = enriched_claim.get('evidence_count', 0)
+            claims_with_evidence += 1 if evidence_count > 0 else 0
+            total_evidence += evidence_count
+            pending.append(enriched_claim)
+            if len(pending) >= STREAMING_SPILL_CLAIMS:
+                run_paths.append(_write_sorted_run(Path(spill_dir), len(run_paths), pending))
+                pending = []
+        if pending or not run_paths:
+            run_paths.append(_write_sorted_run(Path(spill_dir), len(run_paths), pending))
+        del doc_index, example_index, vocab, pending
+
+        avg_evidence = total_evidence / len(claims) if claims else 0.0
+        metadata = {
+            'total_claims': len(claims),
+            'claims_with_evidence': claims_with_evidence,
+            'average_evidence_per_claim': round(avg_evidence, 2),
+            'total_supporting_evidence': total_evidence,
+        }
+        full_header = {**header, 'metadata': metadata}
+        validate_evidence_map_structure({**full_header, 'claims': []})
+        atomic_write_chunks(output_path, _merged_evidence_map_chunks(run_paths, full_header))
+
+    return metadata, avg_evidence
+
+
+
+def _map_evidence_in_memory(
+    claims: List[Dict[str, Any]],
+    doc_files: List[Dict[str, Any]],
+    example_files: List[Dict[str, Any]],
+    repo_dir: Path,
+    repo_url: str,
+    repo_sha: str,
+    output_path: Path,
+    progress,
+) -> Tuple[Dict[str, Any], float]:
+    """Map evidence holding all files and claims in memory, then write evidence_map.json.
+
+    Returns:
+        (evidence map, unrounded average evidence per claim)
+    """
+    # Pre-load + pre-tokenize all docs/examples once (avoids O(claims×docs) I/O and tokenization)
+    doc_cache = _load_and_tokenize_files(
+        doc_files,
+        repo_dir,
+        label="doc",
+        emit_event=lambda e: logger.info("doc_tokenization_progress", **e)
+    )
+    example_cache = _load_and_tokenize_files(
+        example_files,
+        repo_dir,
+        label="example",
+        emit_event=lambda e: logger.info("example_tokenization_progress", **e)
+    )
+
+    # Enrich each claim with supporting evidence
+    enriched_claims = []
+    for idx, claim in enumerate(claims, 1):
+        progress(idx)
+
+        try:
+            enriched_claim = enrich_claim_with_evidence(
+                claim,
+                doc_files,
+                example_files,
+                repo_dir,
+                _doc_cache=doc_cache,
+                _example_cache=example_cache,
+            )
+            enriched_claims.append(enriched_claim)
+        except Exception as e:
+            logger.warning(
+                "claim_evidence_mapping_failed",
+                claim_id=claim.get('claim_id'),
+                error=str(e),
+            )
+            # Include claim without evidence enrichment
+            enriched_claims.append(claim)
+
+    # Sort deterministically
+    enriched_claims = sort_claims_deterministically(enriched_claims)
+
+    # Compute metadata
+    claims_with_evidence = sum(
+        1 for c in enriched_claims if c.get('evidence_count', 0) > 0
+    )
+    total_evidence = sum(c.get('evidence_count', 0) for c in enriched_claims)
+    avg_evidence = total_evidence / len(enriched_claims) if enriched_claims else 0.0
+
+    # Build evidence map
+    evidence_map = {
+        'schema_version': '1.0.0',
+        'repo_url': repo_url,
+        'repo_sha': repo_sha,
+        'claims': enriched_claims,
+        'contradictions': [],  # Contradiction detection not implemented in TC-412
+        'metadata': {
+            'total_claims': len(enriched_claims),
+            'claims_with_evidence': claims_with_evidence,
+            'average_evidence_per_claim': round(avg_evidence, 2),
+            'total_supporting_evidence': total_evidence,
+        },
+    }
+
+    # Validate structure
+    try:
+        validate_evidence_map_structure(evidence_map)
+    except EvidenceValidationError as e:
+        logger.error("evidence_map_validation_failed", error=str(e))
+        raise
+
+    # Write artifact
+    atomic_write_json(output_path, evidence_map)
+
+    return evidence_map, avg_evidence
+
 
 def map_evidence(
     repo_dir: Path,
@@ -585,6 +1032,7 @@ def map_evidence(
     run_id: Optional[str] = None,
     trace_id: Optional[str] = None,
     span_id: Optional[str] = None,
+    streaming: bool = False,
 ) -> Dict[str, Any]:
     """Map evidence from claims to documentation and examples.
 
@@ -601,6 +1049,11 @@ def map_evidence(
         repo_dir: Repository directory path
         run_dir: Run directory path
         llm_client: Optional LLM client (for semantic similarity)
+        streaming: Memory-bounded mode: files are reduced to interned word
+            IDs, enriched claims are spilled as sorted JSON Lines runs and
+            merged into evidence_map.json (byte-identical to the default
+            mode). The returned map is then a lazy EvidenceMapReader over the
+            written file.
 
     Returns:
         Evidence map dictionary with:
@@ -700,24 +1153,10 @@ def map_evidence(
         "total_examples": len(example_files),
     })
 
-    # Pre-load + pre-tokenize all docs/examples once (avoids O(claims×docs) I/O and tokenization)
-    doc_cache = _load_and_tokenize_files(
-        doc_files,
-        repo_dir,
-        label="doc",
-        emit_event=lambda e: logger.info("doc_tokenization_progress", **e)
-    )
-    example_cache = _load_and_tokenize_files(
-        example_files,
-        repo_dir,
-        label="example",
-        emit_event=lambda e: logger.info("example_tokenization_progress", **e)
-    )
-
-    # Enrich each claim with supporting evidence
-    enriched_claims = []
+    output_path = run_layout.artifacts_dir / "evidence_map.json"
     total_claims = len(claims)
-    for idx, claim in enumerate(claims, 1):
+
+    def report_progress(idx: int) -> None:
         # Log progress every 500 claims
         if idx % 500 == 0 or idx == total_claims:
             payload = {
@@ -729,64 +1168,33 @@ def map_evidence(
             emit("EVIDENCE_MAPPING_PROGRESS", payload)
             logger.info("evidence_mapping_progress", **payload)
 
+    if streaming:
+        header = {
+            'schema_version': '1.0.0',
+            'repo_url': repo_url,
+            'repo_sha': repo_sha,
+            'contradictions': [],  # Contradiction detection not implemented in TC-412
+        }
         try:
-            enriched_claim = enrich_claim_with_evidence(
-                claim,
-                doc_files,
-                example_files,
-                repo_dir,
-                _doc_cache=doc_cache,
-                _example_cache=example_cache,
+            metadata, avg_evidence = _map_evidence_streaming(
+                claims, doc_files, example_files, repo_dir, output_path, header, report_progress,
             )
-            enriched_claims.append(enriched_claim)
-        except Exception as e:
-            logger.warning(
-                "claim_evidence_mapping_failed",
-                claim_id=claim.get('claim_id'),
-                error=str(e),
-            )
-            # Include claim without evidence enrichment
-            enriched_claims.append(claim)
-
-    # Sort deterministically
-    enriched_claims = sort_claims_deterministically(enriched_claims)
-
-    # Compute metadata
-    claims_with_evidence = sum(
-        1 for c in enriched_claims if c.get('evidence_count', 0) > 0
-    )
-    total_evidence = sum(c.get('evidence_count', 0) for c in enriched_claims)
-    avg_evidence = total_evidence / len(enriched_claims) if enriched_claims else 0.0
-
-    # Build evidence map
-    evidence_map = {
-        'schema_version': '1.0.0',
-        'repo_url': repo_url,
-        'repo_sha': repo_sha,
-        'claims': enriched_claims,
-        'contradictions': [],  # Contradiction detection not implemented in TC-412
-        'metadata': {
-            'total_claims': len(enriched_claims),
-            'claims_with_evidence': claims_with_evidence,
-            'average_evidence_per_claim': round(avg_evidence, 2),
-            'total_supporting_evidence': total_evidence,
-        },
-    }
-
-    # Validate structure
-    try:
-        validate_evidence_map_structure(evidence_map)
-    except EvidenceValidationError as e:
-        logger.error("evidence_map_validation_failed", error=str(e))
-        raise
-
-    # Write artifact
-    output_path = run_layout.artifacts_dir / "evidence_map.json"
-    atomic_write_json(output_path, evidence_map)
+        except EvidenceValidationError as e:
+            logger.error("evidence_map_validation_failed", error=str(e))
+            raise
+        evidence_map = EvidenceMapReader(output_path)
+        total_mapped = metadata['total_claims']
+        claims_with_evidence = metadata['claims_with_evidence']
+    else:
+        evidence_map, avg_evidence = _map_evidence_in_memory(
+            claims, doc_files, example_files, repo_dir, repo_url, repo_sha, output_path, report_progress,
+        )
+        total_mapped = evidence_map['metadata']['total_claims']
+        claims_with_evidence = evidence_map['metadata']['claims_with_evidence']
 
     logger.info(
         "evidence_map_generated",
-        total_claims=len(enriched_claims),
+        total_claims=total_mapped,
         claims_with_evidence=claims_with_evidence,
         average_evidence_per_claim=avg_evidence,
         output_path=str(output_path),
@@ -795,7 +1203,7 @@ def map_evidence(
     # Emit structured completion event with summary statistics
     emit("EVIDENCE_MAPPING_COMPLETED", {
         "step": "TC-412",
-        "total_claims": len(enriched_claims),
+        "total_claims": total_mapped,
         "claims_with_evidence": claims_with_evidence,
         "average_evidence_per_claim": avg_evidence,
         "output_path": str(output_path),
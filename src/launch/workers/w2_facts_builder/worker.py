@@ -65,6 +65,9 @@ from .enrich_claims import enrich_claims_batch
 
 logger = get_logger()
 
+# run_config key enabling memory-bounded streaming evidence mapping (opt-in)
+EVIDENCE_STREAMING_KEY = "evidence_streaming"
+
 
 class FactsBuilderError(Exception):
     """Base exception for W2 FactsBuilder errors."""
@@ -204,13 +207,18 @@ def assemble_product_facts(
         repo_inventory = json.load(f)
 
     # Run code analysis on repository (TC-1042)
-    from .code_analyzer import analyze_repository_code
+    from .code_analyzer import analyze_repository_code, api_index_dir
 
     repo_dir = run_layout.work_dir / "repo"
     if not repo_dir.exists():
         repo_dir = run_layout.work_dir
     product_name_for_analysis = repo_inventory.get('product_name', '')
-    code_analysis = analyze_repository_code(repo_dir, repo_inventory, product_name_for_analysis)
+    code_analysis = analyze_repository_code(
+        repo_dir,
+        repo_inventory,
+        product_name_for_analysis,
+        cache_dir=api_index_dir(run_layout.run_dir),
+    )
 
     # Extract metadata
     product_name = repo_inventory.get('product_name', '')
@@ -699,6 +707,8 @@ def execute_facts_builder(
                 run_id=run_id,
                 trace_id=trace_id,
                 span_id=span_id,
+                streaming=isinstance(run_config_dict, dict)
+                and bool(run_config_dict.get(EVIDENCE_STREAMING_KEY, False)),
             )
         except EvidenceMappingError as e:
             raise FactsBuilderEvidenceError(f"Evidence mapping failed: {e}") from e
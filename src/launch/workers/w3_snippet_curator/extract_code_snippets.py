@@ -31,6 +31,7 @@ import re
 from pathlib import Path
 from typing import Dict, Any, List, Optional, Tuple
 
+from ...io.evidence_map_reader import EvidenceMapReader, evidence_cited_paths
 from ...io.run_layout import RunLayout
 from ...models.event import (
     Event,
@@ -38,6 +39,7 @@ from ...models.event import (
     EVENT_WORK_ITEM_FINISHED,
     EVENT_ARTIFACT_WRITTEN,
 )
+from ...state.event_log import append_event
 
 
 # Language file extension mapping
@@ -477,17 +479,8 @@ def compute_snippet_relevance_score(
 
     # Evidence map boost
     if evidence_map:
-        # Check if this file is cited in evidence_map
-        file_is_cited = False
-        for claim in evidence_map.get("claims", []):
-            for citation in claim.get("citations", []):
-                if citation.get("path") == file_path:
-                    file_is_cited = True
-                    break
-            if file_is_cited:
-                break
-
-        if file_is_cited:
+        # Check if this file is cited in evidence_map (set cached by EvidenceMapReader)
+        if file_path in evidence_cited_paths(evidence_map):
             base_score += 10
 
     return base_score
@@ -628,7 +621,7 @@ def load_repo_inventory(run_layout: RunLayout) -> Dict[str, Any]:
     return json.loads(inventory_path.read_text(encoding="utf-8"))
 
 
-def load_evidence_map(run_layout: RunLayout) -> Optional[Dict[str, Any]]:
+def load_evidence_map(run_layout: RunLayout) -> Optional[EvidenceMapReader]:
     """Load evidence_map.json from TC-410 (optional for prioritization).
 
     Args:
@@ -643,7 +636,8 @@ def load_evidence_map(run_layout: RunLayout) -> Optional[Dict[str, Any]]:
         # Evidence map is optional for snippet extraction
         return None
 
-    return json.loads(evidence_path.read_text(encoding="utf-8"))
+    # Streamed lazily: only the cited-path set is ever materialized
+    return EvidenceMapReader(evidence_path)
 
 
 def build_code_snippets_artifact(
@@ -744,11 +738,7 @@ def emit_extract_code_snippets_events(
             span_id=span_id,
         )
 
-        event_line = json.dumps(event.to_dict()) + "\n"
-
-        # Append to events.ndjson (append-only log)
-        with events_file.open("a", encoding="utf-8") as f:
-            f.write(event_line)
+        append_event(events_file, event)
 
     # WORK_ITEM_STARTED
     write_event(
@@ -29,6 +29,7 @@ import re
 from pathlib import Path
 from typing import Dict, Any, List, Optional, Tuple
 
+from ...io.evidence_map_reader import EvidenceMapReader, evidence_cited_paths
 from ...io.run_layout import RunLayout
 from ...models.event import (
     Event,
@@ -36,6 +37,8 @@ from ...models.event import (
     EVENT_WORK_ITEM_FINISHED,
     EVENT_ARTIFACT_WRITTEN,
 )
+from ...state.event_log import append_event
+from .._shared.repo_content_store import get_repo_content_store
 
 
 # Code fence pattern (markdown)
@@ -306,17 +309,8 @@ def compute_snippet_relevance_score(
 
     # Evidence map boost
     if evidence_map:
-        # Check if this doc is cited in evidence_map
-        doc_is_cited = False
-        for claim in evidence_map.get("claims", []):
-            for citation in claim.get("citations", []):
-                if citation.get("path") == doc_path:
-                    doc_is_cited = True
-                    break
-            if doc_is_cited:
-                break
-
-        if doc_is_cited:
+        # Check if this doc is cited in evidence_map (set cached by EvidenceMapReader)
+        if doc_path in evidence_cited_paths(evidence_map):
             base_score += 10
 
     return base_score
@@ -469,7 +463,7 @@ def load_discovered_docs(run_layout: RunLayout) -> Dict[str, Any]:
     return json.loads(docs_path.read_text(encoding="utf-8"))
 
 
-def load_evidence_map(run_layout: RunLayout) -> Optional[Dict[str, Any]]:
+def load_evidence_map(run_layout: RunLayout) -> Optional[EvidenceMapReader]:
     """Load evidence_map.json from TC-410 (optional for prioritization).
 
     Args:
@@ -484,7 +478,8 @@ def load_evidence_map(run_layout: RunLayout) -> Optional[Dict[str, Any]]:
         # Evidence map is optional for snippet extraction
         return None
 
-    return json.loads(evidence_path.read_text(encoding="utf-8"))
+    # Streamed lazily: only the cited-path set is ever materialized
+    return EvidenceMapReader(evidence_path)
 
 
 def extract_snippets_from_doc(
@@ -508,12 +503,9 @@ def extract_snippets_from_doc(
     """
     file_path = repo_dir / doc_path
 
-    if not file_path.exists():
-        return []
-
-    try:
-        content = file_path.read_text(encoding="utf-8", errors="ignore")
-    except (OSError, UnicodeDecodeError):
+    # Reuse text loaded earlier in the run (W1/W2) via the shared store
+    content = get_repo_content_store(repo_dir).get_text(doc_path)
+    if content is None:
         return []
 
     # Extract code fences
@@ -670,11 +662,7 @@ def emit_extract_doc_snippets_events(
             span_id=span_id,
         )
 
-        event_line = json.dumps(event.to_dict()) + "\n"
-
-        # Append to events.ndjson (append-only log)
-        with events_file.open("a", encoding="utf-8") as f:
-            f.write(event_line)
+        append_event(events_file, event)
 
     # WORK_ITEM_STARTED
     write_event(
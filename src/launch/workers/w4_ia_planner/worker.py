@@ -26,11 +26,13 @@ TC-430: W4 IAPlanner
 
 from __future__ import annotations
 
+import copy
 import datetime
 import hashlib
 import json
 import re
 import uuid
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any, Optional, List, Tuple
 
@@ -47,12 +49,25 @@ from ...models.event import (
 from ...models.run_config import RunConfig
 from ...io.run_config import load_and_validate_run_config
 from ...io.atomic import atomic_write_json
+from ...io.hashing import sha256_file
 from ...io.yamlio import load_yaml
+from ...content.template_registry import (
+    TITLE_MALFORMED,
+    TITLE_MISSING,
+    TITLE_NO_FRONTMATTER,
+    compile_template,
+    find_template,
+    get_template_registry,
+    template_registry_dir,
+)
 from ...util.logging import get_logger
 from ...resolvers.public_urls import build_absolute_public_url
 
 logger = get_logger()
 
+# TC-967: Template filenames must be concrete (placeholder directories are OK)
+_PLACEHOLDER_FILENAME_RE = re.compile(r'__[A-Z_]+__')
+
 
 def assign_page_role(section: str, slug: str, is_index: bool = False) -> str:
     """Assign page role based on section, slug, and type.
@@ -250,7 +265,8 @@ def emit_event(
 def load_product_facts(artifacts_dir: Path) -> Dict[str, Any]:
     """Load product_facts.json from artifacts directory.
 
-    TC-1033: Delegates to ArtifactStore.load_artifact for centralized I/O.
+    TC-1033: Delegates to ArtifactStore for centralized I/O. Returns a shared
+    read-only view (see io/artifact_cache.py).
 
     Args:
         artifacts_dir: Path to artifacts directory
@@ -263,7 +279,7 @@ def load_product_facts(artifacts_dir: Path) -> Dict[str, Any]:
     """
     store = ArtifactStore(run_dir=artifacts_dir.parent)
     try:
-        return store.load_artifact("product_facts.json", validate_schema=False)
+        return store.load_artifact_view("product_facts.json", validate_schema=False)
     except FileNotFoundError:
         raise IAPlannerError(f"Missing required artifact: {artifacts_dir / 'product_facts.json'}")
     except json.JSONDecodeError as e:
@@ -273,7 +289,8 @@ def load_product_facts(artifacts_dir: Path) -> Dict[str, Any]:
 def load_snippet_catalog(artifacts_dir: Path) -> Dict[str, Any]:
     """Load snippet_catalog.json from artifacts directory.
 
-    TC-1033: Delegates to ArtifactStore.load_artifact for centralized I/O.
+    TC-1033: Delegates to ArtifactStore for centralized I/O. Returns a shared
+    read-only view (see io/artifact_cache.py).
 
     Args:
         artifacts_dir: Path to artifacts directory
@@ -286,18 +303,25 @@ def load_snippet_catalog(artifacts_dir: Path) -> Dict[str, Any]:
     """
     store = ArtifactStore(run_dir=artifacts_dir.parent)
     try:
-        return store.load_artifact("snippet_catalog.json", validate_schema=False)
+        return store.load_artifact_view("snippet_catalog.json", validate_schema=False)
     except FileNotFoundError:
         raise IAPlannerError(f"Missing required artifact: {artifacts_dir / 'snippet_catalog.json'}")
     except json.JSONDecodeError as e:
         raise IAPlannerError(f"Invalid JSON in snippet_catalog.json: {e}")
 
 
+@lru_cache(maxsize=8)
+def _parse_ruleset(ruleset_path: str, content_sha256: str) -> Dict[str, Any]:
+    """Parse a ruleset once per content hash (shared across plans in this process)."""
+    return load_yaml(Path(ruleset_path))
+
+
 def load_ruleset(repo_root: Path = None) -> Dict[str, Any]:
     """Load full ruleset from ruleset.v1.yaml.
 
     TC-984: Loads the complete ruleset dict for use by load_and_merge_page_requirements()
-    and other config-driven functions.
+    and other config-driven functions. The YAML is parsed once per ruleset
+    content; callers get their own copy.
 
     Args:
         repo_root: Path to repository root (auto-detected from worker location if None)
@@ -316,12 +340,25 @@ def load_ruleset(repo_root: Path = None) -> Dict[str, Any]:
         raise IAPlannerError(f"Missing ruleset: {ruleset_path}")
 
     try:
-        ruleset = load_yaml(ruleset_path)
-        return ruleset
+        ruleset = _parse_ruleset(str(ruleset_path), sha256_file(ruleset_path))
+        return copy.deepcopy(ruleset)
     except Exception as e:
         raise IAPlannerError(f"Failed to load ruleset: {e}")
 
 
+def ruleset_quotas(ruleset: Dict[str, Any]) -> Dict[str, Dict[str, int]]:
+    """Extract per-section page quotas (min_pages, max_pages) from a loaded ruleset."""
+    quotas = {}
+    for section, config in ruleset.get("sections", {}).items():
+        quotas[section] = {
+            "min_pages": config.get("min_pages", 1),
+            "max_pages": config.get("max_pages", 10),
+        }
+
+    logger.info(f"[W4 IAPlanner] Loaded section quotas from ruleset: {quotas}")
+    return quotas
+
+
 def load_ruleset_quotas(repo_root: Path = None) -> Dict[str, Dict[str, int]]:
     """Load page quotas from ruleset.v1.yaml.
 
@@ -337,30 +374,9 @@ def load_ruleset_quotas(repo_root: Path = None) -> Dict[str, Dict[str, int]]:
     Raises:
         IAPlannerError: If ruleset is missing or invalid
     """
-    if repo_root is None:
-        # Auto-detect repo root from this file's location
-        # src/launch/workers/w4_ia_planner/worker.py -> go up 5 levels to reach repo root
-        repo_root = Path(__file__).parent.parent.parent.parent.parent
-
-    ruleset_path = repo_root / "specs" / "rulesets" / "ruleset.v1.yaml"
-    if not ruleset_path.exists():
-        raise IAPlannerError(f"Missing ruleset: {ruleset_path}")
-
+    ruleset = load_ruleset(repo_root)
     try:
-        ruleset = load_yaml(ruleset_path)
-        sections_config = ruleset.get("sections", {})
-
-        # Extract quotas for each section
-        quotas = {}
-        for section, config in sections_config.items():
-            quotas[section] = {
-                "min_pages": config.get("min_pages", 1),
-                "max_pages": config.get("max_pages", 10),
-            }
-
-        logger.info(f"[W4 IAPlanner] Loaded section quotas from ruleset: {quotas}")
-        return quotas
-
+        return ruleset_quotas(ruleset)
     except Exception as e:
         raise IAPlannerError(f"Failed to load ruleset: {e}")
 
@@ -1848,44 +1864,36 @@ def enumerate_templates(
     templates = []
 
     # Search from family level to discover all templates in placeholder or literal directories
-    # The rglob("*.md") below will recursively find templates in any nested structure:
-    # - __LOCALE__/*.md
-    # - __POST_SLUG__/*.md
-    # This fixes the bug where we searched for literal "en/" dirs that don't exist
+    # (e.g. __LOCALE__/*.md, __POST_SLUG__/*.md). Templates come from the
+    # precompiled registry, so planning does not rescan or reread the tree.
     search_root = template_dir / subdomain / family
 
     if not search_root.exists():
         logger.debug(f"[W4] Template directory not found: {search_root}")
         return []
 
-    # Walk directory tree and find all .md files
-    templates_discovered = list(search_root.rglob("*.md"))
+    registry = get_template_registry(template_dir)
+
+    # TC-968: Extract section from subdomain (not directory path)
+    # Directory names like __LOCALE__ are placeholders, not sections
+    # Section comes from subdomain: docs.aspose.org -> "docs"
+    section = subdomain.split('.')[0]
 
-    # TC-967: Filter out README files and templates with placeholder filenames
-    # Placeholder directories are OK (needed for path structure), but filenames must be concrete
-    # to prevent URL collisions like /3d/python/__REFERENCE_SLUG__/
-    import re
-    placeholder_pattern = re.compile(r'__[A-Z_]+__')
+    for record in registry.for_family(subdomain, family):
+        filename = record.filename
 
-    templates_to_process = []
-    for template_path in templates_discovered:
         # Skip README files
-        if template_path.name == "README.md":
+        if filename == "README.md":
             continue
 
         # TC-967: Filter out templates with placeholder filenames
         # Check FILENAME only (not full path) to allow placeholder directories
-        filename = template_path.name
-        if placeholder_pattern.search(filename):
-            logger.debug(
-                f"[W4] Skipping template with placeholder filename: {template_path.relative_to(search_root)}"
-            )
+        # to prevent URL collisions like /3d/python/__REFERENCE_SLUG__/
+        if _PLACEHOLDER_FILENAME_RE.search(filename):
+            logger.debug(f"[W4] Skipping template with placeholder filename: {record.relative_path}")
             continue
 
-        templates_to_process.append(template_path)
-
-    # Process filtered templates
-    for template_path in templates_to_process:
+        template_path = template_dir / record.relative_path
         path_str = str(template_path)
 
         # HEAL-BUG4: Skip obsolete blog templates with __LOCALE__ folder structure
@@ -1895,57 +1903,20 @@ def enumerate_templates(
                 logger.debug(f"[W4] Skipping obsolete blog template with __LOCALE__: {path_str}")
                 continue
 
-        # Extract template metadata
-        filename = template_path.name
-        relative_path = template_path.relative_to(search_root)
-
-        # TC-968: Extract section from subdomain (not directory path)
-        # Directory names like __LOCALE__ are placeholders, not sections
-        # Section comes from subdomain: docs.aspose.org -> "docs"
-        section = subdomain.split('.')[0]
-
-        # Extract slug from filename
-        slug = filename.replace(".md", "")
-        if ".variant-" in slug:
-            base_slug, variant = slug.split(".variant-", 1)
-            slug = base_slug
-        else:
-            variant = "default"
-
-        # Handle _index files
-        if slug == "_index":
-            slug = "index"
-
-        # Extract placeholders from template content
-        placeholders = []
-        try:
-            content = template_path.read_text(encoding="utf-8")
-            import re
-            placeholders = sorted(set(re.findall(r'__([A-Z_]+)__', content)))
-        except Exception:
-            pass
-
-        # Determine if mandatory
-        is_mandatory = (
-            filename == "_index.md" or
-            "/mandatory/" in str(template_path) or
-            "mandatory: true" in content if 'content' in locals() else False
-        )
+        relative_path = record.relative_path.split("/", 2)[2]
 
         # TC-993: Derive page_role from template filename prefix
         # Per specs/21_worker_contracts.md binding requirement
-        page_role = _derive_page_role_from_template(
-            filename, str(relative_path), section
-        )
+        page_role = _derive_page_role_from_template(filename, relative_path, section)
 
         templates.append({
             "section": section,
-            "template_path": str(template_path),
-            "slug": slug,
+            "template_path": path_str,
+            "slug": record.slug,
             "filename": filename,
-            "variant": variant,
-            "is_mandatory": is_mandatory,
-            "placeholders": placeholders,
+            "variant": record.variant,
+            "is_mandatory": record.is_mandatory or "/mandatory/" in path_str,
+            "placeholders": list(record.placeholders),
             "page_role": page_role,
         })
 
@@ -2059,42 +2030,35 @@ def extract_title_from_template(template_path: str) -> str:
     Raises:
         IAPlannerValidationError: If template has no frontmatter or missing title
     """
-    import yaml
-
-    try:
-        template_file = Path(template_path)
-        content = template_file.read_text(encoding="utf-8")
-
-        # Parse frontmatter (YAML between --- delimiters)
-        if content.startswith("---"):
-            # Split on --- and take the second part (first is empty)
-            parts = content.split("---", 2)
-            if len(parts) >= 3:
-                frontmatter_text = parts[1]
-                frontmatter = yaml.safe_load(frontmatter_text)
-
-                if frontmatter and "title" in frontmatter:
-                    return frontmatter["title"]
-                else:
-                    raise IAPlannerValidationError(
-                        f"Template {template_path} has frontmatter but missing 'title' field"
-                    )
-            else:
-                raise IAPlannerValidationError(
-                    f"Template {template_path} has malformed frontmatter"
-                )
-        else:
+    _, record = find_template(template_path)
+    if record is None:
+        # Not under a loaded template root: compile it directly
+        try:
+            record = compile_template(Path(template_path))
+        except Exception as e:
+            logger.error(f"[W4] Failed to extract title from template {template_path}: {e}")
             raise IAPlannerValidationError(
-                f"Template {template_path} has no frontmatter (must start with ---)"
+                f"Failed to extract title from template {template_path}: {e}"
             )
-    except Exception as e:
-        if isinstance(e, IAPlannerValidationError):
-            raise
-        logger.error(f"[W4] Failed to extract title from template {template_path}: {e}")
+
+    if record.title_error is None:
+        return record.title
+    if record.title_error == TITLE_MISSING:
         raise IAPlannerValidationError(
-            f"Failed to extract title from template {template_path}: {e}"
+            f"Template {template_path} has frontmatter but missing 'title' field"
         )
-
+    if record.title_error == TITLE_MALFORMED:
+        raise IAPlannerValidationError(
+            f"Template {template_path} has malformed frontmatter"
+        )
+    if record.title_error == TITLE_NO_FRONTMATTER:
+        raise IAPlannerValidationError(
+            f"Template {template_path} has no frontmatter (must start with ---)"
+        )
+    logger.error(f"[W4] Failed to extract title from template {template_path}: {record.title_error}")
+    raise IAPlannerValidationError(
+        f"Failed to extract title from template {template_path}: {record.title_error}"
+    )
 
 
 def _extract_symbols_from_claims(
@@ -2768,13 +2732,12 @@ def execute_ia_planner(
         product_facts = load_product_facts(run_layout.artifacts_dir)
         snippet_catalog = load_snippet_catalog(run_layout.artifacts_dir)
 
-        # Load section quotas from ruleset (TC-953)
+        # TC-984: Load full ruleset for config-driven page requirements
+        # and derive section quotas from it (TC-953)
         # src/launch/workers/w4_ia_planner/worker.py -> go up 5 levels to reach repo root
         repo_root = Path(__file__).parent.parent.parent.parent.parent
-        section_quotas = load_ruleset_quotas(repo_root)
-
-        # TC-984: Load full ruleset for config-driven page requirements
         ruleset = load_ruleset(repo_root)
+        section_quotas = ruleset_quotas(ruleset)
 
         # Load run_config if not provided (follow W2 pattern - TC-925)
         if run_config is None:
@@ -2827,6 +2790,9 @@ def execute_ia_planner(
         # src/launch/workers/w4_ia_planner/worker.py -> go up 5 levels to reach repo root
         template_dir = Path(__file__).parent.parent.parent.parent.parent / "specs" / "templates"
 
+        # Load (or build and persist) the template registry once for all sections
+        get_template_registry(template_dir, cache_dir=template_registry_dir(run_dir))
+
         # Plan pages using template enumeration
         all_pages = []
         sections_subdomains = [
@@ -3,6 +3,6 @@
 TC-1100-P1: W5.5 ContentReviewer Phase 1 - Core Review Logic
 """
 
-from .worker import execute_content_reviewer
+from .worker import REVIEW_SCOPE_KEY, execute_content_reviewer
 
-__all__ = ['execute_content_reviewer']
+__all__ = ['REVIEW_SCOPE_KEY', 'execute_content_reviewer']
@@ -14,6 +14,7 @@ import uuid
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from ....clients.llm_governor import LANE_REVIEW
 from ....clients.llm_provider import LLMProviderClient
 
 
@@ -155,6 +156,7 @@ def _api_hallucination_llm(
             response = llm_client.chat_completion(
                 messages=[{"role": "user", "content": prompt}],
                 call_id=f"semantic_api_hallucination_{page_slug}_{line}",
+                priority=LANE_REVIEW,
             )
             response_text = response.get("content", "")
 
@@ -318,6 +320,7 @@ def _licensing_llm(
             response = llm_client.chat_completion(
                 messages=[{"role": "user", "content": prompt}],
                 call_id=f"semantic_licensing_{page_slug}_{section['line']}",
+                priority=LANE_REVIEW,
             )
             response_text = response.get("content", "")
 
@@ -460,6 +463,7 @@ def _content_relevance_llm(
             response = llm_client.chat_completion(
                 messages=[{"role": "user", "content": prompt}],
                 call_id=f"semantic_relevance_{page_slug}_{section['line']}",
+                priority=LANE_REVIEW,
             )
             response_text = response.get("content", "")
 
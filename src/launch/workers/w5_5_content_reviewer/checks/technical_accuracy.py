@@ -14,6 +14,8 @@ import re
 from pathlib import Path
 from typing import Dict, List, Any
 
+from launch.io.evidence_map_reader import evidence_claim_ids
+
 
 def check_all(
     drafts_dir: Path,
@@ -28,7 +30,7 @@ def check_all(
         drafts_dir: Path to drafts directory (RUN_DIR/drafts)
         product_facts: Product facts dict from product_facts.json
         snippet_catalog: Snippet catalog dict from snippet_catalog.json
-        evidence_map: Evidence map dict from evidence_map.json
+        evidence_map: Evidence map from evidence_map.json (dict or lazy EvidenceMapReader)
         page_plan: Page plan dict from page_plan.json
 
     Returns:
@@ -474,12 +476,8 @@ def _check_10_claim_evidence_linkage(content: str, rel_path: str, page_slug: str
     """
     issues = []
 
-    # Get claims from evidence_map
-    claims_with_evidence = set()
-    for claim in evidence_map.get('claims', []):
-        claim_id = claim.get('claim_id')
-        if claim_id:
-            claims_with_evidence.add(claim_id)
+    # Get claims from evidence_map (cached per file version for EvidenceMapReader)
+    claims_with_evidence = evidence_claim_ids(evidence_map)
 
     # Extract claim markers from content
     claim_pattern = r'<!--\s*claim_id:\s*([a-f0-9\-]+)\s*-->'
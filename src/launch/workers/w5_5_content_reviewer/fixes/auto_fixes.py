@@ -12,30 +12,44 @@ Spec reference: abstract-hugging-kite.md:286-330 (Auto-fix requirements)
 
 from __future__ import annotations
 
+import os
 import re
 import yaml
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 
 from .iteration_tracker import IterationTracker
 
+# Below this many drafts, process startup costs more than it saves
+PARALLEL_AUTO_FIX_MIN_FILES = 16
+
 
 def apply_auto_fixes(
     issues: List[Dict],
     drafts_dir: Path,
     product_facts: Dict,
-    iteration_tracker: IterationTracker
+    iteration_tracker: IterationTracker,
+    max_workers: Optional[int] = None,
 ) -> List[Dict]:
     """Apply deterministic auto-fixes to markdown drafts.
 
     This function processes issues identified by Phase 1 checks and applies
     appropriate fixes. Only issues with auto_fixable=True are processed.
 
+    Each draft is read once, every routed fix runs against an in-memory
+    DraftBuffer in issue order, and the draft is written once if it changed.
+    Drafts are independent, so above PARALLEL_AUTO_FIX_MIN_FILES they are
+    fixed on a process pool; iteration tracking is applied afterwards in
+    path order.
+
     Args:
         issues: List of issue dicts from Phase 1 checks
         drafts_dir: Path to drafts/ directory
         product_facts: ProductFacts for context
         iteration_tracker: Tracks iterations per page
+        max_workers: Pool size (defaults to the CPU count)
 
     Returns:
         List of fix_result dicts:
@@ -66,115 +80,213 @@ def apply_auto_fixes(
 
         issues_by_path[path].append(issue)
 
-    # Process each file
+    # Results per file, in sorted path order; None marks files still to fix
+    results_by_path: Dict[str, Optional[List[Dict]]] = {}
+    pending = []
     for rel_path, file_issues in sorted(issues_by_path.items()):
         # Convert relative path to absolute
         file_path = drafts_dir.parent / rel_path
 
         if not file_path.exists():
-            for issue in file_issues:
-                fix_results.append({
+            results_by_path[rel_path] = [
+                {
                     "issue_id": issue.get("issue_id", "unknown"),
                     "fix_type": "error",
                     "files_changed": [],
                     "success": False,
                     "error": f"File not found: {file_path}"
-                })
+                }
+                for issue in file_issues
+            ]
             continue
 
-        # Extract page_id from path for iteration tracking
-        page_id = _extract_page_id(rel_path)
-
         # Check if we can iterate on this page
+        page_id = _extract_page_id(rel_path)
         if not iteration_tracker.can_iterate(page_id):
-            for issue in file_issues:
-                fix_results.append({
+            results_by_path[rel_path] = [
+                {
                     "issue_id": issue.get("issue_id", "unknown"),
                     "fix_type": "max_iterations",
                     "files_changed": [],
                     "success": False,
                     "error": f"Max iterations ({iteration_tracker.MAX_ITERATIONS}) reached for page {page_id}"
-                })
+                }
+                for issue in file_issues
+            ]
             continue
 
-        # Apply fixes for this file
-        fixes_applied = 0
-        for issue in file_issues:
-            check_name = issue.get("check", "")
-
-            # Route to appropriate fix function
-            if "claim_marker_format" in check_name:
-                result = fix_claim_markers(issue, file_path)
-            elif "licensing_accuracy" in check_name or "foss_licensing" in check_name:
-                result = fix_foss_licensing(issue, file_path)
-            elif "frontmatter_completeness" in check_name and "collapsed" in issue.get("message", "").lower():
-                result = fix_collapsed_frontmatter(issue, file_path)
-            elif "frontmatter_completeness" in check_name and "missing required" in issue.get("message", "").lower():
-                result = fix_frontmatter_fields(issue, file_path, product_facts)
-            elif "frontmatter_completeness" in check_name and "comment" in issue.get("message", "").lower():
-                result = fix_frontmatter_comments(issue, file_path)
-            elif "claim_validity" in check_name or "claim_evidence_linkage" in check_name:
-                result = fix_invalid_claim_marker(issue, file_path)
-            elif "template_token" in check_name.lower():
-                result = fix_template_tokens(issue, file_path, product_facts)
-            elif "heading_hierarchy" in check_name:
-                result = fix_heading_hierarchy(issue, file_path)
-            elif "paragraph_structure" in check_name:
-                result = fix_paragraph_breaks(issue, file_path)
-            elif "link" in check_name and "./page.md" in issue.get("message", ""):
-                result = fix_link_normalization(issue, file_path)
-            elif "bullet" in check_name and "long" in issue.get("message", "").lower():
-                result = fix_bullet_splitting(issue, file_path)
-            elif "alt_text" in check_name or ("image" in issue.get("message", "").lower() and "alt" in issue.get("message", "").lower()):
-                result = fix_alt_text(issue, file_path)
-            elif "metadata" in check_name or "product_name" in issue.get("message", "").lower():
-                result = fix_metadata(issue, file_path, product_facts)
-            elif "prerequisites_clarity" in check_name:
-                result = fix_missing_prerequisites(issue, file_path, product_facts)
-            elif "call_to_action" in check_name:
-                result = fix_missing_cta(issue, file_path, product_facts)
-            elif "user_journey" in check_name:
-                result = fix_missing_next_steps(issue, file_path)
-            elif "content_density" in check_name:
-                result = fix_low_content_density(issue, file_path, product_facts)
-            elif "heading_descriptiveness" in check_name:
-                result = fix_heading_descriptiveness(issue, file_path, product_facts)
-            elif "search_optimization" in check_name:
-                result = fix_metadata(issue, file_path, product_facts)
-            elif "example_clarity" in check_name:
-                result = fix_example_clarity(issue, file_path)
-            elif "snippet_attribution" in check_name:
-                result = fix_snippet_attribution(issue, file_path)
-            elif "technical_terminology_consistency" in check_name:
-                result = fix_terminology_consistency(issue, file_path)
-            elif "completeness" in check_name:
-                result = fix_placeholder_content(issue, file_path)
-            elif "error_message_clarity" in check_name:
-                result = fix_error_message_format(issue, file_path)
-            else:
-                # Unknown fix type
-                result = {
-                    "issue_id": issue.get("issue_id", "unknown"),
-                    "fix_type": "unknown",
-                    "files_changed": [],
-                    "success": False,
-                    "error": f"No fix handler for check: {check_name}"
-                }
+        results_by_path[rel_path] = None
+        pending.append((rel_path, str(file_path), file_issues))
+
+    fixed = dict(zip(
+        (rel_path for rel_path, _, _ in pending),
+        _fix_files(pending, product_facts, max_workers),
+        strict=True,
+    ))
+
+    for rel_path, results in results_by_path.items():
+        if results is None:
+            results = fixed[rel_path]
+            # Record iteration if fixes were applied
+            fixes_applied = sum(1 for r in results if r.get("success", False))
+            if fixes_applied > 0:
+                iteration_tracker.record_iteration(
+                    page_id=_extract_page_id(rel_path),
+                    fix_type="auto_fixes",
+                    count=fixes_applied
+                )
+        fix_results.extend(results)
 
-            fix_results.append(result)
+    return fix_results
 
-            if result.get("success", False):
-                fixes_applied += 1
 
-        # Record iteration if fixes were applied
-        if fixes_applied > 0:
-            iteration_tracker.record_iteration(
-                page_id=page_id,
-                fix_type="auto_fixes",
-                count=fixes_applied
-            )
+class DraftBuffer:
+    """In-memory stand-in for a draft's Path while its fixes are applied.
 
-    return fix_results
+    Fix functions only call read_text/write_text and read stem/parent/name,
+    so they run unchanged against a buffer; apply_auto_fixes reads the file
+    once before the first fix and writes it once after the last.
+    """
+
+    def __init__(self, path: Path, text: str):
+        self.path = path
+        self.text = text
+
+    def read_text(self, encoding: Optional[str] = None) -> str:
+        return self.text
+
+    def write_text(self, data: str, encoding: Optional[str] = None) -> int:
+        self.text = data
+        return len(data)
+
+    @property
+    def name(self) -> str:
+        return self.path.name
+
+    @property
+    def stem(self) -> str:
+        return self.path.stem
+
+    @property
+    def parent(self) -> Path:
+        return self.path.parent
+
+    def __fspath__(self) -> str:
+        return str(self.path)
+
+    def __str__(self) -> str:
+        return str(self.path)
+
+
+def _fix_file(file_path: str, file_issues: List[Dict], product_facts: Dict) -> List[Dict]:
+    """Apply every fix for one draft with a single read and write; process-pool safe."""
+    path = Path(file_path)
+    try:
+        original = path.read_text(encoding='utf-8')
+    except (OSError, UnicodeDecodeError) as e:
+        return [
+            {
+                "issue_id": issue.get("issue_id", "unknown"),
+                "fix_type": "error",
+                "files_changed": [],
+                "success": False,
+                "error": str(e),
+            }
+            for issue in file_issues
+        ]
+    buffer = DraftBuffer(path, original)
+    results = [_route_fix(issue, buffer, product_facts) for issue in file_issues]
+    if buffer.text != original:
+        path.write_text(buffer.text, encoding='utf-8')
+    return results
+
+
+def _fix_files(
+    pending: List[Tuple[str, str, List[Dict]]],
+    product_facts: Dict,
+    max_workers: Optional[int],
+) -> List[List[Dict]]:
+    workers = max_workers or os.cpu_count() or 1
+    paths = [file_path for _, file_path, _ in pending]
+    file_issues = [issues for _, _, issues in pending]
+    if workers > 1 and len(pending) >= PARALLEL_AUTO_FIX_MIN_FILES:
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                chunksize = max(1, len(pending) // (workers * 4))
+                return list(pool.map(
+                    _fix_file, paths, file_issues, [product_facts] * len(pending),
+                    chunksize=chunksize,
+                ))
+        except (BrokenProcessPool, OSError):
+            # Process pools unavailable (restricted sandbox); fall back to serial fixing
+            pass
+    return [_fix_file(path, issues, product_facts) for path, issues in zip(paths, file_issues, strict=True)]
+
+
+def _route_fix(issue: Dict, file_path: Any, product_facts: Dict) -> Dict:
+    """Route an issue to its fix function by check name."""
+    check_name = issue.get("check", "")
+
+    # Route to appropriate fix function
+    if "claim_marker_format" in check_name:
+        result = fix_claim_markers(issue, file_path)
+    elif "licensing_accuracy" in check_name or "foss_licensing" in check_name:
+        result = fix_foss_licensing(issue, file_path)
+    elif "frontmatter_completeness" in check_name and "collapsed" in issue.get("message", "").lower():
+        result = fix_collapsed_frontmatter(issue, file_path)
+    elif "frontmatter_completeness" in check_name and "missing required" in issue.get("message", "").lower():
+        result = fix_frontmatter_fields(issue, file_path, product_facts)
+    elif "frontmatter_completeness" in check_name and "comment" in issue.get("message", "").lower():
+        result = fix_frontmatter_comments(issue, file_path)
+    elif "claim_validity" in check_name or "claim_evidence_linkage" in check_name:
+        result = fix_invalid_claim_marker(issue, file_path)
+    elif "template_token" in check_name.lower():
+        result = fix_template_tokens(issue, file_path, product_facts)
+    elif "heading_hierarchy" in check_name:
+        result = fix_heading_hierarchy(issue, file_path)
+    elif "paragraph_structure" in check_name:
+        result = fix_paragraph_breaks(issue, file_path)
+    elif "link" in check_name and "./page.md" in issue.get("message", ""):
+        result = fix_link_normalization(issue, file_path)
+    elif "bullet" in check_name and "long" in issue.get("message", "").lower():
+        result = fix_bullet_splitting(issue, file_path)
+    elif "alt_text" in check_name or ("image" in issue.get("message", "").lower() and "alt" in issue.get("message", "").lower()):
+        result = fix_alt_text(issue, file_path)
+    elif "metadata" in check_name or "product_name" in issue.get("message", "").lower():
+        result = fix_metadata(issue, file_path, product_facts)
+    elif "prerequisites_clarity" in check_name:
+        result = fix_missing_prerequisites(issue, file_path, product_facts)
+    elif "call_to_action" in check_name:
+        result = fix_missing_cta(issue, file_path, product_facts)
+    elif "user_journey" in check_name:
+        result = fix_missing_next_steps(issue, file_path)
+    elif "content_density" in check_name:
+        result = fix_low_content_density(issue, file_path, product_facts)
+    elif "heading_descriptiveness" in check_name:
+        result = fix_heading_descriptiveness(issue, file_path, product_facts)
+    elif "search_optimization" in check_name:
+        result = fix_metadata(issue, file_path, product_facts)
+    elif "example_clarity" in check_name:
+        result = fix_example_clarity(issue, file_path)
+    elif "snippet_attribution" in check_name:
+        result = fix_snippet_attribution(issue, file_path)
+    elif "technical_terminology_consistency" in check_name:
+        result = fix_terminology_consistency(issue, file_path)
+    elif "completeness" in check_name:
+        result = fix_placeholder_content(issue, file_path)
+    elif "error_message_clarity" in check_name:
+        result = fix_error_message_format(issue, file_path)
+    else:
+        # Unknown fix type
+        result = {
+            "issue_id": issue.get("issue_id", "unknown"),
+            "fix_type": "unknown",
+            "files_changed": [],
+            "success": False,
+            "error": f"No fix handler for check: {check_name}"
+        }
+
+    return result
 
 
 # Fix Function 1: Claim Markers
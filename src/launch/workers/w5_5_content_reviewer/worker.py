@@ -26,6 +26,7 @@ from pathlib import Path
 from typing import Dict, List, Any
 
 from launch.io.artifact_store import ArtifactStore
+from launch.io.evidence_map_reader import EvidenceMapReader
 
 from .checks import content_quality, technical_accuracy, usability
 from .scoring import calculate_scores, route_review_result
@@ -50,6 +51,12 @@ class ContentReviewerValidationError(ContentReviewerError):
     pass
 
 
+# run_config key restricting the review to these drafts (paths relative to
+# run_dir); set for delta relaunches, where the other drafts were reviewed
+# in the base run
+REVIEW_SCOPE_KEY = "_review_scope"
+
+
 def execute_content_reviewer(run_dir: Path, run_config: Dict[str, Any]) -> Dict[str, Any]:
     """W5.5 ContentReviewer worker - reviews generated markdown.
 
@@ -97,7 +104,7 @@ def execute_content_reviewer(run_dir: Path, run_config: Dict[str, Any]) -> Dict[
     product_facts = _load_artifact(artifacts_dir, "product_facts.json")
     snippet_catalog = _load_artifact(artifacts_dir, "snippet_catalog.json")
     page_plan = _load_artifact(artifacts_dir, "page_plan.json")
-    evidence_map = _load_artifact(artifacts_dir, "evidence_map.json")
+    evidence_map = _load_evidence_map(artifacts_dir)
 
     # Check drafts directory exists
     if not drafts_dir.exists():
@@ -137,6 +144,13 @@ def execute_content_reviewer(run_dir: Path, run_config: Dict[str, Any]) -> Dict[
     )
     all_issues.extend(usability_issues)
 
+    review_scope = run_config.get(REVIEW_SCOPE_KEY)
+    if review_scope is not None:
+        # Checks report paths relative to run_dir or to drafts_dir
+        scope = set(review_scope) | {p.partition('/')[2] for p in review_scope}
+        draft_files = [f for f in draft_files if f.relative_to(run_dir).as_posix() in scope]
+        all_issues = [i for i in all_issues if i.get('location', {}).get('path') in scope]
+
     # Apply deterministic auto-fixes (Phase 2)
     tracker = IterationTracker(run_dir=run_dir)
     auto_fixable = [i for i in all_issues if i.get("auto_fixable", False)]
@@ -261,6 +275,20 @@ def execute_content_reviewer(run_dir: Path, run_config: Dict[str, Any]) -> Dict[
 
 # Helper functions
 
+def _load_evidence_map(artifacts_dir: Path) -> EvidenceMapReader:
+    """Open evidence_map.json lazily (streamed on first use, never fully parsed).
+
+    Raises:
+        ContentReviewerArtifactMissingError: If evidence_map.json not found
+    """
+    evidence_map = EvidenceMapReader.from_artifacts_dir(artifacts_dir)
+    if evidence_map is None:
+        raise ContentReviewerArtifactMissingError(
+            "Required artifact not found: evidence_map.json"
+        )
+    return evidence_map
+
+
 def _load_artifact(artifacts_dir: Path, artifact_name: str) -> Dict[str, Any]:
     """Load JSON artifact from artifacts directory.
 
@@ -269,20 +297,19 @@ def _load_artifact(artifacts_dir: Path, artifact_name: str) -> Dict[str, Any]:
         artifact_name: Artifact filename (e.g., product_facts.json)
 
     Returns:
-        Parsed JSON artifact
+        Parsed JSON artifact as a shared read-only view
 
     Raises:
         ContentReviewerArtifactMissingError: If artifact not found
     """
-    artifact_path = artifacts_dir / artifact_name
-    if not artifact_path.exists():
+    store = ArtifactStore(run_dir=artifacts_dir.parent)
+    try:
+        return store.load_artifact_view(artifact_name, validate_schema=False)
+    except FileNotFoundError:
         raise ContentReviewerArtifactMissingError(
             f"Required artifact not found: {artifact_name}"
         )
 
-    with open(artifact_path, 'r', encoding='utf-8') as f:
-        return json.load(f)
-
 
 def _emit_event(run_dir: Path, event_type: str, payload: Dict[str, Any],
                 run_id: str = None, trace_id: str = None, span_id: str = None) -> None:
@@ -9,6 +9,11 @@ TC-440: W5 SectionWriter implementation complete.
 
 from .worker import (
     execute_section_writer,
+    generate_page_id,
+    merge_draft_manifests,
+    planned_sections,
+    REUSED_DRAFTS_KEY,
+    SECTION_SCOPE_KEY,
     SectionWriterError,
     SectionWriterClaimMissingError,
     SectionWriterSnippetMissingError,
@@ -19,6 +24,11 @@ from .worker import (
 
 __all__ = [
     "execute_section_writer",
+    "generate_page_id",
+    "merge_draft_manifests",
+    "planned_sections",
+    "REUSED_DRAFTS_KEY",
+    "SECTION_SCOPE_KEY",
     "SectionWriterError",
     "SectionWriterClaimMissingError",
     "SectionWriterSnippetMissingError",
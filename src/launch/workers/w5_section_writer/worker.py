@@ -15,6 +15,18 @@ Output artifacts:
 - drafts/<page_id>_<section_id>.md (one per section)
 - draft_manifest.json (listing all draft files)
 
+Per-section fan-out: when run_config[SECTION_SCOPE_KEY] names a section, only
+that section's pages are drafted and a partial manifest is written to
+artifacts/draft_manifests/<section>.json instead of draft_manifest.json. The
+orchestrator runs one such work item per section and merge_draft_manifests
+combines the partials deterministically. A partial whose inputs are unchanged
+and whose drafts are intact is reused, so a failed section can be retried
+without redrafting the others.
+
+Delta relaunch: run_config[REUSED_DRAFTS_KEY] maps page IDs to drafts from a
+base run (see launch.orchestrator.delta). Those pages are copied from the
+base draft instead of being generated.
+
 Spec references:
 - specs/07_section_templates.md (Section writing templates)
 - specs/21_worker_contracts.md:195-226 (W5 SectionWriter contract)
@@ -33,8 +45,10 @@ import json
 import re
 import uuid
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Mapping, Optional, List
 
+from ...clients.llm_governor import LANE_DRAFTING
+from ...content.template_registry import read_template
 from ...io.run_layout import RunLayout
 from ...io.artifact_store import ArtifactStore
 from ...models.event import (
@@ -46,6 +60,8 @@ from ...models.event import (
     EVENT_RUN_FAILED,
 )
 from ...io.atomic import atomic_write_json
+from ...io.evidence_map_reader import EvidenceMapReader
+from ...io.hashing import sha256_file
 from ...util.logging import get_logger
 from .link_transformer import transform_cross_section_links
 
@@ -56,6 +72,26 @@ MAX_CLAIM_TEXT_LENGTH = 200  # Display limit for claim text in bullet points
 MAX_CLAIM_FILTER_LENGTH = 1000  # Pre-filter limit to remove pathological cases
 MAX_LIMITATION_CLAIMS = 10  # Maximum number of limitation claims to display
 
+# Deterministic section order for draft_manifest.json (specs/10_determinism_and_caching.md:43)
+SECTION_ORDER = {"products": 0, "docs": 1, "reference": 2, "kb": 3, "blog": 4}
+
+# run_config key restricting an invocation to one section (per-section fan-out)
+SECTION_SCOPE_KEY = "_section_scope"
+
+# run_config key mapping page_id -> base-run draft path to copy (delta relaunch)
+REUSED_DRAFTS_KEY = "_reused_drafts"
+
+# Directory under artifacts/ holding per-section partial manifests
+PARTIAL_MANIFESTS_DIR = "draft_manifests"
+
+# Input artifacts whose content decides whether a section's drafts can be reused
+SECTION_INPUT_ARTIFACTS = (
+    "page_plan.json",
+    "product_facts.json",
+    "snippet_catalog.json",
+    "evidence_map.json",
+)
+
 
 class SectionWriterError(Exception):
     """Base exception for W5 SectionWriter errors."""
@@ -120,7 +156,8 @@ def emit_event(
 def load_page_plan(artifacts_dir: Path) -> Dict[str, Any]:
     """Load page_plan.json from artifacts directory.
 
-    TC-1033: Delegates to ArtifactStore.load_artifact for centralized I/O.
+    TC-1033: Delegates to ArtifactStore for centralized I/O. Returns a shared
+    read-only view (see io/artifact_cache.py).
 
     Args:
         artifacts_dir: Path to artifacts directory
@@ -133,7 +170,7 @@ def load_page_plan(artifacts_dir: Path) -> Dict[str, Any]:
     """
     store = ArtifactStore(run_dir=artifacts_dir.parent)
     try:
-        return store.load_artifact("page_plan.json", validate_schema=False)
+        return store.load_artifact_view("page_plan.json", validate_schema=False)
     except FileNotFoundError:
         raise SectionWriterError(f"Missing required artifact: {artifacts_dir / 'page_plan.json'}")
     except json.JSONDecodeError as e:
@@ -143,7 +180,8 @@ def load_page_plan(artifacts_dir: Path) -> Dict[str, Any]:
 def load_product_facts(artifacts_dir: Path) -> Dict[str, Any]:
     """Load product_facts.json from artifacts directory.
 
-    TC-1033: Delegates to ArtifactStore.load_artifact for centralized I/O.
+    TC-1033: Delegates to ArtifactStore for centralized I/O. Returns a shared
+    read-only view (see io/artifact_cache.py).
 
     Args:
         artifacts_dir: Path to artifacts directory
@@ -156,7 +194,7 @@ def load_product_facts(artifacts_dir: Path) -> Dict[str, Any]:
     """
     store = ArtifactStore(run_dir=artifacts_dir.parent)
     try:
-        return store.load_artifact("product_facts.json", validate_schema=False)
+        return store.load_artifact_view("product_facts.json", validate_schema=False)
     except FileNotFoundError:
         raise SectionWriterError(f"Missing required artifact: {artifacts_dir / 'product_facts.json'}")
     except json.JSONDecodeError as e:
@@ -166,7 +204,8 @@ def load_product_facts(artifacts_dir: Path) -> Dict[str, Any]:
 def load_snippet_catalog(artifacts_dir: Path) -> Dict[str, Any]:
     """Load snippet_catalog.json from artifacts directory.
 
-    TC-1033: Delegates to ArtifactStore.load_artifact for centralized I/O.
+    TC-1033: Delegates to ArtifactStore for centralized I/O. Returns a shared
+    read-only view (see io/artifact_cache.py).
 
     Args:
         artifacts_dir: Path to artifacts directory
@@ -179,33 +218,27 @@ def load_snippet_catalog(artifacts_dir: Path) -> Dict[str, Any]:
     """
     store = ArtifactStore(run_dir=artifacts_dir.parent)
     try:
-        return store.load_artifact("snippet_catalog.json", validate_schema=False)
+        return store.load_artifact_view("snippet_catalog.json", validate_schema=False)
     except FileNotFoundError:
         raise SectionWriterError(f"Missing required artifact: {artifacts_dir / 'snippet_catalog.json'}")
     except json.JSONDecodeError as e:
         raise SectionWriterError(f"Invalid JSON in snippet_catalog.json: {e}")
 
 
-def load_evidence_map(artifacts_dir: Path) -> Dict[str, Any]:
-    """Load evidence_map.json from artifacts directory.
+def load_evidence_map(artifacts_dir: Path) -> Mapping[str, Any]:
+    """Open evidence_map.json from artifacts directory.
 
-    TC-1033: Delegates to ArtifactStore.load_artifact_or_default for centralized I/O.
+    The map is returned as a lazy EvidenceMapReader: it is only streamed
+    from disk when accessed, so large maps are never parsed up front.
 
     Args:
         artifacts_dir: Path to artifacts directory
 
     Returns:
-        Evidence map dictionary (may be empty if file doesn't exist)
+        Evidence map (may be empty if file doesn't exist)
     """
-    store = ArtifactStore(run_dir=artifacts_dir.parent)
-    try:
-        return store.load_artifact_or_default(
-            "evidence_map.json",
-            default={"claims": []},
-            validate_schema=False,
-        )
-    except json.JSONDecodeError as e:
-        raise SectionWriterError(f"Invalid JSON in evidence_map.json: {e}")
+    evidence_map = EvidenceMapReader.from_artifacts_dir(artifacts_dir)
+    return evidence_map if evidence_map is not None else {"claims": []}
 
 
 def get_claims_by_ids(
@@ -817,8 +850,8 @@ def generate_section_content(
     if template_path and token_mappings:
         logger.info(f"[W5 SectionWriter] Loading template for page {page['slug']}: {template_path}")
         try:
-            template_file = Path(template_path)
-            template_content = template_file.read_text(encoding="utf-8")
+            # Served from W4's template registry when loaded in this process
+            template_content = read_template(template_path)
 
             # Apply token mappings to replace placeholders
             content = apply_token_mappings(template_content, token_mappings)
@@ -924,6 +957,7 @@ def generate_section_content(
                 ],
                 call_id=f"section_writer_{page['slug']}",
                 temperature=0.0,  # Deterministic
+                priority=LANE_DRAFTING,
             )
             content = response["content"]
 
@@ -1405,6 +1439,161 @@ def check_unfilled_tokens(content: str) -> List[str]:
     return list(set(matches))  # Return unique tokens
 
 
+def planned_sections(page_plan: Dict[str, Any]) -> List[str]:
+    """Return the sections that have planned pages, in deterministic order.
+
+    Args:
+        page_plan: Page plan dictionary
+
+    Returns:
+        Section names ordered by SECTION_ORDER, then name
+    """
+    sections = {page["section"] for page in page_plan.get("pages", [])}
+    return sorted(sections, key=lambda s: (SECTION_ORDER.get(s, 99), s))
+
+
+def build_draft_manifest(
+    run_id: str,
+    total_pages: int,
+    draft_files: List[Dict[str, Any]],
+) -> Dict[str, Any]:
+    """Build draft_manifest.json with drafts in deterministic order.
+
+    Args:
+        run_id: Run identifier
+        total_pages: Number of planned pages
+        draft_files: Draft entries (any order)
+
+    Returns:
+        Manifest dictionary
+    """
+    # Sort by (section_order, output_path) per specs/10_determinism_and_caching.md:43
+    drafts = sorted(
+        draft_files,
+        key=lambda d: (SECTION_ORDER.get(d["section"], 99), d["output_path"]),
+    )
+    return {
+        "schema_version": "1.0",
+        "run_id": run_id,
+        "total_pages": total_pages,
+        "draft_count": len(drafts),
+        "drafts": drafts,
+    }
+
+
+def partial_manifest_path(run_dir: Path, section: str) -> Path:
+    """Return the partial manifest path for a section."""
+    return run_dir / "artifacts" / PARTIAL_MANIFESTS_DIR / f"{section}.json"
+
+
+def compute_section_inputs_digest(run_dir: Path, run_config: Dict[str, Any]) -> str:
+    """Hash the inputs that determine a section's drafts.
+
+    Covers SECTION_INPUT_ARTIFACTS and the public run_config entries
+    (private "_" keys such as the telemetry client are excluded).
+
+    Args:
+        run_dir: Run directory path
+        run_config: Run configuration dictionary
+
+    Returns:
+        Hex sha256 digest
+    """
+    artifacts_dir = run_dir / "artifacts"
+    material = {
+        "artifacts": {
+            name: sha256_file(artifacts_dir / name) if (artifacts_dir / name).is_file() else None
+            for name in SECTION_INPUT_ARTIFACTS
+        },
+        "run_config": {k: v for k, v in run_config.items() if not k.startswith("_")},
+    }
+    encoded = json.dumps(material, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def load_reusable_partial_manifest(
+    run_dir: Path,
+    section: str,
+    inputs_digest: str,
+) -> Optional[Dict[str, Any]]:
+    """Return a section's partial manifest if its drafts can be reused.
+
+    Reusable means: the partial was produced from the same inputs and every
+    draft it lists still exists with the recorded sha256.
+
+    Args:
+        run_dir: Run directory path
+        section: Section name
+        inputs_digest: Current compute_section_inputs_digest value
+
+    Returns:
+        Partial manifest dictionary, or None if the section must be redrafted
+    """
+    path = partial_manifest_path(run_dir, section)
+    try:
+        partial = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return None
+    if partial.get("section") != section or partial.get("inputs_digest") != inputs_digest:
+        return None
+    for draft_path, sha256 in partial.get("draft_sha256", {}).items():
+        draft_file = run_dir / draft_path
+        if not draft_file.is_file() or sha256_file(draft_file) != sha256:
+            return None
+    return partial
+
+
+def merge_draft_manifests(run_dir: Path, run_id: str) -> Optional[Dict[str, Any]]:
+    """Merge per-section partial manifests into draft_manifest.json.
+
+    Args:
+        run_dir: Run directory path
+        run_id: Run identifier
+
+    Returns:
+        Merged manifest, or None if no partial manifests exist (W5 ran
+        unscoped and wrote draft_manifest.json itself)
+
+    Raises:
+        SectionWriterError: If a planned section has no partial manifest
+    """
+    run_layout = RunLayout(run_dir=run_dir)
+    if not (run_layout.artifacts_dir / PARTIAL_MANIFESTS_DIR).is_dir():
+        return None
+
+    page_plan = load_page_plan(run_layout.artifacts_dir)
+    draft_files: List[Dict[str, Any]] = []
+    missing: List[str] = []
+    for section in planned_sections(page_plan):
+        path = partial_manifest_path(run_dir, section)
+        if not path.is_file():
+            missing.append(section)
+            continue
+        draft_files.extend(json.loads(path.read_text(encoding="utf-8"))["drafts"])
+    if missing:
+        raise SectionWriterError(
+            f"Missing partial draft manifests for sections: {', '.join(missing)}"
+        )
+
+    manifest = build_draft_manifest(run_id, len(page_plan.get("pages", [])), draft_files)
+    manifest_path = run_layout.artifacts_dir / "draft_manifest.json"
+    atomic_write_json(manifest_path, manifest)
+
+    emit_event(
+        run_layout=run_layout,
+        run_id=run_id,
+        trace_id=str(uuid.uuid4()),
+        span_id=str(uuid.uuid4()),
+        event_type=EVENT_ARTIFACT_WRITTEN,
+        payload={
+            "artifact": "draft_manifest.json",
+            "path": str(manifest_path),
+            "draft_count": manifest["draft_count"],
+        },
+    )
+    return manifest
+
+
 def generate_page_id(page: Dict[str, Any]) -> str:
     """Generate deterministic page ID from page specification.
 
@@ -1427,7 +1616,8 @@ def execute_section_writer(
     """Execute W5 SectionWriter worker.
 
     Generates markdown content for all planned pages using templates,
-    product facts, and snippet catalog.
+    product facts, and snippet catalog. With run_config[SECTION_SCOPE_KEY]
+    set, drafts only that section and writes its partial manifest.
 
     Per specs/07_section_templates.md and specs/21_worker_contracts.md:195-226.
 
@@ -1439,9 +1629,12 @@ def execute_section_writer(
     Returns:
         Dictionary containing:
         - status: "success" or "failed"
-        - manifest_path: Path to draft_manifest.json
-        - draft_count: Number of drafts generated
+        - manifest_path: Path to draft_manifest.json (or the partial manifest
+          when scoped to a section)
+        - draft_count: Number of drafts written
         - total_pages: Total pages processed
+        - reused_drafts: Drafts copied from a base run (delta relaunch)
+        - section, reused: Scoped invocations only
 
     Raises:
         SectionWriterError: If section writing fails
@@ -1459,6 +1652,23 @@ def execute_section_writer(
     telemetry_trace_id = run_config.get("_telemetry_trace_id") if isinstance(run_config, dict) else trace_id
     telemetry_parent_span_id = run_config.get("_telemetry_parent_span_id") if isinstance(run_config, dict) else span_id
 
+    section_scope = run_config.get(SECTION_SCOPE_KEY)
+    reused_drafts = run_config.get(REUSED_DRAFTS_KEY) or {}
+    inputs_digest = None
+    if section_scope:
+        inputs_digest = compute_section_inputs_digest(run_dir, run_config)
+        partial = load_reusable_partial_manifest(run_dir, section_scope, inputs_digest)
+        if partial is not None:
+            logger.info(f"[W5 SectionWriter] Reusing drafts for section {section_scope} (inputs unchanged)")
+            return {
+                "status": "success",
+                "manifest_path": str(partial_manifest_path(run_dir, section_scope)),
+                "draft_count": len(partial["drafts"]),
+                "total_pages": len(partial["drafts"]),
+                "section": section_scope,
+                "reused": True,
+            }
+
     # TC-999: Auto-construct LLM client from run_config if not provided
     if llm_client is None and run_config.get("llm", {}).get("api_base_url"):
         try:
@@ -1513,6 +1723,10 @@ def execute_section_writer(
         evidence_map = load_evidence_map(run_layout.artifacts_dir)
 
         pages = page_plan.get("pages", [])
+        if section_scope:
+            pages = [page for page in pages if page["section"] == section_scope]
+            # A stale partial must not survive a failed redraft
+            partial_manifest_path(run_dir, section_scope).unlink(missing_ok=True)
         logger.info(f"[W5 SectionWriter] Processing {len(pages)} pages")
 
         # Create drafts directory
@@ -1526,17 +1740,21 @@ def execute_section_writer(
             slug = page["slug"]
             section = page["section"]
 
-            logger.info(f"[W5 SectionWriter] Generating content for page: {page_id}")
-
-            # Generate section content
-            # TC-973: Pass page_plan to enable TOC generation
-            content = generate_section_content(
-                page=page,
-                product_facts=product_facts,
-                snippet_catalog=snippet_catalog,
-                llm_client=llm_client,
-                page_plan=page_plan,
-            )
+            if page_id in reused_drafts:
+                logger.info(f"[W5 SectionWriter] Reusing base-run draft for page: {page_id}")
+                content = Path(reused_drafts[page_id]).read_text(encoding="utf-8")
+            else:
+                logger.info(f"[W5 SectionWriter] Generating content for page: {page_id}")
+
+                # Generate section content
+                # TC-973: Pass page_plan to enable TOC generation
+                content = generate_section_content(
+                    page=page,
+                    product_facts=product_facts,
+                    snippet_catalog=snippet_catalog,
+                    llm_client=llm_client,
+                    page_plan=page_plan,
+                )
 
             # Check for unfilled tokens
             unfilled_tokens = check_unfilled_tokens(content)
@@ -1602,23 +1820,31 @@ def execute_section_writer(
                 },
             )
 
-        # Sort draft files deterministically per specs/10_determinism_and_caching.md:43
-        # Sort by (section_order, output_path)
-        section_order = {"products": 0, "docs": 1, "reference": 2, "kb": 3, "blog": 4}
-        draft_files.sort(key=lambda d: (section_order.get(d["section"], 99), d["output_path"]))
-
-        # Build manifest
-        manifest = {
-            "schema_version": "1.0",
-            "run_id": run_id,
-            "total_pages": len(pages),
-            "draft_count": len(draft_files),
-            "drafts": draft_files,
-        }
-
-        # Write manifest
-        manifest_path = run_layout.artifacts_dir / "draft_manifest.json"
-        atomic_write_json(manifest_path, manifest)
+        # Build manifest (drafts sorted deterministically)
+        manifest = build_draft_manifest(run_id, len(pages), draft_files)
+
+        # Write manifest (partial manifest when scoped to one section)
+        if section_scope:
+            manifest_artifact = f"{PARTIAL_MANIFESTS_DIR}/{section_scope}.json"
+            manifest_path = partial_manifest_path(run_dir, section_scope)
+            manifest_path.parent.mkdir(parents=True, exist_ok=True)
+            atomic_write_json(
+                manifest_path,
+                {
+                    "schema_version": "1.0",
+                    "section": section_scope,
+                    "inputs_digest": inputs_digest,
+                    "drafts": manifest["drafts"],
+                    "draft_sha256": {
+                        d["draft_path"]: sha256_file(run_dir / d["draft_path"])
+                        for d in manifest["drafts"]
+                    },
+                },
+            )
+        else:
+            manifest_artifact = "draft_manifest.json"
+            manifest_path = run_layout.artifacts_dir / manifest_artifact
+            atomic_write_json(manifest_path, manifest)
 
         logger.info(f"[W5 SectionWriter] Wrote draft manifest: {manifest_path}")
 
@@ -1630,7 +1856,7 @@ def execute_section_writer(
             span_id=span_id,
             event_type=EVENT_ARTIFACT_WRITTEN,
             payload={
-                "artifact": "draft_manifest.json",
+                "artifact": manifest_artifact,
                 "path": str(manifest_path),
                 "draft_count": len(draft_files),
             },
@@ -1651,12 +1877,16 @@ def execute_section_writer(
             },
         )
 
-        return {
+        result = {
             "status": "success",
             "manifest_path": str(manifest_path),
             "draft_count": len(draft_files),
             "total_pages": len(pages),
+            "reused_drafts": sum(1 for page in pages if generate_page_id(page) in reused_drafts),
         }
+        if section_scope:
+            result.update({"section": section_scope, "reused": False})
+        return result
 
     except Exception as e:
         logger.error(f"[W5 SectionWriter] Section writing failed: {e}")
@@ -50,6 +50,7 @@ from ...models.event import (
 )
 from ...io.atomic import atomic_write_json, atomic_write_text
 from ...util.logging import get_logger
+from ...util.path_validation import compile_path_prefixes
 
 logger = get_logger()
 
@@ -117,7 +118,8 @@ def emit_event(
 def load_page_plan(artifacts_dir: Path) -> Dict[str, Any]:
     """Load page_plan.json from artifacts directory.
 
-    TC-1033: Delegates to ArtifactStore.load_artifact for centralized I/O.
+    TC-1033: Delegates to ArtifactStore for centralized I/O. Returns a shared
+    read-only view (see io/artifact_cache.py).
 
     Args:
         artifacts_dir: Path to artifacts directory
@@ -130,7 +132,7 @@ def load_page_plan(artifacts_dir: Path) -> Dict[str, Any]:
     """
     store = ArtifactStore(run_dir=artifacts_dir.parent)
     try:
-        return store.load_artifact("page_plan.json", validate_schema=False)
+        return store.load_artifact_view("page_plan.json", validate_schema=False)
     except FileNotFoundError:
         raise LinkerAndPatcherError(f"Missing required artifact: {artifacts_dir / 'page_plan.json'}")
     except json.JSONDecodeError as e:
@@ -140,7 +142,8 @@ def load_page_plan(artifacts_dir: Path) -> Dict[str, Any]:
 def load_draft_manifest(artifacts_dir: Path) -> Dict[str, Any]:
     """Load draft_manifest.json from artifacts directory.
 
-    TC-1033: Delegates to ArtifactStore.load_artifact for centralized I/O.
+    TC-1033: Delegates to ArtifactStore for centralized I/O. Returns a shared
+    read-only view (see io/artifact_cache.py).
 
     Args:
         artifacts_dir: Path to artifacts directory
@@ -153,7 +156,7 @@ def load_draft_manifest(artifacts_dir: Path) -> Dict[str, Any]:
     """
     store = ArtifactStore(run_dir=artifacts_dir.parent)
     try:
-        return store.load_artifact("draft_manifest.json", validate_schema=False)
+        return store.load_artifact_view("draft_manifest.json", validate_schema=False)
     except FileNotFoundError:
         raise LinkerAndPatcherError(f"Missing required artifact: {artifacts_dir / 'draft_manifest.json'}")
     except json.JSONDecodeError as e:
@@ -205,12 +208,9 @@ def validate_allowed_path(
 
     relative_str = str(relative_path).replace("\\", "/")
 
-    for allowed_pattern in allowed_paths:
-        # Simple prefix matching (can be enhanced with glob patterns)
-        if relative_str.startswith(allowed_pattern.rstrip("/")):
-            return True
-
-    return False
+    # Simple prefix matching, compiled once per allowed_paths list
+    prefixes = compile_path_prefixes(tuple(p.rstrip("/") for p in allowed_paths))
+    return prefixes.has_prefix_of(relative_str)
 
 
 def parse_frontmatter(content: str) -> Tuple[Optional[str], str]:
@@ -2,15 +2,114 @@
 
 Validates that Hugo site builds successfully.
 
+Builds are cached: the result of a completed build is stored under a key
+derived from the site tree contents, the Hugo version and the build command,
+so re-validating an unchanged site (e.g. after a fix that touched only
+artifacts) skips Hugo entirely. Builds use a persistent --cacheDir outside
+the site tree, so rebuilds after small edits reuse Hugo's caches. Each
+build's outcome (including duration) is written to
+artifacts/hugo_build_result.json for Gate P3; validations that stop before
+building remove it, so P3 never reads a previous iteration's duration.
+
+Cache layout (default: <runs dir>/.hugo_cache, or LAUNCH_HUGO_CACHE_DIR):
+    results/<key>.json   Cached gate result of a completed build
+    cache/               Hugo --cacheDir
+    public/<tmp>/        Hugo --destination, removed after each build
+
+Set LAUNCH_HUGO_BUILD_CACHE=0 to always build.
+
 Per specs/09_validation_gates.md (Gate 5 Hugo Build).
 """
 
 from __future__ import annotations
 
+import hashlib
+import json
+import os
+import shutil
 import subprocess
+import tempfile
+import time
+from launch.io.atomic import atomic_write_json
 from launch.util.subprocess import run as subprocess_run
 from pathlib import Path
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
+
+# Artifact (under artifacts/) recording this run's build outcome for Gate P3
+HUGO_BUILD_RESULT_ARTIFACT = "hugo_build_result.json"
+
+# Bump when the cached result format or key derivation changes
+HUGO_BUILD_CACHE_VERSION = 1
+
+# Hugo-generated paths excluded from the site tree digest
+_GENERATED_PATHS = frozenset({".git", "public", "resources", ".hugo_build.lock"})
+
+
+def hugo_cache_dir(run_dir: Path) -> Path:
+    """Workspace-level directory for Hugo build caches (shared by all runs)."""
+    override = os.environ.get("LAUNCH_HUGO_CACHE_DIR")
+    if override:
+        return Path(override)
+    return Path(run_dir).parent / ".hugo_cache"
+
+
+def _build_cache_enabled() -> bool:
+    """Return False when LAUNCH_HUGO_BUILD_CACHE disables result reuse."""
+    return os.environ.get("LAUNCH_HUGO_BUILD_CACHE", "1").lower() not in ("0", "false", "no", "off")
+
+
+def site_tree_digest(site_dir: Path) -> str:
+    """Hash every source file of a Hugo site (paths and contents).
+
+    Args:
+        site_dir: Hugo site root
+
+    Returns:
+        SHA256 hex digest, stable across machines for identical trees
+    """
+    digest = hashlib.sha256()
+    files = sorted(
+        p for p in site_dir.rglob("*")
+        if p.is_file() and p.relative_to(site_dir).parts[0] not in _GENERATED_PATHS
+    )
+    for path in files:
+        digest.update(path.relative_to(site_dir).as_posix().encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(hashlib.sha256(path.read_bytes()).digest())
+    return digest.hexdigest()
+
+
+def build_cache_key(tree_digest: str, hugo_version: str, hugo_cmd: List[str]) -> str:
+    """Key a build result by site tree, Hugo version and build command."""
+    data = json.dumps([HUGO_BUILD_CACHE_VERSION, tree_digest, hugo_version.strip(), hugo_cmd])
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+
+def _load_cached_result(path: Path) -> Optional[Dict[str, Any]]:
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return None
+
+
+def _write_build_result(
+    run_dir: Path,
+    key: str,
+    issues: List[Dict[str, Any]],
+    duration_seconds: Optional[float],
+    cached: bool,
+) -> None:
+    """Record this run's build outcome for Gate P3."""
+    atomic_write_json(
+        run_dir / "artifacts" / HUGO_BUILD_RESULT_ARTIFACT,
+        {
+            "schema_version": "1.0",
+            "cache_key": key,
+            "cached": cached,
+            "ok": not issues,
+            "duration_seconds": duration_seconds,
+        },
+    )
 
 
 def execute_gate(run_dir: Path, profile: str) -> Tuple[bool, List[Dict[str, Any]]]:
@@ -27,6 +126,9 @@ def execute_gate(run_dir: Path, profile: str) -> Tuple[bool, List[Dict[str, Any]
     """
     issues = []
 
+    # Only this validation's build may report a duration to Gate P3
+    (run_dir / "artifacts" / HUGO_BUILD_RESULT_ARTIFACT).unlink(missing_ok=True)
+
     # Determine timeout based on profile
     timeouts = {"local": 300, "ci": 600, "prod": 600}  # seconds
     timeout = timeouts.get(profile, 300)
@@ -83,6 +185,8 @@ def execute_gate(run_dir: Path, profile: str) -> Tuple[bool, List[Dict[str, Any]
         )
         return False, issues
 
+    hugo_version = result.stdout or ""
+
     # Run Hugo build
     # TC-976: Check if configs directory exists and use --configDir flag
     configs_dir = site_dir / "configs"
@@ -90,14 +194,38 @@ def execute_gate(run_dir: Path, profile: str) -> Tuple[bool, List[Dict[str, Any]
     if configs_dir.exists():
         hugo_cmd.extend(["--configDir", "configs"])
 
+    # Reuse the result of a completed build of an identical tree
+    key = build_cache_key(site_tree_digest(site_dir), hugo_version, hugo_cmd)
+    cache_dir = hugo_cache_dir(run_dir)
+    result_path = cache_dir / "results" / f"{key}.json"
+    cached = _load_cached_result(result_path) if _build_cache_enabled() else None
+    if cached is not None:
+        issues = cached.get("issues", [])
+        _write_build_result(run_dir, key, issues, cached.get("duration_seconds"), cached=True)
+        return len(issues) == 0, issues
+
+    # Persistent Hugo cache outside the site tree (so it never changes its
+    # digest); the rendered output is only needed while the build runs
+    (cache_dir / "public").mkdir(parents=True, exist_ok=True)
+    destination = Path(tempfile.mkdtemp(dir=cache_dir / "public")).resolve()
+    build_cmd = hugo_cmd + [
+        "--cacheDir", str((cache_dir / "cache").resolve()),
+        "--destination", str(destination),
+    ]
+
+    duration_seconds = None
+    completed = False
+    start = time.perf_counter()
     try:
         result = subprocess_run(
-            hugo_cmd,
+            build_cmd,
             cwd=site_dir,
             capture_output=True,
             text=True,
             timeout=timeout,
         )
+        duration_seconds = round(time.perf_counter() - start, 3)
+        completed = True
 
         # Check for errors in output
         if result.returncode != 0:
@@ -155,6 +283,16 @@ def execute_gate(run_dir: Path, profile: str) -> Tuple[bool, List[Dict[str, Any]
                 "status": "OPEN",
             }
         )
+    finally:
+        shutil.rmtree(destination, ignore_errors=True)
+
+    # Timeouts and crashes are not a property of the tree; only cache completed builds
+    if completed:
+        atomic_write_json(
+            result_path,
+            {"schema_version": "1.0", "issues": issues, "duration_seconds": duration_seconds},
+        )
+    _write_build_result(run_dir, key, issues, duration_seconds, cached=False)
 
     # Gate passes if no issues (all Hugo build issues are blockers)
     gate_passed = len(issues) == 0
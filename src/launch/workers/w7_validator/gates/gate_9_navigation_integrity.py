@@ -8,10 +8,13 @@ Per specs/09_validation_gates.md (navigation integrity requirements).
 from __future__ import annotations
 
 import json
-import re
 from pathlib import Path
 from typing import Any, Dict, List, Set, Tuple
 
+import yaml
+
+from launch.content.site_link_graph import get_site_link_graph
+
 
 def execute_gate(run_dir: Path, profile: str) -> Tuple[bool, List[Dict[str, Any]]]:
     """Execute Gate 9: Navigation Integrity.
@@ -64,15 +67,11 @@ def execute_gate(run_dir: Path, profile: str) -> Tuple[bool, List[Dict[str, Any]
     if not site_dir.exists():
         return True, []
 
-    md_files = sorted(site_dir.rglob("*.md"))
+    # Shared site link graph (already built by Gate 5 in the same pass)
+    graph = get_site_link_graph(site_dir)
 
-    # Collect all actual page paths (relative to site_dir)
-    actual_pages: Set[str] = set()
-    for md_file in md_files:
-        rel_path = str(md_file.relative_to(site_dir))
-        # Normalize path separators to forward slashes for cross-platform compatibility
-        rel_path = rel_path.replace("\\", "/")
-        actual_pages.add(rel_path)
+    # Collect all actual page paths (relative to site_dir, forward slashes)
+    actual_pages: Set[str] = set(graph.pages())
 
     # Check for orphaned pages (actual pages not in plan)
     orphaned_pages = actual_pages - planned_pages
@@ -105,52 +104,44 @@ def execute_gate(run_dir: Path, profile: str) -> Tuple[bool, List[Dict[str, Any]
             }
         )
 
-    # Pattern to match navigation frontmatter field
     # Look for nav_menu or menu fields in frontmatter
-    for md_file in md_files:
+    for page in graph.pages():
+        md_file = site_dir / page
+        frontmatter_text = graph.nodes[page].front_matter
+        # Cheap pre-filter: only YAML-parse front matter that mentions a menu
+        if not frontmatter_text or "menu" not in frontmatter_text:
+            continue
+
         try:
-            content = md_file.read_text(encoding="utf-8")
-
-            # Parse frontmatter
-            frontmatter_match = re.match(
-                r"^---\s*\n(.*?\n)---\s*\n", content, re.DOTALL
-            )
-            if frontmatter_match:
-                import yaml
-
-                try:
-                    frontmatter = yaml.safe_load(frontmatter_match.group(1))
-
-                    # Check for nav_menu field
-                    nav_menu = frontmatter.get("nav_menu") or frontmatter.get("menu")
-                    if nav_menu and isinstance(nav_menu, list):
-                        # Validate nav links exist
-                        for nav_item in nav_menu:
-                            if isinstance(nav_item, dict):
-                                link = nav_item.get("link") or nav_item.get("url")
-                                if link and not link.startswith("http"):
-                                    # Internal link - check if it exists
-                                    # Strip leading slash
-                                    link_path = link.lstrip("/")
-                                    if link_path not in actual_pages:
-                                        issues.append(
-                                            {
-                                                "issue_id": f"navigation_broken_link_{md_file.name}_{link_path.replace('/', '_')}",
-                                                "gate": "gate_9_navigation_integrity",
-                                                "severity": "error",
-                                                "message": f"Navigation link to non-existent page: {link}",
-                                                "error_code": "GATE_NAVIGATION_BROKEN_LINK",
-                                                "location": {"path": str(md_file)},
-                                                "status": "OPEN",
-                                            }
-                                        )
-
-                except yaml.YAMLError:
-                    pass  # YAML errors caught by other gates
-
-        except Exception:
-            # Error reading file - will be caught by other gates
-            pass
+            frontmatter = yaml.safe_load(frontmatter_text)
+        except yaml.YAMLError:
+            continue  # YAML errors caught by other gates
+        if not isinstance(frontmatter, dict):
+            continue
+
+        # Check for nav_menu field
+        nav_menu = frontmatter.get("nav_menu") or frontmatter.get("menu")
+        if nav_menu and isinstance(nav_menu, list):
+            # Validate nav links exist
+            for nav_item in nav_menu:
+                if isinstance(nav_item, dict):
+                    link = nav_item.get("link") or nav_item.get("url")
+                    if link and not link.startswith("http"):
+                        # Internal link - check if it exists
+                        # Strip leading slash
+                        link_path = link.lstrip("/")
+                        if not graph.has_page(link_path):
+                            issues.append(
+                                {
+                                    "issue_id": f"navigation_broken_link_{md_file.name}_{link_path.replace('/', '_')}",
+                                    "gate": "gate_9_navigation_integrity",
+                                    "severity": "error",
+                                    "message": f"Navigation link to non-existent page: {link}",
+                                    "error_code": "GATE_NAVIGATION_BROKEN_LINK",
+                                    "location": {"path": str(md_file)},
+                                    "status": "OPEN",
+                                }
+                            )
 
     # Gate passes if no error/blocker issues (warnings are OK)
     gate_passed = not any(
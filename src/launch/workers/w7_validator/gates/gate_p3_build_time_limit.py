@@ -11,13 +11,18 @@ import json
 from pathlib import Path
 from typing import Any, Dict, List, Tuple
 
+from launch.state.event_log import iter_events
+
+from .gate_13_hugo_build import HUGO_BUILD_RESULT_ARTIFACT
+
 
 def execute_gate(run_dir: Path, profile: str) -> Tuple[bool, List[Dict[str, Any]]]:
     """Execute Gate P3: Build Time Limit.
 
     Validates that Hugo build completed within 60 seconds.
     This gate checks the build time recorded in previous gate executions
-    (specifically gate_13_hugo_build).
+    (specifically gate_13_hugo_build, via artifacts/hugo_build_result.json;
+    HUGO_BUILD_STARTED/COMPLETED events are the fallback when it is absent).
 
     Args:
         run_dir: Run directory path
@@ -29,6 +34,38 @@ def execute_gate(run_dir: Path, profile: str) -> Tuple[bool, List[Dict[str, Any]
     issues = []
     max_build_time_seconds = 60
 
+    # Gate 13 records its build duration (from this run or the cached build
+    # of an identical site) in artifacts/hugo_build_result.json
+    build_result_path = run_dir / "artifacts" / HUGO_BUILD_RESULT_ARTIFACT
+    if build_result_path.exists():
+        try:
+            build_result = json.loads(build_result_path.read_text(encoding="utf-8"))
+            duration_seconds = build_result.get("duration_seconds")
+        except (OSError, json.JSONDecodeError) as e:
+            duration_seconds = None
+            issues.append(
+                {
+                    "issue_id": "build_time_check_error",
+                    "gate": "gate_p3_build_time_limit",
+                    "severity": "warn",
+                    "message": f"Error checking build time: {e}",
+                    "error_code": "GATE_BUILD_TIME_CHECK_ERROR",
+                    "status": "OPEN",
+                }
+            )
+        if duration_seconds is not None and duration_seconds > max_build_time_seconds:
+            issues.append(
+                {
+                    "issue_id": "build_time_limit_exceeded",
+                    "gate": "gate_p3_build_time_limit",
+                    "severity": "warn",
+                    "message": f"Hugo build time exceeded limit: {duration_seconds:.2f}s > {max_build_time_seconds}s",
+                    "error_code": "GATE_BUILD_TIME_LIMIT_EXCEEDED",
+                    "status": "OPEN",
+                }
+            )
+        return True, issues
+
     # Check if validation_report.json exists from a previous run
     # to extract build time information
     validation_report_path = run_dir / "artifacts" / "validation_report.json"
@@ -43,17 +80,17 @@ def execute_gate(run_dir: Path, profile: str) -> Tuple[bool, List[Dict[str, Any]
                 build_start_time = None
                 build_end_time = None
 
-                # Parse events to find HUGO_BUILD_STARTED and HUGO_BUILD_COMPLETED
-                with events_file.open(encoding="utf-8") as f:
-                    for line in f:
-                        try:
-                            event = json.loads(line.strip())
-                            if event.get("type") == "HUGO_BUILD_STARTED":
-                                build_start_time = event.get("ts")
-                            elif event.get("type") == "HUGO_BUILD_COMPLETED":
-                                build_end_time = event.get("ts")
-                        except json.JSONDecodeError:
-                            continue
+                # Stream only HUGO_BUILD_STARTED and HUGO_BUILD_COMPLETED events
+                for event in iter_events(
+                    events_file,
+                    types={"HUGO_BUILD_STARTED", "HUGO_BUILD_COMPLETED"},
+                    payload_keys=(),
+                    skip_invalid=True,
+                ):
+                    if event["type"] == "HUGO_BUILD_STARTED":
+                        build_start_time = event.get("ts")
+                    else:
+                        build_end_time = event.get("ts")
 
                 # Calculate build duration if both timestamps found
                 if build_start_time and build_end_time:
@@ -7,9 +7,56 @@ Per TC-571 requirements: Sensitive Data Leak (no API keys, passwords, secrets).
 
 from __future__ import annotations
 
-import re
 from pathlib import Path
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Set, Tuple
+
+from ....security.scan_engine import LineIndex, PatternSet
+
+# Patterns for sensitive data detection. Whitespace classes are restricted to
+# [^\S\n] so matches never span lines (markdown is checked line by line).
+SENSITIVE_PATTERNS = PatternSet(
+    [
+        (r'AKIA[0-9A-Z]{16}', "AWS_ACCESS_KEY", 1.0),
+        (r'(?i)aws_secret_access_key[^\S\n]*=[^\S\n]*["\']?[\w/+=]{40}["\']?', "AWS_SECRET_KEY", 1.0),
+        (r'(?i)api[_-]?key[^\S\n]*[=:][^\S\n]*["\']?[a-zA-Z0-9_\-]{32,}["\']?', "GENERIC_API_KEY", 1.0),
+        (r'sk-[a-zA-Z0-9]{48}', "OPENAI_KEY", 1.0),
+        (r'(?i)password[^\S\n]*[=:][^\S\n]*["\']?[^\s"\']{8,}["\']?', "PASSWORD", 1.0),
+        (r'-----BEGIN (RSA |EC )?PRIVATE KEY-----', "PRIVATE_KEY", 1.0),
+        (r'ghp_[a-zA-Z0-9]{36}', "GITHUB_TOKEN", 1.0),
+        (r'xox[baprs]-[a-zA-Z0-9-]{10,}', "SLACK_TOKEN", 1.0),
+        (r'(?i)bearer[^\S\n]+[a-zA-Z0-9_\-\.]{20,}', "BEARER_TOKEN", 1.0),
+        (r'(?i)authorization:[^\S\n]*basic[^\S\n]+[a-zA-Z0-9+/=]{20,}', "BASIC_AUTH", 1.0),
+    ]
+)
+
+
+def _code_block_lines(content: str) -> Set[int]:
+    """Return line numbers inside fenced code blocks, fence lines included."""
+    excluded: Set[int] = set()
+    in_code_block = False
+    for i, line in enumerate(content.split("\n"), start=1):
+        if line.strip().startswith("```"):
+            in_code_block = not in_code_block
+            excluded.add(i)
+        elif in_code_block:
+            excluded.add(i)
+    return excluded
+
+
+def _find_line_hits(content: str) -> List[Tuple[int, str]]:
+    """Return sorted (line_number, pattern_name) hits outside code blocks."""
+    if not SENSITIVE_PATTERNS.may_match(content):
+        return []
+
+    order = {p.name: idx for idx, p in enumerate(SENSITIVE_PATTERNS.patterns)}
+    line_index = LineIndex(content)
+    excluded = _code_block_lines(content) if "```" in content else set()
+    hits: Set[Tuple[int, str]] = set()
+    for pattern, match in SENSITIVE_PATTERNS.finditer(content):
+        line_num = line_index.line_of(match.start())
+        if line_num not in excluded:
+            hits.add((line_num, pattern.name))
+    return sorted(hits, key=lambda hit: (hit[0], order[hit[1]]))
 
 
 def execute_gate(run_dir: Path, profile: str) -> Tuple[bool, List[Dict[str, Any]]]:
@@ -38,53 +85,27 @@ def execute_gate(run_dir: Path, profile: str) -> Tuple[bool, List[Dict[str, Any]
 
     md_files = sorted(site_dir.rglob("*.md"))
 
-    # Patterns for sensitive data detection
-    patterns = {
-        "AWS_ACCESS_KEY": re.compile(r'AKIA[0-9A-Z]{16}'),
-        "AWS_SECRET_KEY": re.compile(r'aws_secret_access_key\s*=\s*["\']?[\w/+=]{40}["\']?', re.IGNORECASE),
-        "GENERIC_API_KEY": re.compile(r'api[_-]?key\s*[=:]\s*["\']?[a-zA-Z0-9_\-]{32,}["\']?', re.IGNORECASE),
-        "OPENAI_KEY": re.compile(r'sk-[a-zA-Z0-9]{48}'),
-        "PASSWORD": re.compile(r'password\s*[=:]\s*["\']?[^\s"\']{8,}["\']?', re.IGNORECASE),
-        "PRIVATE_KEY": re.compile(r'-----BEGIN (RSA |EC )?PRIVATE KEY-----'),
-        "GITHUB_TOKEN": re.compile(r'ghp_[a-zA-Z0-9]{36}'),
-        "SLACK_TOKEN": re.compile(r'xox[baprs]-[a-zA-Z0-9-]{10,}'),
-        "BEARER_TOKEN": re.compile(r'bearer\s+[a-zA-Z0-9_\-\.]{20,}', re.IGNORECASE),
-        "BASIC_AUTH": re.compile(r'authorization:\s*basic\s+[a-zA-Z0-9+/=]{20,}', re.IGNORECASE),
-    }
-
     for md_file in md_files:
         try:
             content = md_file.read_text(encoding="utf-8")
 
             # Skip code blocks for sensitive data checks (code examples might show patterns)
             lines = content.split("\n")
-            in_code_block = False
-            processed_lines = []
-
-            for i, line in enumerate(lines, start=1):
-                if line.strip().startswith("```"):
-                    in_code_block = not in_code_block
-                    continue
-                if not in_code_block:
-                    processed_lines.append((i, line))
-
-            # Check each pattern
-            for line_num, line in processed_lines:
-                for pattern_name, pattern in patterns.items():
-                    if pattern.search(line):
-                        # Redact the actual value in the message
-                        redacted_line = line[:50] + "..." if len(line) > 50 else line
-                        issues.append(
-                            {
-                                "issue_id": f"sensitive_data_{pattern_name.lower()}_{md_file.name}_{line_num}",
-                                "gate": "gate_s2_sensitive_data_leak",
-                                "severity": "blocker",
-                                "message": f"Potential {pattern_name} found in {md_file.name} at line {line_num}",
-                                "error_code": f"GATE_SENSITIVE_DATA_{pattern_name}",
-                                "location": {"path": str(md_file), "line": line_num},
-                                "status": "OPEN",
-                            }
-                        )
+            for line_num, pattern_name in _find_line_hits(content):
+                line = lines[line_num - 1]
+                # Redact the actual value in the message
+                redacted_line = line[:50] + "..." if len(line) > 50 else line
+                issues.append(
+                    {
+                        "issue_id": f"sensitive_data_{pattern_name.lower()}_{md_file.name}_{line_num}",
+                        "gate": "gate_s2_sensitive_data_leak",
+                        "severity": "blocker",
+                        "message": f"Potential {pattern_name} found in {md_file.name} at line {line_num}",
+                        "error_code": f"GATE_SENSITIVE_DATA_{pattern_name}",
+                        "location": {"path": str(md_file), "line": line_num},
+                        "status": "OPEN",
+                    }
+                )
 
         except Exception as e:
             issues.append(
@@ -109,19 +130,18 @@ def execute_gate(run_dir: Path, profile: str) -> Tuple[bool, List[Dict[str, Any]
             try:
                 content = artifact_file.read_text(encoding="utf-8")
 
-                for pattern_name, pattern in patterns.items():
-                    if pattern.search(content):
-                        issues.append(
-                            {
-                                "issue_id": f"sensitive_data_{pattern_name.lower()}_{artifact_file.name}",
-                                "gate": "gate_s2_sensitive_data_leak",
-                                "severity": "blocker",
-                                "message": f"Potential {pattern_name} found in artifact {artifact_file.name}",
-                                "error_code": f"GATE_SENSITIVE_DATA_{pattern_name}",
-                                "location": {"path": str(artifact_file)},
-                                "status": "OPEN",
-                            }
-                        )
+                for pattern_name in SENSITIVE_PATTERNS.matching_names(content):
+                    issues.append(
+                        {
+                            "issue_id": f"sensitive_data_{pattern_name.lower()}_{artifact_file.name}",
+                            "gate": "gate_s2_sensitive_data_leak",
+                            "severity": "blocker",
+                            "message": f"Potential {pattern_name} found in artifact {artifact_file.name}",
+                            "error_code": f"GATE_SENSITIVE_DATA_{pattern_name}",
+                            "location": {"path": str(artifact_file)},
+                            "status": "OPEN",
+                        }
+                    )
 
             except Exception:
                 pass  # Skip files that cannot be read
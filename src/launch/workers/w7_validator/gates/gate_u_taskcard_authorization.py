@@ -128,32 +128,14 @@ def execute_gate(run_dir: Path, profile: str) -> Tuple[bool, List[Dict[str, Any]
     if not taskcard_id:
         return True, []
 
-    # Load taskcard to get allowed_paths
+    # Load taskcard policy (parsed once per taskcard file version, shared
+    # with the Layer 3 write fence)
     repo_root = run_dir.parent.parent
-    try:
-        from launch.util.taskcard_loader import get_allowed_paths, load_taskcard
-        from launch.util.taskcard_validation import validate_taskcard_active
-
-        taskcard = load_taskcard(taskcard_id, repo_root)
-
-        # Validate taskcard is active
-        try:
-            validate_taskcard_active(taskcard)
-        except Exception as e:
-            issues.append(
-                {
-                    "issue_id": f"gate_u_taskcard_inactive_{taskcard_id}",
-                    "gate": "gate_u_taskcard_authorization",
-                    "severity": "blocker",
-                    "message": f"Taskcard {taskcard_id} is not active: {e}",
-                    "error_code": "GATE_U_TASKCARD_INACTIVE",
-                    "status": "OPEN",
-                }
-            )
-            return False, issues
-
-        allowed_paths = get_allowed_paths(taskcard)
+    from launch.util.taskcard_validation import validate_taskcard_active
+    from launch.util.write_fence import load_taskcard_policy
 
+    try:
+        policy = load_taskcard_policy(taskcard_id, repo_root)
     except Exception as e:
         issues.append(
             {
@@ -167,13 +149,29 @@ def execute_gate(run_dir: Path, profile: str) -> Tuple[bool, List[Dict[str, Any]
         )
         return False, issues
 
+    # Validate taskcard is active
+    try:
+        validate_taskcard_active(policy.taskcard)
+    except Exception as e:
+        issues.append(
+            {
+                "issue_id": f"gate_u_taskcard_inactive_{taskcard_id}",
+                "gate": "gate_u_taskcard_authorization",
+                "severity": "blocker",
+                "message": f"Taskcard {taskcard_id} is not active: {e}",
+                "error_code": "GATE_U_TASKCARD_INACTIVE",
+                "status": "OPEN",
+            }
+        )
+        return False, issues
+
+    allowed_paths = list(policy.allowed_paths)
+
     # Get modified files from git
     site_dir = run_dir / "work" / "site"
     modified_files = get_modified_files_git(site_dir)
 
-    # Validate each modified file against allowed_paths
-    from launch.util.path_validation import validate_path_matches_patterns
-
+    # Validate each modified file against the compiled allowed_paths
     for modified_file in modified_files:
         try:
             # Make path relative to repo_root for matching
@@ -183,9 +181,7 @@ def execute_gate(run_dir: Path, profile: str) -> Tuple[bool, List[Dict[str, Any]
             continue
 
         # Check if file matches allowed patterns
-        if not validate_path_matches_patterns(
-            relative_path, allowed_paths, repo_root=repo_root
-        ):
+        if not policy.matcher.matches(relative_path):
             issues.append(
                 {
                     "issue_id": f"gate_u_path_violation_{relative_path.as_posix().replace('/', '_')}",
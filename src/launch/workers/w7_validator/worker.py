@@ -99,7 +99,8 @@ def emit_event(
 def load_json_artifact(run_dir: Path, artifact_name: str) -> Dict[str, Any]:
     """Load JSON artifact from RUN_DIR/artifacts/.
 
-    TC-1033: Delegates to ArtifactStore.load_artifact for centralized I/O.
+    TC-1033: Delegates to ArtifactStore for centralized I/O. Returns a shared
+    read-only view (see io/artifact_cache.py).
 
     Args:
         run_dir: Run directory path
@@ -113,7 +114,7 @@ def load_json_artifact(run_dir: Path, artifact_name: str) -> Dict[str, Any]:
     """
     store = ArtifactStore(run_dir=run_dir)
     try:
-        return store.load_artifact(artifact_name, validate_schema=False)
+        return store.load_artifact_view(artifact_name, validate_schema=False)
     except FileNotFoundError:
         raise ValidatorArtifactMissingError(
             f"Required artifact not found: {artifact_name}"
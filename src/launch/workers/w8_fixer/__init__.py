@@ -4,6 +4,7 @@ This module implements TC-470: Issue resolution per specs/28_coordination_and_ha
 
 Main entry point:
 - execute_fixer: Apply minimal fix to resolve exactly one validation issue
+  (or, with FIX_BATCH_MODE_KEY set in run_config, a batch of independent issues)
 
 Exception hierarchy:
 - FixerError: Base exception
@@ -21,6 +22,7 @@ Spec references:
 """
 
 from .worker import (
+    FIX_BATCH_MODE_KEY,
     FixerError,
     FixerIssueNotFoundError,
     FixerUnfixableError,
@@ -31,6 +33,7 @@ from .worker import (
 
 __all__ = [
     "execute_fixer",
+    "FIX_BATCH_MODE_KEY",
     "FixerError",
     "FixerIssueNotFoundError",
     "FixerUnfixableError",
@@ -4,6 +4,7 @@ This module implements TC-470: Issue resolution per specs/28_coordination_and_ha
 
 Main entry point:
 - execute_fixer: Apply minimal fix to resolve exactly one validation issue
+  (or, in opt-in batch mode, a batch of independent issues)
 
 Exception hierarchy:
 - FixerError: Base exception
@@ -103,7 +104,8 @@ def emit_event(
 def load_json_artifact(run_dir: Path, artifact_name: str) -> Dict[str, Any]:
     """Load JSON artifact from RUN_DIR/artifacts/.
 
-    TC-1033: Delegates to ArtifactStore.load_artifact for centralized I/O.
+    TC-1033: Delegates to ArtifactStore for centralized I/O. Returns a shared
+    read-only view (see io/artifact_cache.py).
 
     Args:
         run_dir: Run directory path
@@ -117,7 +119,7 @@ def load_json_artifact(run_dir: Path, artifact_name: str) -> Dict[str, Any]:
     """
     store = ArtifactStore(run_dir=run_dir)
     try:
-        return store.load_artifact(artifact_name, validate_schema=False)
+        return store.load_artifact_view(artifact_name, validate_schema=False)
     except FileNotFoundError:
         raise FixerArtifactMissingError(
             f"Required artifact not found: {artifact_name}"
@@ -176,6 +178,18 @@ def compute_file_hash(file_path: Path) -> str:
     return hashlib.sha256(content).hexdigest()
 
 
+def _issue_sort_key(issue: Dict[str, Any]) -> Tuple:
+    """Deterministic fix order: severity rank, gate, path, line, issue_id."""
+    severity_rank = {"blocker": 0, "error": 1, "warn": 2, "info": 3}
+    rank = severity_rank.get(issue.get("severity", "info"), 3)
+    gate = issue.get("gate", "")
+    location = issue.get("location", {})
+    path = location.get("path", "") if isinstance(location, dict) else ""
+    line = location.get("line", 0) if isinstance(location, dict) else 0
+    issue_id = issue.get("issue_id", "")
+    return (rank, gate, path, line, issue_id)
+
+
 def select_issue_to_fix(
     validation_report: Dict[str, Any], current_issue: Optional[Dict[str, Any]] = None
 ) -> Optional[Dict[str, Any]]:
@@ -219,21 +233,111 @@ def select_issue_to_fix(
         return None
 
     # Sort by severity rank, gate, location
-    severity_rank = {"blocker": 0, "error": 1, "warn": 2, "info": 3}
+    sorted_issues = sorted(fixable_issues, key=_issue_sort_key)
+
+    # Return first issue
+    return sorted_issues[0] if sorted_issues else None
+
+
+# run_config key enabling batch fix mode (opt-in; default is one issue per pass)
+FIX_BATCH_MODE_KEY = "fix_batch_mode"
+
+# Upper bound on issues fixed in one batch pass
+MAX_BATCH_ISSUES = 100
+
+# Region of a page each batchable fix rewrites, by error_code routing. Line
+# fixes run before frontmatter fixes in a batch, since frontmatter rewrites
+# shift the line numbers the line fixes were reported against.
+_FIX_REGION_LINE = "line"
+_FIX_REGION_FRONTMATTER = "frontmatter"
+
+
+def fix_region(issue: Dict[str, Any]) -> Optional[str]:
+    """Return the page region an issue's fix rewrites, or None if not batchable.
+
+    Args:
+        issue: Issue dict
+
+    Returns:
+        "line" (unresolved token), "frontmatter" (missing/invalid frontmatter,
+        consistency mismatch), or None
+    """
+    error_code = issue.get("error_code", "")
+    if "TEMPLATE_TOKEN" in error_code:
+        return _FIX_REGION_LINE
+    if error_code in ("GATE_FRONTMATTER_MISSING", "GATE_FRONTMATTER_INVALID_YAML") or "CONSISTENCY" in error_code:
+        return _FIX_REGION_FRONTMATTER
+    return None
+
+
+def select_issue_batch(
+    validation_report: Dict[str, Any], current_issue: Optional[Dict[str, Any]] = None
+) -> List[Dict[str, Any]]:
+    """Select a batch of independent issues to fix in one pass.
+
+    The first issue is the one select_issue_to_fix picks. Further fixable
+    issues (in the same deterministic order) join the batch when their fix is
+    batchable (see fix_region) and independent of every issue already in it:
+    on a different file, or on the same file but rewriting a different region.
+    At most one line fix joins per file, since removing a line shifts the
+    ones below it. Issues without a file path never join.
+
+    The batch is returned in selection order (apply it in
+    batch_application_order).
+
+    Args:
+        validation_report: Validation report dict
+        current_issue: Optional specific issue to lead the batch
+
+    Returns:
+        Issues to fix (empty if no fixable issues)
+
+    Raises:
+        FixerIssueNotFoundError: If current_issue provided but not found
+    """
+    first = select_issue_to_fix(validation_report, current_issue)
+    if first is None:
+        return []
+
+    candidates = sorted(
+        (
+            issue
+            for issue in validation_report.get("issues", [])
+            if issue.get("status") == "OPEN"
+            and issue.get("severity") in ["blocker", "error"]
+            and issue.get("issue_id") != first.get("issue_id")
+        ),
+        key=_issue_sort_key,
+    )
 
-    def sort_key(issue: Dict[str, Any]) -> Tuple:
-        rank = severity_rank.get(issue.get("severity", "info"), 3)
-        gate = issue.get("gate", "")
+    def claim(issue: Dict[str, Any]) -> Optional[Tuple[str, Optional[str]]]:
         location = issue.get("location", {})
         path = location.get("path", "") if isinstance(location, dict) else ""
-        line = location.get("line", 0) if isinstance(location, dict) else 0
-        issue_id = issue.get("issue_id", "")
-        return (rank, gate, path, line, issue_id)
+        return (path, fix_region(issue)) if path else None
 
-    sorted_issues = sorted(fixable_issues, key=sort_key)
+    batch = [first]
+    # (path, region) pairs already rewritten; an unbatchable lead claims its whole file
+    claimed = set()
+    first_claim = claim(first)
+    if first_claim is not None:
+        regions = [first_claim[1]] if first_claim[1] else [_FIX_REGION_LINE, _FIX_REGION_FRONTMATTER]
+        claimed.update((first_claim[0], region) for region in regions)
 
-    # Return first issue
-    return sorted_issues[0] if sorted_issues else None
+    for issue in candidates:
+        if len(batch) >= MAX_BATCH_ISSUES:
+            break
+        issue_claim = claim(issue)
+        if issue_claim is None or issue_claim[1] is None or issue_claim in claimed:
+            continue
+        claimed.add(issue_claim)
+        batch.append(issue)
+
+    return batch
+
+
+def batch_application_order(issues: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Order a batch for applying: line fixes first, otherwise selection order."""
+    return sorted(issues, key=lambda issue: fix_region(issue) == _FIX_REGION_FRONTMATTER)
 
 
 def fix_unresolved_token(
@@ -545,6 +649,128 @@ def check_fix_produced_diff(
     return False
 
 
+def _snapshot_hashes(issue: Dict[str, Any]) -> Dict[str, str]:
+    """Hash the files an issue may touch, before fixing it."""
+    files_to_check = list(issue.get("files", []))
+    location = issue.get("location", {})
+    if isinstance(location, dict) and "path" in location:
+        files_to_check.append(location["path"])
+
+    original_hashes = {}
+    for file_path_str in files_to_check:
+        file_path = Path(file_path_str)
+        original_hashes[str(file_path)] = compute_file_hash(file_path)
+    return original_hashes
+
+
+def _fix_issue(
+    issue: Dict[str, Any],
+    run_dir: Path,
+    llm_client: Any,
+    trace_id: str,
+    span_id: str,
+) -> Dict[str, Any]:
+    """Fix one issue, emitting its ISSUE_RESOLVED or ISSUE_FIX_FAILED event.
+
+    Returns:
+        Per-issue result with status "resolved", "unfixable" or "no_diff"
+    """
+    issue_id = issue.get("issue_id", "unknown")
+    original_hashes = _snapshot_hashes(issue)
+
+    # Apply fix
+    try:
+        fix_result = apply_fix(issue, run_dir, llm_client)
+    except FixerUnfixableError as e:
+        fix_result = {"fixed": False, "error": str(e)}
+
+    if not fix_result.get("fixed", False):
+        # Fix failed
+        error_msg = fix_result.get("error", "Unknown error")
+        emit_event(
+            run_dir,
+            "ISSUE_FIX_FAILED",
+            {"issue_id": issue_id, "reason": error_msg},
+            trace_id,
+            span_id,
+        )
+        return {
+            "status": "unfixable",
+            "issue_id": issue_id,
+            "files_changed": [],
+            "diff_summary": "",
+            "error_message": error_msg,
+        }
+
+    # Check if fix produced actual diff
+    files_changed = fix_result.get("files_changed", [])
+    if not check_fix_produced_diff(files_changed, run_dir, original_hashes):
+        # Fix produced no diff - this is a blocker per spec
+        emit_event(
+            run_dir,
+            "ISSUE_FIX_FAILED",
+            {"issue_id": issue_id, "reason": "Fix produced no diff"},
+            trace_id,
+            span_id,
+        )
+        return {
+            "status": "no_diff",
+            "issue_id": issue_id,
+            "files_changed": [],
+            "diff_summary": "",
+            "error_message": f"Fix for issue {issue_id} produced no diff",
+        }
+
+    # Emit ISSUE_RESOLVED event
+    emit_event(
+        run_dir,
+        "ISSUE_RESOLVED",
+        {
+            "issue_id": issue_id,
+            "files_changed": files_changed,
+            "diff_summary": fix_result.get("diff_summary", ""),
+        },
+        trace_id,
+        span_id,
+    )
+    return {
+        "status": "resolved",
+        "issue_id": issue_id,
+        "files_changed": files_changed,
+        "diff_summary": fix_result.get("diff_summary", ""),
+    }
+
+
+def _write_fix_report(run_dir: Path, issue: Dict[str, Any], result: Dict[str, Any]) -> None:
+    """Write reports/fix_<issue_id>.md for a resolved issue."""
+    issue_id = result["issue_id"]
+    files_changed = result["files_changed"]
+    reports_dir = run_dir / "reports"
+    reports_dir.mkdir(parents=True, exist_ok=True)
+    fix_report_path = reports_dir / f"fix_{issue_id}.md"
+
+    fix_report_content = f"""# Fix Report: {issue_id}
+
+## Issue Details
+- **Issue ID**: {issue_id}
+- **Gate**: {issue.get("gate", "unknown")}
+- **Severity**: {issue.get("severity", "unknown")}
+- **Error Code**: {issue.get("error_code", "unknown")}
+- **Message**: {issue.get("message", "unknown")}
+
+## Fix Applied
+{result["diff_summary"] or "No summary available"}
+
+## Files Changed
+{chr(10).join(f"- {f}" for f in files_changed)}
+
+## Status
+Resolved successfully.
+"""
+
+    fix_report_path.write_text(fix_report_content, encoding="utf-8")
+
+
 def execute_fixer(
     run_dir: Path,
     run_config: Dict[str, Any],
@@ -562,10 +788,16 @@ def execute_fixer(
     - Fail with blocker FixNoOp if cannot produce meaningful diff
 
     Per specs/28_coordination_and_handoffs.md:71-84:
-    - Single-issue-at-a-time fixing (no batch fixes)
+    - Single-issue-at-a-time fixing, unless run_config["fix_batch_mode"]
+      opts into batch fixing of independent issues (see select_issue_batch)
     - Deterministic fix selection
     - Max fix attempts enforcement
 
+    In batch mode every issue in the batch gets its own ISSUE_RESOLVED or
+    ISSUE_FIX_FAILED event and fix report; the pass is "resolved" if any
+    issue was, and FixerNoOpError is raised only when nothing was resolved
+    and the lead issue produced no diff.
+
     Args:
         run_dir: Run directory path (e.g., runs/run_001)
         run_config: Run configuration dictionary
@@ -575,10 +807,11 @@ def execute_fixer(
     Returns:
         Fix result dictionary with:
             - status: "resolved" | "needs_retry" | "unfixable"
-            - issue_id: ID of issue that was fixed
+            - issue_id: ID of issue that was fixed (the lead issue in batch mode)
             - files_changed: List of changed file paths
             - diff_summary: Summary of changes made
             - error_message: Error message if unfixable
+            - issues: Per-issue results (batch mode only)
 
     Raises:
         FixerError: On fixer errors
@@ -589,6 +822,7 @@ def execute_fixer(
     # Generate trace IDs
     trace_id = str(uuid.uuid4())
     span_id = str(uuid.uuid4())
+    batch_mode = bool(run_config.get(FIX_BATCH_MODE_KEY, False))
 
     # Load validation report
     try:
@@ -603,10 +837,14 @@ def execute_fixer(
         )
         raise
 
-    # Select issue to fix
-    issue = select_issue_to_fix(validation_report, current_issue)
+    # Select issue(s) to fix
+    if batch_mode:
+        issues = select_issue_batch(validation_report, current_issue)
+    else:
+        issue = select_issue_to_fix(validation_report, current_issue)
+        issues = [issue] if issue is not None else []
 
-    if issue is None:
+    if not issues:
         # No fixable issues
         emit_event(
             run_dir,
@@ -622,135 +860,63 @@ def execute_fixer(
             "diff_summary": "No issues to fix",
         }
 
-    issue_id = issue.get("issue_id", "unknown")
+    lead = issues[0]
+    issue_id = lead.get("issue_id", "unknown")
 
     # Emit FIXER_STARTED event
-    emit_event(
-        run_dir,
-        "FIXER_STARTED",
-        {"issue_id": issue_id, "gate": issue.get("gate"), "severity": issue.get("severity")},
-        trace_id,
-        span_id,
-    )
-
-    # Compute hashes of files before fixing
-    files_to_check = issue.get("files", [])
-    location = issue.get("location", {})
-    if isinstance(location, dict) and "path" in location:
-        files_to_check.append(location["path"])
-
-    original_hashes = {}
-    for file_path_str in files_to_check:
-        file_path = Path(file_path_str)
-        original_hashes[str(file_path)] = compute_file_hash(file_path)
-
-    # Apply fix
-    try:
-        fix_result = apply_fix(issue, run_dir, llm_client)
-    except FixerUnfixableError as e:
-        emit_event(
-            run_dir,
-            "ISSUE_FIX_FAILED",
-            {"issue_id": issue_id, "reason": str(e)},
-            trace_id,
-            span_id,
-        )
-        return {
-            "status": "unfixable",
-            "issue_id": issue_id,
-            "files_changed": [],
-            "diff_summary": "",
-            "error_message": str(e),
-        }
+    started = {"issue_id": issue_id, "gate": lead.get("gate"), "severity": lead.get("severity")}
+    if batch_mode:
+        started["issue_ids"] = [i.get("issue_id", "unknown") for i in issues]
+    emit_event(run_dir, "FIXER_STARTED", started, trace_id, span_id)
+
+    results = [
+        _fix_issue(i, run_dir, llm_client, trace_id, span_id)
+        for i in batch_application_order(issues)
+    ]
+    resolved = [r for r in results if r["status"] == "resolved"]
+    lead_result = next(r for r in results if r["issue_id"] == issue_id)
 
-    if not fix_result.get("fixed", False):
-        # Fix failed
-        error_msg = fix_result.get("error", "Unknown error")
-        emit_event(
-            run_dir,
-            "ISSUE_FIX_FAILED",
-            {"issue_id": issue_id, "reason": error_msg},
-            trace_id,
-            span_id,
-        )
-        return {
+    if not resolved:
+        if lead_result["status"] == "no_diff":
+            raise FixerNoOpError(lead_result["error_message"])
+        failed = {
             "status": "unfixable",
             "issue_id": issue_id,
             "files_changed": [],
             "diff_summary": "",
-            "error_message": error_msg,
+            "error_message": lead_result["error_message"],
         }
+        if batch_mode:
+            failed["issues"] = results
+        return failed
 
-    # Check if fix produced actual diff
-    files_changed = fix_result.get("files_changed", [])
-    has_diff = check_fix_produced_diff(files_changed, run_dir, original_hashes)
-
-    if not has_diff:
-        # Fix produced no diff - this is a blocker per spec
-        emit_event(
-            run_dir,
-            "ISSUE_FIX_FAILED",
-            {"issue_id": issue_id, "reason": "Fix produced no diff"},
-            trace_id,
-            span_id,
-        )
-        raise FixerNoOpError(f"Fix for issue {issue_id} produced no diff")
-
-    # Emit ISSUE_RESOLVED event
-    emit_event(
-        run_dir,
-        "ISSUE_RESOLVED",
-        {
-            "issue_id": issue_id,
-            "files_changed": files_changed,
-            "diff_summary": fix_result.get("diff_summary", ""),
-        },
-        trace_id,
-        span_id,
-    )
+    if batch_mode:
+        files_changed = sorted({f for r in resolved for f in r["files_changed"]})
+    else:
+        files_changed = resolved[0]["files_changed"]
 
     # Emit FIXER_COMPLETED event
-    emit_event(
-        run_dir,
-        "FIXER_COMPLETED",
-        {
-            "issue_id": issue_id,
-            "status": "resolved",
-            "files_changed_count": len(files_changed),
-        },
-        trace_id,
-        span_id,
-    )
-
-    # Write fix report (optional)
-    reports_dir = run_dir / "reports"
-    reports_dir.mkdir(parents=True, exist_ok=True)
-    fix_report_path = reports_dir / f"fix_{issue_id}.md"
-
-    fix_report_content = f"""# Fix Report: {issue_id}
-
-## Issue Details
-- **Issue ID**: {issue_id}
-- **Gate**: {issue.get("gate", "unknown")}
-- **Severity**: {issue.get("severity", "unknown")}
-- **Error Code**: {issue.get("error_code", "unknown")}
-- **Message**: {issue.get("message", "unknown")}
-
-## Fix Applied
-{fix_result.get("diff_summary", "No summary available")}
-
-## Files Changed
-{chr(10).join(f"- {f}" for f in files_changed)}
-
-## Status
-Resolved successfully.
-"""
+    completed = {
+        "issue_id": issue_id,
+        "status": "resolved",
+        "files_changed_count": len(files_changed),
+    }
+    if batch_mode:
+        completed["resolved_count"] = len(resolved)
+        completed["failed_count"] = len(results) - len(resolved)
+    emit_event(run_dir, "FIXER_COMPLETED", completed, trace_id, span_id)
 
-    fix_report_path.write_text(fix_report_content, encoding="utf-8")
+    # Write fix reports (optional)
+    issues_by_id = {i.get("issue_id", "unknown"): i for i in issues}
+    for result in resolved:
+        _write_fix_report(run_dir, issues_by_id[result["issue_id"]], result)
 
-    return {
+    fix_result = {
         "status": "resolved",
         "issue_id": issue_id,
         "files_changed": files_changed,
-        "diff_summary": fix_result.get("diff_summary", ""),
+        "diff_summary": "; ".join(r["diff_summary"] for r in resolved if r["diff_summary"]),
     }
+    if batch_mode:
+        fix_result["issues"] = results
+    return fix_result
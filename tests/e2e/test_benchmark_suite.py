@@ -0,0 +1,74 @@
+"""E2E tests for the synthetic-repo benchmark suite.
+
+Tests verify:
+- The generator honours the configured sizes
+- Every benchmark runs against the tiny preset and reports throughput
+- Baseline comparison flags throughput regressions
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add scripts to path
+repo_root = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(repo_root / "scripts"))
+
+from benchmark_suite import (
+    BENCHMARKS,
+    SIZE_PRESETS,
+    SyntheticSizes,
+    compare_to_baseline,
+    generate_synthetic_repo,
+    run_benchmarks,
+)
+
+
+def test_generator_honours_sizes(tmp_path: Path):
+    sizes = SyntheticSizes(files=30, docs=4, examples=5, claims=20)
+    counts = generate_synthetic_repo(tmp_path, sizes)
+
+    files = [p for p in tmp_path.rglob("*") if p.is_file()]
+    assert len(files) == 30
+    assert counts["docs"] == 4 and counts["examples"] == 5
+    assert len(list((tmp_path / "examples").glob("*.py"))) == 5
+    text = "".join(p.read_text(encoding="utf-8") for p in [tmp_path / "README.md", *(tmp_path / "docs").glob("*.md")])
+    assert text.count("Synthlib") >= 10
+
+
+def test_all_benchmarks_run_on_tiny_preset(tmp_path: Path):
+    results = run_benchmarks(tmp_path, SIZE_PRESETS["tiny"], repeat=1)
+
+    assert list(results["benchmarks"]) == [b.name for b in BENCHMARKS]
+    for name, bench in results["benchmarks"].items():
+        assert bench["items"] > 0, name
+        assert bench["throughput"] > 0, name
+        assert len(bench["runs"]) == 1
+
+
+def test_only_runs_prerequisites_untimed(tmp_path: Path):
+    results = run_benchmarks(tmp_path, SIZE_PRESETS["tiny"], repeat=2, only=["w2_map"])
+
+    assert list(results["benchmarks"]) == ["w2_map"]
+    assert len(results["benchmarks"]["w2_map"]["runs"]) == 2
+
+    with pytest.raises(ValueError, match="Unknown benchmarks"):
+        run_benchmarks(tmp_path / "other", SIZE_PRESETS["tiny"], only=["w99"])
+
+
+def test_baseline_comparison_flags_regressions():
+    sizes = {"files": 1}
+    baseline = {"sizes": sizes, "benchmarks": {"a": {"throughput": 100.0}, "b": {"throughput": 100.0}}}
+    results = {
+        "sizes": sizes,
+        "benchmarks": {"a": {"throughput": 90.0}, "b": {"throughput": 70.0}, "new": {"throughput": 1.0}},
+    }
+
+    comparisons = {c["name"]: c for c in compare_to_baseline(results, baseline, tolerance=0.15)}
+
+    assert set(comparisons) == {"a", "b"}
+    assert comparisons["a"]["regressed"] is False
+    assert comparisons["b"]["regressed"] is True
+    with pytest.raises(ValueError, match="sizes"):
+        compare_to_baseline({**results, "sizes": {"files": 2}}, baseline, tolerance=0.15)
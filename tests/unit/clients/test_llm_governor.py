@@ -0,0 +1,227 @@
+"""Tests for the process-wide LLM governor.
+
+Test coverage:
+- Priority lane ordering and the in-flight bound
+- Token-rate limiting
+- Retry classification (permanent failures raise at once)
+- End-to-end 429 handling against a local provider stub
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+from launch.clients.llm_governor import (
+    LANE_DRAFTING,
+    LANE_EXTRACTION,
+    LANE_REVIEW,
+    GovernorConfig,
+    LLMGovernor,
+    TokenBucket,
+    reset_llm_governor,
+)
+from launch.clients.llm_provider import LLMError, LLMHTTPError, LLMProviderClient
+
+
+@pytest.fixture(autouse=True)
+def _fresh_governor():
+    reset_llm_governor(GovernorConfig())
+    yield
+    reset_llm_governor(GovernorConfig())
+
+
+class TestAdmission:
+    def test_lanes_admitted_in_priority_order(self):
+        governor = LLMGovernor(GovernorConfig(max_in_flight=1))
+        blocker = governor.acquire(LANE_REVIEW)
+        order = []
+
+        def worker(lane):
+            permit = governor.acquire(lane)
+            order.append(lane)
+            governor.release(permit)
+
+        threads = []
+        for lane in (LANE_REVIEW, LANE_EXTRACTION, LANE_DRAFTING):
+            t = threading.Thread(target=worker, args=(lane,))
+            t.start()
+            threads.append(t)
+            # Let each thread queue before the next one
+            while len(governor._waiters) < len(threads):
+                time.sleep(0.001)
+
+        governor.release(blocker)
+        for t in threads:
+            t.join(timeout=5)
+
+        assert order == [LANE_DRAFTING, LANE_EXTRACTION, LANE_REVIEW]
+
+    def test_split_divides_limits_between_processes(self):
+        share = GovernorConfig(requests_per_minute=60, tokens_per_minute=9000, max_in_flight=4).split(3)
+        assert (share.requests_per_minute, share.tokens_per_minute, share.max_in_flight) == (20, 3000, 1)
+        assert GovernorConfig().split(4).requests_per_minute == 0  # unlimited stays unlimited
+
+    def test_in_flight_bound(self):
+        governor = LLMGovernor(GovernorConfig(max_in_flight=2))
+        barrier = threading.Barrier(6)
+
+        def call():
+            barrier.wait()
+            governor.call(lambda: time.sleep(0.01))
+
+        threads = [threading.Thread(target=call) for _ in range(6)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join(timeout=5)
+
+        metrics = governor.metrics()
+        assert metrics["admitted"] == 6
+        assert metrics["max_in_flight_observed"] == 2
+        assert metrics["in_flight"] == 0
+
+    def test_token_bucket_wait(self):
+        bucket = TokenBucket(rate_per_minute=600, now=0.0)
+
+        assert bucket.wait_time(600, now=0.0) == 0
+        bucket.take(600, now=0.0)
+        assert bucket.wait_time(100, now=0.0) == pytest.approx(10.0)
+        assert bucket.wait_time(100, now=10.0) == 0
+
+        bucket.adjust(-50)  # refund unused estimate
+        assert bucket.tokens == pytest.approx(150)
+
+    def test_tokens_per_minute_throttles(self):
+        # 60k TPM = 1000 tokens/s; the second call must wait ~0.1s
+        governor = LLMGovernor(GovernorConfig(tokens_per_minute=60_000))
+        governor.call(lambda: None, estimated_tokens=60_000)
+
+        started = time.monotonic()
+        _, permit = governor.call(lambda: None, estimated_tokens=100)
+
+        assert time.monotonic() - started >= 0.09
+        assert permit.wait_ms >= 90
+
+
+class TestRetries:
+    def test_permanent_failure_raises_immediately(self):
+        governor = LLMGovernor(GovernorConfig(max_retries=3, base_delay_seconds=0.01))
+        calls = []
+
+        def fail():
+            calls.append(1)
+            raise ValueError("bad request payload")
+
+        with pytest.raises(ValueError):
+            governor.call(fail)
+
+        assert len(calls) == 1
+        assert governor.metrics()["failed"] == 1
+
+    def test_rate_limit_retried_until_budget_exhausted(self):
+        governor = LLMGovernor(GovernorConfig(max_retries=2, base_delay_seconds=0.01))
+        calls = []
+
+        def throttled():
+            calls.append(1)
+            raise LLMHTTPError(429, "slow down", retry_after=0)
+
+        with pytest.raises(LLMHTTPError):
+            governor.call(throttled)
+
+        assert len(calls) == 3
+        assert governor.metrics()["rate_limited"] == 2
+
+
+class _ProviderStub(BaseHTTPRequestHandler):
+    """Returns 429 for the first `throttle` requests, then a completion."""
+
+    throttle = 0
+    requests = 0
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        cls = type(self)
+        cls.requests += 1
+        if cls.requests <= cls.throttle:
+            self.send_response(429)
+            self.send_header("Retry-After", "0")
+            self.end_headers()
+            self.wfile.write(b"rate limited")
+            return
+        body = json.dumps(
+            {
+                "choices": [{"message": {"content": "ok"}, "finish_reason": "stop"}],
+                "usage": {"prompt_tokens": 4, "completion_tokens": 6, "total_tokens": 10},
+            }
+        ).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def provider_stub():
+    handler = type("Stub", (_ProviderStub,), {"throttle": 2, "requests": 0})
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server, handler
+    server.shutdown()
+    server.server_close()
+
+
+class TestProviderIntegration:
+    def test_429_is_absorbed_and_recorded(self, provider_stub, tmp_path: Path):
+        server, handler = provider_stub
+        governor = reset_llm_governor(GovernorConfig(max_retries=3, base_delay_seconds=0.01))
+        client = LLMProviderClient(
+            api_base_url=f"http://127.0.0.1:{server.server_address[1]}",
+            model="m",
+            run_dir=tmp_path,
+            telemetry_run_id="r",
+        )
+
+        result = client.chat_completion(
+            [{"role": "user", "content": "hi"}], call_id="c1", priority=LANE_EXTRACTION
+        )
+
+        assert result["content"] == "ok"
+        assert handler.requests == 3
+        assert governor.metrics()["rate_limited"] == 2
+
+        events = [
+            json.loads(line)
+            for line in (tmp_path / "events.ndjson").read_text(encoding="utf-8").splitlines()
+        ]
+        finished = [e for e in events if e["type"] == "LLM_CALL_FINISHED"]
+        assert finished[0]["payload"]["governor"] == {
+            "lane": LANE_EXTRACTION,
+            "attempts": 3,
+            "wait_ms": finished[0]["payload"]["governor"]["wait_ms"],
+            "rate_limited": 2,
+        }
+
+    def test_exhausted_retries_raise_llm_error(self, provider_stub, tmp_path: Path):
+        server, handler = provider_stub
+        reset_llm_governor(GovernorConfig(max_retries=1, base_delay_seconds=0.01))
+        client = LLMProviderClient(
+            api_base_url=f"http://127.0.0.1:{server.server_address[1]}",
+            model="m",
+            run_dir=tmp_path,
+        )
+
+        with pytest.raises(LLMError, match="429"):
+            client.chat_completion([{"role": "user", "content": "hi"}], call_id="c2")
+        assert handler.requests == 2
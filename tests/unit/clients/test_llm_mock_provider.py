@@ -14,6 +14,7 @@ from pathlib import Path
 import pytest
 
 from launch.clients.llm_mock_provider import MockLLMProvider
+from launch.io.llm_evidence_store import LLMEvidenceReader
 
 
 def test_mock_llm_deterministic_responses():
@@ -87,12 +88,12 @@ def test_mock_llm_evidence_capture():
 
         response = provider.chat_completion(messages, call_id="test_evidence")
 
-        # Check evidence file exists
-        evidence_path = Path(response["evidence_path"])
-        assert evidence_path.exists()
+        # Check evidence was recorded
+        reader = LLMEvidenceReader.for_run(run_dir)
+        assert "test_evidence" in reader
 
         # Check evidence structure
-        evidence = json.loads(evidence_path.read_text())
+        evidence = reader.resolve(response["evidence_path"])
 
         assert evidence["call_id"] == "test_evidence"
         assert evidence["model"] == "mock-llm-v1"
@@ -18,6 +18,7 @@ import pytest
 
 from launch.clients.llm_provider import LLMProviderClient, LLMError
 from launch.clients.telemetry import TelemetryClient
+from launch.io.llm_evidence_store import LLMEvidenceReader
 
 
 class TestLLMProviderBackwardCompatibility:
@@ -71,8 +72,8 @@ class TestLLMProviderBackwardCompatibility:
         assert "evidence_path" in result
 
         # Verify evidence saved
-        evidence_file = tmp_path / "evidence" / "llm_calls" / "test_backward_compat.json"
-        assert evidence_file.exists()
+        reader = LLMEvidenceReader(tmp_path / "evidence" / "llm_calls")
+        assert "test_backward_compat" in reader
 
     @patch("launch.clients.llm_provider.http_post")
     def test_telemetry_params_optional(self, mock_http_post, tmp_path):
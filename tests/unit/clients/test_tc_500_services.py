@@ -28,6 +28,7 @@ from launch.clients import (
     TelemetryClient,
     TelemetryError,
 )
+from launch.io.llm_evidence_store import LLMEvidenceReader
 
 
 class TestTelemetryClient:
@@ -475,13 +476,12 @@ class TestLLMProviderClient:
         assert "latency_ms" in result
         assert "evidence_path" in result
 
-        # Verify evidence file exists
-        evidence_path = Path(result["evidence_path"])
-        assert evidence_path.exists()
+        # Verify evidence was recorded
+        reader = LLMEvidenceReader(client.evidence_dir)
+        assert "test-call-1" in reader
 
         # Verify evidence content
-        with open(evidence_path, "r", encoding="utf-8") as f:
-            evidence = json.load(f)
+        evidence = reader.resolve(result["evidence_path"])
 
         assert evidence["call_id"] == "test-call-1"
         assert evidence["model"] == "test-model"
@@ -530,12 +530,13 @@ class TestLLMProviderClient:
         messages = [{"role": "user", "content": "Test"}]
         result = client.chat_completion(messages, call_id="atomic-test")
 
-        # Evidence file should exist (no .tmp files left)
-        evidence_path = Path(result["evidence_path"])
-        assert evidence_path.exists()
+        # Evidence should be recorded (no .tmp files left)
+        reader = LLMEvidenceReader(client.evidence_dir)
+        assert "atomic-test" in reader
+        assert reader.resolve(result["evidence_path"])["call_id"] == "atomic-test"
 
         # No temp files should exist
-        temp_files = list(evidence_path.parent.glob("*.tmp"))
+        temp_files = list(client.evidence_dir.glob("*.tmp"))
         assert len(temp_files) == 0
 
 
@@ -0,0 +1,158 @@
+"""Tests for the site link graph used by Gate 5 and Gate 9.
+
+Tests page parsing (links, anchors, front matter), in-memory resolution with
+Hugo fallbacks, incremental updates, and gate integration.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from launch.content.site_link_graph import (
+    SiteLinkGraph,
+    anchorize,
+    clear_site_link_graphs,
+    get_site_link_graph,
+    parse_page,
+)
+
+
+@pytest.fixture(autouse=True)
+def _clear_graphs():
+    clear_site_link_graphs()
+    yield
+    clear_site_link_graphs()
+
+
+@pytest.fixture
+def site(tmp_path):
+    site_dir = tmp_path / "site"
+    (site_dir / "docs" / "guide").mkdir(parents=True)
+    (site_dir / "docs" / "_index.md").write_text("# Docs\n", encoding="utf-8")
+    (site_dir / "docs" / "guide" / "index.md").write_text("## Setup Steps\n", encoding="utf-8")
+    (site_dir / "docs" / "intro.md").write_text(
+        "---\ntitle: Intro\n---\n"
+        "# Getting Started\n\n"
+        "See [guide](guide/#setup-steps) and [api](api.md).\n"
+        "```\n[not a link](nowhere.md)\n```\n"
+        "Jump to [top](#getting-started).\n",
+        encoding="utf-8",
+    )
+    return site_dir
+
+
+def test_anchorize_matches_hugo_style():
+    assert anchorize("Getting Started") == "getting-started"
+    assert anchorize("What's `new` in 2.0?") == "whats-new-in-20"
+
+
+def test_parse_page_links_skip_code_and_externals():
+    node = parse_page(
+        "a.md",
+        "[x](https://example.com)\n[y](/abs/)\n```\n[z](z.md)\n```\n[w](w.md#frag)\n",
+    )
+    assert [(e.path, e.anchor, e.line) for e in node.links] == [("w.md", "frag", 6)]
+
+
+def test_parse_page_duplicate_and_explicit_anchors():
+    node = parse_page("a.md", "## Usage\n## Usage\n## Custom {#my-id}\n")
+    assert node.anchors == {"usage", "usage-1", "my-id"}
+
+
+def test_resolution_uses_hugo_fallbacks(site):
+    graph = SiteLinkGraph.from_site_dir(site)
+    assert graph.resolve_link("docs/intro.md", "guide/") == "docs/guide"
+    assert graph.page_for_target("docs/guide") == "docs/guide/index.md"
+    assert graph.resolve_link("docs/intro.md", "../docs") == "docs"
+    assert graph.resolve_link("docs/intro.md", "intro") == "docs/intro.md"
+    assert graph.resolve_link("docs/intro.md", "api.md") is None
+
+
+def test_broken_links_and_anchors(site):
+    graph = SiteLinkGraph.from_site_dir(site)
+    results = {edge.url: target for edge, target in graph.iter_resolved_links()}
+    assert results["api.md"] is None
+    assert results["#getting-started"] == "docs/intro.md"
+    assert graph.anchor_exists("docs/guide/index.md", "setup-steps")
+
+
+def test_refresh_reparses_only_changed_pages(site):
+    graph = SiteLinkGraph.from_site_dir(site)
+    parsed_before = graph.pages_parsed
+
+    api = site / "docs" / "api.md"
+    api.write_text("# API\n", encoding="utf-8")
+    changed = graph.refresh()
+
+    assert changed == ["docs/api.md"]
+    assert graph.pages_parsed == parsed_before + 1
+    # Existing edge from intro.md now resolves without re-parsing intro.md
+    assert graph.resolve_link("docs/intro.md", "api.md") == "docs/api.md"
+
+    api.unlink()
+    assert graph.refresh() == ["docs/api.md"]
+    assert not graph.has_page("docs/api.md")
+
+
+def test_update_page_in_memory(site):
+    graph = SiteLinkGraph.from_site_dir(site)
+    graph.update_page("docs/intro.md", content="[a](missing.md)\n")
+    edges = graph.nodes["docs/intro.md"].links
+    assert [e.path for e in edges] == ["missing.md"]
+    assert [e.source for e in graph.inbound_links("docs/_index.md")] == []
+
+
+def test_registry_returns_refreshed_graph(site):
+    graph = get_site_link_graph(site)
+    (site / "new.md").write_text("# New\n", encoding="utf-8")
+    assert get_site_link_graph(site) is graph
+    assert graph.has_page("new.md")
+
+
+def _make_run(tmp_path: Path) -> Path:
+    run_dir = tmp_path / "run"
+    (run_dir / "artifacts").mkdir(parents=True)
+    (run_dir / "work" / "site").mkdir(parents=True)
+    return run_dir
+
+
+def test_gate_5_reports_line_numbers_and_anchors(tmp_path):
+    from launch.workers.w7_validator.gates import gate_5_cross_page_link_validity
+
+    run_dir = _make_run(tmp_path)
+    site_dir = run_dir / "work" / "site"
+    (site_dir / "b.md").write_text("# Real Heading\n", encoding="utf-8")
+    (site_dir / "a.md").write_text(
+        "```\ncode\n```\n\n[ok](b.md#real-heading)\n[bad anchor](b.md#nope)\n[broken](c.md)\n",
+        encoding="utf-8",
+    )
+
+    gate_passed, issues = gate_5_cross_page_link_validity.execute_gate(run_dir, "local")
+
+    assert gate_passed is False
+    by_code = {i["error_code"]: i for i in issues}
+    assert by_code["GATE_LINK_BROKEN_INTERNAL"]["location"]["line"] == 7
+    assert by_code["GATE_LINK_BROKEN_INTERNAL"]["issue_id"] == "link_broken_a.md_c.md"
+    assert by_code["GATE_LINK_BROKEN_ANCHOR"]["severity"] == "warn"
+    assert by_code["GATE_LINK_BROKEN_ANCHOR"]["location"]["line"] == 6
+
+
+def test_gate_9_uses_graph_for_nav_links(tmp_path):
+    from launch.workers.w7_validator.gates import gate_9_navigation_integrity
+
+    run_dir = _make_run(tmp_path)
+    site_dir = run_dir / "work" / "site"
+    (run_dir / "artifacts" / "page_plan.json").write_text(
+        json.dumps({"pages": [{"output_path": "a.md"}]}), encoding="utf-8"
+    )
+    (site_dir / "a.md").write_text(
+        "---\ntitle: A\nnav_menu:\n  - link: /missing.md\n---\nBody\n", encoding="utf-8"
+    )
+
+    gate_passed, issues = gate_9_navigation_integrity.execute_gate(run_dir, "local")
+
+    assert gate_passed is False
+    assert [i["error_code"] for i in issues] == ["GATE_NAVIGATION_BROKEN_LINK"]
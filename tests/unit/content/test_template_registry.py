@@ -0,0 +1,96 @@
+"""Tests for the precompiled template registry shared by W4 and W5."""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from launch.content import template_registry
+from launch.content.template_registry import (
+    TITLE_MISSING,
+    TITLE_NO_FRONTMATTER,
+    find_template,
+    get_template_registry,
+    read_template,
+)
+
+
+@pytest.fixture
+def templates(tmp_path: Path) -> Path:
+    root = tmp_path / "templates"
+    docs = root / "docs.aspose.org" / "cells" / "__LOCALE__"
+    docs.mkdir(parents=True)
+    (docs / "_index.md").write_text("---\ntitle: __PRODUCT_NAME__ Docs\n---\n# __TITLE__\n")
+    (docs / "howto.variant-rich.md").write_text("---\ntitle: How to\nmandatory: true\n---\n__BODY__\n")
+    (docs / "untitled.md").write_text("---\nlayout: page\n---\n")
+    (docs / "plain.md").write_text("no frontmatter\n")
+    blog = root / "blog.aspose.org" / "cells"
+    blog.mkdir(parents=True)
+    (blog / "post.md").write_text("---\ntitle: Post\n---\n")
+    return root
+
+
+def _age(root: Path, seconds: int = 10) -> None:
+    """Backdate every template so the in-process fast path applies."""
+    for path in root.rglob("*.md"):
+        st = path.stat()
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns - seconds * 1_000_000_000))
+
+
+def test_records(templates: Path):
+    registry = get_template_registry(templates)
+
+    records = {r.filename: r for r in registry.for_family("docs.aspose.org", "cells")}
+    assert sorted(records) == ["_index.md", "howto.variant-rich.md", "plain.md", "untitled.md"]
+
+    index = records["_index.md"]
+    assert (index.slug, index.variant, index.is_mandatory) == ("index", "default", True)
+    assert index.placeholders == ("PRODUCT_NAME", "TITLE")
+    assert index.title == "__PRODUCT_NAME__ Docs"
+
+    howto = records["howto.variant-rich.md"]
+    assert (howto.slug, howto.variant, howto.is_mandatory) == ("howto", "rich", True)
+    assert records["untitled.md"].title_error == TITLE_MISSING
+    assert records["plain.md"].title_error == TITLE_NO_FRONTMATTER
+    assert [r.filename for r in registry.for_family("blog.aspose.org", "cells")] == ["post.md"]
+
+
+def test_reused_in_process_and_rebuilt_on_change(templates: Path):
+    _age(templates)
+    first = get_template_registry(templates)
+    assert get_template_registry(templates) is first
+
+    (templates / "blog.aspose.org" / "cells" / "post.md").write_text("---\ntitle: Changed\n---\n")
+    second = get_template_registry(templates)
+
+    assert second.key != first.key
+    assert second.get("blog.aspose.org/cells/post.md").title == "Changed"
+
+
+def test_persisted_registry_is_reused(templates: Path, tmp_path: Path, monkeypatch):
+    cache_dir = tmp_path / "cache"
+    built = get_template_registry(templates, cache_dir=cache_dir)
+    assert json.loads((cache_dir / f"{built.key}.json").read_text())["key"] == built.key
+
+    # A fresh process (empty in-memory registry) loads instead of compiling
+    monkeypatch.setattr(template_registry, "_REGISTRIES", type(template_registry._REGISTRIES)())
+    monkeypatch.setattr(template_registry, "_compile", lambda *a: pytest.fail("recompiled"))
+    loaded = get_template_registry(templates, cache_dir=cache_dir)
+
+    assert loaded.key == built.key
+    assert loaded.records == built.records
+
+
+def test_bodies_are_lazy_and_never_stale(templates: Path):
+    registry = get_template_registry(templates)
+    path = templates / "docs.aspose.org" / "cells" / "__LOCALE__" / "_index.md"
+
+    assert find_template(path)[1] is registry.get(path)
+    assert read_template(path).startswith("---\ntitle: __PRODUCT_NAME__ Docs")
+
+    path.write_text("---\ntitle: Rewritten and longer\n---\n")
+    assert find_template(path) == (None, None)
+    assert read_template(path) == "---\ntitle: Rewritten and longer\n---\n"
@@ -0,0 +1,166 @@
+"""Tests for streaming, cached and parallel golden-run verification.
+
+Covers:
+- Streaming normalized hash parity with whole-file normalization
+- Hash cache keyed by (path, size, mtime_ns)
+- Manifest comparison ordering and fail-fast short-circuit
+- Run-directory comparison
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+from pathlib import Path
+
+import pytest
+
+from launch.determinism import golden_run
+from launch.determinism.golden_run import (
+    _collect_artifacts,
+    _compute_normalized_hash,
+    _normalize_line_endings,
+    _strip_trailing_whitespace,
+    clear_hash_cache,
+    compare_artifact_hashes,
+    compare_run_dirs,
+)
+
+OLD_NS = 1_000_000_000_000_000_000
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    clear_hash_cache()
+    yield
+    clear_hash_cache()
+
+
+def _reference_hash(content: bytes) -> str:
+    content = _normalize_line_endings(content)
+    if b"\x00" not in content[:8192]:
+        content = _strip_trailing_whitespace(content)
+    return hashlib.sha256(content).hexdigest()
+
+
+def _make_run(root: Path, files: dict) -> Path:
+    for rel, content in files.items():
+        path = root / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(content)
+        os.utime(path, ns=(OLD_NS, OLD_NS))
+    return root
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        b"",
+        b"no newline   ",
+        b"a  \r\nb\t\r\n\r\nc \r",
+        b"x\r\r\ny \x0b\n",
+        b"\x00binary\r\n  \r\n",
+        b"\x00bin\r",
+    ],
+)
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 1024])
+def test_streaming_hash_matches_reference(tmp_path, monkeypatch, content, chunk_size):
+    monkeypatch.setattr(golden_run, "HASH_CHUNK_SIZE", chunk_size)
+    path = tmp_path / "f.bin"
+    path.write_bytes(content)
+    assert _compute_normalized_hash(path) == _reference_hash(content)
+
+
+def test_hash_cache_keyed_by_size_and_mtime(tmp_path, monkeypatch):
+    run_dir = _make_run(tmp_path / "run", {"artifacts/a.json": b"{}\n"})
+    calls = []
+    real = golden_run._compute_normalized_hash
+    monkeypatch.setattr(
+        golden_run, "_compute_normalized_hash", lambda p: calls.append(p) or real(p)
+    )
+
+    first = _collect_artifacts(run_dir)
+    assert _collect_artifacts(run_dir) == first
+    assert len(calls) == 1
+
+    path = run_dir / "artifacts" / "a.json"
+    path.write_bytes(b"[]\n")
+    os.utime(path, ns=(OLD_NS + 1, OLD_NS + 1))
+    assert _collect_artifacts(run_dir) != first
+    assert len(calls) == 2
+
+
+def test_recently_modified_files_are_not_cached(tmp_path, monkeypatch):
+    path = tmp_path / "artifacts" / "a.json"
+    path.parent.mkdir()
+    path.write_bytes(b"{}")
+    calls = []
+    real = golden_run._compute_normalized_hash
+    monkeypatch.setattr(
+        golden_run, "_compute_normalized_hash", lambda p: calls.append(p) or real(p)
+    )
+    _collect_artifacts(tmp_path)
+    _collect_artifacts(tmp_path)
+    assert len(calls) == 2
+
+
+def test_compare_reports_all_mismatches_in_order(tmp_path):
+    run_dir = _make_run(
+        tmp_path / "run",
+        {
+            "artifacts/a.json": b"A",
+            "artifacts/c.json": b"C-changed",
+            "artifacts/z.json": b"Z",
+            "drafts/p.md": b"# P\n",
+        },
+    )
+    expected = _collect_artifacts(run_dir)
+    expected["artifacts/b.json"] = "0" * 64
+    expected["artifacts/c.json"] = "1" * 64
+    del expected["artifacts/z.json"]
+
+    mismatches = compare_artifact_hashes(run_dir, expected)
+
+    assert [(m.artifact_path, m.actual_hash == "MISSING") for m in mismatches] == [
+        ("artifacts/b.json", True),
+        ("artifacts/c.json", False),
+        ("artifacts/z.json", False),
+    ]
+    assert mismatches[-1].expected_hash == "NOT_IN_GOLDEN"
+
+
+def test_fail_fast_skips_hashing_when_listing_differs(tmp_path, monkeypatch):
+    run_dir = _make_run(tmp_path / "run", {"artifacts/a.json": b"A"})
+    monkeypatch.setattr(
+        golden_run,
+        "_cached_normalized_hash",
+        lambda p: pytest.fail("hashed despite missing artifact"),
+    )
+
+    mismatches = compare_artifact_hashes(
+        run_dir, {"artifacts/a.json": "x", "artifacts/b.json": "y"}, fail_fast=True
+    )
+
+    assert [m.artifact_path for m in mismatches] == ["artifacts/b.json"]
+
+
+def test_fail_fast_returns_single_mismatch(tmp_path):
+    files = {f"artifacts/{i:02d}.json": b"%d" % i for i in range(20)}
+    run_dir = _make_run(tmp_path / "run", files)
+    expected = {rel: "0" * 64 for rel in files}
+
+    mismatches = compare_artifact_hashes(run_dir, expected, fail_fast=True, max_workers=2)
+
+    assert len(mismatches) == 1
+    assert mismatches[0].artifact_path in files
+
+
+def test_compare_run_dirs(tmp_path):
+    run_a = _make_run(tmp_path / "a", {"artifacts/x.json": b"x \r\n", "drafts/d.md": b"d"})
+    run_b = _make_run(tmp_path / "b", {"artifacts/x.json": b"x\n", "drafts/d.md": b"d"})
+    assert compare_run_dirs(run_a, run_b) == []
+
+    (run_b / "drafts" / "d.md").write_bytes(b"different")
+    mismatches = compare_run_dirs(run_a, run_b, fail_fast=True)
+    assert [m.artifact_path for m in mismatches] == [str(Path("drafts") / "d.md")]
+    assert mismatches[0].size_difference == len(b"different") - 1
@@ -0,0 +1,134 @@
+"""Tests for the run-scoped parsed artifact cache and read-only views."""
+
+from __future__ import annotations
+
+import copy
+import json
+import pickle
+from pathlib import Path
+
+import pytest
+import yaml
+
+from launch.io.artifact_cache import (
+    FrozenDict,
+    FrozenList,
+    ParsedArtifactCache,
+    freeze,
+    release_parsed_artifacts,
+    thaw,
+)
+from launch.io.artifact_store import ArtifactStore
+
+FACTS = {"product_name": "Widget", "claims": [{"claim_id": "c1", "tags": ["api"]}]}
+
+
+@pytest.fixture(autouse=True)
+def _release():
+    yield
+    release_parsed_artifacts()
+
+
+def _write(run_dir: Path, name: str, data) -> Path:
+    path = run_dir / "artifacts" / name
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(data), encoding="utf-8")
+    return path
+
+
+class TestViews:
+    def test_mutation_raises(self):
+        view = freeze(FACTS)
+
+        with pytest.raises(TypeError, match="read-only"):
+            view["product_name"] = "Gadget"
+        with pytest.raises(TypeError):
+            view["claims"].append({})
+        with pytest.raises(TypeError):
+            view["claims"][0]["tags"] += ["x"]
+        with pytest.raises(TypeError):
+            view.setdefault("new", 1)
+
+    def test_copies_are_mutable(self):
+        view = freeze(FACTS)
+
+        mutable = copy.deepcopy(view)
+        mutable["claims"][0]["tags"].append("x")
+        assert type(mutable) is dict and type(mutable["claims"]) is list
+        assert view["claims"][0]["tags"] == ["api"]
+
+        shallow = dict(view)
+        shallow["product_name"] = "Gadget"
+        assert thaw(view) == FACTS
+
+    def test_serializes_like_plain_data(self):
+        view = freeze(FACTS)
+
+        assert isinstance(view, dict) and view == FACTS
+        assert json.dumps(view, sort_keys=True) == json.dumps(FACTS, sort_keys=True)
+        assert yaml.dump(view) == yaml.dump(FACTS)
+        assert yaml.safe_dump(view) == yaml.safe_dump(FACTS)
+
+        restored = pickle.loads(pickle.dumps(view))
+        assert isinstance(restored, FrozenDict) and isinstance(restored["claims"], FrozenList)
+        assert restored == FACTS
+
+
+class TestCache:
+    def test_parse_once_and_share_view(self, tmp_path: Path):
+        path = _write(tmp_path, "product_facts.json", FACTS)
+        cache = ParsedArtifactCache()
+
+        first = cache.load(path)
+        second = cache.load(path)
+
+        assert first is second
+        assert cache.stats["misses"] == 1
+
+    def test_rewrite_is_never_served_stale(self, tmp_path: Path):
+        path = _write(tmp_path, "page_plan.json", {"pages": ["a"]})
+        cache = ParsedArtifactCache()
+        assert cache.load(path) == {"pages": ["a"]}
+
+        # Same size, written immediately: stat alone cannot tell them apart
+        path.write_text(json.dumps({"pages": ["b"]}), encoding="utf-8")
+        assert cache.load(path) == {"pages": ["b"]}
+
+    def test_budget_and_release(self, tmp_path: Path):
+        a = _write(tmp_path, "a.json", {"k": "x" * 100})
+        b = _write(tmp_path, "b.json", {"k": "y" * 100})
+        cache = ParsedArtifactCache(budget_mb=150 / (1024 * 1024))
+
+        cache.load(a)
+        cache.load(b)
+        assert cache.stats["evictions"] == 1
+
+        cache.release(tmp_path)
+        cache.load(b)
+        assert cache.stats["misses"] == 3
+
+
+class TestArtifactStore:
+    def test_view_reflects_write_artifact(self, tmp_path: Path):
+        store = ArtifactStore(run_dir=tmp_path)
+        store.write_artifact("product_facts.json", FACTS)
+
+        view = store.load_artifact_view("product_facts.json")
+        assert view == FACTS
+        assert store.load_artifact_view("product_facts.json") is view
+
+        store.write_artifact("product_facts.json", {**FACTS, "product_name": "Gadget"})
+        assert store.load_artifact_view("product_facts.json")["product_name"] == "Gadget"
+
+    def test_load_artifact_stays_mutable(self, tmp_path: Path):
+        store = ArtifactStore(run_dir=tmp_path)
+        store.write_artifact("product_facts.json", FACTS)
+        store.load_artifact_view("product_facts.json")
+
+        data = store.load_artifact("product_facts.json")
+        data["claims"].append({"claim_id": "c2"})
+        assert len(store.load_artifact_view("product_facts.json")["claims"]) == 1
+
+    def test_missing_view_raises(self, tmp_path: Path):
+        with pytest.raises(FileNotFoundError):
+            ArtifactStore(run_dir=tmp_path).load_artifact_view("evidence_map.json")
@@ -0,0 +1,111 @@
+"""Unit tests for the lazy evidence map reader (launch.io.evidence_map_reader).
+
+Covers round-tripping evidence_map.json through the Mapping interface,
+derived claim sets, cache invalidation when the file changes, and
+bounded memory on large maps.
+"""
+
+from __future__ import annotations
+
+import json
+import tracemalloc
+from pathlib import Path
+
+import pytest
+
+from launch.io.evidence_map_reader import (
+    EvidenceMapReader,
+    evidence_cited_paths,
+    evidence_claim_ids,
+)
+
+
+def _claim(i: int, path: str = "README.md") -> dict:
+    return {
+        "claim_id": f"claim_{i:04d}",
+        "claim_text": f"supports format {i}",
+        "citations": [{"path": path, "start_line": 1, "end_line": 2}],
+        "supporting_evidence": [{"path": "docs/guide.md", "relevance_score": 0.5}],
+    }
+
+
+def _write(path: Path, evidence_map: dict) -> None:
+    path.write_text(json.dumps(evidence_map, ensure_ascii=False, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+
+
+@pytest.fixture
+def evidence_map():
+    return {
+        "repo_url": "https://example.com/repo",
+        "repo_sha": "abc123",
+        "claims": [_claim(1), _claim(2, "docs/api.md"), _claim(3, "src/ünïcode.py")],
+        "metadata": {"total_claims": 3, "claims_with_evidence": 3, "average_evidence_per_claim": 1.0},
+    }
+
+
+def test_round_trip_through_mapping(tmp_path, evidence_map):
+    path = tmp_path / "evidence_map.json"
+    _write(path, evidence_map)
+    reader = EvidenceMapReader(path)
+
+    assert list(reader) == sorted(evidence_map)
+    assert reader["metadata"] == evidence_map["metadata"]
+    assert reader.get("missing") is None
+    assert list(reader["claims"]) == evidence_map["claims"]
+    assert len(reader["claims"]) == 3 and reader["claims"]
+    assert reader.get_claim("claim_0002") == evidence_map["claims"][1]
+    assert reader.get_claim("claim_9999") is None
+
+
+def test_empty_claims_and_missing_file(tmp_path):
+    path = tmp_path / "evidence_map.json"
+    _write(path, {"claims": [], "metadata": {}})
+    reader = EvidenceMapReader(path)
+
+    assert "claims" in reader
+    assert not reader["claims"] and list(reader["claims"]) == []
+    assert EvidenceMapReader.from_artifacts_dir(tmp_path / "nowhere") is None
+
+
+def test_derived_sets_match_parsed_dict(tmp_path, evidence_map):
+    path = tmp_path / "evidence_map.json"
+    _write(path, evidence_map)
+    reader = EvidenceMapReader(path)
+
+    assert evidence_claim_ids(reader) == evidence_claim_ids(evidence_map) == {
+        "claim_0001", "claim_0002", "claim_0003",
+    }
+    assert evidence_cited_paths(reader) == evidence_cited_paths(evidence_map) == {
+        "README.md", "docs/api.md", "src/ünïcode.py",
+    }
+
+
+def test_cache_invalidated_when_file_changes(tmp_path, evidence_map):
+    path = tmp_path / "evidence_map.json"
+    _write(path, evidence_map)
+    reader = EvidenceMapReader(path)
+    assert reader.claim_count() == 3
+
+    evidence_map["claims"].append(_claim(4, "docs/new.md"))
+    _write(path, evidence_map)
+    assert reader.claim_count() == 4
+    assert "docs/new.md" in reader.cited_paths()
+
+
+def test_memory_bounded_on_large_map(tmp_path):
+    path = tmp_path / "evidence_map.json"
+    with path.open("w", encoding="utf-8") as f:
+        f.write('{"claims": [')
+        f.write(",".join(json.dumps({**_claim(i), "blob": "x" * 2000}) for i in range(5000)))  # ~10 MB
+        f.write('], "metadata": {}}')
+    reader = EvidenceMapReader(path)
+
+    tracemalloc.start()
+    try:
+        assert reader.claim_count() == 5000
+        assert sum(1 for _ in reader["claims"]) == 5000
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert peak < 2_000_000
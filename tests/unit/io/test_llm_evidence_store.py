@@ -0,0 +1,94 @@
+"""Tests for the append-only segmented LLM evidence store."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from launch.io import llm_evidence_store
+from launch.io.llm_evidence_store import (
+    DEDUP_MIN_CHARS,
+    LLMEvidenceReader,
+    LLMEvidenceWriter,
+)
+
+SYSTEM_PROMPT = "You are a careful technical writer. " * 20
+
+
+def _evidence(call_id: str, user: str = "Summarize the README") -> dict:
+    return {
+        "call_id": call_id,
+        "prompt_hash": f"hash-{user}",
+        "model": "m",
+        "request": {
+            "model": "m",
+            "messages": [
+                {"role": "system", "content": SYSTEM_PROMPT},
+                {"role": "user", "content": user},
+            ],
+        },
+        "response": {"choices": [{"message": {"content": f"answer {call_id}"}}]},
+    }
+
+
+def test_round_trip_and_dedup(tmp_path: Path):
+    writer = LLMEvidenceWriter(tmp_path, writer_id="w1")
+    for i in range(20):
+        ref = writer.append(_evidence(f"call_{i:03d}", user=f"q{i % 2}"))
+    assert ref == "evidence/llm_calls/call_019.json"
+
+    reader = LLMEvidenceReader(tmp_path)
+
+    assert len(reader) == 20
+    assert reader.get("call_007") == _evidence("call_007", user="q1")
+    assert reader.resolve(ref)["response"]["choices"][0]["message"]["content"] == "answer call_019"
+    assert reader.find_by_prompt_hash("hash-q0") == [f"call_{i:03d}" for i in range(0, 20, 2)]
+
+    # 20 calls in one segment plus one index; the system prompt stored once
+    stats = reader.stats()
+    assert stats["segments"] == 1 and stats["blobs"] == 1
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["index-w1.ndjson", "segment-w1-000001.bin"]
+    index = [json.loads(line) for line in (tmp_path / "index-w1.ndjson").read_text().splitlines()]
+    assert [e["kind"] for e in index].count("blob") == 1
+    assert len(SYSTEM_PROMPT) >= DEDUP_MIN_CHARS
+
+
+def test_segments_roll_and_writers_resume(tmp_path: Path, monkeypatch):
+    monkeypatch.setattr(llm_evidence_store, "SEGMENT_MAX_BYTES", 200)
+    writer = LLMEvidenceWriter(tmp_path, writer_id="w1")
+    for i in range(5):
+        writer.append(_evidence(f"a{i}", user=f"q{i}"))
+
+    # A restarted writer reuses known blobs; a second writer gets its own files
+    LLMEvidenceWriter(tmp_path, writer_id="w1").append(_evidence("a5"))
+    LLMEvidenceWriter(tmp_path, writer_id="w2").append(_evidence("b0"))
+
+    reader = LLMEvidenceReader(tmp_path)
+    assert reader.stats()["segments"] > 2
+    assert reader.stats()["blobs"] == 1
+    assert reader.call_ids() == ["a0", "a1", "a2", "a3", "a4", "a5", "b0"]
+    for call_id in reader.call_ids():
+        assert reader.get(call_id)["request"]["messages"][0]["content"] == SYSTEM_PROMPT
+
+
+def test_torn_index_line_and_legacy_files(tmp_path: Path):
+    LLMEvidenceWriter(tmp_path, writer_id="w1").append(_evidence("new"))
+    with open(tmp_path / "index-w1.ndjson", "a", encoding="utf-8") as f:
+        f.write('{"kind": "call", "call_id": "tor')
+    (tmp_path / "old.json").write_text(json.dumps({"call_id": "old"}), encoding="utf-8")
+
+    reader = LLMEvidenceReader(tmp_path)
+
+    assert reader.call_ids() == ["new", "old"]
+    assert reader.get("old") == {"call_id": "old"}
+    with pytest.raises(KeyError):
+        reader.get("missing")
+
+
+def test_missing_directory_is_empty(tmp_path: Path):
+    reader = LLMEvidenceReader.for_run(tmp_path)
+
+    assert len(reader) == 0
+    assert reader.stats()["calls"] == 0
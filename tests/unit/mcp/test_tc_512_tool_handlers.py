@@ -266,6 +266,25 @@ async def test_handle_launch_get_artifact_not_found(temp_workspace, sample_run):
     assert "not found" in response["error"]["message"].lower()
 
 
+@pytest.mark.asyncio
+async def test_handle_launch_get_artifact_llm_evidence(temp_workspace, sample_run):
+    """Test launch_get_artifact resolves LLM call evidence from the segmented store."""
+    from launch.io.llm_evidence_store import LLMEvidenceWriter
+
+    evidence = {"call_id": "draft_001", "prompt_hash": "abc", "response": {"content": "ok"}}
+    writer = LLMEvidenceWriter(sample_run["run_dir"] / "evidence" / "llm_calls")
+    artifact_name = writer.append(evidence)
+
+    result = await handlers.handle_launch_get_artifact(
+        {"run_id": sample_run["run_id"], "artifact_name": artifact_name}
+    )
+    response = json.loads(result[0].text)
+
+    assert response["ok"] is True
+    assert response["artifact"]["content_type"] == "application/json"
+    assert json.loads(response["artifact"]["content"]) == evidence
+
+
 @pytest.mark.asyncio
 async def test_handle_launch_validate_success(temp_workspace, sample_run):
     """Test launch_validate executes validation."""
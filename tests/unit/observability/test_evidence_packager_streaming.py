@@ -0,0 +1,127 @@
+"""
+Tests for single-pass, parallel and incremental evidence packaging.
+
+Covers the precompressed ZIP writer, hash parity with sha256_file, the
+ZIP64 fallback, incremental packaging against a previous manifest, and the
+optional tar.zst format.
+"""
+
+import os
+import sys
+import zipfile
+from pathlib import Path
+
+import pytest
+
+from src.launch.io.hashing import sha256_file
+from src.launch.observability import evidence_packager
+from src.launch.observability.evidence_packager import (
+    PackageManifest,
+    create_evidence_package,
+)
+
+
+@pytest.fixture
+def run_dir(tmp_path: Path) -> Path:
+    run_dir = tmp_path / "runs" / "run-1"
+    llm_calls = run_dir / "artifacts" / "evidence" / "llm_calls"
+    llm_calls.mkdir(parents=True)
+    for i in range(25):
+        (llm_calls / f"call_{i:03d}.json").write_text(f'{{"call": {i}, "text": "{"x" * i * 50}"}}')
+    (run_dir / "artifacts" / "empty.txt").write_bytes(b"")
+    (run_dir / "artifacts" / "naïve.md").write_text("# unicode name\n", encoding="utf-8")
+    (run_dir / "events.ndjson").write_text('{"event_id": "1"}\n')
+    return run_dir
+
+
+def _zip_contents(path: Path) -> dict:
+    with zipfile.ZipFile(path) as zipf:
+        assert zipf.testzip() is None
+        return {name: zipf.read(name) for name in zipf.namelist()}
+
+
+def test_parallel_zip_is_valid_and_matches_manifest(run_dir: Path, tmp_path: Path):
+    output_path = tmp_path / "evidence.zip"
+
+    manifest = create_evidence_package(run_dir, output_path, max_workers=4)
+
+    contents = _zip_contents(output_path)
+    assert list(contents) == [f.relative_path for f in manifest.files]
+    for f in manifest.files:
+        source = run_dir / f.relative_path
+        assert contents[f.relative_path] == source.read_bytes()
+        assert f.sha256 == sha256_file(source)
+        assert f.size_bytes == source.stat().st_size
+
+
+def test_each_file_read_once(run_dir: Path, tmp_path: Path, monkeypatch):
+    monkeypatch.setattr(evidence_packager, "CHUNK_SIZE", 64)
+    opened = []
+    real_open = open
+
+    def counting_open(file, mode="r", *args, **kwargs):
+        if "b" in mode and str(file).startswith(str(run_dir)):
+            opened.append(str(file))
+        return real_open(file, mode, *args, **kwargs)
+
+    monkeypatch.setattr("builtins.open", counting_open)
+    manifest = create_evidence_package(run_dir, tmp_path / "evidence.zip")
+
+    assert sorted(opened) == sorted(str(run_dir / f.relative_path) for f in manifest.files)
+
+
+def test_zip64_fallback_matches_parallel_writer(run_dir: Path, tmp_path: Path, monkeypatch):
+    fast = create_evidence_package(run_dir, tmp_path / "fast.zip")
+    monkeypatch.setattr(evidence_packager, "_ZIP32_MAX_ENTRIES", 1)
+    slow = create_evidence_package(run_dir, tmp_path / "slow.zip")
+
+    assert [f.sha256 for f in slow.files] == [f.sha256 for f in fast.files]
+    assert _zip_contents(tmp_path / "slow.zip") == _zip_contents(tmp_path / "fast.zip")
+
+
+def test_incremental_package_skips_unchanged_files(run_dir: Path, tmp_path: Path):
+    first = create_evidence_package(run_dir, tmp_path / "first.zip")
+    manifest_path = tmp_path / "first_manifest.json"
+    manifest_path.write_text(first.to_json(), encoding="utf-8")
+
+    changed = run_dir / "artifacts" / "evidence" / "llm_calls" / "call_003.json"
+    changed.write_text('{"call": 3, "text": "changed"}')
+    touched = run_dir / "events.ndjson"
+    os.utime(touched, (1_000_000, 1_000_000))  # same bytes, new mtime
+    (run_dir / "artifacts" / "new.json").write_text("{}")
+
+    second = create_evidence_package(
+        run_dir, tmp_path / "second.zip", previous_manifest=manifest_path
+    )
+
+    packed = set(_zip_contents(tmp_path / "second.zip"))
+    assert packed == {"artifacts/evidence/llm_calls/call_003.json", "artifacts/new.json"}
+    assert "events.ndjson" in second.skipped_files
+    assert second.total_files == first.total_files + 1
+    assert PackageManifest.from_dict(second.to_dict()).skipped_files == second.skipped_files
+
+
+def test_unknown_archive_format_rejected(run_dir: Path, tmp_path: Path):
+    with pytest.raises(ValueError, match="archive_format"):
+        create_evidence_package(run_dir, tmp_path / "out.rar", archive_format="rar")
+
+
+def test_tar_zst_requires_zstandard(run_dir: Path, tmp_path: Path, monkeypatch):
+    monkeypatch.setitem(sys.modules, "zstandard", None)
+    with pytest.raises(ImportError, match="zstandard"):
+        create_evidence_package(run_dir, tmp_path / "evidence.tar.zst", archive_format="tar.zst")
+
+
+def test_tar_zst_roundtrip(run_dir: Path, tmp_path: Path):
+    zstandard = pytest.importorskip("zstandard")
+    import io
+    import tarfile
+
+    output_path = tmp_path / "evidence.tar.zst"
+    manifest = create_evidence_package(run_dir, output_path, archive_format="tar.zst")
+
+    data = zstandard.ZstdDecompressor().stream_reader(output_path.read_bytes()).read()
+    with tarfile.open(fileobj=io.BytesIO(data)) as tar:
+        names = tar.getnames()
+    assert names == [f.relative_path for f in manifest.files]
+    assert manifest.archive_format == "tar.zst"
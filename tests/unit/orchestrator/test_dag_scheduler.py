@@ -0,0 +1,192 @@
+"""Tests for the dataflow work item scheduler.
+
+Covers dependency derivation from declared inputs/outputs (including
+undeclared reads), concurrent execution of independent items, event log
+order matching declaration order, failure handling, and LLM rate limits
+holding across a process pool.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+from unittest.mock import patch
+
+import pytest
+
+from launch.clients.llm_governor import GovernorConfig, get_llm_governor, reset_llm_governor
+from launch.io.artifact_store import ArtifactStore
+from launch.orchestrator.dag_scheduler import (
+    DagScheduler,
+    SchedulerError,
+    WorkSpec,
+    build_dependencies,
+    plan_levels,
+)
+from launch.orchestrator.worker_invoker import WorkerInvoker
+
+BARRIER = threading.Barrier(2, timeout=5)
+STARTED: List[str] = []
+
+
+def stub_section_writer(run_dir: Path, run_config: Dict[str, Any]) -> Dict[str, Any]:
+    section = run_config["section"]
+    STARTED.append(section)
+    if run_config.get("wait_for_peer"):
+        BARRIER.wait()  # both sections must be in flight at once
+    if run_config.get("slow"):
+        time.sleep(0.2)
+    if run_config.get("fail"):
+        raise RuntimeError(f"boom in {section}")
+    ArtifactStore(run_dir=run_dir).emit_event("SECTION_DRAFTED", {"section": section})
+    out = run_dir / "drafts" / section
+    out.mkdir(parents=True, exist_ok=True)
+    (out / "index.md").write_text(f"# {section}\n")
+    return {"status": "success", "section": section}
+
+
+def stub_reviewer(run_dir: Path, run_config: Dict[str, Any]) -> Dict[str, Any]:
+    STARTED.append("review")
+    drafted = sorted(p.parent.name for p in (run_dir / "drafts").glob("*/index.md"))
+    return {"status": "success", "drafted": drafted}
+
+
+def stub_llm_section_writer(run_dir: Path, run_config: Dict[str, Any]) -> Dict[str, Any]:
+    """Issue LLM calls through the process's governor for one second, logging each admission."""
+    governor = get_llm_governor()
+    log = run_dir / f"llm_calls_{run_config['section']}.log"
+
+    def call_forever() -> None:
+        while True:
+            governor.call(lambda: None)
+            with log.open("a") as f:
+                f.write(f"{time.time()}\n")
+
+    threading.Thread(target=call_forever, daemon=True).start()
+    time.sleep(1.0)
+    return {"status": "success", "section": run_config["section"]}
+
+
+STUB_DISPATCH = {"W5.SectionWriter": stub_section_writer, "W5.5.ContentReviewer": stub_reviewer}
+
+
+@pytest.fixture(autouse=True)
+def _reset(monkeypatch):
+    monkeypatch.setenv("LAUNCH_WORKER_CACHE", "0")
+    BARRIER.reset()
+    STARTED.clear()
+
+
+def _section(name: str, **config: Any) -> WorkSpec:
+    return WorkSpec(
+        worker="W5.SectionWriter",
+        inputs=["page_plan.json"],
+        outputs=[f"drafts/{name}/"],
+        scope_key=name,
+        run_config={"section": name, **config},
+    )
+
+
+def _events(run_dir: Path) -> List[Dict[str, Any]]:
+    return [json.loads(line) for line in (run_dir / "events.ndjson").read_text().splitlines()]
+
+
+class TestDependencies:
+    def test_hazards_order_dependent_items(self):
+        specs = [
+            _section("docs"),
+            _section("kb"),
+            WorkSpec("W5.5.ContentReviewer", ["drafts/"], ["review_report.json"]),
+            WorkSpec("W7.Validator", ["patch_bundle.json"], ["validation_report.json"]),
+            WorkSpec("W7.Validator", ["validation_report.json"], ["validation_report.json"], scope_key="again"),
+        ]
+        deps = build_dependencies(specs)
+
+        assert deps[1] == set()  # disjoint section outputs
+        assert deps[2] == {0, 1}  # reads the drafts/ directory
+        assert deps[3] == set()
+        assert deps[4] == {3}  # reads and rewrites the same report
+        assert plan_levels(specs) == [[0, 1, 3], [2, 4]]
+
+    def test_undeclared_reads_and_exclusive_workers(self):
+        specs = [
+            WorkSpec("W2.FactsBuilder", ["repo_inventory.json"], ["product_facts.json"]),
+            WorkSpec("W3.SnippetCurator", ["repo_inventory.json"], ["snippet_catalog.json"]),
+            _section("docs"),
+        ]
+        deps = build_dependencies(specs)
+
+        assert deps[1] == {0}  # W2 reads snippet_catalog.json without declaring it
+        assert deps[2] == {0, 1}  # W3 runs alone
+
+    def test_duplicate_scope_key_rejected(self):
+        with pytest.raises(SchedulerError, match="scope_key"):
+            build_dependencies([_section("docs"), _section("docs")])
+
+
+@patch("launch.orchestrator.worker_invoker.WORKER_DISPATCH", STUB_DISPATCH)
+class TestRun:
+    def test_independent_items_overlap_and_events_keep_declaration_order(self, tmp_path: Path):
+        invoker = WorkerInvoker("run-1", tmp_path, "trace", "span")
+        specs = [
+            _section("docs", wait_for_peer=True, slow=True),
+            _section("kb", wait_for_peer=True),
+            WorkSpec("W5.5.ContentReviewer", ["drafts/"], ["review_report.json"]),
+        ]
+
+        results = DagScheduler(invoker, max_parallel=4).run(specs)
+
+        assert [r.get("section") for r in results[:2]] == ["docs", "kb"]
+        assert results[2]["drafted"] == ["docs", "kb"]
+        assert STARTED[-1] == "review"
+
+        summary = [
+            (e["type"], e["payload"].get("work_item_id") or e["payload"].get("section"))
+            for e in _events(tmp_path)
+        ]
+        per_item = ["WORK_ITEM_QUEUED", "WORK_ITEM_STARTED"]
+        assert summary == [
+            *[(t, "run-1:W5.SectionWriter:1:docs") for t in per_item],
+            ("SECTION_DRAFTED", "docs"),
+            ("WORK_ITEM_FINISHED", "run-1:W5.SectionWriter:1:docs"),
+            *[(t, "run-1:W5.SectionWriter:1:kb") for t in per_item],
+            ("SECTION_DRAFTED", "kb"),
+            ("WORK_ITEM_FINISHED", "run-1:W5.SectionWriter:1:kb"),
+            *[(t, "run-1:W5.5.ContentReviewer:1") for t in per_item],
+            ("WORK_ITEM_FINISHED", "run-1:W5.5.ContentReviewer:1"),
+        ]
+
+    def test_failure_stops_dependents_and_raises_first_error(self, tmp_path: Path):
+        invoker = WorkerInvoker("run-1", tmp_path, "trace", "span")
+        specs = [
+            _section("docs", fail=True),
+            _section("kb"),
+            WorkSpec("W5.5.ContentReviewer", ["drafts/"], ["review_report.json"]),
+        ]
+
+        with pytest.raises(RuntimeError, match="boom in docs"):
+            DagScheduler(invoker, max_parallel=1).run(specs)
+
+        assert "review" not in STARTED
+        finished = [e for e in _events(tmp_path) if e["type"] == "WORK_ITEM_FINISHED"]
+        assert finished[0]["payload"]["success"] is False
+        assert finished[0]["payload"]["work_item_id"].endswith(":docs")
+
+
+class TestProcessPool:
+    @patch("launch.orchestrator.worker_invoker.WORKER_DISPATCH", {"W5.SectionWriter": stub_llm_section_writer})
+    def test_sections_in_processes_stay_within_rpm_limit(self, tmp_path: Path):
+        # Burst capacity is one minute's worth, so in one second the pool may admit at most the RPM limit
+        reset_llm_governor(GovernorConfig(requests_per_minute=12))
+        try:
+            invoker = WorkerInvoker("run-1", tmp_path, "trace", "span")
+            sections = ["docs", "kb", "reference"]
+            DagScheduler(invoker, max_parallel=3, use_processes=True).run([_section(s) for s in sections])
+        finally:
+            reset_llm_governor(GovernorConfig())
+
+        calls = sum(len((tmp_path / f"llm_calls_{s}.log").read_text().splitlines()) for s in sections)
+        assert 0 < calls <= 12
@@ -0,0 +1,227 @@
+"""Tests for delta relaunch (launch.orchestrator.delta).
+
+Covers mapping a repo diff to affected claims and pages, redrafting pages
+that use changed product-level facts, reuse of base-run drafts in
+draft_sections_node, the review scope, and the fallbacks to a full run.
+"""
+
+from __future__ import annotations
+
+import json
+import subprocess
+from pathlib import Path
+from typing import Any, Dict
+
+import pytest
+
+from launch.orchestrator.delta import (
+    DELTA_FROM_RUN_KEY,
+    compute_delta_plan,
+    review_scope,
+)
+from launch.orchestrator.graph import draft_sections_node
+from launch.workers.w5_section_writer import execute_section_writer
+
+# (section, slug, required_claim_ids, required_snippet_tags)
+PAGES = [
+    ("products", "overview", ["c_core"], []),
+    ("docs", "getting-started", ["c_core", "c_io"], []),
+    ("docs", "install", ["c_install"], []),
+    ("reference", "api-overview", [], ["io"]),
+]
+
+
+@pytest.fixture(autouse=True)
+def _no_worker_cache(monkeypatch):
+    monkeypatch.setenv("LAUNCH_WORKER_CACHE", "0")
+
+
+def _git(repo: Path, *args: str) -> str:
+    return subprocess.run(
+        ["git", "-C", str(repo), *args], check=True, capture_output=True, text=True
+    ).stdout.strip()
+
+
+def _commit(repo: Path, files: Dict[str, str]) -> str:
+    for rel, text in files.items():
+        (repo / rel).parent.mkdir(parents=True, exist_ok=True)
+        (repo / rel).write_text(text)
+    _git(repo, "add", "-A")
+    _git(repo, "-c", "user.name=t", "-c", "user.email=t@t", "commit", "-q", "-m", "c")
+    return _git(repo, "rev-parse", "HEAD")
+
+
+def _make_run(runs: Path, run_id: str, sha: str) -> Path:
+    run_dir = runs / run_id
+    artifacts = run_dir / "artifacts"
+    artifacts.mkdir(parents=True)
+    pages = [
+        {
+            "section": section,
+            "slug": slug,
+            "output_path": f"content/docs.example.org/widget/en/{section}/{slug}.md",
+            "url_path": f"/widget/{section}/{slug}/",
+            "title": slug.replace("-", " ").title(),
+            "purpose": f"{slug} page",
+            "required_headings": [],
+            "required_claim_ids": claims,
+            "required_snippet_tags": tags,
+        }
+        for section, slug, claims, tags in PAGES
+    ]
+    citations = {"c_core": "src/core.py", "c_io": "src/io.py", "c_install": "README.md"}
+    (artifacts / "page_plan.json").write_text(json.dumps({"schema_version": "1.0", "pages": pages}))
+    (artifacts / "product_facts.json").write_text(
+        json.dumps({"product_name": "Widget", "claims": [{"claim_id": "c_core", "claim_text": "Reads XLSX"}]})
+    )
+    (artifacts / "evidence_map.json").write_text(
+        json.dumps(
+            {
+                "claims": [
+                    {"claim_id": cid, "citations": [{"path": path, "start_line": 1, "end_line": 1}]}
+                    for cid, path in citations.items()
+                ]
+            }
+        )
+    )
+    (artifacts / "snippet_catalog.json").write_text(
+        json.dumps({"snippets": [{"snippet_id": "s1", "tags": ["io"], "source": {"type": "repo_file", "path": "examples/io.py"}}]})
+    )
+    (artifacts / "resolved_refs.json").write_text(json.dumps({"repo": {"resolved_sha": sha}}))
+    return run_dir
+
+
+@pytest.fixture
+def runs(tmp_path: Path):
+    """Base run drafted at the first commit; current run cloned at the second."""
+    runs = tmp_path / "runs"
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    _git(repo, "init", "-q")
+    base_sha = _commit(repo, {"src/core.py": "a", "src/io.py": "b", "README.md": "r", "examples/io.py": "e"})
+    sha = _commit(repo, {"src/io.py": "b2"})
+
+    base = _make_run(runs, "base", base_sha)
+    execute_section_writer(base, {"run_id": "base"})
+
+    current = _make_run(runs, "current", sha)
+    (current / "work").mkdir()
+    repo.rename(current / "work" / "repo")
+    return base, current
+
+
+def _state(run_dir: Path, config: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "run_id": run_dir.name,
+        "run_state": "PLAN_READY",
+        "run_dir": str(run_dir),
+        "run_config": {"run_id": run_dir.name, **config},
+        "snapshot": {},
+        "issues": [],
+        "fix_attempts": 0,
+        "current_issue": None,
+    }
+
+
+def test_plan_follows_changed_files_to_pages(runs):
+    base, current = runs
+
+    plan = compute_delta_plan(current, "base")
+
+    assert plan.changed_files == ["src/io.py"]
+    assert plan.affected_claim_ids == ["c_io"]
+    assert plan.redraft_page_ids == ["docs_getting-started"]
+    assert sorted(plan.reused_drafts) == ["docs_install", "products_overview", "reference_api-overview"]
+    assert plan.reused_drafts["docs_install"] == str((base / "drafts" / "docs" / "install.md").resolve())
+
+
+def test_plan_redrafts_changed_plan_entries_and_snippets(runs):
+    _, current = runs
+    _commit(current / "work" / "repo", {"examples/io.py": "e2"})
+    (current / "artifacts" / "resolved_refs.json").write_text(
+        json.dumps({"repo": {"resolved_sha": _git(current / "work" / "repo", "rev-parse", "HEAD")}})
+    )
+    plan_path = current / "artifacts" / "page_plan.json"
+    plan = json.loads(plan_path.read_text())
+    plan["pages"][0]["title"] = "Renamed"
+    plan_path.write_text(json.dumps(plan))
+
+    delta = compute_delta_plan(current, "base")
+
+    assert delta.redraft_page_ids == ["docs_getting-started", "products_overview", "reference_api-overview"]
+    assert sorted(delta.reused_drafts) == ["docs_install"]
+
+
+def test_draft_sections_reuses_base_drafts(runs):
+    base, current = runs
+    (base / "drafts" / "docs" / "install.md").write_text("base install draft\n")
+
+    draft_sections_node(_state(current, {DELTA_FROM_RUN_KEY: "base"}))
+
+    drafts = current / "drafts"
+    assert (drafts / "docs" / "install.md").read_text() == "base install draft\n"
+    assert (drafts / "docs" / "getting-started.md").read_text() == (
+        base / "drafts" / "docs" / "getting-started.md"
+    ).read_text()
+    manifest = json.loads((current / "artifacts" / "draft_manifest.json").read_text())
+    assert manifest["draft_count"] == len(PAGES)
+    delta = json.loads((current / "artifacts" / "delta_plan.json").read_text())
+    assert delta["base_run_id"] == "base" and delta["redraft_page_ids"] == ["docs_getting-started"]
+
+    assert review_scope(current) == ["drafts/docs/getting-started.md"]
+
+
+def test_falls_back_to_full_run(runs):
+    base, current = runs
+
+    assert compute_delta_plan(current, "missing") is None
+
+    # Base commit unreachable and no base clone to compare against
+    (current / "artifacts" / "resolved_refs.json").write_text(json.dumps({"repo": {"resolved_sha": "0" * 40}}))
+    assert compute_delta_plan(current, "base") is None
+
+    # No delta_plan.json: W5.5 reviews everything
+    draft_sections_node(_state(current, {DELTA_FROM_RUN_KEY: "base"}))
+    assert not (current / "artifacts" / "delta_plan.json").exists()
+    assert review_scope(current) is None
+
+
+def test_unchanged_repo_reuses_every_draft(runs):
+    base, current = runs
+    (current / "artifacts" / "resolved_refs.json").write_text(
+        (base / "artifacts" / "resolved_refs.json").read_text()
+    )
+
+    plan = compute_delta_plan(current, "base")
+
+    assert plan.changed_files == [] and plan.redraft_page_ids == []
+    assert len(plan.reused_drafts) == len(PAGES)
+
+
+def test_product_level_changes_redraft_dependent_pages(runs):
+    base, current = runs
+    (current / "artifacts" / "resolved_refs.json").write_text(
+        (base / "artifacts" / "resolved_refs.json").read_text()
+    )
+    for run_dir in (base, current):
+        plan_path = run_dir / "artifacts" / "page_plan.json"
+        plan = json.loads(plan_path.read_text())
+        plan["pages"][2]["required_headings"] = ["Limitations"]
+        plan_path.write_text(json.dumps(plan))
+
+    facts_path = current / "artifacts" / "product_facts.json"
+    facts = json.loads(facts_path.read_text())
+    facts["claims"].append({"claim_id": "c_limit", "claim_text": "No macro support"})
+    facts["claim_groups"] = {"limitations": ["c_limit"]}
+    facts_path.write_text(json.dumps(facts))
+
+    plan = compute_delta_plan(current, "base")
+    assert plan.changed_product_inputs == ["limitations"]
+    assert plan.redraft_page_ids == ["docs_install"]
+
+    facts["positioning"] = {"tagline": "Spreadsheets, simplified"}
+    facts_path.write_text(json.dumps(facts))
+
+    plan = compute_delta_plan(current, "base")
+    assert plan.changed_product_inputs == ["limitations", "positioning"]
+    assert len(plan.redraft_page_ids) == len(PAGES) and plan.reused_drafts == {}
@@ -0,0 +1,128 @@
+"""Tests for the per-section W5 fan-out in draft_sections_node.
+
+Covers parity of the merged draft_manifest.json and drafts with a single
+unscoped W5 run, reuse of intact sections on retry, and the merge error for
+a section without a partial manifest.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any, Dict
+
+import pytest
+
+from launch.orchestrator.graph import draft_sections_node
+from launch.workers.w5_section_writer import (
+    SECTION_SCOPE_KEY,
+    SectionWriterError,
+    execute_section_writer,
+    merge_draft_manifests,
+)
+
+PAGES = [
+    ("kb", "faq"),
+    ("products", "overview"),
+    ("docs", "getting-started"),
+    ("docs", "install"),
+    ("reference", "api-overview"),
+]
+
+
+@pytest.fixture(autouse=True)
+def _no_worker_cache(monkeypatch):
+    monkeypatch.setenv("LAUNCH_WORKER_CACHE", "0")
+
+
+def _make_run(root: Path) -> Path:
+    run_dir = root / "run-1"
+    artifacts = run_dir / "artifacts"
+    artifacts.mkdir(parents=True)
+    pages = [
+        {
+            "section": section,
+            "slug": slug,
+            "output_path": f"content/docs.example.org/widget/en/{section}/{slug}.md",
+            "url_path": f"/widget/{section}/{slug}/",
+            "title": slug.replace("-", " ").title(),
+            "purpose": f"{slug} page",
+            "required_headings": [],
+            "required_claim_ids": [],
+            "required_snippet_tags": [],
+        }
+        for section, slug in PAGES
+    ]
+    (artifacts / "page_plan.json").write_text(json.dumps({"schema_version": "1.0", "pages": pages}))
+    (artifacts / "product_facts.json").write_text(
+        json.dumps({"product_name": "Widget", "claims": [{"claim_id": "c1", "claim_text": "Reads XLSX"}]})
+    )
+    (artifacts / "snippet_catalog.json").write_text(json.dumps({"snippets": []}))
+    return run_dir
+
+
+def _state(run_dir: Path) -> Dict[str, Any]:
+    return {
+        "run_id": "run-1",
+        "run_state": "PLAN_READY",
+        "run_dir": str(run_dir),
+        "run_config": {"run_id": "run-1", "offline_mode": True},
+        "snapshot": {},
+        "issues": [],
+        "fix_attempts": 0,
+        "current_issue": None,
+    }
+
+
+def _drafts(run_dir: Path) -> Dict[str, bytes]:
+    return {
+        p.relative_to(run_dir).as_posix(): p.read_bytes()
+        for p in sorted((run_dir / "drafts").rglob("*.md"))
+    }
+
+
+def test_fanout_matches_single_run(tmp_path: Path):
+    serial = _make_run(tmp_path / "serial")
+    execute_section_writer(serial, {"run_id": "run-1"})
+
+    fanned = _make_run(tmp_path / "fanned")
+    state = draft_sections_node(_state(fanned))
+
+    assert state["run_state"] == "DRAFT_READY"
+    manifest = "artifacts/draft_manifest.json"
+    assert (fanned / manifest).read_bytes() == (serial / manifest).read_bytes()
+    assert _drafts(fanned) == _drafts(serial)
+
+    events = [json.loads(line) for line in (fanned / "events.ndjson").read_text().splitlines()]
+    queued = [e["payload"]["scope_key"] for e in events if e["type"] == "WORK_ITEM_QUEUED"]
+    assert queued == ["products", "docs", "reference", "kb"]
+
+
+def test_retry_reuses_intact_sections(tmp_path: Path):
+    run_dir = _make_run(tmp_path)
+    config = {"run_id": "run-1"}
+
+    first = execute_section_writer(run_dir, {**config, SECTION_SCOPE_KEY: "docs"})
+    assert first["reused"] is False and first["draft_count"] == 2
+
+    again = execute_section_writer(run_dir, {**config, SECTION_SCOPE_KEY: "docs"})
+    assert again["reused"] is True
+
+    # A damaged draft forces a redraft of that section only
+    (run_dir / "drafts" / "docs" / "install.md").write_text("truncated")
+    redone = execute_section_writer(run_dir, {**config, SECTION_SCOPE_KEY: "docs"})
+    assert redone["reused"] is False
+    assert (run_dir / "drafts" / "docs" / "install.md").read_text() != "truncated"
+
+    # Changed inputs invalidate the partial
+    (run_dir / "artifacts" / "snippet_catalog.json").write_text(json.dumps({"snippets": [], "v": 2}))
+    assert execute_section_writer(run_dir, {**config, SECTION_SCOPE_KEY: "docs"})["reused"] is False
+
+
+def test_merge_requires_every_planned_section(tmp_path: Path):
+    run_dir = _make_run(tmp_path)
+    assert merge_draft_manifests(run_dir, "run-1") is None  # unscoped runs write their own manifest
+
+    execute_section_writer(run_dir, {"run_id": "run-1", SECTION_SCOPE_KEY: "docs"})
+    with pytest.raises(SectionWriterError, match="products, reference, kb"):
+        merge_draft_manifests(run_dir, "run-1")
@@ -0,0 +1,158 @@
+"""Tests for worker output memoization in WorkerInvoker.
+
+Covers cache hits and misses keyed on input artifact hashes, the run_config
+subset, worker code version, repo files and template trees, output
+restoration into a fresh RUN_DIR, and the cache_hit flag on
+WORK_ITEM_FINISHED events.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any, Dict, List
+from unittest.mock import patch
+
+import pytest
+
+from launch.orchestrator.worker_cache import WorkerOutputCache, worker_code_version
+from launch.orchestrator.worker_invoker import WorkerInvoker
+
+CALLS: List[Path] = []
+
+
+def stub_ia_planner(run_dir: Path, run_config: Dict[str, Any]) -> Dict[str, Any]:
+    CALLS.append(run_dir)
+    facts = json.loads((run_dir / "artifacts" / "product_facts.json").read_text())
+    (run_dir / "artifacts" / "page_plan.json").write_text(
+        json.dumps({"product": facts["product"], "pages": []}, sort_keys=True)
+    )
+    return {"status": "success", "pages": 0}
+
+
+def stub_validator(run_dir: Path, run_config: Dict[str, Any]) -> Dict[str, Any]:
+    CALLS.append(run_dir)
+    (run_dir / "artifacts" / "validation_report.json").write_text("{}")
+    return {"status": "success"}
+
+
+STUB_DISPATCH = {"W4.IAPlanner": stub_ia_planner, "W7.Validator": stub_validator}
+
+W4_INPUTS = ["product_facts.json", "evidence_map.json", "snippet_catalog.json"]
+
+
+@pytest.fixture(autouse=True)
+def _reset_calls(monkeypatch):
+    monkeypatch.delenv("LAUNCH_WORKER_CACHE", raising=False)
+    monkeypatch.delenv("LAUNCH_WORKER_CACHE_DIR", raising=False)
+    CALLS.clear()
+
+
+def _make_run(runs_dir: Path, run_id: str, product: str = "Widget") -> Path:
+    run_dir = runs_dir / run_id
+    (run_dir / "artifacts").mkdir(parents=True)
+    (run_dir / "artifacts" / "product_facts.json").write_text(json.dumps({"product": product}))
+    (run_dir / "artifacts" / "snippet_catalog.json").write_text("[]")
+    return run_dir
+
+
+def _invoke(run_dir: Path, worker: str = "W4.IAPlanner", run_config=None, inputs=W4_INPUTS):
+    invoker = WorkerInvoker(run_dir.name, run_dir, "trace", "span")
+    return invoker.invoke_worker(worker, inputs, [], run_config=run_config or {"family": "words"})
+
+
+def _finished_events(run_dir: Path) -> List[Dict[str, Any]]:
+    events = [json.loads(line) for line in (run_dir / "events.ndjson").read_text().splitlines()]
+    return [e for e in events if e["type"] == "WORK_ITEM_FINISHED"]
+
+
+@patch("launch.orchestrator.worker_invoker.WORKER_DISPATCH", STUB_DISPATCH)
+def test_second_run_restores_outputs_without_invoking(tmp_path: Path):
+    run_a = _make_run(tmp_path / "runs", "run-a")
+    run_b = _make_run(tmp_path / "runs", "run-b")
+
+    first = _invoke(run_a)
+    second = _invoke(run_b, run_config={"family": "words", "site_ref": "moved", "_telemetry_client": object()})
+
+    assert CALLS == [run_a]
+    assert second["cache_hit"] is True
+    assert second["pages"] == first["pages"]
+    assert (run_b / "artifacts" / "page_plan.json").read_bytes() == (
+        run_a / "artifacts" / "page_plan.json"
+    ).read_bytes()
+    assert _finished_events(run_a)[0]["payload"]["cache_hit"] is False
+    assert _finished_events(run_b)[0]["payload"]["cache_hit"] is True
+
+
+@patch("launch.orchestrator.worker_invoker.WORKER_DISPATCH", STUB_DISPATCH)
+def test_changed_input_or_config_misses(tmp_path: Path):
+    _invoke(_make_run(tmp_path / "runs", "run-a"))
+    _invoke(_make_run(tmp_path / "runs", "run-b", product="Gadget"))
+    _invoke(_make_run(tmp_path / "runs", "run-c"), run_config={"family": "cells"})
+
+    assert len(CALLS) == 3
+
+
+@patch("launch.orchestrator.worker_invoker.WORKER_DISPATCH", STUB_DISPATCH)
+def test_non_cacheable_worker_always_runs(tmp_path: Path):
+    _invoke(_make_run(tmp_path / "runs", "run-a"), worker="W7.Validator", inputs=["patch_bundle.json"])
+    _invoke(_make_run(tmp_path / "runs", "run-b"), worker="W7.Validator", inputs=["patch_bundle.json"])
+
+    assert len(CALLS) == 2
+
+
+@patch("launch.orchestrator.worker_invoker.WORKER_DISPATCH", STUB_DISPATCH)
+def test_cache_can_be_disabled(tmp_path: Path, monkeypatch):
+    monkeypatch.setenv("LAUNCH_WORKER_CACHE", "0")
+    _invoke(_make_run(tmp_path / "runs", "run-a"))
+    _invoke(_make_run(tmp_path / "runs", "run-b"))
+
+    assert len(CALLS) == 2
+    assert not (tmp_path / "runs" / ".worker_cache").exists()
+
+
+def test_corrupt_entry_is_a_miss(tmp_path: Path):
+    run_dir = _make_run(tmp_path / "runs", "run-a")
+    cache = WorkerOutputCache(tmp_path / "cache")
+    key = cache.compute_key("W4.IAPlanner", stub_ia_planner, run_dir, W4_INPUTS, {})
+    stub_ia_planner(run_dir, {})
+    cache.store(key, "W4.IAPlanner", run_dir, ["artifacts/page_plan.json"], {})
+    assert cache.lookup(key) is not None
+
+    (tmp_path / "cache" / key[:2] / key / "files" / "artifacts" / "page_plan.json").unlink()
+    assert cache.lookup(key) is None
+
+
+def test_code_version_covers_worker_package():
+    from launch.workers.w4_ia_planner import execute_ia_planner
+
+    version = worker_code_version(execute_ia_planner)
+    assert version == worker_code_version(execute_ia_planner)
+    assert version != worker_code_version(stub_ia_planner)
+    assert version != worker_code_version(execute_ia_planner, ("content",))
+
+
+def test_ruleset_and_template_changes_miss(tmp_path: Path):
+    repo_root = tmp_path / "repo"
+    ruleset = repo_root / "specs" / "rulesets" / "ruleset.v1.yaml"
+    template = repo_root / "specs" / "templates" / "docs.aspose.org" / "words" / "en" / "_index.md"
+    ruleset.parent.mkdir(parents=True)
+    template.parent.mkdir(parents=True)
+    ruleset.write_text("sections: {}\n")
+    template.write_text("---\ntitle: Words\n---\n")
+
+    run_dir = _make_run(tmp_path / "runs", "run-a")
+    cache = WorkerOutputCache(tmp_path / "cache", repo_root=repo_root)
+
+    def key() -> str:
+        return cache.compute_key("W4.IAPlanner", stub_ia_planner, run_dir, W4_INPUTS, {})
+
+    first = key()
+    assert key() == first
+
+    ruleset.write_text("sections: {docs: {min_pages: 2}}\n")
+    second = key()
+    assert second != first
+
+    template.write_text("---\ntitle: Words for Python\n---\n")
+    assert key() not in (first, second)
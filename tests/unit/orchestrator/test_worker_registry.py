@@ -0,0 +1,52 @@
+"""Tests for the lazy worker registry behind WORKER_DISPATCH."""
+
+from __future__ import annotations
+
+import sys
+
+import pytest
+
+from launch.orchestrator.worker_registry import (
+    BUILTIN_WORKERS,
+    LazyWorkerRegistry,
+    resolve_target,
+)
+
+
+def test_lookup_imports_only_the_dispatched_worker():
+    registry = LazyWorkerRegistry(BUILTIN_WORKERS)
+
+    assert "W7.Validator" in registry
+    assert not registry.is_loaded("W7.Validator")
+    assert list(registry) == list(BUILTIN_WORKERS)
+
+    executor = registry["W7.Validator"]
+
+    assert executor.__name__ == "execute_validator"
+    assert registry.is_loaded("W7.Validator")
+    assert not registry.is_loaded("W9.PRManager")
+    assert registry["W7.Validator"] is executor
+
+
+def test_builtin_targets_resolve():
+    for name, target in BUILTIN_WORKERS.items():
+        module_name, _, attr = target.partition(":")
+        assert callable(resolve_target(target)), name
+        assert module_name in sys.modules
+
+
+def test_unknown_worker_and_registration():
+    registry = LazyWorkerRegistry({})
+
+    assert "W10.Extra" not in registry
+    with pytest.raises(KeyError):
+        registry["W10.Extra"]
+
+    registry.register("W10.Extra", "launch.orchestrator.worker_registry:resolve_target")
+    assert registry["W10.Extra"] is resolve_target
+    assert len(registry) == 1
+
+
+def test_invalid_target():
+    with pytest.raises(ValueError, match="module:attribute"):
+        resolve_target("launch.workers.w7_validator")
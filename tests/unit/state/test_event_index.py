@@ -0,0 +1,135 @@
+"""Unit tests for the events.idx sidecar index (launch.state.event_index).
+
+Covers index maintenance on append, indexed lookups, catch-up and repair
+of stale or corrupt indexes, and parity of indexed replay with
+replay_events.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from launch.models.event import Event
+from launch.state.event_index import (
+    RECORD_SIZE,
+    EventIndex,
+    event_index_path,
+    rebuild_event_index,
+)
+from launch.state.event_log import append_event, capture_events, flush_captured_events, iter_event_lines
+from launch.state.snapshot_manager import replay_events, replay_indexed_events
+
+
+def _event(i: int, event_type: str, payload=None) -> Event:
+    return Event(
+        event_id=f"evt-{i:04d}",
+        run_id="run",
+        ts=f"2026-01-01T00:{i // 60:02d}:{i % 60:02d}+00:00",
+        type=event_type,
+        payload=payload if payload is not None else {"n": i},
+        trace_id="t",
+        span_id="s",
+    )
+
+
+def _write_run(path: Path) -> None:
+    append_event(path, _event(0, "RUN_CREATED"))
+    append_event(path, _event(1, "RUN_STATE_CHANGED", {"old_state": "CREATED", "new_state": "INGESTED"}))
+    for i in range(2, 32, 3):
+        wid = f"w{i}"
+        append_event(path, _event(i, "WORK_ITEM_QUEUED", {"work_item_id": wid, "worker": "W1"}))
+        append_event(path, _event(i + 1, "LLM_CALL_FINISHED", {"call_id": f"c{i}"}))
+        append_event(path, _event(i + 2, "WORK_ITEM_FINISHED", {"work_item_id": wid}))
+    append_event(path, _event(40, "ISSUE_OPENED", {"issue": {"issue_id": "i1", "status": "OPEN"}}))
+    append_event(path, _event(41, "ARTIFACT_WRITTEN", {"name": "a.json", "path": "a.json", "sha256": "x"}))
+    append_event(path, _event(42, "RUN_STATE_CHANGED", {"old_state": "INGESTED", "new_state": "DONE"}))
+
+
+@pytest.fixture
+def events_file(tmp_path: Path) -> Path:
+    path = tmp_path / "events.ndjson"
+    _write_run(path)
+    return path
+
+
+def test_append_maintains_index(events_file):
+    lines = list(iter_event_lines(events_file))
+    index_file = event_index_path(events_file)
+
+    assert index_file.name == "events.idx"
+    assert index_file.stat().st_size == len(lines) * RECORD_SIZE
+    assert rebuild_event_index(events_file) == len(lines)
+    assert index_file.stat().st_size == len(lines) * RECORD_SIZE
+
+
+def test_indexed_lookups(events_file):
+    index = EventIndex(events_file)
+
+    assert index.last("RUN_STATE_CHANGED")["payload"]["new_state"] == "DONE"
+    assert index.last("RUN_CANCELLED") is None
+    assert [e["type"] for e in index.events(work_item_id="w8")] == ["WORK_ITEM_QUEUED", "WORK_ITEM_FINISHED"]
+    assert [e["payload"]["call_id"] for e in index.events(["LLM_CALL_FINISHED"], since_ts="2026-01-01T00:00:24Z")] == [
+        "c23", "c26", "c29",
+    ]
+    assert index.count(["LLM_CALL_FINISHED", "ISSUE_OPENED", "NEVER"]) == {
+        "LLM_CALL_FINISHED": 10, "ISSUE_OPENED": 1, "NEVER": 0,
+    }
+    assert (index.first_ts(), index.last_ts()) == ("2026-01-01T00:00:00+00:00", "2026-01-01T00:00:42+00:00")
+
+
+def test_indexed_replay_matches_full_replay(events_file):
+    assert replay_indexed_events(events_file, "run").to_dict() == replay_events(events_file, "run").to_dict()
+
+
+def test_captured_events_are_indexed_on_flush(tmp_path):
+    path = tmp_path / "events.ndjson"
+    with capture_events() as buffer:
+        _write_run(path)
+    assert not path.exists()
+
+    flush_captured_events(buffer)
+    assert event_index_path(path).stat().st_size == len(buffer) * RECORD_SIZE
+    assert EventIndex(path).last("RUN_STATE_CHANGED")["event_id"] == "evt-0042"
+
+
+def test_stale_and_corrupt_indexes_are_repaired(events_file):
+    index_file = event_index_path(events_file)
+    total = len(list(iter_event_lines(events_file)))
+
+    # Log written before the index existed: built on first read, then maintained
+    index_file.unlink()
+    append_event(events_file, _event(43, "RUN_STATE_CHANGED", {"new_state": "FAILED"}))
+    assert not index_file.exists()
+    assert EventIndex(events_file).last("RUN_STATE_CHANGED")["payload"]["new_state"] == "FAILED"
+    assert len(EventIndex(events_file)) == total + 1
+
+    # Lines appended without index records are caught up
+    with events_file.open("a") as f:
+        f.write('{"event_id":"evt-0044","ts":"2026-01-01T00:00:44+00:00","type":"RUN_STATE_CHANGED",'
+                '"payload":{"new_state":"DONE"}}\n')
+    assert EventIndex(events_file).last("RUN_STATE_CHANGED")["event_id"] == "evt-0044"
+    assert index_file.stat().st_size == (total + 2) * RECORD_SIZE
+
+    # A line appended between indexed lines leaves a gap, which forces a rebuild
+    with events_file.open("a") as f:
+        f.write('{"event_id":"evt-0045","ts":"2026-01-01T00:00:45+00:00","type":"ARTIFACT_WRITTEN",'
+                '"payload":{"name":"b.json"}}\n')
+    append_event(events_file, _event(46, "RUN_STATE_CHANGED", {"new_state": "DONE"}))
+    index = EventIndex(events_file)
+    assert len(index) == total + 4
+    assert index.count(["ARTIFACT_WRITTEN"]) == {"ARTIFACT_WRITTEN": 2}
+    total += 2
+
+    # A torn trailing record is dropped
+    index_file.write_bytes(index_file.read_bytes() + b"\x00\x01")
+    assert len(EventIndex(events_file)) == total + 2
+    assert index_file.stat().st_size == (total + 2) * RECORD_SIZE
+
+    # An index pointing past the end of the log (truncated log) is rebuilt
+    lines = [line for _, line in iter_event_lines(events_file)]
+    events_file.write_bytes(b"".join(lines[:5]))
+    index = EventIndex(events_file)
+    assert len(index) == 5 and index.last_ts() == "2026-01-01T00:00:04+00:00"
+    assert index_file.stat().st_size == 5 * RECORD_SIZE
@@ -0,0 +1,114 @@
+"""Unit tests for the streaming event log reader (launch.state.event_log).
+
+Covers type/time/offset filtering, payload projection, the raw-line
+pre-filter, counting, and parity with read_events.
+"""
+
+from __future__ import annotations
+
+import json
+import tracemalloc
+from pathlib import Path
+
+import pytest
+
+from launch.models.event import Event
+from launch.state.event_log import (
+    append_event,
+    count_events,
+    iter_event_lines,
+    iter_events,
+    read_events,
+)
+
+
+def _event(i: int, event_type: str, payload=None) -> Event:
+    return Event(
+        event_id=f"evt-{i:04d}",
+        run_id="run",
+        ts=f"2026-01-01T00:{i // 60:02d}:{i % 60:02d}+00:00",
+        type=event_type,
+        payload=payload if payload is not None else {"n": i, "blob": "x" * 10},
+        trace_id="t",
+        span_id="s",
+    )
+
+
+@pytest.fixture
+def events_file(tmp_path: Path) -> Path:
+    path = tmp_path / "events.ndjson"
+    types = ["WORK_ITEM_STARTED", "LLM_CALL_FINISHED", "WORK_ITEM_FINISHED"]
+    for i in range(30):
+        append_event(path, _event(i, types[i % 3], {"n": i, "call_id": f"c{i}", "blob": "x" * 10}))
+    return path
+
+
+def test_iter_events_matches_read_events(events_file):
+    assert [Event.from_dict(e).to_dict() for e in iter_events(events_file)] == [
+        e.to_dict() for e in read_events(events_file)
+    ]
+    assert read_events(events_file.parent / "missing.ndjson") == []
+
+
+def test_type_time_and_projection_filters(events_file):
+    finished = list(iter_events(events_file, types={"LLM_CALL_FINISHED"}, payload_keys=["call_id"]))
+    assert [e["payload"] for e in finished] == [{"call_id": f"c{i}"} for i in range(1, 30, 3)]
+
+    recent = list(iter_events(events_file, since_ts="2026-01-01T00:00:25Z"))
+    assert [e["event_id"] for e in recent] == [f"evt-{i:04d}" for i in range(25, 30)]
+
+    both = list(iter_events(events_file, types=["WORK_ITEM_STARTED"], since_ts="2026-01-01T00:00:20+00:00"))
+    assert [e["payload"]["n"] for e in both] == [21, 24, 27]
+
+
+def test_prefilter_matches_spaced_json_and_skips_payload_mentions(tmp_path):
+    path = tmp_path / "events.ndjson"
+    path.write_text(
+        json.dumps({"event_id": "1", "ts": "2026-01-01T00:00:00Z", "type": "HUGO_BUILD_STARTED", "payload": {}}) + "\n"
+        + json.dumps({"event_id": "2", "ts": "2026-01-01T00:00:01Z", "type": "OTHER",
+                      "payload": {"note": "HUGO_BUILD_STARTED"}}) + "\n"
+        + "not json\n\n"
+    )
+
+    events = list(iter_events(path, types={"HUGO_BUILD_STARTED"}, skip_invalid=True))
+    assert [e["event_id"] for e in events] == ["1"]
+    with pytest.raises(json.JSONDecodeError):
+        list(iter_events(path))
+
+
+def test_since_offset_resumes_after_last_line(events_file):
+    lines = list(iter_event_lines(events_file))
+    offset, line = lines[9]
+    resume_at = offset + len(line)
+
+    rest = list(iter_events(events_file, since_offset=resume_at))
+    assert [e["event_id"] for e in rest] == [f"evt-{i:04d}" for i in range(10, 30)]
+
+    append_event(events_file, _event(30, "RUN_COMPLETED"))
+    tail = list(iter_events(events_file, since_offset=lines[-1][0] + len(lines[-1][1])))
+    assert [e["type"] for e in tail] == ["RUN_COMPLETED"]
+
+
+def test_count_events(events_file):
+    assert count_events(events_file) == {
+        "WORK_ITEM_STARTED": 10, "LLM_CALL_FINISHED": 10, "WORK_ITEM_FINISHED": 10,
+    }
+    assert count_events(events_file, types={"LLM_CALL_FINISHED"}, since_ts="2026-01-01T00:00:15Z") == {
+        "LLM_CALL_FINISHED": 5,
+    }
+
+
+def test_memory_bounded_on_large_log(tmp_path):
+    path = tmp_path / "events.ndjson"
+    line = json.dumps(_event(0, "LLM_CALL_FINISHED", {"blob": "y" * 2000}).to_dict()) + "\n"
+    with path.open("w") as f:
+        f.writelines(line for _ in range(5000))  # ~10 MB
+
+    tracemalloc.start()
+    try:
+        assert count_events(path)["LLM_CALL_FINISHED"] == 5000
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert peak < 1_000_000
@@ -0,0 +1,68 @@
+"""
+Import-time budget for CLI and MCP entry points.
+
+Read-only commands (launch_run status/list, launch_validate, the MCP server)
+must start well under a second, so their entry modules must not import
+LangGraph or any worker at import time. Measured with `python -X importtime`
+in a fresh interpreter; the budget is the cumulative import time of the
+entry module.
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, Tuple
+
+import pytest
+
+SRC_DIR = Path(__file__).resolve().parents[2] / "src"
+
+# Cumulative import time budget per entry module (microseconds)
+IMPORT_BUDGET_US = 750_000
+
+ENTRY_MODULES = [
+    "launch.cli",
+    "launch.validators.cli",
+    "launch.mcp.server",
+    "launch.orchestrator.worker_invoker",
+]
+
+# Modules that must only be imported once a run actually executes
+DEFERRED_PREFIXES = ("langgraph", "langchain", "launch.workers.w", "launch.orchestrator.graph")
+
+
+def _import_profile(module: str) -> Dict[str, Tuple[int, int]]:
+    """Return {module: (self_us, cumulative_us)} for a fresh import of module."""
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(SRC_DIR), env.get("PYTHONPATH")]))
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-W", "ignore", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        env=env,
+        timeout=60,
+    )
+    assert result.returncode == 0, result.stderr[-2000:]
+
+    profile: Dict[str, Tuple[int, int]] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        profile[name.strip()] = (int(self_us), int(cumulative_us))
+    return profile
+
+
+@pytest.mark.parametrize("module", ENTRY_MODULES)
+def test_entry_module_defers_heavy_imports(module):
+    profile = _import_profile(module)
+
+    eager = sorted(name for name in profile if name.startswith(DEFERRED_PREFIXES))
+    assert eager == [], f"{module} imports {eager[:5]} at import time"
+
+    cumulative_us = profile[module][1]
+    assert cumulative_us < IMPORT_BUDGET_US, (
+        f"{module} took {cumulative_us / 1000:.0f} ms to import "
+        f"(budget {IMPORT_BUDGET_US / 1000:.0f} ms)"
+    )
@@ -0,0 +1,132 @@
+"""Tests for the compiled write-fence policy (launch.util.write_fence)."""
+
+from __future__ import annotations
+
+import itertools
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+from launch.util import write_fence
+from launch.util.path_validation import (
+    PathPrefixTrie,
+    PathValidationError,
+    compile_path_patterns,
+)
+from launch.util.write_fence import WriteFence, get_write_fence, load_taskcard_policy
+
+PATTERNS = [
+    "src/launch/**", "reports/**", "pyproject.toml", "src/**/*.py", "src/launch/workers/w1_*/**",
+    "*.md", "docs/?.txt", "a/[bc]/x", "a/[!b]/y", "**", "/abs/**", "x/**/y", "[!.]*.cfg", "a.b/**",
+]
+PATHS = [
+    "src/launch/a.py", "src/launch", "x/src/launch/b.py", "reports/a/b/c.md", "reports", "pyproject.toml",
+    "sub/pyproject.toml", "src/x/y/z.py", "src/launch/workers/w1_repo/worker.py", "README.md", "docs/a.txt",
+    "docs/ab.txt", "a/b/x", "a/c/x", "a/d/y", "a/b/y", "/abs/q", "x/q/y", "x/q/r/y", "setup.cfg",
+    ".setup.cfg", "a.b/c", "aXb/c", "q",
+]
+
+
+def _legacy_matches(path, patterns, repo_root) -> bool:
+    """The per-call implementation PathPatternMatcher replaced."""
+    path_obj = Path(path)
+    try:
+        relative = path_obj.relative_to(Path(repo_root).resolve()) if path_obj.is_absolute() else path_obj
+    except ValueError:
+        return False
+    relative_str = str(relative).replace("\\", "/")
+    for pattern in patterns:
+        pattern_str = str(pattern).replace("\\", "/")
+        if pattern_str == relative_str or relative.match(pattern_str):
+            return True
+        if pattern_str.endswith("/**"):
+            prefix = pattern_str[:-3]
+            if relative_str.startswith(prefix + "/") or relative_str == prefix:
+                return True
+    return False
+
+
+def _taskcard(root: Path, status: str = "In-Progress", allowed: str = "src/launch/ok/**") -> Path:
+    path = root / "plans" / "taskcards" / "TC-999_test.md"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(f"---\nid: TC-999\nstatus: {status}\nallowed_paths:\n  - {allowed}\n---\n")
+    return path
+
+
+def test_matcher_matches_legacy_semantics(tmp_path: Path):
+    candidates = PATHS + [str(tmp_path / p) for p in PATHS if not p.startswith("/")]
+    for combo in itertools.chain(([p] for p in PATTERNS), itertools.combinations(PATTERNS, 3)):
+        matcher = compile_path_patterns(combo, tmp_path)
+        for path in candidates:
+            assert matcher.matches(path) == _legacy_matches(path, combo, tmp_path), (combo, path)
+
+
+def test_prefix_trie_alignment():
+    trie = PathPrefixTrie(["content/doc", "static"])
+
+    assert trie.has_prefix_of("content/docs/page.md")
+    assert trie.has_prefix_of("static")
+    assert trie.has_prefix_of("content/doc", aligned=True)
+    assert not trie.has_prefix_of("content/docs/page.md", aligned=True)
+    assert trie.has_prefix_of("content/doc/page.md", aligned=True)
+    assert not trie.has_prefix_of("content")
+
+
+def test_fence_error_codes(tmp_path: Path):
+    _taskcard(tmp_path)
+
+    WriteFence(tmp_path, "TC-999").check(tmp_path / "src" / "launch" / "ok" / "a.py")
+    WriteFence(tmp_path).check(tmp_path / "reports" / "a.md")
+
+    cases = [
+        (WriteFence(tmp_path), "POLICY_TASKCARD_MISSING"),
+        (WriteFence(tmp_path, "TC-404"), "POLICY_TASKCARD_MISSING"),
+        (WriteFence(tmp_path, "TC-999"), "POLICY_TASKCARD_PATH_VIOLATION"),
+        (WriteFence(tmp_path, "TC-999", allowed_paths=["specs/**"]), "POLICY_TASKCARD_PATH_VIOLATION"),
+    ]
+    for fence, code in cases:
+        with pytest.raises(PathValidationError) as exc_info:
+            fence.check(tmp_path / "src" / "launch" / "other.py")
+        assert exc_info.value.error_code == code
+    WriteFence(tmp_path, enforcement_mode="disabled").check(tmp_path / "src" / "launch" / "other.py")
+
+
+def test_taskcard_parsed_once_per_file_version(tmp_path: Path, monkeypatch):
+    path = _taskcard(tmp_path)
+    calls = []
+    real_load = write_fence.load_taskcard
+    monkeypatch.setattr(write_fence, "load_taskcard", lambda *a: calls.append(a) or real_load(*a))
+
+    fence = get_write_fence(tmp_path, "TC-999")
+    assert get_write_fence(tmp_path, "TC-999") is fence
+    for _ in range(50):
+        fence.check(tmp_path / "src" / "launch" / "ok" / "a.py")
+    assert len(calls) == 1
+
+    # Editing the taskcard (here: deactivating it) is picked up on the next write
+    _taskcard(tmp_path, status="Draft")
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    with pytest.raises(PathValidationError) as exc_info:
+        fence.check(tmp_path / "src" / "launch" / "ok" / "a.py")
+    assert exc_info.value.error_code == "POLICY_TASKCARD_INACTIVE"
+    assert len(calls) == 2
+    assert load_taskcard_policy("TC-999", tmp_path).taskcard["status"] == "Draft"
+
+
+def test_check_overhead_is_microseconds(tmp_path: Path):
+    _taskcard(tmp_path)
+    fence = get_write_fence(tmp_path, "TC-999")
+    protected = tmp_path / "src" / "launch" / "ok" / "deep" / "module.py"
+    fence.check(protected)
+
+    n = 5000
+    start = time.perf_counter()
+    for _ in range(n):
+        fence.check(protected)
+        fence.check(tmp_path / "reports" / "out.md")
+    per_check = (time.perf_counter() - start) / (2 * n)
+
+    assert per_check < 100e-6
@@ -0,0 +1,180 @@
+"""Unit tests for the run-scoped RepoContentStore shared by W1, W2 and W3.
+
+Tests cover:
+- Text decoding parity with Path.read_text(errors="ignore"/"replace")
+- Binary detection without retaining bytes or loading unread files
+- Derived value caching (lowercase, token sets)
+- LRU eviction under a byte budget
+- Revalidation when a file changes on disk
+- Registry sharing and release
+- One read per file across W1 discovery, W2 claims/evidence and W3 snippets
+
+Spec references:
+- specs/10_determinism_and_caching.md (Caching)
+- specs/02_repo_ingestion.md (Docs discovery)
+"""
+
+import json
+import os
+
+import pytest
+
+from launch.workers._shared.repo_content_store import (
+    RepoContentStore,
+    get_repo_content_store,
+    release_repo_content_stores,
+)
+
+
+@pytest.fixture(autouse=True)
+def _clean_registry():
+    release_repo_content_stores()
+    yield
+    release_repo_content_stores()
+
+
+class TestRepoContentStore:
+    """Test the store in isolation."""
+
+    def test_text_matches_read_text(self, tmp_path):
+        """Cached text is identical to read_text, including newline translation."""
+        f = tmp_path / "doc.md"
+        f.write_bytes(b"# Title\r\nline two\rthree\n\xff bad byte\n")
+        store = RepoContentStore(tmp_path)
+        assert store.get_text("doc.md") == f.read_text(encoding="utf-8", errors="ignore")
+
+    def test_replace_decoding_matches_read_text(self, tmp_path):
+        f = tmp_path / "doc.md"
+        f.write_bytes(b"title: caf\xe9\n")
+        (tmp_path / "ok.md").write_text("plain\n", encoding="utf-8")
+        store = RepoContentStore(tmp_path)
+        assert store.get_text("doc.md") == f.read_text(encoding="utf-8", errors="ignore")
+        assert store.get_text("doc.md", errors="replace") == f.read_text(encoding="utf-8", errors="replace")
+        assert store.get_text("ok.md", errors="replace") == "plain\n"
+        assert store.read_counts == {"doc.md": 1, "ok.md": 1}
+
+    def test_missing_file_returns_none(self, tmp_path):
+        store = RepoContentStore(tmp_path)
+        assert store.get_text("nope.md") is None
+        assert store.is_binary("nope.md") is True
+
+    def test_binary_detection_drops_bytes(self, tmp_path):
+        (tmp_path / "blob.dat").write_bytes(b"abc\x00def")
+        store = RepoContentStore(tmp_path)
+        assert store.is_binary("blob.dat") is True
+        assert store.bytes_used == 0
+
+    def test_binary_sniff_does_not_load_file(self, tmp_path):
+        (tmp_path / "vendor.js").write_text("x" * 100_000, encoding="utf-8")
+        store = RepoContentStore(tmp_path)
+        assert store.is_binary("vendor.js") is False
+        assert store.read_counts == {} and store.bytes_used == 0
+
+    def test_file_read_once(self, tmp_path):
+        (tmp_path / "a.md").write_text("Hello World", encoding="utf-8")
+        store = RepoContentStore(tmp_path)
+        store.get_text("a.md")
+        assert store.is_binary("a.md") is False
+        assert store.get_lower("a.md") == "hello world"
+        assert store.get_text(tmp_path / "a.md") == "Hello World"
+        assert store.read_counts == {"a.md": 1}
+        assert store.stats["hits"] >= 3
+
+    def test_derived_built_once(self, tmp_path):
+        (tmp_path / "a.md").write_text("x y z", encoding="utf-8")
+        store = RepoContentStore(tmp_path)
+        calls = []
+
+        def builder(text):
+            calls.append(text)
+            return frozenset(text.split())
+
+        assert store.get_derived("a.md", "tokens", builder) == frozenset({"x", "y", "z"})
+        store.get_derived("a.md", "tokens", builder)
+        assert len(calls) == 1
+
+    def test_lru_eviction_under_budget(self, tmp_path):
+        for name in ("a.md", "b.md", "c.md"):
+            (tmp_path / name).write_text(name * 40, encoding="utf-8")
+        store = RepoContentStore(tmp_path, max_bytes=250)
+        store.get_text("a.md")
+        store.get_text("b.md")
+        store.get_text("c.md")
+        assert store.stats["evictions"] >= 1
+        assert store.bytes_used <= 250
+        # Evicted entry is transparently re-read
+        assert store.get_text("a.md") == "a.md" * 40
+        assert store.read_counts["a.md"] == 2
+
+    def test_changed_file_is_reloaded(self, tmp_path):
+        f = tmp_path / "a.md"
+        f.write_text("old", encoding="utf-8")
+        store = RepoContentStore(tmp_path)
+        assert store.get_text("a.md") == "old"
+        f.write_text("newer content", encoding="utf-8")
+        os.utime(f, ns=(1, 1))
+        assert store.get_text("a.md") == "newer content"
+
+    def test_registry_shares_and_releases(self, tmp_path):
+        store = get_repo_content_store(tmp_path)
+        assert get_repo_content_store(tmp_path) is store
+        release_repo_content_stores(tmp_path)
+        assert get_repo_content_store(tmp_path) is not store
+
+
+class TestSharedAcrossWorkers:
+    """Test that W1, W2 and W3 consumers read each file once per run."""
+
+    def test_one_read_per_file(self, tmp_path):
+        from launch.workers.w1_repo_scout.discover_docs import (
+            build_discovered_docs_artifact,
+            discover_documentation_files,
+        )
+        from launch.workers.w1_repo_scout.frontmatter_discovery import build_frontmatter_contract
+        from launch.workers.w2_facts_builder.extract_claims import extract_claims
+        from launch.workers.w2_facts_builder.map_evidence import _load_and_tokenize_files
+        from launch.workers.w3_snippet_curator.extract_doc_snippets import extract_snippets_from_doc
+
+        repo_dir = tmp_path / "repo"
+        (repo_dir / "docs").mkdir(parents=True)
+        (repo_dir / "README.md").write_text(
+            "# Usage\n\nThis library supports reading PDF files.\n\n"
+            "```python\nimport lib\nlib.read('a.pdf')\n```\n",
+            encoding="utf-8",
+        )
+        (repo_dir / "docs" / "intro.md").write_text(
+            "---\ntitle: Intro\n---\n# Features\n\nIt can write DOCX files.\n",
+            encoding="utf-8",
+        )
+
+        docs = discover_documentation_files(repo_dir, gitignore_mode="ignore")
+        artifact = build_discovered_docs_artifact(repo_dir, [], docs)
+
+        build_frontmatter_contract(repo_dir, artifact, {}, {})
+
+        run_dir = tmp_path / "run"
+        (run_dir / "artifacts").mkdir(parents=True)
+        (run_dir / "artifacts" / "discovered_docs.json").write_text(json.dumps(artifact))
+        (run_dir / "artifacts" / "repo_inventory.json").write_text(
+            json.dumps({"repo_url": "https://github.com/x/lib", "repo_sha": "a" * 40})
+        )
+        extract_claims(repo_dir, run_dir)
+        _load_and_tokenize_files(docs, repo_dir, label="doc")
+        for doc in docs:
+            extract_snippets_from_doc(doc["path"], doc, repo_dir, None)
+
+        store = get_repo_content_store(repo_dir)
+        assert store.read_counts == {"README.md": 1, "docs/intro.md": 1}
+
+    def test_discovery_only_loads_doc_extension_files(self, tmp_path):
+        from launch.workers.w1_repo_scout.discover_docs import discover_documentation_files
+
+        (tmp_path / "README.md").write_text("# Lib\n", encoding="utf-8")
+        (tmp_path / "bundle.js").write_text("var x = 1;\n" * 10_000, encoding="utf-8")
+        (tmp_path / "data.bin").write_bytes(b"\x00" * 100_000)
+
+        store = RepoContentStore(tmp_path)
+        docs = discover_documentation_files(tmp_path, gitignore_mode="ignore", content_store=store)
+
+        assert {d["path"] for d in docs} == {"README.md", "bundle.js", "data.bin"}
+        assert store.read_counts == {"README.md": 1}
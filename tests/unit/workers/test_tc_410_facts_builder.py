@@ -11,12 +11,14 @@ Spec references:
 - specs/11_state_and_events.md (Event emission)
 """
 
+import importlib
 import json
 import pytest
 from pathlib import Path
 from typing import Dict, Any
 
 from launch.workers.w2_facts_builder import (
+    EVIDENCE_STREAMING_KEY,
     execute_facts_builder,
     FactsBuilderError,
     FactsBuilderClaimsError,
@@ -671,3 +673,38 @@ def test_facts_builder_artifact_validation(
     assert "workflow_claims" in claim_groups
     assert "limitations" in claim_groups
     assert "compatibility_notes" in claim_groups
+
+
+@pytest.mark.parametrize("flag", [True, False])
+def test_facts_builder_passes_evidence_streaming_flag(
+    mock_run_dir: Path,
+    mock_repo_dir: Path,
+    mock_repo_inventory: Dict[str, Any],
+    mock_discovered_docs: Dict[str, Any],
+    mock_discovered_examples: Dict[str, Any],
+    mock_run_config: Dict[str, Any],
+    monkeypatch,
+    flag: bool,
+):
+    """Test run_config evidence_streaming is forwarded to map_evidence."""
+    worker_module = importlib.import_module("launch.workers.w2_facts_builder.worker")
+    real_map_evidence = worker_module.map_evidence
+    calls = []
+
+    def recording_map_evidence(**kwargs):
+        calls.append(kwargs)
+        return real_map_evidence(**kwargs)
+
+    monkeypatch.setattr(worker_module, "map_evidence", recording_map_evidence)
+
+    result = execute_facts_builder(
+        run_dir=mock_run_dir,
+        run_config={**mock_run_config, EVIDENCE_STREAMING_KEY: flag},
+        run_id="test_run_streaming",
+        trace_id="trace_streaming",
+        span_id="span_streaming",
+        llm_client=None,
+    )
+
+    assert result["status"] == "success"
+    assert [call["streaming"] for call in calls] == [flag]
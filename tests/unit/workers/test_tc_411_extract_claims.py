@@ -12,7 +12,7 @@ TC-411: W2.1 Extract claims from product repo
 import json
 import tempfile
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Tuple
 from unittest.mock import MagicMock, Mock, patch
 
 import pytest
@@ -750,3 +750,89 @@ class TestTC1026NoExtractionLimits:
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
+
+
+def _git(repo_dir: Path, *args: str) -> None:
+    import subprocess
+    subprocess.run(
+        ["git", "-C", str(repo_dir), "-c", "user.name=t", "-c", "user.email=t@example.com", *args],
+        check=True, capture_output=True,
+    )
+
+
+class TestIncrementalExtraction:
+    """Per-document claims cache keyed by git blob SHA."""
+
+    @staticmethod
+    def _repo(tmp_path: Path, count: int = 3) -> Tuple[Path, list]:
+        repo_dir = tmp_path / "repo"
+        (repo_dir / "docs").mkdir(parents=True)
+        doc_files = []
+        for i in range(count):
+            (repo_dir / "docs" / f"doc_{i}.md").write_text(
+                f"# Doc {i}\n\nThe library supports format {i}.\nIt can export scene {i}.\n"
+            )
+            doc_files.append({'path': f'docs/doc_{i}.md'})
+        return repo_dir, doc_files
+
+    def test_list_blob_shas_matches_git_and_skips_dirty_files(self, tmp_path):
+        from src.launch.io.hashing import git_blob_sha
+        from src.launch.workers._git.clone_helpers import list_blob_shas
+
+        repo_dir, _ = self._repo(tmp_path)
+        _git(repo_dir, "init", "-q")
+        _git(repo_dir, "add", ".")
+        _git(repo_dir, "commit", "-q", "-m", "init")
+        (repo_dir / "docs" / "doc_1.md").write_text("edited\n")
+
+        shas = list_blob_shas(repo_dir)
+
+        assert sorted(shas) == ["docs/doc_0.md", "docs/doc_2.md"]
+        assert shas["docs/doc_0.md"] == git_blob_sha((repo_dir / "docs" / "doc_0.md").read_bytes())
+        assert list_blob_shas(tmp_path / "not-a-repo") == {}
+
+    def test_only_changed_docs_are_reextracted(self, tmp_path):
+        from src.launch.workers._shared.repo_content_store import release_repo_content_stores
+        from src.launch.workers.w2_facts_builder.extract_claims import extract_doc_claims_incremental
+
+        repo_dir, doc_files = self._repo(tmp_path)
+        _git(repo_dir, "init", "-q")
+        _git(repo_dir, "add", ".")
+        _git(repo_dir, "commit", "-q", "-m", "v1")
+        cache_dir = tmp_path / "cache"
+
+        _, stats = extract_doc_claims_incremental(doc_files, repo_dir, "P", cache_dir=cache_dir)
+        assert stats == {'docs_cached': 0, 'docs_extracted': 3}
+
+        # Relaunch at a newer commit where one doc changed
+        (repo_dir / "docs" / "doc_2.md").write_text("# Doc 2\n\nThe library supports format Z.\n")
+        _git(repo_dir, "commit", "-q", "-am", "v2")
+        release_repo_content_stores()
+
+        claims, stats = extract_doc_claims_incremental(doc_files, repo_dir, "P", cache_dir=cache_dir)
+        fresh, _ = extract_doc_claims_incremental(doc_files, repo_dir, "P")
+
+        assert stats == {'docs_cached': 2, 'docs_extracted': 1}
+        assert claims == fresh
+        assert any("format Z" in c['claim_text'] for c in claims)
+
+    def test_cache_key_includes_product_name(self, tmp_path):
+        from src.launch.workers.w2_facts_builder.extract_claims import extract_doc_claims_incremental
+
+        repo_dir, doc_files = self._repo(tmp_path, count=1)
+        cache_dir = tmp_path / "cache"
+        extract_doc_claims_incremental(doc_files, repo_dir, "Alpha", cache_dir=cache_dir)
+        _, stats = extract_doc_claims_incremental(doc_files, repo_dir, "Beta", cache_dir=cache_dir)
+
+        assert stats == {'docs_cached': 0, 'docs_extracted': 1}
+
+    def test_process_pool_matches_serial(self, tmp_path):
+        from src.launch.workers.w2_facts_builder.extract_claims import extract_doc_claims_incremental
+
+        repo_dir, doc_files = self._repo(tmp_path, count=40)
+
+        serial, _ = extract_doc_claims_incremental(doc_files, repo_dir, "P", max_workers=1)
+        parallel, _ = extract_doc_claims_incremental(doc_files, repo_dir, "P", max_workers=4)
+
+        assert parallel == serial
+        assert len(serial) == 80
@@ -9,6 +9,7 @@ Tests evidence mapping, relevance scoring, and artifact generation per:
 TC-412: W2.2 Map claims to evidence in docs and examples
 """
 
+import importlib
 import json
 import tempfile
 from pathlib import Path
@@ -1489,5 +1490,68 @@ class TestMapEvidenceTelemetry:
         assert "claims_with_evidence" in completed_event["payload"]
 
 
+class TestMapEvidenceStreaming:
+    """Test the opt-in streaming mode (run_config evidence_streaming)."""
+
+    def _setup(self, tmp_path):
+        repo_dir = tmp_path / "repo"
+        repo_dir.mkdir()
+        artifacts_dir = tmp_path / "run" / "artifacts"
+        artifacts_dir.mkdir(parents=True)
+
+        (repo_dir / "README.md").write_text("Supports OBJ and STL formats. Load a mesh with load_mesh.")
+        (repo_dir / "guide.md").write_text("Convert OBJ files to STL. Export scenes to GLTF.")
+        (repo_dir / "example.py").write_text("mesh = load_mesh('model.obj')\nmesh.save('model.stl')\n")
+
+        claims = [
+            {
+                "claim_id": f"claim_{i % 7:03d}",
+                "claim_text": text,
+                "claim_kind": "format",
+                "truth_status": "fact",
+                "citations": [],
+            }
+            for i, text in enumerate([
+                "supports obj format", "supports stl format", "export gltf scenes",
+                "load mesh from obj", "convert obj to stl", "unrelated python packaging",
+                "save mesh as stl", "obj files", "stl export",
+            ])
+        ]
+        (artifacts_dir / "extracted_claims.json").write_text(
+            json.dumps({"repo_url": "https://example.com/repo", "repo_sha": "abc123", "claims": claims})
+        )
+        (artifacts_dir / "discovered_docs.json").write_text(json.dumps({"doc_entrypoint_details": [
+            {"path": "README.md", "type": "README"},
+            {"path": "guide.md", "type": "guide"},
+            {"path": "missing.md", "type": "guide"},
+        ]}))
+        (artifacts_dir / "discovered_examples.json").write_text(json.dumps({"example_file_details": [
+            {"path": "example.py", "language": "python"},
+        ]}))
+        return repo_dir, tmp_path / "run"
+
+    def test_streaming_output_is_byte_identical(self, tmp_path, monkeypatch):
+        """Streaming mode writes the same evidence_map.json, even across spill runs."""
+        map_evidence_module = importlib.import_module("src.launch.workers.w2_facts_builder.map_evidence")
+
+        repo_dir, run_dir = self._setup(tmp_path)
+        evidence_path = run_dir / "artifacts" / "evidence_map.json"
+
+        legacy = map_evidence(repo_dir=repo_dir, run_dir=run_dir)
+        legacy_bytes = evidence_path.read_bytes()
+
+        monkeypatch.setattr(map_evidence_module, "STREAMING_SPILL_CLAIMS", 2)
+        streamed = map_evidence(repo_dir=repo_dir, run_dir=run_dir, streaming=True)
+
+        assert evidence_path.read_bytes() == legacy_bytes
+        assert streamed["metadata"] == legacy["metadata"]
+        assert list(streamed["claims"]) == legacy["claims"]
+        assert streamed.claim_ids() == {c["claim_id"] for c in legacy["claims"]}
+        # Spill runs are cleaned up
+        assert sorted(p.name for p in (run_dir / "artifacts").iterdir()) == [
+            "discovered_docs.json", "discovered_examples.json", "evidence_map.json", "extracted_claims.json",
+        ]
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -27,6 +27,7 @@ from typing import Any, Dict
 import pytest
 
 from src.launch.workers.w8_fixer import (
+    FIX_BATCH_MODE_KEY,
     FixerError,
     FixerIssueNotFoundError,
     FixerUnfixableError,
@@ -36,6 +37,7 @@ from src.launch.workers.w8_fixer import (
 )
 from src.launch.workers.w8_fixer.worker import (
     select_issue_to_fix,
+    select_issue_batch,
     fix_unresolved_token,
     fix_frontmatter_missing,
     fix_frontmatter_invalid_yaml,
@@ -644,3 +646,96 @@ def test_deterministic_event_emission(run_dir, mock_llm_client):
         assert "type" in event
         assert "trace_id" in event
         assert "span_id" in event
+
+
+# Tests for batch fix mode
+def _issue(issue_id, error_code, path, line=1, severity="error", message=""):
+    return {
+        "issue_id": issue_id,
+        "gate": "gate_x",
+        "severity": severity,
+        "message": message,
+        "error_code": error_code,
+        "location": {"path": path, "line": line},
+        "status": "OPEN",
+    }
+
+
+def test_select_issue_batch_groups_independent_issues():
+    """Batch takes the selected issue plus non-overlapping batchable issues."""
+    report = {
+        "issues": [
+            _issue("a_token", "GATE_TEMPLATE_TOKEN_UNRESOLVED", "a.md", 3, severity="blocker"),
+            _issue("a_token2", "GATE_TEMPLATE_TOKEN_UNRESOLVED", "a.md", 7),
+            _issue("a_fm", "GATE_FRONTMATTER_MISSING", "a.md"),
+            _issue("a_yaml", "GATE_FRONTMATTER_INVALID_YAML", "a.md"),
+            _issue("b_fm", "GATE_FRONTMATTER_MISSING", "b.md"),
+            _issue("c_other", "GATE_LINK_BROKEN", "c.md"),
+            _issue("d_warn", "GATE_FRONTMATTER_MISSING", "d.md", severity="warn"),
+        ]
+    }
+
+    batch = select_issue_batch(report)
+
+    assert [i["issue_id"] for i in batch] == ["a_token", "a_fm", "b_fm"]
+    assert select_issue_batch({"issues": []}) == []
+
+
+def test_select_issue_batch_unbatchable_lead_claims_its_file():
+    report = {
+        "issues": [
+            _issue("a_other", "GATE_LINK_BROKEN", "a.md", severity="blocker"),
+            _issue("a_fm", "GATE_FRONTMATTER_MISSING", "a.md"),
+            _issue("b_fm", "GATE_FRONTMATTER_MISSING", "b.md"),
+        ]
+    }
+
+    assert [i["issue_id"] for i in select_issue_batch(report)] == ["a_other", "b_fm"]
+
+
+def test_execute_fixer_batch_mode(run_dir, mock_llm_client):
+    """One pass fixes every independent issue, each with its own event and report."""
+    site = run_dir / "work" / "site"
+    page_a = site / "page-a.md"
+    page_a.write_text("Intro\nUses __PRODUCT_NAME__ here\nEnd\n", encoding="utf-8")
+    page_b = site / "page-b.md"
+    page_b.write_text("Body only\n", encoding="utf-8")
+    page_c = site / "page-c.md"
+    page_c.write_text("No token here\n", encoding="utf-8")
+
+    report = {
+        "schema_version": "1.0",
+        "ok": False,
+        "profile": "local",
+        "gates": [],
+        "issues": [
+            _issue("a_fm", "GATE_FRONTMATTER_MISSING", str(page_a), severity="blocker"),
+            _issue("a_token", "GATE_TEMPLATE_TOKEN_UNRESOLVED", str(page_a), 2,
+                   message="Unresolved template token found: __PRODUCT_NAME__"),
+            _issue("b_fm", "GATE_FRONTMATTER_MISSING", str(page_b)),
+            _issue("c_token", "GATE_TEMPLATE_TOKEN_UNRESOLVED", str(page_c), 1,
+                   message="Unresolved template token found: __MISSING__"),
+        ],
+    }
+    (run_dir / "artifacts" / "validation_report.json").write_text(json.dumps(report), encoding="utf-8")
+
+    result = execute_fixer(run_dir, {FIX_BATCH_MODE_KEY: True}, mock_llm_client)
+
+    assert result["status"] == "resolved"
+    assert result["issue_id"] == "a_fm"
+    assert result["files_changed"] == sorted([str(page_a), str(page_b)])
+    statuses = {r["issue_id"]: r["status"] for r in result["issues"]}
+    assert statuses == {"a_fm": "resolved", "a_token": "resolved", "b_fm": "resolved", "c_token": "no_diff"}
+
+    # Token removed at its reported line before frontmatter shifted the body
+    text_a = page_a.read_text(encoding="utf-8")
+    assert text_a.startswith("---\n") and "__PRODUCT_NAME__" not in text_a and "Intro" in text_a
+    assert page_b.read_text(encoding="utf-8").startswith("---\n")
+
+    events = [json.loads(line) for line in (run_dir / "events.ndjson").read_text().splitlines() if line.strip()]
+    types = [e["type"] for e in events]
+    assert types.count("FIXER_STARTED") == 1 and types.count("FIXER_COMPLETED") == 1
+    assert types.count("ISSUE_RESOLVED") == 3 and types.count("ISSUE_FIX_FAILED") == 1
+    for issue_id in ("a_fm", "a_token", "b_fm"):
+        assert (run_dir / "reports" / f"fix_{issue_id}.md").exists()
+    assert not (run_dir / "reports" / "fix_c_token.md").exists()
@@ -535,3 +535,113 @@ def test_detect_public_entrypoints_main_py(tmp_path):
 
     assert '__init__.py' in result
     assert '__main__.py' in result
+
+
+def _write_sdk(root, count):
+    src_dir = root / "src" / "sdk"
+    src_dir.mkdir(parents=True)
+    (src_dir / "__init__.py").write_text("__all__ = ['core']\n__version__ = '2.0'\n")
+    for i in range(count):
+        (src_dir / f"module_{i:05d}.py").write_text(
+            f"class Class{i}:\n    def method_{i}(self):\n        pass\n\n"
+            f"def function_{i}():\n    pass\n"
+        )
+
+
+def test_analyze_repository_code_has_no_file_cap(tmp_path):
+    """Test that every source file is analyzed (no 100-file cap)."""
+    _write_sdk(tmp_path, 150)
+
+    result = analyze_repository_code(tmp_path, {}, "Sdk", max_workers=1)
+
+    assert result["metadata"]["files_analyzed"] == 151
+    assert "Class149" in result["api_surface"]["classes"]
+    assert result["api_surface"]["modules"] == ["core"]
+    assert result["constants"]["version"] == "2.0"
+
+
+def test_analyze_repository_code_process_pool_matches_serial(tmp_path):
+    """Test that the process pool produces the same result as serial analysis."""
+    _write_sdk(tmp_path, 200)
+
+    serial = analyze_repository_code(tmp_path, {}, "Sdk", max_workers=1)
+    parallel = analyze_repository_code(tmp_path, {}, "Sdk", max_workers=4)
+
+    assert parallel["api_surface"] == serial["api_surface"]
+    assert parallel["constants"] == serial["constants"]
+    assert parallel["metadata"]["files_analyzed"] == 201
+
+
+def test_analyze_repository_code_caches_by_content(tmp_path, monkeypatch):
+    """Test that unchanged files are served from the cache across runs."""
+    from src.launch.workers.w2_facts_builder import code_analyzer
+
+    repo = tmp_path / "repo"
+    _write_sdk(repo, 10)
+    cache_dir = tmp_path / "cache"
+
+    cold = analyze_repository_code(repo, {}, "Sdk", cache_dir=cache_dir, max_workers=1)
+    assert cold["metadata"]["cache_hits"] == 0
+
+    # An identical checkout elsewhere hits the cache; only the edited file is parsed
+    copy = tmp_path / "copy"
+    _write_sdk(copy, 10)
+    (copy / "src" / "sdk" / "module_00003.py").write_text("class Edited:\n    pass\n")
+    parsed = []
+    real = code_analyzer.analyze_source_file
+    monkeypatch.setattr(code_analyzer, "analyze_source_file", lambda p: parsed.append(p.name) or real(p))
+
+    warm = analyze_repository_code(copy, {}, "Sdk", cache_dir=cache_dir, max_workers=1)
+
+    assert parsed == ["module_00003.py"]
+    assert warm["metadata"]["cache_hits"] == 10
+    assert "Edited" in warm["api_surface"]["classes"]
+    assert "Class3" not in warm["api_surface"]["classes"]
+    assert warm["api_surface"]["modules"] == cold["api_surface"]["modules"]
+
+
+def test_init_cache_entry_not_shared_with_identical_module(tmp_path):
+    """Test that an __init__.py never reuses the cache entry of a byte-identical module."""
+    repo = tmp_path / "repo"
+    pkg = repo / "src" / "sdk"
+    pkg.mkdir(parents=True)
+    source = "from .core import Engine\nfrom .io import Reader\n"
+    (pkg / "api.py").write_text(source)
+    (pkg / "__init__.py").write_text(source)
+    cache_dir = tmp_path / "cache"
+
+    uncached = analyze_repository_code(repo, {}, "Sdk", max_workers=1)
+    cold = analyze_repository_code(repo, {}, "Sdk", cache_dir=cache_dir, max_workers=1)
+    warm = analyze_repository_code(repo, {}, "Sdk", cache_dir=cache_dir, max_workers=1)
+
+    assert uncached["api_surface"]["modules"] == ["core", "io"]
+    assert cold["api_surface"] == uncached["api_surface"]
+    assert warm["metadata"]["cache_hits"] == 2
+    assert warm["api_surface"] == uncached["api_surface"]
+
+
+def test_analyze_repository_code_time_budget(tmp_path):
+    """Test that an exhausted time budget is reported instead of capping files."""
+    _write_sdk(tmp_path, 20)
+
+    result = analyze_repository_code(tmp_path, {}, "Sdk", time_budget_s=0, max_workers=1)
+
+    assert result["metadata"]["files_discovered"] == 21
+    assert result["metadata"]["files_analyzed"] == 0
+    assert result["metadata"]["files_skipped"] == 21
+    assert result["metadata"]["time_budget_exhausted"] is True
+
+
+def test_warm_cache_performance_budget(tmp_path):
+    """Test that a 5k-file SDK is analyzed in seconds on a warm cache."""
+    _write_sdk(tmp_path / "repo", 5000)
+    cache_dir = tmp_path / "cache"
+    analyze_repository_code(tmp_path / "repo", {}, "Sdk", cache_dir=cache_dir)
+
+    start_time = time.time()
+    result = analyze_repository_code(tmp_path / "repo", {}, "Sdk", cache_dir=cache_dir)
+    duration = time.time() - start_time
+
+    assert result["metadata"]["cache_hits"] == 5001
+    assert len(result["api_surface"]["classes"]) == 5000
+    assert duration < 5.0, f"Warm analysis took {duration:.2f}s, expected < 5.0s"
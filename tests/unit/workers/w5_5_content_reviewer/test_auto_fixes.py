@@ -157,6 +157,76 @@ class TestApplyAutoFixes:
         assert result[0]["fix_type"] == "max_iterations"
 
 
+class TestBatchedAutoFixes:
+    """Test single read/write per draft and parallel per-file fixing."""
+
+    CONTENT = "# Title\n\n### Skipped\n[claim: 12345678-1234-1234-1234-123456789abc]\n"
+
+    @staticmethod
+    def _issues(rel_path):
+        return [
+            {
+                "issue_id": f"{rel_path}:markers",
+                "auto_fixable": True,
+                "check": "content_quality.claim_marker_format",
+                "location": {"path": rel_path, "line": 4},
+            },
+            {
+                "issue_id": f"{rel_path}:headings",
+                "auto_fixable": True,
+                "check": "content_quality.heading_hierarchy",
+                "location": {"path": rel_path, "line": 3},
+            },
+        ]
+
+    def test_fixes_share_one_read_and_write(self, tmp_path, monkeypatch):
+        """All fixes for a draft apply to one buffer, read and written once."""
+        drafts_dir = tmp_path / "drafts"
+        drafts_dir.mkdir()
+        draft = drafts_dir / "page.md"
+        draft.write_text(self.CONTENT, encoding="utf-8")
+
+        calls = []
+        real_read, real_write = Path.read_text, Path.write_text
+        monkeypatch.setattr(Path, "read_text", lambda self, *a, **k: calls.append("read") or real_read(self, *a, **k))
+        monkeypatch.setattr(Path, "write_text", lambda self, *a, **k: calls.append("write") or real_write(self, *a, **k))
+
+        tracker = IterationTracker(run_dir=tmp_path)
+        results = apply_auto_fixes(self._issues("drafts/page.md"), drafts_dir, {}, tracker)
+
+        assert calls == ["read", "write"]
+        assert [r["success"] for r in results] == [True, True]
+        assert results[0]["files_changed"] == [str(draft)]
+        text = real_read(draft, encoding="utf-8")
+        assert "## Skipped" in text and "<!-- claim_id: 12345678" in text
+        assert tracker.get_iteration_count("page") == 1
+
+    def test_parallel_matches_serial(self, tmp_path):
+        """Pooled fixing yields the same drafts, results and iteration counts."""
+        outcomes = []
+        for workers in (1, 4):
+            run_dir = tmp_path / f"run{workers}"
+            drafts_dir = run_dir / "drafts"
+            drafts_dir.mkdir(parents=True)
+            issues = []
+            for i in range(20):
+                (drafts_dir / f"p{i:02d}.md").write_text(self.CONTENT, encoding="utf-8")
+                issues.extend(self._issues(f"drafts/p{i:02d}.md"))
+            issues.reverse()
+
+            tracker = IterationTracker(run_dir=run_dir)
+            results = apply_auto_fixes(issues, drafts_dir, {}, tracker, max_workers=workers)
+            outcomes.append((
+                [(r["issue_id"], r["success"]) for r in results],
+                [p.read_text(encoding="utf-8") for p in sorted(drafts_dir.glob("*.md"))],
+                [tracker.get_iteration_count(f"p{i:02d}") for i in range(20)],
+            ))
+
+        assert outcomes[0] == outcomes[1]
+        assert outcomes[0][0][0] == ("drafts/p00.md:headings", True)
+        assert outcomes[0][2] == [1] * 20
+
+
 class TestFixClaimMarkers:
     """Test claim marker fix function."""
 
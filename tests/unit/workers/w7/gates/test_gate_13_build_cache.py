@@ -0,0 +1,149 @@
+"""Unit tests for the Gate 13 Hugo build cache and its Gate P3 hand-off.
+
+A fake `hugo` script on PATH records each build invocation, so the caching
+logic runs without a real Hugo install.
+"""
+
+import json
+import os
+import stat
+from pathlib import Path
+
+import pytest
+
+from launch.workers.w7_validator.gates import gate_13_hugo_build, gate_p3_build_time_limit
+
+FAKE_HUGO = """#!/bin/sh
+if [ "$1" = "version" ]; then
+  echo "hugo v${FAKE_HUGO_VERSION:-0.120.0}+extended linux/amd64"
+  exit 0
+fi
+echo "$@" >> "$FAKE_HUGO_LOG"
+exit ${FAKE_HUGO_EXIT:-0}
+"""
+
+
+@pytest.fixture
+def fake_hugo(tmp_path, monkeypatch):
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    script = bin_dir / "hugo"
+    script.write_text(FAKE_HUGO)
+    script.chmod(script.stat().st_mode | stat.S_IEXEC)
+    log = tmp_path / "hugo.log"
+    log.touch()
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+    monkeypatch.setenv("FAKE_HUGO_LOG", str(log))
+    monkeypatch.delenv("LAUNCH_HUGO_CACHE_DIR", raising=False)
+    monkeypatch.delenv("LAUNCH_HUGO_BUILD_CACHE", raising=False)
+    return log
+
+
+@pytest.fixture
+def run_dir(tmp_path):
+    run_dir = tmp_path / "runs" / "run_001"
+    site = run_dir / "work" / "site"
+    (site / "content").mkdir(parents=True)
+    (run_dir / "artifacts").mkdir()
+    (site / "hugo.toml").write_text('title = "Site"\n')
+    (site / "content" / "page.md").write_text("---\ntitle: Page\n---\nBody\n")
+    return run_dir
+
+
+def _builds(log: Path):
+    return [line.split() for line in log.read_text().splitlines()]
+
+
+def _build_result(run_dir: Path):
+    path = run_dir / "artifacts" / gate_13_hugo_build.HUGO_BUILD_RESULT_ARTIFACT
+    return json.loads(path.read_text())
+
+
+def test_unchanged_tree_skips_build(fake_hugo, run_dir):
+    assert gate_13_hugo_build.execute_gate(run_dir, "local") == (True, [])
+    assert len(_builds(fake_hugo)) == 1
+    assert _build_result(run_dir)["cached"] is False
+
+    assert gate_13_hugo_build.execute_gate(run_dir, "local") == (True, [])
+    assert len(_builds(fake_hugo)) == 1
+    assert _build_result(run_dir)["cached"] is True
+
+    # Hugo output inside the site tree does not count as a change
+    (run_dir / "work" / "site" / "public").mkdir()
+    (run_dir / "work" / "site" / "public" / "index.html").write_text("<html/>")
+    gate_13_hugo_build.execute_gate(run_dir, "local")
+    assert len(_builds(fake_hugo)) == 1
+
+
+def test_content_version_and_config_changes_rebuild(fake_hugo, run_dir, monkeypatch):
+    site = run_dir / "work" / "site"
+    gate_13_hugo_build.execute_gate(run_dir, "local")
+
+    (site / "content" / "page.md").write_text("---\ntitle: Page\n---\nEdited\n")
+    gate_13_hugo_build.execute_gate(run_dir, "local")
+    assert len(_builds(fake_hugo)) == 2
+
+    monkeypatch.setenv("FAKE_HUGO_VERSION", "0.121.0")
+    gate_13_hugo_build.execute_gate(run_dir, "local")
+    assert len(_builds(fake_hugo)) == 3
+
+    (site / "configs").mkdir()
+    (site / "configs" / "hugo.toml").write_text('baseURL = "/"\n')
+    gate_13_hugo_build.execute_gate(run_dir, "local")
+    builds = _builds(fake_hugo)
+    assert len(builds) == 4 and "--configDir" in builds[-1]
+
+
+def test_build_uses_persistent_cache_and_destination(fake_hugo, run_dir):
+    gate_13_hugo_build.execute_gate(run_dir, "local")
+
+    args = _builds(fake_hugo)[0]
+    cache_root = (run_dir.parent / ".hugo_cache").resolve()
+    cache_dir = Path(args[args.index("--cacheDir") + 1])
+    destination = Path(args[args.index("--destination") + 1])
+    assert cache_dir == cache_root / "cache"
+    assert destination.parent == cache_root / "public"
+    # Rendered output does not accumulate per run directory
+    assert not destination.exists()
+    assert list((cache_root / "public").iterdir()) == []
+
+
+def test_failed_build_is_cached(fake_hugo, run_dir, monkeypatch):
+    monkeypatch.setenv("FAKE_HUGO_EXIT", "1")
+
+    passed, issues = gate_13_hugo_build.execute_gate(run_dir, "local")
+    assert passed is False and issues[0]["error_code"] == "GATE_HUGO_BUILD_FAILED"
+
+    assert gate_13_hugo_build.execute_gate(run_dir, "local") == (False, issues)
+    assert len(_builds(fake_hugo)) == 1
+    assert _build_result(run_dir)["ok"] is False
+
+    monkeypatch.setenv("LAUNCH_HUGO_BUILD_CACHE", "0")
+    gate_13_hugo_build.execute_gate(run_dir, "local")
+    assert len(_builds(fake_hugo)) == 2
+
+
+def test_early_return_removes_previous_build_result(fake_hugo, run_dir, monkeypatch):
+    gate_13_hugo_build.execute_gate(run_dir, "local")
+    result_path = run_dir / "artifacts" / gate_13_hugo_build.HUGO_BUILD_RESULT_ARTIFACT
+    assert result_path.exists()
+
+    # Hugo no longer on PATH: the gate fails before building
+    monkeypatch.setenv("PATH", "")
+    passed, issues = gate_13_hugo_build.execute_gate(run_dir, "local")
+    assert passed is False and issues[0]["error_code"] == "GATE_HUGO_BUILD_TOOL_MISSING"
+    assert not result_path.exists()
+
+
+def test_p3_reads_build_duration_from_gate_13(run_dir):
+    result_path = run_dir / "artifacts" / gate_13_hugo_build.HUGO_BUILD_RESULT_ARTIFACT
+    # Present even after an earlier pass wrote validation_report.json
+    (run_dir / "artifacts" / "validation_report.json").write_text("{}")
+
+    result_path.write_text(json.dumps({"duration_seconds": 12.5, "cached": False}))
+    assert gate_p3_build_time_limit.execute_gate(run_dir, "local") == (True, [])
+
+    result_path.write_text(json.dumps({"duration_seconds": 90.0, "cached": True}))
+    passed, issues = gate_p3_build_time_limit.execute_gate(run_dir, "local")
+    assert passed is True
+    assert [i["error_code"] for i in issues] == ["GATE_BUILD_TIME_LIMIT_EXCEEDED"]